@@ -35,6 +35,14 @@ if [ -f "$BATCH_STATE" ]; then
     total_features=$(jq -r '.total_features // 0' "$BATCH_STATE" 2>/dev/null || echo "0")
     features=$(jq -c '.features // []' "$BATCH_STATE" 2>/dev/null || echo "[]")
 
+    # Large batches journal progress between snapshot compactions
+    # (batch_state_manager): take current_index from the journal tail too
+    if [ -f "$BATCH_STATE.journal" ]; then
+      current_index=$(jq -s --argjson base "$current_index" \
+        '[.[] | select(.op == "progress") | .feature_index + 1] + [$base] | max' \
+        "$BATCH_STATE.journal" 2>/dev/null || echo "$current_index")
+    fi
+
     # Try to read RALPH checkpoint if available
     checkpoint_data="{}"
     if [ -n "$batch_id" ]; then
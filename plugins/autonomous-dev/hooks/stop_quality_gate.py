@@ -14,7 +14,7 @@ Problem Solved:
 Solution:
 Stop hook that:
 1. Detects available quality tools (pytest, ruff, mypy)
-2. Runs checks in parallel for speed
+2. Runs checks concurrently under one shared deadline (fail-fast)
 3. Formats results for stderr output (Claude surfaces this)
 4. Provides graceful degradation for missing tools
 5. Never blocks (always exits EXIT_SUCCESS)
@@ -69,10 +69,14 @@ except ImportError:
 
 
 import os
+import queue
+import signal
 import sys
 import subprocess
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from subprocess import TimeoutExpired
 
 # Import exit codes with fallback
@@ -121,6 +125,20 @@ try:
 except ImportError:
     EXIT_SUCCESS = 0
 
+# Test-impact selection: run only the tests touching the changed code
+try:
+    from test_impact import select_tests as _select_impacted_tests
+except ImportError:
+    _select_impacted_tests = None
+
+# Tree-hash keyed pytest verdict cache: skip re-running an unchanged suite
+try:
+    from test_result_cache import OUTPUT_TAIL_CHARS as _OUTPUT_TAIL_CHARS
+    from test_result_cache import TestResultCache as _TestResultCache
+except ImportError:
+    _OUTPUT_TAIL_CHARS = 4000
+    _TestResultCache = None
+
 
 def should_enforce_quality_gate() -> bool:
     """
@@ -296,18 +314,132 @@ def detect_project_tools(project_root: Path) -> Dict[str, Dict[str, Any]]:
     return tools
 
 
+# Issue #177: one deadline shared by all checks (they run concurrently, so the
+# whole gate finishes within this budget instead of 60s per tool).
+QUALITY_CHECK_DEADLINE_SECONDS = 60
+
+# Tools reported by format_results(), in display order.
+QUALITY_TOOLS = ("pytest", "ruff", "mypy")
+
+# Command line per tool.
+QUALITY_CHECK_COMMANDS = {
+    "pytest": ["pytest", "--tb=line", "-q"],
+    "ruff": ["ruff", "check", "."],
+    "mypy": ["mypy", "."],
+}
+
+# Exit codes that mean "ran fine and reported findings" (lint / type errors).
+# These never cancel other checks under fail_fast; any other non-zero exit
+# (a pytest failure, a crash, a usage error or a signal) does.
+QUALITY_FINDINGS_EXIT_CODES = {
+    "ruff": (1,),
+    "mypy": (1,),
+}
+
+# Grace period between SIGTERM and SIGKILL when cancelling a check.
+_TERMINATE_GRACE_SECONDS = 2
+
+# Per-tool wall times (ms) of the last run_quality_checks() call, attached to
+# the hook timing row by _timed_main().
+_LAST_CHECK_DURATIONS_MS: Dict[str, float] = {}
+
+
+def _drain(stream, chunks: List[str]) -> None:
+    """Copy a child pipe into ``chunks`` until EOF (keeps the pipe from filling)."""
+    try:
+        for chunk in iter(lambda: stream.read(8192), ""):
+            chunks.append(chunk)
+    except (OSError, ValueError):
+        pass
+    finally:
+        try:
+            stream.close()
+        except OSError:
+            pass
+
+
+def _terminate(proc: "subprocess.Popen") -> None:
+    """Stop a check and its children (SIGTERM, then SIGKILL after a grace period)."""
+    if proc.poll() is not None:
+        return
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGTERM)
+        else:
+            proc.terminate()
+        proc.wait(timeout=_TERMINATE_GRACE_SECONDS)
+    except (OSError, TimeoutExpired):
+        try:
+            if os.name == "posix":
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+            proc.wait(timeout=_TERMINATE_GRACE_SECONDS)
+        except (OSError, TimeoutExpired):
+            pass
+
+
+def select_pytest_targets(project_root: Path) -> Optional[List[str]]:
+    """
+    Pick the pytest targets for the changed files via test_impact.
+
+    Args:
+        project_root: Project root directory.
+
+    Returns:
+        None to run the full suite (no usable impact map, or selection is not
+        safe), [] when no test touches the changes, else node ids / test
+        files to pass to pytest.
+    """
+    if _select_impacted_tests is None:
+        return None
+    try:
+        selection = _select_impacted_tests(cwd=project_root)
+    except Exception:
+        return None
+    if selection.full_suite:
+        return None
+    if selection.skip_all:
+        return []
+    return selection.pytest_args()
+
+
+def _is_blocking_failure(tool: str, returncode: Optional[int]) -> bool:
+    """True if a finished check's exit should cancel the others.
+
+    A pytest failure or a tool crash is blocking; ruff/mypy reporting
+    findings (QUALITY_FINDINGS_EXIT_CODES) is not.
+    """
+    if returncode == 0:
+        return False
+    return returncode not in QUALITY_FINDINGS_EXIT_CODES.get(tool, ())
+
+
 def run_quality_checks(
-    tools: Dict[str, Dict[str, Any]], project_root: Optional[Path] = None
+    tools: Dict[str, Dict[str, Any]],
+    project_root: Optional[Path] = None,
+    deadline_seconds: float = QUALITY_CHECK_DEADLINE_SECONDS,
+    fail_fast: bool = True,
+    pytest_targets: Optional[List[str]] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """
     Run quality checks for available tools.
 
-    Executes pytest, ruff, mypy in parallel using subprocess.
-    Each tool has 60 second timeout. Gracefully handles errors.
+    Launches pytest, ruff and mypy at the same time with subprocess.Popen.
+    Output is streamed into memory by one reader thread per pipe, so a chatty
+    tool cannot block on a full pipe. All checks share one overall deadline;
+    checks still running when it expires are terminated and reported as timed
+    out. With fail_fast, the first blocking failure (see
+    _is_blocking_failure) cancels the checks still running; lint and type
+    findings never hide the test result. Gracefully handles errors.
 
     Args:
         tools: Tool availability info from detect_project_tools().
         project_root: Project root directory (defaults to cwd).
+        deadline_seconds: Overall time budget for all checks together.
+        fail_fast: Cancel remaining checks after the first blocking failure.
+        pytest_targets: Node ids / files to run instead of the whole suite
+            (None = whole suite, [] = no impacted tests, pytest not started).
 
     Returns:
         Dict mapping tool names to execution results:
@@ -318,7 +450,9 @@ def run_quality_checks(
                 "returncode": int | None,
                 "stdout": str,
                 "stderr": str,
-                "error": str | None  # Error message if exception occurred
+                "error": str | None,  # Error message if exception occurred
+                "duration_ms": float,  # Wall time (only when the tool ran)
+                "cached": bool  # Verdict reused for an unchanged tree (test_result_cache)
             },
             ...
         }
@@ -332,95 +466,137 @@ def run_quality_checks(
     if project_root is None:
         project_root = Path.cwd()
 
-    results = {
-        "pytest": {"ran": False, "passed": None, "stdout": "", "stderr": "", "error": None},
-        "ruff": {"ran": False, "passed": None, "stdout": "", "stderr": "", "error": None},
-        "mypy": {"ran": False, "passed": None, "stdout": "", "stderr": "", "error": None},
+    results: Dict[str, Dict[str, Any]] = {
+        tool: {"ran": False, "passed": None, "stdout": "", "stderr": "", "error": None}
+        for tool in QUALITY_TOOLS
     }
-
-    # Run pytest if available
-    if tools["pytest"]["available"]:
-        results["pytest"]["ran"] = True
+    _LAST_CHECK_DURATIONS_MS.clear()
+
+    start = time.monotonic()
+    deadline = start + deadline_seconds
+    running: Dict[str, Dict[str, Any]] = {}
+    finished: "queue.Queue[str]" = queue.Queue()
+    pytest_cache = _TestResultCache.for_project(project_root) if _TestResultCache is not None else None
+    pytest_key: Optional[str] = None
+
+    # Launch every available check before waiting on any of them.
+    for tool in QUALITY_TOOLS:
+        command = QUALITY_CHECK_COMMANDS.get(tool)
+        if command is None or not tools.get(tool, {}).get("available"):
+            continue
+        result = results[tool]
+        result["ran"] = True
+        if tool == "pytest" and pytest_targets is not None:
+            if not pytest_targets:
+                result["passed"] = True
+                result["returncode"] = 0
+                result["stdout"] = "No tests touch the changed code (test-impact map)"
+                continue
+            command = [*command, *pytest_targets]
+        if tool == "pytest" and pytest_cache is not None:
+            pytest_key = pytest_cache.key_for(command, cwd=project_root)
+            hit = pytest_cache.get(pytest_key, consumer="stop_quality_gate") if pytest_key else None
+            if hit is not None:
+                result["passed"] = hit.passed
+                result["returncode"] = hit.returncode
+                result["stdout"] = hit.summary.get("stdout", "")
+                result["stderr"] = hit.summary.get("stderr", "")
+                result["cached"] = True
+                continue
+        launched = time.monotonic()
         try:
-            result = subprocess.run(
-                ["pytest", "--tb=line", "-q"],
+            proc = subprocess.Popen(
+                command,
                 cwd=project_root,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
                 text=True,
-                timeout=60,
+                start_new_session=(os.name == "posix"),
             )
-            results["pytest"]["returncode"] = result.returncode
-            results["pytest"]["stdout"] = result.stdout
-            results["pytest"]["stderr"] = result.stderr
-            results["pytest"]["passed"] = result.returncode == 0
         except FileNotFoundError:
-            results["pytest"]["passed"] = False
-            results["pytest"]["error"] = "pytest command not found (not installed)"
-        except TimeoutExpired:
-            results["pytest"]["passed"] = False
-            results["pytest"]["error"] = "pytest timeout after 60 seconds"
+            result["passed"] = False
+            result["error"] = f"{tool} command not found (not installed)"
+            continue
         except PermissionError:
-            results["pytest"]["passed"] = False
-            results["pytest"]["error"] = "Permission denied running pytest"
+            result["passed"] = False
+            result["error"] = f"Permission denied running {tool}"
+            continue
         except Exception as e:
-            results["pytest"]["passed"] = False
-            results["pytest"]["error"] = f"Unexpected error: {str(e)}"
+            result["passed"] = False
+            result["error"] = f"Unexpected error: {str(e)}"
+            continue
 
-    # Run ruff if available
-    if tools["ruff"]["available"]:
-        results["ruff"]["ran"] = True
-        try:
-            result = subprocess.run(
-                ["ruff", "check", "."],
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-            results["ruff"]["returncode"] = result.returncode
-            results["ruff"]["stdout"] = result.stdout
-            results["ruff"]["stderr"] = result.stderr
-            results["ruff"]["passed"] = result.returncode == 0
-        except FileNotFoundError:
-            results["ruff"]["passed"] = False
-            results["ruff"]["error"] = "ruff command not found (not installed)"
-        except TimeoutExpired:
-            results["ruff"]["passed"] = False
-            results["ruff"]["error"] = "ruff timeout after 60 seconds"
-        except PermissionError:
-            results["ruff"]["passed"] = False
-            results["ruff"]["error"] = "Permission denied running ruff"
-        except Exception as e:
-            results["ruff"]["passed"] = False
-            results["ruff"]["error"] = f"Unexpected error: {str(e)}"
+        out: List[str] = []
+        err: List[str] = []
+        readers = [
+            threading.Thread(target=_drain, args=(proc.stdout, out), daemon=True),
+            threading.Thread(target=_drain, args=(proc.stderr, err), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        def _wait(tool=tool, proc=proc, readers=readers):
+            proc.wait()
+            for reader in readers:
+                reader.join()
+            finished.put(tool)
+
+        threading.Thread(target=_wait, daemon=True).start()
+        running[tool] = {
+            "proc": proc, "readers": readers, "out": out, "err": err, "launched": launched,
+        }
 
-    # Run mypy if available
-    if tools["mypy"]["available"]:
-        results["mypy"]["ran"] = True
+    cancelled_by: Optional[str] = None
+    while running:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
         try:
-            result = subprocess.run(
-                ["mypy", "."],
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=60,
+            tool = finished.get(timeout=remaining)
+        except queue.Empty:
+            break
+        run = running.pop(tool)
+        result = results[tool]
+        result["returncode"] = run["proc"].returncode
+        result["stdout"] = "".join(run["out"])
+        result["stderr"] = "".join(run["err"])
+        result["passed"] = run["proc"].returncode == 0
+        result["duration_ms"] = (time.monotonic() - run["launched"]) * 1000
+        if tool == "pytest" and pytest_key is not None:
+            pytest_cache.put(
+                pytest_key,
+                result["passed"],
+                result["returncode"],
+                # Keep the tail: pytest's failure summary is at the end
+                summary={
+                    "stdout": result["stdout"][-_OUTPUT_TAIL_CHARS:],
+                    "stderr": result["stderr"][-_OUTPUT_TAIL_CHARS:],
+                },
+                duration_seconds=result["duration_ms"] / 1000,
             )
-            results["mypy"]["returncode"] = result.returncode
-            results["mypy"]["stdout"] = result.stdout
-            results["mypy"]["stderr"] = result.stderr
-            results["mypy"]["passed"] = result.returncode == 0
-        except FileNotFoundError:
-            results["mypy"]["passed"] = False
-            results["mypy"]["error"] = "mypy command not found (not installed)"
-        except TimeoutExpired:
-            results["mypy"]["passed"] = False
-            results["mypy"]["error"] = "mypy timeout after 60 seconds"
-        except PermissionError:
-            results["mypy"]["passed"] = False
-            results["mypy"]["error"] = "Permission denied running mypy"
-        except Exception as e:
-            results["mypy"]["passed"] = False
-            results["mypy"]["error"] = f"Unexpected error: {str(e)}"
+        if fail_fast and _is_blocking_failure(tool, result["returncode"]):
+            cancelled_by = tool
+            break
+
+    # Anything still running either lost the deadline or was cancelled.
+    for tool, run in running.items():
+        _terminate(run["proc"])
+        for reader in run["readers"]:
+            reader.join(timeout=_TERMINATE_GRACE_SECONDS)
+        result = results[tool]
+        result["passed"] = False
+        result["stdout"] = "".join(run["out"])
+        result["stderr"] = "".join(run["err"])
+        result["duration_ms"] = (time.monotonic() - run["launched"]) * 1000
+        if cancelled_by is not None:
+            result["error"] = f"{tool} cancelled after {cancelled_by} failed"
+        else:
+            result["error"] = f"{tool} timeout after {deadline_seconds:g} seconds"
+
+    for tool, result in results.items():
+        if "duration_ms" in result:
+            _LAST_CHECK_DURATIONS_MS[tool] = round(result["duration_ms"], 3)
 
     return results
 
@@ -470,7 +646,8 @@ def format_results(results: Dict[str, Dict[str, Any]]) -> str:
             continue
 
         if result["passed"]:
-            lines.append(f"✅ {tool_name}: passed")
+            suffix = " (cached: unchanged tree)" if result.get("cached") else ""
+            lines.append(f"✅ {tool_name}: passed{suffix}")
         elif result.get("error"):
             lines.append(f"⚠️  {tool_name}: {result['error']}")
         else:
@@ -496,7 +673,7 @@ def main() -> int:
     Workflow:
     1. Check if quality gate enforcement enabled
     2. Detect available tools in project
-    3. Run quality checks in parallel
+    3. Run quality checks concurrently
     4. Format and print results to stderr
     5. Always exit EXIT_SUCCESS (Stop hooks cannot block)
 
@@ -527,8 +704,11 @@ def main() -> int:
         # Detect available tools
         tools = detect_project_tools(project_root)
 
-        # Run quality checks
-        results = run_quality_checks(tools, project_root)
+        # Run quality checks (pytest limited to impacted tests when possible)
+        pytest_targets = None
+        if tools["pytest"]["available"]:
+            pytest_targets = select_pytest_targets(project_root)
+        results = run_quality_checks(tools, project_root, pytest_targets=pytest_targets)
 
         # Format and output results
         output = format_results(results)
@@ -559,9 +739,26 @@ except ImportError:
 _HOOK_TIMER_NAME = _Path_953(__file__).name
 
 
+def _record_check_durations(timer) -> None:
+    """Attach per-tool check wall times (ms) to the timing row."""
+    add_counters = getattr(timer, "add_counters", None)
+    if add_counters is None or not _LAST_CHECK_DURATIONS_MS:
+        return
+    try:
+        add_counters(
+            "quality_checks",
+            {f"{tool}_ms": ms for tool, ms in _LAST_CHECK_DURATIONS_MS.items()},
+        )
+    except Exception:
+        pass
+
+
 def _timed_main():  # type: ignore[no-redef]
-    with HookTimer(_HOOK_TIMER_NAME):
-        return main()
+    with HookTimer(_HOOK_TIMER_NAME) as timer:
+        try:
+            return main()
+        finally:
+            _record_check_durations(timer)
 
 if __name__ == "__main__":
     _safe_main_953(_timed_main)
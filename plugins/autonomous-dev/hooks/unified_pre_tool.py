@@ -442,29 +442,31 @@ except Exception:
     _is_fresh_file_write_pattern_fn = None
 
 
-# Phase 2 (Issue #1153): defensive import of the shared heredoc-strip
-# utility. Mirrors the pattern above. The shared module is used here at
-# three call sites (formerly the private `_strip_heredoc_content` at the
-# two sites that called it + the inline-duplicated regex inside the
-# state-file deletion check). When the shared module fails to load we
-# fall back to a no-op strip — preserving existing behavior with one
-# minor false-positive risk that was already there before this refactor.
-_strip_heredoc_fn = None
-try:
-    _heredoc_path = (
-        Path(__file__).resolve().parent.parent / "lib" / "heredoc_utils.py"
+# Parse-once Bash command model shared with tool_intent. tool_intent (loaded
+# above) registers the module in sys.modules, so both use ONE parse cache:
+# statements, shlex argv and heredoc/quote-stripped text are computed once
+# per command string instead of once per detector. Required, not defensive:
+# it is the single implementation of the statement split and quote strip the
+# Bash detectors rely on, and it is installed next to tool_intent.
+_parsed_command = sys.modules.get("parsed_command")
+if _parsed_command is None:
+    _pc_path = next(
+        (
+            lib_dir / "parsed_command.py"
+            for lib_dir in (
+                Path(__file__).resolve().parent.parent / "lib",  # plugins/autonomous-dev/lib
+                Path(__file__).resolve().parents[2] / "lib",     # fallback
+            )
+            if (lib_dir / "parsed_command.py").exists()
+        ),
+        None,
     )
-    if _heredoc_path.exists():
-        import importlib.util as _heredoc_ilu
-        _heredoc_spec = _heredoc_ilu.spec_from_file_location(
-            "heredoc_utils", str(_heredoc_path)
-        )
-        if _heredoc_spec and _heredoc_spec.loader:
-            _heredoc_mod = importlib.util.module_from_spec(_heredoc_spec)
-            _heredoc_spec.loader.exec_module(_heredoc_mod)
-            _strip_heredoc_fn = _heredoc_mod.strip_heredoc_content
-except Exception:
-    _strip_heredoc_fn = None
+    if _pc_path is None:
+        raise ImportError("unified_pre_tool requires lib/parsed_command.py")
+    _pc_spec = importlib.util.spec_from_file_location("parsed_command", str(_pc_path))
+    _parsed_command = importlib.util.module_from_spec(_pc_spec)
+    _pc_spec.loader.exec_module(_parsed_command)
+    sys.modules["parsed_command"] = _parsed_command
 
 
 def _is_adev_project() -> bool:
@@ -1014,7 +1016,7 @@ def _detect_git_bypass(command: str) -> Tuple[bool, str]:
         return (False, "")
 
     try:
-        tokens = shlex.split(command)
+        tokens = _shlex_argv(command)
     except ValueError:
         tokens = command.split()
 
@@ -3035,16 +3037,8 @@ def _strip_quoted_segments(command: str) -> str:
 
     This prevents false-positive env-var spoofing detection when a protected
     variable name appears inside a quoted argument (e.g., a --body flag to gh).
-
-    Single-quoted strings in bash have no escape sequences, so the pattern is
-    simple: everything between the first ``'`` and the next ``'``.
-
-    Double-quoted strings support backslash escaping, so ``\\"`` inside a
-    double-quoted segment does NOT end the string.
-
-    On any regex error the original command is returned unchanged (fail-open for
-    the stripping step, but the caller still applies the detection patterns to
-    the original on error).
+    Delegates to ``parsed_command.strip_quoted_segments`` (single-quoted
+    segments first, then double-quoted segments honoring backslash escapes).
 
     Args:
         command: The raw Bash command string.
@@ -3052,42 +3046,60 @@ def _strip_quoted_segments(command: str) -> str:
     Returns:
         Command with quoted segments replaced by empty strings.
     """
-    import re
-
-    try:
-        # Remove single-quoted segments first (no escape sequences in single quotes)
-        result = re.sub(r"'[^']*'", "", command)
-        # Remove double-quoted segments (backslash can escape a quote inside)
-        result = re.sub(r'"(?:[^"\\]|\\.)*"', "", result)
-        return result
-    except re.error:
-        return command
+    return _parsed_command.strip_quoted_segments(command)
 
 
 def _strip_heredoc_content(command: str) -> str:
     """Remove heredoc content from a command string.
 
     Thin wrapper around the shared ``heredoc_utils.strip_heredoc_content``
-    helper. Kept under the original private name so existing internal call
-    sites (``_detect_env_spoofing`` and ``_detect_gh_issue_create``) do not
-    need to be touched as part of the Phase 2 extraction.
+    helper, served through ``parsed_command`` (which loads it). Kept under the
+    original private name so existing internal call sites
+    (``_detect_env_spoofing`` and ``_detect_gh_issue_create``) do not need to
+    be touched as part of the Phase 2 extraction.
 
     Args:
         command: The raw Bash command string.
 
     Returns:
-        Command with heredoc body content replaced by empty strings. Falls
-        back to the input unchanged when the shared module failed to load
-        (no-op strip) to preserve the existing scan behavior.
+        Command with heredoc body content replaced by empty strings. Unchanged
+        when heredoc_utils failed to load (no-op strip, see parsed_command).
 
     Issue: #1153
     """
-    if _strip_heredoc_fn is None:
-        return command
-    try:
-        return _strip_heredoc_fn(command)
-    except Exception:
-        return command
+    # Memoized per command string: every detector shares one pass of the
+    # (backtracking-prone, see #1620) heredoc regex.
+    return _parsed_command.parse_command(command).heredoc_stripped
+
+
+def _strip_heredoc_and_quotes(command: str) -> str:
+    """Return ``command`` with heredoc bodies, then quoted segments, removed.
+
+    Equivalent to ``_strip_quoted_segments(_strip_heredoc_content(command))``
+    but served from the shared ParsedCommand cache.
+
+    Args:
+        command: The raw Bash command string.
+
+    Returns:
+        The scan text used by the env-spoofing, gh-issue and patch-apply gates.
+    """
+    return _parsed_command.parse_command(command).unquoted
+
+
+def _shlex_argv(command: str) -> "list[str]":
+    """``shlex.split(command, posix=True)`` via the shared parse cache.
+
+    Args:
+        command: The Bash command (or statement) string to tokenize.
+
+    Returns:
+        A fresh token list the caller may mutate.
+
+    Raises:
+        ValueError: On malformed quoting, exactly as ``shlex.split`` does.
+    """
+    return _parsed_command.parse_command(command).argv()
 
 
 def _is_protected_env_var(var_name: str) -> bool:
@@ -3139,8 +3151,7 @@ def _detect_env_spoofing(command: str) -> "Optional[str]":
     # writing a Markdown file that documents PIPELINE_STATE_FILE) do not
     # produce false-positive blocks. Mirrors the pattern used by
     # _detect_gh_issue_create at lines 2172-2173.
-    stripped = _strip_heredoc_content(command)
-    stripped = _strip_quoted_segments(stripped)
+    stripped = _strip_heredoc_and_quotes(command)
 
     # --- Pass 1: Check individual PROTECTED_ENV_VARS (exact match) ---
     for var in PROTECTED_ENV_VARS:
@@ -3403,7 +3414,7 @@ def _strip_body_arg_values(cmd: str) -> "tuple[str, list[str]]":
             quotes). Callers must catch and fall back to raw-regex behavior
             to preserve fail-closed blocking on garbled input.
     """
-    toks = shlex.split(cmd, posix=True)  # may raise ValueError; let caller catch
+    toks = _shlex_argv(cmd)  # may raise ValueError; let caller catch
     out: list[str] = []
     dropped: list[str] = []
     i = 0
@@ -3490,7 +3501,7 @@ def _extract_commit_message_payload(command: str) -> Optional[str]:
             return body
 
     try:
-        toks = shlex.split(command, posix=True)
+        toks = _shlex_argv(command)
     except ValueError:
         return None
 
@@ -3613,7 +3624,7 @@ def _is_message_only_amend(command: str) -> bool:
     """
     try:
         try:
-            tokens = shlex.split(command, posix=True)
+            tokens = _shlex_argv(command)
         except ValueError:
             return False
         if "--amend" not in tokens:
@@ -3896,6 +3907,7 @@ def _split_statements(command: str) -> "list[str]":
     Recognized top-level separators: ``;``, ``&&``, ``||``, ``|``, ``&``,
     and newline. The resulting statement strings preserve their interior
     structure (quoting, flags, values) for the caller to feed to shlex.
+    Served from the shared ParsedCommand cache (``parsed_command.split_statements``).
 
     Args:
         command: The raw Bash command string.
@@ -3904,58 +3916,7 @@ def _split_statements(command: str) -> "list[str]":
         List of statement substrings with surrounding whitespace stripped.
         Empty statements are dropped.
     """
-    out: "list[str]" = []
-    buf: "list[str]" = []
-    i = 0
-    n = len(command)
-    in_single = False
-    in_double = False
-    while i < n:
-        c = command[i]
-        # Quote handling: single quotes are literal (no escapes); double
-        # quotes honor backslash escapes for the closing quote.
-        if c == "'" and not in_double:
-            in_single = not in_single
-            buf.append(c)
-            i += 1
-            continue
-        if c == '"' and not in_single:
-            in_double = not in_double
-            buf.append(c)
-            i += 1
-            continue
-        if in_single or in_double:
-            # Inside a quoted region, preserve everything verbatim
-            # (including backslash-escapes inside double quotes).
-            if c == "\\" and in_double and i + 1 < n:
-                buf.append(c)
-                buf.append(command[i + 1])
-                i += 2
-                continue
-            buf.append(c)
-            i += 1
-            continue
-        # Two-character separators take precedence over single-char ones.
-        if i + 1 < n and command[i:i + 2] in ("&&", "||"):
-            stmt = "".join(buf).strip()
-            if stmt:
-                out.append(stmt)
-            buf = []
-            i += 2
-            continue
-        if c in (";", "|", "&", "\n"):
-            stmt = "".join(buf).strip()
-            if stmt:
-                out.append(stmt)
-            buf = []
-            i += 1
-            continue
-        buf.append(c)
-        i += 1
-    tail = "".join(buf).strip()
-    if tail:
-        out.append(tail)
-    return out
+    return list(_parsed_command.parse_command(command).statements)
 
 
 def _strip_shell_comment(statement: str) -> str:
@@ -4279,6 +4240,10 @@ def _gh_issue_create_at_command_position(
     # and three other call sites still drive it. The fix belongs in
     # lib/heredoc_utils.py under #1620, where one change covers every caller
     # at once. Do NOT patch the regex here.
+    #
+    # Since the parse-once model (lib/parsed_command.py) the strip result is
+    # memoized per command string, so the other gates inspecting the same
+    # command reuse this single pass. The cost of that one pass is unchanged.
     stripped_for_heredoc = (
         _strip_heredoc_content(command) if heredoc_stripped is None else heredoc_stripped
     )
@@ -4320,7 +4285,7 @@ def _gh_issue_create_at_command_position(
             # Malformed statement — skip; whole-command fallback handles it.
             continue
         try:
-            seg = shlex.split(stripped_cmd, posix=True)
+            seg = _shlex_argv(stripped_cmd)
         except ValueError:
             continue
         if not seg:
@@ -4942,7 +4907,7 @@ def _gh_issue_create_target_is_cross_owner(command: str) -> bool:
     """
     try:
         try:
-            tokens = shlex.split(command, posix=True)
+            tokens = _shlex_argv(command)
         except ValueError:
             return False
         target = None
@@ -5002,7 +4967,7 @@ def _detect_gh_issue_create(command: str) -> "Optional[str]":
         # against a 5s hook budget) — computing it twice doubled the wall-clock
         # cost of the worst case for no benefit.
         heredoc_stripped = _strip_heredoc_content(command)
-        stripped = _strip_quoted_segments(heredoc_stripped)
+        stripped = _strip_heredoc_and_quotes(command)
 
         # Check 1: Direct 'gh issue create' in the stripped command.
         #
@@ -5034,7 +4999,7 @@ def _detect_gh_issue_create(command: str) -> "Optional[str]":
         # the direct-match path stays False (true argv-blind false positive
         # avoided).
         try:
-            shlex.split(command, posix=True)
+            _shlex_argv(command)
             shlex_parsed = True
         except ValueError:
             shlex_parsed = False
@@ -7157,8 +7122,7 @@ def _check_bash_infra_writes(command: str) -> "Optional[Tuple[str, str]]":
     # False negatives (segment hidden in a separate diff file) remain
     # acceptable; false positives on unrelated Bash commands are prevented.
     try:
-        scan_text = _strip_heredoc_content(command)
-        scan_text = _strip_quoted_segments(scan_text)
+        scan_text = _strip_heredoc_and_quotes(command)
         # Command-start position: start of string OR after a shell separator/opener,
         # optionally followed by whitespace. Matches "patch " and "git apply " when
         # they are being invoked, not when they appear as substrings inside argv.
@@ -9153,9 +9117,26 @@ except ImportError:
 _HOOK_TIMER_NAME = Path(__file__).name
 
 
+def _record_intent_cache_counters(timer) -> None:
+    """Attach tool_intent classification-cache hit/miss counts to the timing row."""
+    add_counters = getattr(timer, "add_counters", None)
+    cache_stats = getattr(_tool_intent, "cache_stats", None)
+    if add_counters is None or cache_stats is None:
+        return
+    try:
+        stats = cache_stats()
+        if stats:
+            add_counters("intent_cache", stats)
+    except Exception:
+        pass
+
+
 def _timed_main():
-    with HookTimer(_HOOK_TIMER_NAME):
-        return main()
+    with HookTimer(_HOOK_TIMER_NAME) as timer:
+        try:
+            return main()
+        finally:
+            _record_intent_cache_counters(timer)
 
 if __name__ == "__main__":
     _hook_safe_main(_timed_main)
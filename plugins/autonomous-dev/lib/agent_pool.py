@@ -9,7 +9,9 @@ Features:
 - Scalable parallelism (3-12 concurrent agents)
 - Priority queue (P1_SECURITY > P2_TESTS > P3_DOCS > P4_OPTIONAL)
 - Token-aware rate limiting (prevents budget exhaustion)
-- Work stealing (distributes load evenly)
+- Work stealing (per-worker deques; idle workers steal from busy ones)
+- Futures (TaskHandle is a concurrent.futures.Future; no polling waits)
+- Asyncio facade (asubmit_task / aawait_all / ``await handle``)
 - Task isolation (agents execute independently)
 - Graceful failure handling (partial results, timeout handling)
 
@@ -35,6 +37,11 @@ Usage:
 
     # Await results
     results = pool.await_all([handle])
+    result = handle.result(timeout=60)      # Future API
+
+    # From asyncio
+    handle = await pool.asubmit_task("planner", "Plan", PriorityLevel.P1_SECURITY)
+    result = await handle
 
 Security:
 - CWE-22: Agent type validation (no path traversal)
@@ -51,16 +58,18 @@ See library-design-patterns skill for standardized library structure.
 See error-handling-patterns skill for exception handling patterns.
 """
 
+import asyncio
+import concurrent.futures
 import logging
-import queue
 import re
 import threading
 import time
 import uuid
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import Deque, List, Optional, Dict, Any
 
 # Import pool configuration and token tracker
 try:
@@ -110,10 +119,16 @@ class PriorityLevel(Enum):
     P4_OPTIONAL = 4
 
 
-@dataclass
-class TaskHandle:
+@dataclass(eq=False)
+class TaskHandle(concurrent.futures.Future):
     """Handle for submitted task.
 
+    A ``concurrent.futures.Future`` whose result is the task's
+    ``AgentResult``: ``handle.result(timeout)``, ``handle.done()``,
+    ``handle.add_done_callback(fn)``, ``handle.cancel()`` (while still
+    queued) and ``concurrent.futures.wait``/``as_completed`` all work. It is
+    also awaitable from asyncio (``result = await handle``).
+
     Attributes:
         task_id: Unique task identifier
         agent_type: Agent type (e.g., "researcher", "planner")
@@ -125,6 +140,20 @@ class TaskHandle:
     priority: PriorityLevel
     submitted_at: datetime
 
+    def __post_init__(self):
+        """Initialize the Future state (condition variable, waiters)."""
+        concurrent.futures.Future.__init__(self)
+
+    def __await__(self):
+        """Await the result from a running event loop."""
+        return asyncio.wrap_future(self).__await__()
+
+    def __repr__(self) -> str:
+        return (
+            f"TaskHandle(task_id={self.task_id!r}, agent_type={self.agent_type!r}, "
+            f"priority={self.priority.name}, state={self._state})"
+        )
+
 
 @dataclass
 class AgentResult:
@@ -171,10 +200,17 @@ class AgentPool:
     rate limiting, and work stealing for load balancing.
 
     Design:
-        - Priority queue: Tasks executed by priority (P1 > P2 > P3 > P4)
+        - Per-worker deques: Each worker owns one deque per priority level.
+          Submissions are spread round-robin (a task submitted from inside a
+          worker goes to that worker's own deque)
+        - Work stealing: An idle worker takes from its own deque first (oldest
+          first) and otherwise steals from the tail of another worker's deque
+        - Priority: Workers always take from the highest non-empty priority
+          level across the whole pool (P1 > P2 > P3 > P4), own or stolen
+        - Event-driven: Idle workers block on a condition variable that
+          ``submit_task()`` notifies; completion resolves the task's Future,
+          so ``await_all()`` wakes as soon as the last handle finishes
         - Token tracking: Enforces budget limits via sliding window
-        - Work stealing: Distributes tasks evenly across agents
-        - Thread pool: Manages concurrent agent execution
         - Graceful failures: Handles timeouts and partial results
 
     Attributes:
@@ -186,6 +222,9 @@ class AgentPool:
     AGENT_TYPE_PATTERN = re.compile(r"^[a-z0-9_-]+$")  # CWE-22: Path traversal prevention (allow underscores)
     DEFAULT_ESTIMATED_TOKENS = 5000  # Default token estimate for submissions
 
+    # Priority levels in scheduling order (index 0 = highest priority)
+    _LEVELS = sorted(PriorityLevel, key=lambda p: p.value)
+
     def __init__(self, config: PoolConfig):
         """Initialize agent pool.
 
@@ -196,22 +235,29 @@ class AgentPool:
             ValueError: If configuration is invalid
         """
         self.config = config
+        # shared=None defers to TOKEN_TRACKER_SHARED when the config doesn't opt in
         self.token_tracker = TokenTracker(
             budget=config.token_budget,
-            window_seconds=config.token_window_seconds
+            window_seconds=config.token_window_seconds,
+            shared=config.shared_budget or None,
         )
 
-        # Task queue (priority queue)
-        self._task_queue: queue.PriorityQueue = queue.PriorityQueue()
-
-        # Results storage
-        self._results: Dict[str, AgentResult] = {}
-        self._results_lock = threading.Lock()
+        # Work-stealing deques: _deques[worker_id][level] holds task entries.
+        # deque append/popleft/pop are atomic, so producers and thieves touch
+        # them without a lock; _pending counts are kept under _work_cond.
+        self._deques: List[List[Deque[Dict[str, Any]]]] = [
+            [deque() for _ in self._LEVELS] for _ in range(config.max_agents)
+        ]
+        self._pending: List[int] = [0 for _ in self._LEVELS]
+        self._work_cond = threading.Condition()
+        self._next_worker = 0
+        self._worker_ids: Dict[int, int] = {}  # thread ident -> worker_id
 
         # Status tracking
         self._active_tasks = 0
         self._queued_tasks = 0
         self._completed_tasks = 0
+        self._steals = 0
         self._status_lock = threading.Lock()
 
         # Worker threads
@@ -237,11 +283,11 @@ class AgentPool:
             estimated_tokens: Estimated token usage (default: 5000)
 
         Returns:
-            TaskHandle for tracking task
+            TaskHandle (a ``concurrent.futures.Future`` of ``AgentResult``)
 
         Raises:
             ValueError: If agent_type invalid or prompt too large
-            RuntimeError: If token budget exhausted
+            RuntimeError: If token budget exhausted or pool is shut down
         """
         # Validate agent_type (CWE-22: Path traversal prevention)
         if not self.AGENT_TYPE_PATTERN.match(agent_type):
@@ -255,6 +301,9 @@ class AgentPool:
                 f"Prompt exceeds maximum size of {self.MAX_PROMPT_SIZE} characters"
             )
 
+        if self._shutdown:
+            raise RuntimeError("Cannot submit task: agent pool is shut down")
+
         # Check token budget (estimated)
         tokens = estimated_tokens or self.DEFAULT_ESTIMATED_TOKENS
         if not self.token_tracker.can_submit(tokens):
@@ -272,33 +321,58 @@ class AgentPool:
             submitted_at=datetime.now()
         )
 
-        # Add to priority queue (lower priority value = higher priority)
-        # Use submission timestamp for FIFO within same priority
         task_data = {
             "handle": handle,
             "prompt": prompt,
             "estimated_tokens": tokens
         }
-        submission_time = time.time()
-        self._task_queue.put((priority.value, submission_time, task_id, task_data))
+        level = self._LEVELS.index(priority)
 
-        # Update status
         with self._status_lock:
             self._queued_tasks += 1
 
+        with self._work_cond:
+            # A worker submitting follow-up work keeps it local; everyone
+            # else spreads round-robin so no single deque becomes the queue.
+            owner = self._worker_ids.get(threading.get_ident())
+            if owner is None:
+                owner = self._next_worker
+                self._next_worker = (owner + 1) % len(self._deques)
+            self._deques[owner][level].append(task_data)
+            self._pending[level] += 1
+            self._work_cond.notify()
+
         logger.info(f"Submitted task {task_id} ({agent_type}, priority={priority.name})")
 
         return handle
 
+    async def asubmit_task(
+        self,
+        agent_type: str,
+        prompt: str,
+        priority: PriorityLevel,
+        estimated_tokens: Optional[int] = None
+    ) -> TaskHandle:
+        """Asyncio facade for ``submit_task`` (same arguments and errors).
+
+        Submission never blocks, so this runs inline. ``await`` the returned
+        handle (or pass it to ``aawait_all``) to get the ``AgentResult``.
+        """
+        return self.submit_task(agent_type, prompt, priority, estimated_tokens)
+
     def await_all(self, handles: List[TaskHandle], timeout: Optional[float] = None) -> List[AgentResult]:
         """Wait for all tasks to complete.
 
+        Blocks on the handles' completion signals (no polling): returns as
+        soon as the last handle resolves.
+
         Args:
             handles: List of task handles to wait for
             timeout: Optional timeout in seconds
 
         Returns:
-            List of AgentResult (in same order as handles)
+            List of AgentResult (in same order as handles). Tasks cancelled
+            before they started yield a failed AgentResult.
 
         Raises:
             TimeoutError: If timeout exceeded (only if timeout specified)
@@ -306,28 +380,28 @@ class AgentPool:
         if not handles:
             return []
 
-        # Wait for all tasks to complete
-        start_time = time.time()
-        while True:
-            # Check if all tasks complete
-            with self._results_lock:
-                all_complete = all(h.task_id in self._results for h in handles)
-
-            if all_complete:
-                break
+        _done, not_done = concurrent.futures.wait(handles, timeout=timeout)
+        if not_done:
+            raise TimeoutError(f"Timeout waiting for tasks after {timeout} seconds")
 
-            # Check timeout
-            if timeout and (time.time() - start_time) > timeout:
-                raise TimeoutError(f"Timeout waiting for tasks after {timeout} seconds")
+        return [self._result_of(h) for h in handles]
 
-            # Sleep briefly to avoid busy waiting
-            time.sleep(0.1)
+    async def aawait_all(self, handles: List[TaskHandle], timeout: Optional[float] = None) -> List[AgentResult]:
+        """Asyncio facade for ``await_all``: awaits handles without blocking the loop.
 
-        # Collect results in order
-        with self._results_lock:
-            results = [self._results[h.task_id] for h in handles]
-
-        return results
+        Raises:
+            TimeoutError: If timeout exceeded (only if timeout specified)
+        """
+        if not handles:
+            return []
+        waiters = [asyncio.wrap_future(h) for h in handles]
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*waiters, return_exceptions=True), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timeout waiting for tasks after {timeout} seconds")
+        return [self._result_of(h) for h in handles]
 
     def get_pool_status(self) -> PoolStatus:
         """Get current pool status.
@@ -345,9 +419,32 @@ class AgentPool:
                 token_usage=token_usage
             )
 
-    def shutdown(self):
-        """Shutdown agent pool gracefully."""
-        self._shutdown = True
+    def get_steal_count(self) -> int:
+        """Number of tasks a worker took from another worker's deque."""
+        with self._status_lock:
+            return self._steals
+
+    def shutdown(self, cancel_pending: bool = True):
+        """Shutdown agent pool gracefully.
+
+        Running tasks finish; tasks still queued are cancelled (their
+        handles resolve as cancelled) unless ``cancel_pending`` is False, in
+        which case workers drain the queue before exiting.
+        """
+        with self._work_cond:
+            self._shutdown = True
+            self._work_cond.notify_all()
+
+        if cancel_pending:
+            for worker_deques in self._deques:
+                for level, tasks in enumerate(worker_deques):
+                    while True:
+                        try:
+                            task_data = tasks.popleft()
+                        except IndexError:
+                            break
+                        self._claimed(level)
+                        task_data["handle"].cancel()
 
         # Wait for workers to finish
         for worker in self._workers:
@@ -360,6 +457,43 @@ class AgentPool:
             worker.start()
             self._workers.append(worker)
 
+    def _claimed(self, level: int) -> None:
+        """Bookkeeping after an entry was popped from a deque."""
+        with self._work_cond:
+            self._pending[level] -= 1
+        with self._status_lock:
+            self._queued_tasks -= 1
+
+    def _take(self, worker_id: int) -> Optional[Dict[str, Any]]:
+        """Pop the next task for ``worker_id``: own deque first, then steal.
+
+        Scans priority levels from highest to lowest and stops at the first
+        level with pending work anywhere in the pool, so a worker never runs
+        its own P4 task while a P1 task waits in another worker's deque.
+        """
+        n = len(self._deques)
+        for level in range(len(self._LEVELS)):
+            if not self._pending[level]:
+                continue
+            try:
+                task_data = self._deques[worker_id][level].popleft()
+            except IndexError:
+                pass
+            else:
+                self._claimed(level)
+                return task_data
+            for offset in range(1, n):
+                victim = self._deques[(worker_id + offset) % n][level]
+                try:
+                    task_data = victim.pop()
+                except IndexError:
+                    continue
+                self._claimed(level)
+                with self._status_lock:
+                    self._steals += 1
+                return task_data
+        return None
+
     def _worker_loop(self, worker_id: int):
         """Worker thread loop for executing tasks.
 
@@ -367,74 +501,98 @@ class AgentPool:
             worker_id: Worker identifier
         """
         logger.debug(f"Worker {worker_id} started")
+        with self._work_cond:
+            self._worker_ids[threading.get_ident()] = worker_id
 
-        while not self._shutdown:
-            try:
-                # Get task from queue (with timeout to allow shutdown)
-                try:
-                    priority, submission_time, task_id, task_data = self._task_queue.get(timeout=1.0)
-                except queue.Empty:
-                    continue
+        while True:
+            task_data = self._take(worker_id)
+            if task_data is None:
+                with self._work_cond:
+                    if self._shutdown and not any(self._pending):
+                        break
+                    if not any(self._pending):
+                        self._work_cond.wait()
+                continue
+            self._run_task(worker_id, task_data)
 
-                # Update status (task now active)
-                with self._status_lock:
-                    self._queued_tasks -= 1
-                    self._active_tasks += 1
+        logger.debug(f"Worker {worker_id} stopped")
 
-                # Execute task
-                handle = task_data["handle"]
-                prompt = task_data["prompt"]
-                estimated_tokens = task_data["estimated_tokens"]
+    def _run_task(self, worker_id: int, task_data: Dict[str, Any]):
+        """Execute one task and resolve its handle.
 
-                logger.info(f"Worker {worker_id} executing task {task_id} ({handle.agent_type})")
+        Args:
+            worker_id: Worker identifier
+            task_data: Entry popped from a deque
+        """
+        handle = task_data["handle"]
+        task_id = handle.task_id
 
-                try:
-                    # Execute agent
-                    result = self._execute_agent(handle, prompt)
-
-                    # Record token usage
-                    self.token_tracker.record_usage(
-                        agent_id=f"worker_{worker_id}",
-                        tokens=result.tokens_used
-                    )
-
-                except TimeoutError as e:
-                    # Handle timeout
-                    logger.warning(f"Task {task_id} timed out: {e}")
-                    result = AgentResult(
-                        task_id=task_id,
-                        success=False,
-                        output=f"Timeout: {e}",
-                        tokens_used=0,
-                        duration=0.0
-                    )
-
-                except Exception as e:
-                    # Handle unexpected errors
-                    logger.error(f"Task {task_id} failed: {e}")
-                    result = AgentResult(
-                        task_id=task_id,
-                        success=False,
-                        output=f"Error: {e}",
-                        tokens_used=0,
-                        duration=0.0
-                    )
-
-                # Store result
-                with self._results_lock:
-                    self._results[task_id] = result
-
-                # Update status (task now complete)
-                with self._status_lock:
-                    self._active_tasks -= 1
-                    self._completed_tasks += 1
+        # Cancelled while queued: nothing to run.
+        if not handle.set_running_or_notify_cancel():
+            return
 
-                logger.info(f"Worker {worker_id} completed task {task_id} (success={result.success})")
+        # Update status (task now active)
+        with self._status_lock:
+            self._active_tasks += 1
 
-            except Exception as e:
-                logger.error(f"Worker {worker_id} error: {e}")
+        prompt = task_data["prompt"]
 
-        logger.debug(f"Worker {worker_id} stopped")
+        logger.info(f"Worker {worker_id} executing task {task_id} ({handle.agent_type})")
+
+        try:
+            # Execute agent
+            result = self._execute_agent(handle, prompt)
+
+            # Record token usage
+            self.token_tracker.record_usage(
+                agent_id=f"worker_{worker_id}",
+                tokens=result.tokens_used
+            )
+
+        except TimeoutError as e:
+            # Handle timeout
+            logger.warning(f"Task {task_id} timed out: {e}")
+            result = AgentResult(
+                task_id=task_id,
+                success=False,
+                output=f"Timeout: {e}",
+                tokens_used=0,
+                duration=0.0
+            )
+
+        except Exception as e:
+            # Handle unexpected errors
+            logger.error(f"Task {task_id} failed: {e}")
+            result = AgentResult(
+                task_id=task_id,
+                success=False,
+                output=f"Error: {e}",
+                tokens_used=0,
+                duration=0.0
+            )
+
+        # Update status (task now complete) before waking waiters, so a
+        # caller returning from await_all() sees consistent counters.
+        with self._status_lock:
+            self._active_tasks -= 1
+            self._completed_tasks += 1
+
+        handle.set_result(result)
+
+        logger.info(f"Worker {worker_id} completed task {task_id} (success={result.success})")
+
+    @staticmethod
+    def _result_of(handle: TaskHandle) -> AgentResult:
+        """Result of a finished handle; cancelled handles map to a failed result."""
+        if handle.cancelled():
+            return AgentResult(
+                task_id=handle.task_id,
+                success=False,
+                output="Cancelled: task was cancelled before it started",
+                tokens_used=0,
+                duration=0.0
+            )
+        return handle.result()
 
     def _execute_agent(self, handle: TaskHandle, prompt: str) -> AgentResult:
         """Execute agent task.
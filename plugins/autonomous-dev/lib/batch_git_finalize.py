@@ -176,6 +176,22 @@ def cleanup_worktree(worktree_path: Path) -> Tuple[bool, Optional[str], Optional
     return True, None, safe_cwd
 
 
+def _predict_conflicts(branch: str, repo: Path) -> Optional[Any]:
+    """merge_conflict_predictor result for merging branch into repo's HEAD.
+
+    Returns None when prediction is unavailable; the real merge then decides.
+    """
+    try:
+        try:
+            from merge_conflict_predictor import predict_merge_conflicts
+        except ImportError:
+            from .merge_conflict_predictor import predict_merge_conflicts  # type: ignore[no-redef]
+        return predict_merge_conflicts(branch, "HEAD", repo_root=repo)
+    except Exception as e:
+        logger.debug("Merge conflict prediction unavailable: %s", e)
+        return None
+
+
 def batch_git_finalize(
     worktree_path: Path,
     features: List[str],
@@ -302,6 +318,14 @@ def batch_git_finalize(
     )
     worktree_branch = branch_result.stdout.strip()
 
+    # Predict conflicts before touching the main repo: a conflicting merge is
+    # reported without the stash / merge / abort / stash-pop round trip.
+    prediction = _predict_conflicts(worktree_branch, main_repo)
+    if prediction is not None and prediction.ok and prediction.has_conflicts:
+        result["conflicts"] = prediction.conflicted_files
+        result["error"] = f"Merge conflict predicted (merge not attempted): {prediction.summary()}"
+        return result
+
     # Stash if needed
     stashed = False
     if auto_stash:
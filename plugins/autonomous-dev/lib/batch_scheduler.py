@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Batch Scheduler - Run independent batch features concurrently in DAG order.
+
+``/implement --batch`` stores ``feature_order`` and ``feature_dependencies``
+(feature_dependency_analyzer) in BatchState but still runs features one after
+another, so a batch takes the sum of all features even when the graph has no
+edges. BatchScheduler runs every feature whose dependencies are complete at
+the same time, up to ``width`` at once, each in its own worktree leased from a
+WorktreePool. Batch wall-clock then approaches the longest dependency chain.
+
+Scheduling:
+- A feature is ready when all of its dependencies completed (in this run or
+  an earlier session of the same batch)
+- Ready features start longest-remaining-chain first (critical path, weighted
+  by optional per-feature duration estimates), then in ``feature_order``
+- When a feature fails, every feature that depends on it (transitively) is
+  marked skipped with category "dependency"
+
+Completion funnel (one feature at a time, under a lock):
+- batch_git_finalize(worktree, [feature], cleanup=False): commit + merge into
+  the target branch, so dependents leased later branch from merged work
+- update_batch_progress(state_file, index, "completed" | "failed")
+- the worktree goes back to the pool
+
+Usage:
+    from batch_scheduler import BatchScheduler
+
+    def run_feature(index, feature, worktree):
+        ...  # run the pipeline for one feature inside ``worktree``
+        return {"success": True, "context_token_delta": 12000}
+
+    result = BatchScheduler(state_file, run_feature, width=3).run()
+    print(result.completed, result.failed, result.skipped)
+
+Environment Variables:
+- BATCH_PARALLEL_WIDTH: default width when none is passed (default: 1)
+
+Date: 2026-10-18
+Issue: #157 (Smart dependency ordering for /implement --batch)
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+try:
+    from batch_state_manager import (
+        BatchState,
+        compact_batch_journal,
+        load_batch_state,
+        mark_feature_skipped,
+        update_batch_progress,
+    )
+    from batch_git_finalize import batch_git_finalize
+    from env_utils import positive_int_from_env
+    from feature_dependency_analyzer import CircularDependencyError
+    from worktree_manager import WorktreePool
+except ImportError:
+    from .batch_state_manager import (  # type: ignore[no-redef]
+        BatchState,
+        compact_batch_journal,
+        load_batch_state,
+        mark_feature_skipped,
+        update_batch_progress,
+    )
+    from .batch_git_finalize import batch_git_finalize  # type: ignore[no-redef]
+    from .env_utils import positive_int_from_env  # type: ignore[no-redef]
+    from .feature_dependency_analyzer import CircularDependencyError  # type: ignore[no-redef]
+    from .worktree_manager import WorktreePool  # type: ignore[no-redef]
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+ENV_WIDTH = "BATCH_PARALLEL_WIDTH"
+DEFAULT_WIDTH = 1
+
+#: Signature of the per-feature runner: (index, feature, worktree) -> outcome dict
+#: with "success" (bool) and optional "error" (str) and "context_token_delta" (int).
+FeatureRunner = Callable[[int, str, Path], Dict[str, Any]]
+
+
+def width_from_env(default: int = DEFAULT_WIDTH) -> int:
+    """Parallel width from BATCH_PARALLEL_WIDTH (invalid values -> default)."""
+    return positive_int_from_env(ENV_WIDTH, default)
+
+
+# =============================================================================
+# Graph helpers
+# =============================================================================
+
+def _dependents(deps: Dict[int, List[int]], nodes: Iterable[int]) -> Dict[int, List[int]]:
+    nodes = set(nodes)
+    dependents: Dict[int, List[int]] = {n: [] for n in nodes}
+    for node, requires in deps.items():
+        if node not in nodes:
+            continue
+        for dep in requires:
+            if dep in nodes and dep != node:
+                dependents[dep].append(node)
+    return dependents
+
+
+def critical_path_lengths(
+    deps: Dict[int, List[int]],
+    nodes: Iterable[int],
+    weights: Optional[Dict[int, float]] = None,
+) -> Dict[int, float]:
+    """Length of the longest dependency chain starting at each node.
+
+    A node's value is its own weight plus the largest value among the
+    features that depend on it, so running high values first shortens the
+    batch's total wall-clock.
+
+    Args:
+        deps: Feature index -> indices it depends on
+        nodes: Feature indices to consider (others are ignored)
+        weights: Optional feature index -> estimated duration (default 1.0)
+
+    Returns:
+        Feature index -> chain length
+
+    Raises:
+        CircularDependencyError: If the graph among ``nodes`` has a cycle
+    """
+    nodes = sorted(set(nodes))
+    weights = weights or {}
+    dependents = _dependents(deps, nodes)
+    # Kahn's algorithm over the "dependent" edges, then fold in reverse order
+    pending = {n: 0 for n in nodes}
+    for children in dependents.values():
+        for child in children:
+            pending[child] += 1
+    queue = [n for n in nodes if pending[n] == 0]
+    order: List[int] = []
+    while queue:
+        node = queue.pop()
+        order.append(node)
+        for child in dependents[node]:
+            pending[child] -= 1
+            if pending[child] == 0:
+                queue.append(child)
+    if len(order) != len(nodes):
+        raise CircularDependencyError(
+            f"Circular dependency detected: {len(order)} of {len(nodes)} features ordered"
+        )
+    lengths: Dict[int, float] = {}
+    for node in reversed(order):
+        tail = max((lengths[c] for c in dependents[node]), default=0.0)
+        lengths[node] = float(weights.get(node, 1.0)) + tail
+    return lengths
+
+
+def normalize_dependencies(deps: Dict[Any, Iterable[Any]]) -> Dict[int, List[int]]:
+    """Integer-keyed copy of a dependency graph (JSON round-trips keys as strings)."""
+    return {int(k): [int(d) for d in v] for k, v in (deps or {}).items()}
+
+
+# =============================================================================
+# Results
+# =============================================================================
+
+@dataclass
+class FeatureRun:
+    """Outcome of one scheduled feature."""
+    index: int
+    success: bool
+    error: Optional[str] = None
+    worktree_path: Optional[str] = None
+    finalize: Dict[str, Any] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+
+
+@dataclass
+class ScheduleResult:
+    """Outcome of a scheduled batch run.
+
+    Attributes:
+        completed: Feature indices completed in this run
+        failed: Feature indices that failed in this run
+        skipped: Feature indices skipped because a dependency failed
+        started: Feature indices in the order they were started
+        runs: Per-feature details
+        wall_seconds: Elapsed time of the run
+        max_concurrency: Most features that ran at the same time
+    """
+    completed: List[int] = field(default_factory=list)
+    failed: List[int] = field(default_factory=list)
+    skipped: List[int] = field(default_factory=list)
+    started: List[int] = field(default_factory=list)
+    runs: Dict[int, FeatureRun] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+    max_concurrency: int = 0
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+class BatchScheduler:
+    """Runs a batch's pending features concurrently, respecting dependencies.
+
+    Attributes:
+        state_file: Batch state file (BatchState JSON)
+        run_feature: Per-feature runner (see FeatureRunner)
+        width: Maximum features running at once
+        target_branch: Branch features are leased from and merged into
+        finalize: Commit + merge each successful feature (batch_git_finalize)
+    """
+
+    def __init__(
+        self,
+        state_file: Path,
+        run_feature: FeatureRunner,
+        width: Optional[int] = None,
+        pool: Optional[WorktreePool] = None,
+        target_branch: str = "master",
+        finalize: bool = True,
+        weights: Optional[Dict[int, float]] = None,
+        repo_root: Optional[Path] = None,
+    ):
+        self.state_file = Path(state_file)
+        self.run_feature = run_feature
+        self.width = max(1, width if width is not None else width_from_env())
+        self.target_branch = target_branch
+        self.finalize = finalize
+        self.weights = weights or {}
+        self.pool = pool or WorktreePool(size=self.width, base_branch=target_branch, repo_root=repo_root)
+        self._funnel = threading.Lock()
+
+    # -- planning -------------------------------------------------------------
+
+    @staticmethod
+    def _finished(state: BatchState) -> Dict[str, Set[int]]:
+        return {
+            "completed": set(state.completed_features),
+            "failed": {f["feature_index"] for f in state.failed_features},
+            "skipped": {s["feature_index"] for s in state.skipped_features},
+        }
+
+    def ready_features(self, state: Optional[BatchState] = None, running: Iterable[int] = ()) -> List[int]:
+        """Pending features whose dependencies are all complete, highest priority first.
+
+        Usable on its own by prompt-driven batches to decide what may start next.
+        """
+        state = state or load_batch_state(self.state_file)
+        deps = normalize_dependencies(state.feature_dependencies)
+        finished = self._finished(state)
+        done = finished["completed"] | finished["failed"] | finished["skipped"] | set(running)
+        pending = [i for i in range(state.total_features) if i not in done]
+        ready = [i for i in pending if all(d in finished["completed"] for d in deps.get(i, []) if d != i)]
+        return sorted(ready, key=self._priority_key(state, pending))
+
+    def _priority_key(self, state: BatchState, pending: List[int]) -> Callable[[int], tuple]:
+        deps = normalize_dependencies(state.feature_dependencies)
+        lengths = critical_path_lengths(deps, pending, self.weights)
+        position = {index: n for n, index in enumerate(state.feature_order or range(state.total_features))}
+        return lambda i: (-lengths.get(i, 0.0), position.get(i, i))
+
+    # -- execution ------------------------------------------------------------
+
+    def _branch_name(self, state: BatchState, index: int) -> str:
+        return f"{state.batch_id}-f{index}"
+
+    def _execute(self, state: BatchState, index: int) -> FeatureRun:
+        feature = state.features[index]
+        start = time.monotonic()
+        run = FeatureRun(index=index, success=False)
+        ok, leased = self.pool.lease(self._branch_name(state, index), self.target_branch)
+        if not ok:
+            run.error = f"worktree lease failed: {leased}"
+            with self._funnel:
+                update_batch_progress(self.state_file, index, "failed", error_message=run.error)
+            run.duration_seconds = time.monotonic() - start
+            return run
+        run.worktree_path = str(leased)
+        token_delta = 0
+        try:
+            try:
+                outcome = self.run_feature(index, feature, Path(leased)) or {}
+            except Exception as e:
+                outcome = {"success": False, "error": f"{type(e).__name__}: {e}"}
+            token_delta = int(outcome.get("context_token_delta") or 0)
+            run.success = bool(outcome.get("success"))
+            run.error = outcome.get("error")
+
+            with self._funnel:
+                if run.success and self.finalize:
+                    issue = state.issue_numbers[index] if state.issue_numbers and index < len(state.issue_numbers) else None
+                    run.finalize = batch_git_finalize(
+                        Path(leased),
+                        [feature],
+                        issue_numbers=[issue] if issue is not None else None,
+                        target_branch=self.target_branch,
+                        cleanup=False,
+                    )
+                    if not run.finalize.get("success"):
+                        run.success = False
+                        run.error = f"finalize failed: {run.finalize.get('error')}"
+                update_batch_progress(
+                    self.state_file,
+                    index,
+                    "completed" if run.success else "failed",
+                    context_token_delta=token_delta,
+                    error_message=None if run.success else (run.error or "Unknown error"),
+                )
+        finally:
+            self.pool.release(Path(leased))
+            run.duration_seconds = time.monotonic() - start
+        return run
+
+    def _skip_dependents(self, state: BatchState, failed: int, result: ScheduleResult, started: Set[int]) -> None:
+        deps = normalize_dependencies(state.feature_dependencies)
+        blocked = [failed]
+        while blocked:
+            current = blocked.pop()
+            for index, requires in deps.items():
+                if current in requires and index not in started and index not in result.skipped:
+                    mark_feature_skipped(
+                        self.state_file,
+                        index,
+                        f"Dependency feature {current} did not complete",
+                        category="dependency",
+                    )
+                    result.skipped.append(index)
+                    blocked.append(index)
+
+    def run(self) -> ScheduleResult:
+        """Run every pending feature; returns when nothing more can start.
+
+        Raises:
+            CircularDependencyError: If the pending features' graph has a cycle
+        """
+        result = ScheduleResult()
+        wall_start = time.monotonic()
+        state = load_batch_state(self.state_file)
+        self.ready_features(state)  # Fail fast on cycles before leasing anything
+        self.pool.warm()
+
+        started: Set[int] = set()
+        running: Dict[Future, int] = {}
+        with ThreadPoolExecutor(max_workers=self.width, thread_name_prefix="batch-feature") as executor:
+            while True:
+                state = load_batch_state(self.state_file)
+                for index in self.ready_features(state, running=started):
+                    if len(running) >= self.width:
+                        break
+                    started.add(index)
+                    result.started.append(index)
+                    running[executor.submit(self._execute, state, index)] = index
+                result.max_concurrency = max(result.max_concurrency, len(running))
+                if not running:
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    try:
+                        run = future.result()
+                    except Exception as e:  # update_batch_progress/finalize raised
+                        run = FeatureRun(index=index, success=False, error=f"{type(e).__name__}: {e}")
+                    result.runs[index] = run
+                    if run.success:
+                        result.completed.append(index)
+                    else:
+                        result.failed.append(index)
+                        self._skip_dependents(load_batch_state(self.state_file), index, result, started)
+
+        # Fold journaled progress into the snapshot for readers that parse it directly
+        compact_batch_journal(self.state_file)
+        result.wall_seconds = time.monotonic() - wall_start
+        return result
@@ -15,6 +15,10 @@ Key Features:
 3. Atomic writes with file locking
 4. Security validations (CWE-22 path traversal, CWE-59 symlinks)
 5. Crash recovery and resume
+6. Append-only progress journal (.claude/batch_state.json.journal): progress
+   and retry updates append one fsynced line instead of rewriting the whole
+   state; load_batch_state() replays the journal over the snapshot and
+   compact_batch_journal() folds it back in
 
 State Structure:
     {
@@ -279,6 +283,9 @@ class BatchState:
     last_checkpoint_at: Optional[str] = None  # Timestamp of last checkpoint
     checkpoint_count: int = 0  # Number of checkpoints created
 
+    # Progress journal: sequence number of the last journal event folded into this state
+    journal_seq: int = 0
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return asdict(self)
@@ -900,6 +907,12 @@ def load_batch_state(state_file: Path | str) -> BatchState:
                 # JSON converts integer keys to strings, convert back to int
                 data['git_operations'] = {int(k): v for k, v in data['git_operations'].items()}
 
+            # Issue #157: Dependency graph keys are feature indices (JSON makes them strings)
+            if data.get('feature_dependencies'):
+                data['feature_dependencies'] = {
+                    int(k): [int(d) for d in v] for k, v in data['feature_dependencies'].items()
+                }
+
             # Compaction-resilience: workflow_mode and workflow_reminder (for backward compatibility)
             if 'workflow_mode' not in data:
                 data['workflow_mode'] = 'auto-implement'
@@ -918,6 +931,9 @@ def load_batch_state(state_file: Path | str) -> BatchState:
             # Create BatchState from data
             state = BatchState(**data)
 
+            # Apply progress events appended since the snapshot was written
+            _replay_journal(state_file, state)
+
             # Audit log
             audit_log("batch_state_load", "success", {
                 "batch_id": state.batch_id,
@@ -945,6 +961,243 @@ def load_batch_state(state_file: Path | str) -> BatchState:
                 raise BatchStateError(f"Failed to load batch state: {e}")
 
 
+# =============================================================================
+# Progress Journal
+# =============================================================================
+
+#: Journal events kept before update_batch_progress() folds them into the snapshot.
+#: Batches with at most this many features compact on every event, so their
+#: snapshot is always current for readers that parse it directly (hooks, jq).
+JOURNAL_COMPACT_EVERY = 32
+
+#: Bytes read from the end of the journal to find the last sequence number.
+_JOURNAL_TAIL_BYTES = 4096
+
+# Snapshot header cache: path -> (stat signature, header)
+_snapshot_headers: Dict[str, Any] = {}
+
+
+def _journal_path(state_file: Path) -> Path:
+    """Journal file next to the snapshot (batch_state.json -> batch_state.json.journal)."""
+    return state_file.with_name(state_file.name + ".journal")
+
+
+def _batch_key(batch_id: str, created_at: str) -> str:
+    """Identity of a batch, so a stale journal from an earlier batch is never replayed."""
+    return f"{batch_id}@{created_at}"
+
+
+def _resolve_state_file(state_file: Path | str) -> Path:
+    """Resolve and validate an existing state file path (same rules as load_batch_state)."""
+    state_file = Path(state_file)
+    if not state_file.is_absolute():
+        from path_utils import get_project_root
+        try:
+            state_file = get_project_root(use_cache=False) / state_file
+        except FileNotFoundError:
+            pass
+    try:
+        state_file = validate_path(state_file, "batch state file", allow_missing=False)
+    except ValueError as e:
+        raise BatchStateError(str(e))
+    if not state_file.exists():
+        raise BatchStateError(f"Batch state file not found: {state_file}")
+    return state_file
+
+
+def _snapshot_header(state_file: Path | str) -> Dict[str, Any]:
+    """Fields of the snapshot that journal appends need, cached per file version.
+
+    The snapshot is parsed only when its stat signature changes (after a
+    compaction or a full save), not on every progress update.
+
+    Returns:
+        Dict with path, total_features, batch (identity key) and journal_seq
+
+    Raises:
+        BatchStateError: If the snapshot is missing or unreadable
+    """
+    path = _resolve_state_file(state_file)
+    try:
+        st = path.stat()
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _snapshot_headers.get(str(path))
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with open(path, "r") as f:
+            data = json.load(f)
+        header = {
+            "path": path,
+            "total_features": int(data["total_features"]),
+            "batch": _batch_key(data.get("batch_id", ""), data.get("created_at", "")),
+            "journal_seq": int(data.get("journal_seq") or 0),
+        }
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise BatchStateError(f"Failed to load batch state: {e}")
+    _snapshot_headers[str(path)] = (signature, header)
+    return header
+
+
+def _read_journal(journal: Path) -> List[Dict[str, Any]]:
+    """All complete, well-formed journal lines (torn last line ignored)."""
+    try:
+        raw = journal.read_bytes()
+    except OSError:
+        return []
+    events = []
+    for line in raw.split(b"\n"):
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict) and isinstance(event.get("seq"), int):
+            events.append(event)
+    return events
+
+
+def _last_journal_seq(journal: Path, default: int) -> int:
+    """Highest sequence number in the journal, reading only its tail."""
+    try:
+        with open(journal, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - _JOURNAL_TAIL_BYTES))
+            tail = f.read()
+    except OSError:
+        return default
+    for line in reversed(tail.split(b"\n")):
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict) and isinstance(event.get("seq"), int):
+            return max(default, event["seq"])
+    return default
+
+
+def _append_journal_event(state_file: Path, header: Dict[str, Any], event: Dict[str, Any]) -> int:
+    """Append one fsynced event and compact when enough have accumulated.
+
+    Caller must hold the state file lock.
+
+    Returns:
+        Sequence number assigned to the event
+    """
+    path = header["path"]
+    journal = _journal_path(path)
+    seq = _last_journal_seq(journal, header["journal_seq"]) + 1
+    line = json.dumps({"seq": seq, "batch": header["batch"], **event}, separators=(",", ":")) + "\n"
+    try:
+        fd = os.open(str(journal), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, line.encode("utf-8"))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        raise BatchStateError(f"Failed to append batch journal: {e}")
+
+    pending = seq - header["journal_seq"]
+    if pending >= JOURNAL_COMPACT_EVERY or header["total_features"] <= JOURNAL_COMPACT_EVERY:
+        compact_batch_journal(path)
+    return seq
+
+
+def _mark_completed_if_done(state: BatchState) -> None:
+    """Set status="completed" once every feature is completed, failed or skipped.
+
+    With DAG-scheduled execution current_index can reach the end while earlier
+    features still run, and the last feature to be accounted for may be one
+    that is skipped rather than processed.
+    """
+    processed = (
+        set(state.completed_features)
+        | {f["feature_index"] for f in state.failed_features}
+        | {s["feature_index"] for s in state.skipped_features}
+    )
+    if state.current_index >= state.total_features and len(processed) >= state.total_features:
+        state.status = "completed"
+
+
+def _apply_journal_event(state: BatchState, event: Dict[str, Any]) -> None:
+    """Apply one journal event to a state (same effect the full rewrite used to have)."""
+    index = event.get("feature_index")
+    if not isinstance(index, int) or not 0 <= index < state.total_features:
+        return
+    op = event.get("op")
+    if op == "progress":
+        if event.get("status") == "completed":
+            if index not in state.completed_features:
+                state.completed_features.append(index)
+        elif event.get("status") == "failed":
+            state.failed_features.append({
+                "feature_index": index,
+                "error_message": event.get("error_message") or "Unknown error",
+                "timestamp": event.get("timestamp", ""),
+            })
+        state.context_token_estimate += int(event.get("token_delta") or 0)
+        # Track progress even with concurrent (out-of-order) updates
+        state.current_index = max(state.current_index, index + 1)
+        _mark_completed_if_done(state)
+    elif op == "retry":
+        state.retry_attempts[index] = state.retry_attempts.get(index, 0) + 1
+    else:
+        return
+    if event.get("timestamp"):
+        state.updated_at = event["timestamp"]
+
+
+def _replay_journal(state_file: Path, state: BatchState) -> None:
+    """Apply journal events newer than the snapshot to a freshly loaded state."""
+    key = _batch_key(state.batch_id, state.created_at)
+    for event in _read_journal(_journal_path(state_file)):
+        if event["seq"] <= state.journal_seq or event.get("batch") != key:
+            continue
+        _apply_journal_event(state, event)
+        state.journal_seq = event["seq"]
+
+
+def compact_batch_journal(state_file: Path | str) -> None:
+    """Fold the progress journal into the JSON snapshot.
+
+    Rewrites the snapshot with every journaled event applied, then replaces
+    the journal with a single marker carrying the last sequence number (so new
+    events keep increasing). Takes the state file lock (reentrant, so callers
+    may already hold it). A crash between the two steps is harmless:
+    events at or below the snapshot's journal_seq are skipped on replay.
+
+    Args:
+        state_file: Path to state file
+
+    Raises:
+        BatchStateError: If the snapshot cannot be loaded or saved
+    """
+    path = _resolve_state_file(state_file)
+    with _get_file_lock(path):
+        state = load_batch_state(path)
+        save_batch_state(path, state)
+
+        # The marker keeps the highest sequence number seen, so numbering stays
+        # monotonic even when a stale journal from an earlier batch is dropped.
+        journal = _journal_path(path)
+        events = _read_journal(journal)
+        marker_seq = max([state.journal_seq] + [e["seq"] for e in events])
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".batch_journal_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps({"seq": marker_seq, "op": "compacted"}, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, str(journal))
+        except OSError as e:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise BatchStateError(f"Failed to compact batch journal: {e}")
+
+
 # =============================================================================
 # State Updates
 # =============================================================================
@@ -990,45 +1243,29 @@ def update_batch_progress(
     # Convert to Path
     state_file_path = Path(state_file)
 
-    # Acquire file lock for atomic read-modify-write
-    # Using RLock (reentrant) so we can call load_batch_state/save_batch_state
-    # which also acquire the same lock
+    # Append one journal event instead of rewriting the whole state. The
+    # snapshot header (total_features, batch identity) is cached until the
+    # snapshot file changes, so the common path reads nothing else.
     lock = _get_file_lock(state_file_path)
     with lock:
-        # Load current state (lock is reentrant, so this is safe)
-        state = load_batch_state(state_file)
+        header = _snapshot_header(state_file_path)
 
         # Validate feature index
-        if feature_index < 0 or feature_index >= state.total_features:
-            raise BatchStateError(f"Invalid feature index: {feature_index} (total: {state.total_features})")
-
-        # Update state based on status
-        if status == "completed":
-            if feature_index not in state.completed_features:
-                state.completed_features.append(feature_index)
-        elif status == "failed":
-            failure_record = {
-                "feature_index": feature_index,
-                "error_message": error_message or "Unknown error",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-            }
-            state.failed_features.append(failure_record)
-        else:
+        if feature_index < 0 or feature_index >= header["total_features"]:
+            raise BatchStateError(f"Invalid feature index: {feature_index} (total: {header['total_features']})")
+        if status not in ("completed", "failed"):
             raise ValueError(f"Invalid status: {status} (must be 'completed' or 'failed')")
 
-        # Update context token estimate
-        state.context_token_estimate += context_token_delta
-
-        # Update current_index to max of (current, feature_index + 1)
-        # This ensures we track progress even with concurrent updates
-        state.current_index = max(state.current_index, feature_index + 1)
-
-        # Update status if all features processed
-        if state.current_index >= state.total_features:
-            state.status = "completed"
-
-        # Save updated state (lock is reentrant, so this is safe)
-        save_batch_state(state_file, state)
+        event: Dict[str, Any] = {
+            "op": "progress",
+            "feature_index": feature_index,
+            "status": status,
+            "token_delta": context_token_delta,
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+        }
+        if status == "failed":
+            event["error_message"] = error_message or "Unknown error"
+        _append_journal_event(state_file_path, header, event)
 
     # Issue #322: Auto-close GitHub issue after successful feature completion
     # This runs OUTSIDE the lock since it involves network calls that could be slow
@@ -1267,6 +1504,10 @@ def cleanup_batch_state(state_file: Path | str) -> None:
     lock = _get_file_lock(state_file)
     with lock:
         try:
+            journal = _journal_path(state_file)
+            if journal.exists():
+                journal.unlink()
+            _snapshot_headers.pop(str(state_file), None)
             if state_file.exists():
                 state_file.unlink()
                 audit_log("batch_state_cleanup", "success", {
@@ -1319,23 +1560,18 @@ def increment_retry_count(state_file: Path | str, feature_index: int) -> None:
     state_path = Path(state_file)
 
     with _get_file_lock(state_path):
-        # Load current state
-        state = load_batch_state(state_path)
-
-        # Increment retry count
-        current_count = state.retry_attempts.get(feature_index, 0)
-        state.retry_attempts[feature_index] = current_count + 1
-
-        # Update timestamp
-        state.updated_at = datetime.utcnow().isoformat() + "Z"
-
-        # Save updated state
-        save_batch_state(state_path, state)
+        # Append a journal event (replayed by load_batch_state)
+        header = _snapshot_header(state_path)
+        seq = _append_journal_event(state_path, header, {
+            "op": "retry",
+            "feature_index": feature_index,
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+        })
 
         # Audit log
         audit_log("retry_count_incremented", "info", {
             "feature_index": feature_index,
-            "new_count": state.retry_attempts[feature_index],
+            "journal_seq": seq,
         })
 
 
@@ -1522,6 +1758,7 @@ def mark_feature_skipped(
 
         # Add to skipped_features
         state.skipped_features.append(skip_record)
+        _mark_completed_if_done(state)
 
         # Update timestamp
         state.updated_at = datetime.utcnow().isoformat() + "Z"
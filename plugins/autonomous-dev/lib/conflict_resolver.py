@@ -18,7 +18,8 @@ Tier 2 (Conflict-Only): Uses AI for semantic understanding
 Tier 3 (Full-File): Comprehensive context analysis
     - Reads entire file for maximum context
     - Handles complex multi-conflict scenarios
-    - Chunks large files to respect API limits
+    - Large files are split into one window per conflict block (plus
+      surrounding context), resolved concurrently and spliced back
 
 Security Features:
 - Path traversal prevention (CWE-22)
@@ -60,12 +61,16 @@ Design Patterns:
     See library-design-patterns skill for standardized design patterns.
 """
 
+import hashlib
 import json
 import os
 import re
 import sys
 import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -78,6 +83,8 @@ from security_utils import validate_path, audit_log
 # Import session tracker for logging
 from session_tracker import SessionTracker
 
+from env_utils import positive_int_from_env
+
 # Try to import anthropic (optional dependency)
 try:
     import anthropic
@@ -453,65 +460,276 @@ def resolve_tier3_full_file(
     return suggestion
 
 
-def _resolve_chunked_file(
-    file_path: str,
-    content: str,
-    conflicts: List[ConflictBlock],
-    api_key: str,
-    warnings: List[str]
-) -> ResolutionSuggestion:
-    """Resolve large file by chunking (internal helper).
+# Chunked (windowed) resolution for large files
+CHUNK_CONTEXT_LINES = 20  # Lines of surrounding code sent with each conflict
+CHUNK_MAX_WORKERS = positive_int_from_env("CONFLICT_RESOLVER_WORKERS", 4)
+RESOLUTION_CACHE_SIZE = 256
+
+# (ours, theirs, base) hash -> (resolved_content, confidence, reasoning, warnings)
+_resolution_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_resolution_cache_lock = threading.Lock()
+
 
-    For very large files, we chunk them into manageable pieces while
-    ensuring conflict blocks stay intact.
+@dataclass
+class ConflictWindow:
+    """One conflict block plus the surrounding lines sent with it.
+
+    Attributes:
+        conflict: The conflict block to resolve
+        before: Context lines above the block (never another conflict)
+        after: Context lines below the block (never another conflict)
+        key: Cache key hashed from (ours, theirs, base)
     """
-    # For now, use simplified chunking: resolve each conflict with Tier 2
-    # and reassemble. Production implementation would use sliding window
-    # context to preserve locality.
+    conflict: ConflictBlock
+    before: str
+    after: str
+    key: str
 
-    if not ANTHROPIC_AVAILABLE:
-        raise ImportError(
-            "anthropic package required. Install with: pip install anthropic"
-        )
 
-    # For this implementation, just call API once with chunked content
-    # Real implementation would use multiple calls
-    client = Anthropic(api_key=api_key)
-    model = "claude-sonnet-4-5-20250929"
+def _resolution_key(conflict: ConflictBlock) -> str:
+    """Cache key for a conflict: SHA-256 of (ours, theirs, base)."""
+    payload = json.dumps(
+        [conflict.ours_content, conflict.theirs_content, conflict.base_content],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cached_resolution(key: str) -> Optional[tuple]:
+    with _resolution_cache_lock:
+        entry = _resolution_cache.get(key)
+        if entry is not None:
+            _resolution_cache.move_to_end(key)
+        return entry
+
+
+def _store_resolution(key: str, entry: tuple) -> None:
+    with _resolution_cache_lock:
+        _resolution_cache[key] = entry
+        _resolution_cache.move_to_end(key)
+        while len(_resolution_cache) > RESOLUTION_CACHE_SIZE:
+            _resolution_cache.popitem(last=False)
+
+
+def clear_resolution_cache() -> None:
+    """Drop all cached chunk resolutions (tests, or after a model change)."""
+    with _resolution_cache_lock:
+        _resolution_cache.clear()
 
-    # Build simplified prompt for chunked file
-    prompt = f"""Resolve all conflicts in this large file (chunked for API limits).
+
+def _build_conflict_windows(
+    lines: List[str],
+    conflicts: List[ConflictBlock],
+    context_lines: int = CHUNK_CONTEXT_LINES
+) -> List[ConflictWindow]:
+    """Build one window per conflict block.
+
+    Context is clipped at neighbouring conflict blocks so each window contains
+    exactly one set of conflict markers and can be resolved independently.
+    """
+    windows = []
+    ordered = sorted(conflicts, key=lambda c: c.start_line)
+    for index, conflict in enumerate(ordered):
+        floor = ordered[index - 1].end_line + 1 if index > 0 else 0
+        ceiling = ordered[index + 1].start_line if index + 1 < len(ordered) else len(lines)
+        before_start = max(floor, conflict.start_line - context_lines)
+        after_end = min(ceiling, conflict.end_line + 1 + context_lines)
+        windows.append(ConflictWindow(
+            conflict=conflict,
+            before="".join(lines[before_start:conflict.start_line]),
+            after="".join(lines[conflict.end_line + 1:after_end]),
+            key=_resolution_key(conflict),
+        ))
+    return windows
+
+
+def _build_window_prompt(file_path: str, window: ConflictWindow) -> str:
+    """Build prompt for resolving a single conflict window."""
+    conflict = window.conflict
+    base_section = ""
+    if conflict.base_content:
+        base_section = f"""
+**Base (Common Ancestor)**:
+```
+{conflict.base_content}
+```
+"""
+
+    prompt = f"""You are a merge conflict resolution assistant. Resolve ONE conflict from a large file.
 
 **File**: {file_path}
-**Conflicts**: {len(conflicts)}
+**Conflict Location**: Lines {conflict.start_line}-{conflict.end_line}
+
+**Code Before Conflict** (context only, do not repeat):
+```
+{window.before}```
+
+**Ours (HEAD)**:
+```
+{conflict.ours_content}
+```
+
+**Theirs (Merging Branch)**:
+```
+{conflict.theirs_content}
+```
+{base_section}
+**Code After Conflict** (context only, do not repeat):
+```
+{window.after}```
 
 Respond with JSON only:
 {{
-    "resolved_content": "complete file content with all conflicts resolved",
-    "confidence": 0.75,
-    "reasoning": "chunked resolution strategy",
-    "warnings": []
+    "resolved_content": "replacement for the conflict block only (no markers, no context lines)",
+    "confidence": 0.85,
+    "reasoning": "why you chose this resolution",
+    "warnings": ["optional warnings"]
 }}
+
+Guidelines:
+- confidence: 0.0-1.0 (use < 0.7 if uncertain)
+- Keep indentation consistent with the surrounding code
+- Preserve code intent from both sides when possible
 """
+    return prompt
+
+
+def _resolve_window(client, model: str, file_path: str, window: ConflictWindow) -> tuple:
+    """Resolve one window with the API; returns a cacheable result tuple."""
+    conflict = window.conflict
+    if conflict.ours_content == conflict.theirs_content:
+        return (conflict.ours_content, 1.0, "Identical changes on both sides", [])
 
     response = client.messages.create(
         model=model,
-        max_tokens=8192,
-        messages=[{"role": "user", "content": prompt}]
+        max_tokens=4096,
+        messages=[{"role": "user", "content": _build_window_prompt(file_path, window)}]
+    )
+    result = json.loads(response.content[0].text)
+    return (
+        result["resolved_content"],
+        float(result.get("confidence", 0.75)),
+        result.get("reasoning", ""),
+        list(result.get("warnings", [])),
     )
 
-    # Parse response
-    response_text = response.content[0].text
-    result = json.loads(response_text)
 
-    return ResolutionSuggestion(
-        resolved_content=result["resolved_content"],
-        confidence=result.get("confidence", 0.75),
-        reasoning=result.get("reasoning", "Chunked resolution"),
+def _splice_resolutions(lines: List[str], replacements: List[tuple]) -> str:
+    """Replace each (start_line, end_line, text) block in lines with text."""
+    output = []
+    cursor = 0
+    for start, end, text in sorted(replacements):
+        output.extend(lines[cursor:start])
+        if text:
+            # Keep the file's line ending after the block
+            ending = "\r\n" if lines[end].endswith("\r\n") else ("\n" if lines[end].endswith("\n") else "")
+            output.append(text.rstrip("\r\n") + ending)
+        cursor = end + 1
+    output.extend(lines[cursor:])
+    return "".join(output)
+
+
+def _resolve_chunked_file(
+    file_path: str,
+    content: str,
+    conflicts: List[ConflictBlock],
+    api_key: str,
+    warnings: List[str],
+    client=None,
+    max_workers: Optional[int] = None
+) -> ResolutionSuggestion:
+    """Resolve large file by chunking (internal helper).
+
+    Each conflict block becomes an independent window (the block plus up to
+    CHUNK_CONTEXT_LINES lines of surrounding code). Windows are resolved
+    concurrently with bounded parallelism, so request size and response size
+    depend on the conflict, not the file. Resolutions are cached by
+    (ours, theirs, base) hash; repeated conflicts are resolved once. The
+    results are spliced back into the original file content.
+
+    Args:
+        file_path: Path used in prompts and audit logs
+        content: Full conflicted file content
+        conflicts: Parsed conflict blocks of content
+        api_key: Anthropic API key
+        warnings: Warnings collected so far (chunking notice etc.)
+        client: Messages client to use instead of Anthropic(api_key) (tests)
+        max_workers: Parallel requests (default: CHUNK_MAX_WORKERS)
+
+    Returns:
+        ResolutionSuggestion with the complete resolved file; confidence is the
+        lowest window confidence
+
+    Raises:
+        ImportError: If anthropic is unavailable and no client was given
+        Exception: First window failure, after all windows have finished
+    """
+    if client is None:
+        if not ANTHROPIC_AVAILABLE:
+            raise ImportError(
+                "anthropic package required. Install with: pip install anthropic"
+            )
+        client = Anthropic(api_key=api_key)
+    model = "claude-sonnet-4-5-20250929"
+
+    lines = content.splitlines(keepends=True)
+    windows = _build_conflict_windows(lines, conflicts)
+
+    # One request per distinct uncached conflict
+    results = {}
+    pending = {}
+    for window in windows:
+        cached = _cached_resolution(window.key)
+        if cached is not None:
+            results[window.key] = cached
+        else:
+            pending.setdefault(window.key, window)
+    cache_hits = sum(1 for w in windows if w.key in results)
+
+    if pending:
+        workers = max(1, min(max_workers or CHUNK_MAX_WORKERS, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="conflict-window") as pool:
+            futures = {
+                key: pool.submit(_resolve_window, client, model, file_path, window)
+                for key, window in pending.items()
+            }
+        errors = []
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+                _store_resolution(key, results[key])
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            _audit_log_resolution(file_path, None, tier=3, success=False, error=str(errors[0]))
+            raise errors[0]
+
+    replacements = []
+    confidences = []
+    window_warnings = []
+    for window in windows:
+        resolved, confidence, _, extra = results[window.key]
+        replacements.append((window.conflict.start_line, window.conflict.end_line, resolved))
+        confidences.append(confidence)
+        window_warnings.extend(
+            f"Lines {window.conflict.start_line}-{window.conflict.end_line}: {w}" for w in extra
+        )
+
+    suggestion = ResolutionSuggestion(
+        resolved_content=_splice_resolutions(lines, replacements),
+        confidence=min(confidences) if confidences else 1.0,
+        reasoning=(
+            f"Chunked resolution: {len(windows)} conflict window(s), "
+            f"{len(pending)} resolved by API, {cache_hits} from cache"
+        ),
         tier_used=3,
-        warnings=warnings + result.get("warnings", [])
+        warnings=warnings + window_warnings
     )
 
+    _audit_log_resolution(file_path, suggestion, tier=3, success=True)
+
+    return suggestion
+
 
 def _build_tier3_prompt(file_path: str, content: str, conflicts: List[ConflictBlock]) -> str:
     """Build prompt for Tier 3 full-file resolution."""
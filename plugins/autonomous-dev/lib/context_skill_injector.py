@@ -11,6 +11,7 @@ Key Features:
 - <100ms latency requirement
 - Graceful degradation (missing skills don't block)
 - Reuses existing skill_loader.py infrastructure
+- Patterns compiled once per category; detection memoized per prompt
 
 Pattern Categories:
 - security: auth, token, password, JWT, encryption
@@ -33,7 +34,8 @@ Usage:
 
 import re
 import sys
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set
 
 # ============================================================================
 # Configuration
@@ -133,6 +135,10 @@ PATTERN_SKILL_MAP: Dict[str, List[str]] = {
     "architecture": ["architecture-patterns"],
 }
 
+# Prompts whose detection result is memoized (same prompt is re-dispatched
+# across retries and batch items)
+DETECTION_CACHE_SIZE = 512
+
 # Priority order for skill selection when limit exceeded
 PATTERN_PRIORITY = [
     "security",       # Security always first
@@ -155,6 +161,22 @@ PATTERN_PRIORITY = [
 # Pattern Detection
 # ============================================================================
 
+# One alternation regex per category: a single scan per category instead of
+# re.search() over every pattern string (which re-hits the re module cache).
+_COMPILED_PATTERNS = {
+    category: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    for category, patterns in CONTEXT_PATTERNS.items()
+}
+
+
+@lru_cache(maxsize=DETECTION_CACHE_SIZE)
+def _detect_patterns_cached(text: str) -> FrozenSet[str]:
+    """Memoized body of detect_context_patterns() (text already lowercased)."""
+    return frozenset(
+        category for category, regex in _COMPILED_PATTERNS.items() if regex.search(text)
+    )
+
+
 def detect_context_patterns(user_prompt: Optional[str]) -> Set[str]:
     """
     Detect context patterns in user prompt.
@@ -177,16 +199,7 @@ def detect_context_patterns(user_prompt: Optional[str]) -> Set[str]:
     if not user_prompt:
         return set()
 
-    text = user_prompt.lower()
-    detected = set()
-
-    for category, patterns in CONTEXT_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                detected.add(category)
-                break  # One match per category is enough
-
-    return detected
+    return set(_detect_patterns_cached(user_prompt.lower()))
 
 
 # ============================================================================
@@ -325,6 +338,27 @@ def get_skills_for_pattern(pattern: str) -> List[str]:
     return PATTERN_SKILL_MAP.get(pattern, [])
 
 
+def get_detection_cache_stats() -> Dict[str, int]:
+    """
+    Get pattern-detection cache counters.
+
+    Returns:
+        Dict with hits, misses, size and maxsize of the detection memo
+    """
+    info = _detect_patterns_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+    }
+
+
+def clear_detection_cache() -> None:
+    """Clear the pattern-detection memo (and its counters)."""
+    _detect_patterns_cached.cache_clear()
+
+
 # ============================================================================
 # CLI Entry Point
 # ============================================================================
@@ -12,6 +12,8 @@ Key Features:
 - Error handling with optional continuation
 - Timestamp preservation
 - Rollback support
+- Content-hash delta sync (only new or changed files are written)
+- Parallel copies with per-target bytes-written summaries
 
 Usage:
     from copy_system import CopySystem
@@ -26,6 +28,14 @@ Usage:
 
     copier.copy_all(progress_callback=progress)
 
+    # Delta sync (skip files whose content hash already matches)
+    summary = copier.delta_sync(protected_patterns=["*.env"])
+    print(f"Wrote {summary['bytes_written']} bytes, "
+          f"{summary['files_unchanged']} files unchanged")
+
+    # Fan out to many targets, hashing the source tree once
+    summaries = sync_to_targets(source_dir, [repo_a / ".claude", repo_b / ".claude"])
+
 Date: 2025-11-17
 Issue: GitHub #80 (Bootstrap overhaul - 100% file coverage)
 Agent: implementer
@@ -34,9 +44,14 @@ Design Patterns:
     See library-design-patterns skill for standardized design patterns.
 """
 
+import fnmatch
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterable
 
 # Security utilities for path validation and audit logging
 try:
@@ -44,12 +59,97 @@ try:
 except ImportError:
     from security_utils import validate_path, audit_log
 
+try:
+    from plugins.autonomous_dev.lib.file_discovery import FileDiscovery, compute_file_hash
+except ImportError:
+    from file_discovery import FileDiscovery, compute_file_hash
+
+
+# Default thread pool size for delta copies (I/O bound, so threads are enough)
+DEFAULT_COPY_WORKERS = 8
+
 
 class CopyError(Exception):
     """Exception raised during copy operations."""
     pass
 
 
+def compile_protected_matcher(
+    protected_files: Optional[Iterable[str]] = None,
+    protected_patterns: Optional[Iterable[str]] = None,
+) -> Callable[[str], bool]:
+    """Compile protected files and glob patterns into a single matcher.
+
+    All patterns are translated with fnmatch.translate() and joined into one
+    alternation regex, so each file is checked with one regex match instead
+    of one fnmatch call per pattern. Matching semantics are identical to
+    calling fnmatch.fnmatch() for each pattern.
+
+    Args:
+        protected_files: Exact relative paths (Unix-style) to protect
+        protected_patterns: Glob patterns for protected files
+
+    Returns:
+        Callable taking a relative path string and returning True if protected
+
+    Examples:
+        >>> is_protected = compile_protected_matcher(["PROJECT.md"], ["*.env"])
+        >>> is_protected("config/.env")
+        True
+    """
+    exact = frozenset(protected_files or [])
+    patterns = list(protected_patterns or [])
+
+    combined = None
+    if patterns:
+        combined = re.compile(
+            "|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in patterns)
+        )
+
+    def is_protected(relative_str: str) -> bool:
+        if relative_str in exact:
+            return True
+        if combined is None:
+            return False
+        return combined.match(os.path.normcase(relative_str)) is not None
+
+    return is_protected
+
+
+@dataclass
+class DeltaPlan:
+    """Result of comparing a source tree against a destination by content hash.
+
+    All paths are relative, Unix-style strings.
+
+    Attributes:
+        new_files: Files missing from the destination
+        changed_files: Files present in the destination with different content
+        unchanged_files: Files whose destination content hash already matches
+        protected_files: Existing destination files skipped as protected
+        source_hashes: SHA-256 per relative path for every hashed source file
+    """
+    new_files: List[str] = field(default_factory=list)
+    changed_files: List[str] = field(default_factory=list)
+    unchanged_files: List[str] = field(default_factory=list)
+    protected_files: List[str] = field(default_factory=list)
+    source_hashes: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def to_copy(self) -> List[str]:
+        """Files that must be written (new + changed)."""
+        return self.new_files + self.changed_files
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (without per-file hashes)."""
+        return {
+            "new_files": list(self.new_files),
+            "changed_files": list(self.changed_files),
+            "unchanged_files": list(self.unchanged_files),
+            "protected_files": list(self.protected_files),
+        }
+
+
 class CopySystem:
     """Intelligent file copying with structure preservation.
 
@@ -135,7 +235,8 @@ class CopySystem:
                 "errors": 0,
                 "error_list": [],
                 "skipped_files": [],
-                "backed_up_files": []
+                "backed_up_files": [],
+                "bytes_written": 48213
             }
 
         Raises:
@@ -150,9 +251,7 @@ class CopySystem:
 
         # Discover files if not provided
         if files is None:
-            from plugins.autonomous_dev.lib.file_discovery import FileDiscovery
-            discovery = FileDiscovery(self.source)
-            files = discovery.discover_all_files()
+            files = FileDiscovery(self.source).discover_all_files()
 
         # Create destination directory
         self.dest.mkdir(parents=True, exist_ok=True)
@@ -164,13 +263,11 @@ class CopySystem:
         errors = []
         skipped_files = []
         backed_up_files = []
+        bytes_written = 0
 
-        # Normalize protected files list
-        protected_set = set(protected_files or [])
-        protected_patterns_list = protected_patterns or []
+        # Compile protected files and patterns into one matcher
+        is_protected_path = compile_protected_matcher(protected_files, protected_patterns)
 
-        # Import fnmatch for pattern matching
-        import fnmatch
         from datetime import datetime
 
         for idx, file_path in enumerate(files, 1):
@@ -181,15 +278,7 @@ class CopySystem:
                 dest_path = self.dest / relative
 
                 # Check if file is protected
-                is_protected = False
-                if relative_str in protected_set:
-                    is_protected = True
-                else:
-                    # Check patterns
-                    for pattern in protected_patterns_list:
-                        if fnmatch.fnmatch(relative_str, pattern):
-                            is_protected = True
-                            break
+                is_protected = is_protected_path(relative_str)
 
                 # Handle protected files
                 if is_protected and dest_path.exists():
@@ -255,18 +344,7 @@ class CopySystem:
                                 f"Use overwrite=True to replace existing files"
                             )
 
-                # Create parent directories
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Security: Validate file path before copy (prevents CWE-22)
-                validate_path(file_path, purpose="plugin file")
-
-                # Copy file without following symlinks (prevents CWE-59)
-                shutil.copy2(file_path, dest_path, follow_symlinks=False)
-
-                # Set permissions
-                is_script = self._is_script(file_path)
-                self._set_permissions(dest_path, file_path, is_script)
+                bytes_written += self._copy_file(file_path, dest_path)
 
                 # Preserve timestamps if requested
                 if not preserve_timestamps:
@@ -297,9 +375,233 @@ class CopySystem:
             "errors": len(errors),
             "error_list": errors,
             "skipped_files": skipped_files,
-            "backed_up_files": backed_up_files
+            "backed_up_files": backed_up_files,
+            "bytes_written": bytes_written
+        }
+
+    def plan_delta(
+        self,
+        files: Optional[List[Path]] = None,
+        protected_files: Optional[List[str]] = None,
+        protected_patterns: Optional[List[str]] = None,
+        manifest: Optional[Dict[str, Any]] = None,
+    ) -> DeltaPlan:
+        """Compare source files against the destination by content hash.
+
+        A destination file whose size differs is classified as changed without
+        hashing it; only same-size files are hashed on both sides.
+
+        Args:
+            files: Source files to consider (absolute paths). If None, discovers all files.
+            protected_files: Relative paths to skip when they already exist
+            protected_patterns: Glob patterns to skip when they already exist
+            manifest: Optional FileDiscovery manifest whose "sha256" entries are
+                reused instead of re-hashing source files
+
+        Returns:
+            DeltaPlan classifying every file as new, changed, unchanged or protected
+
+        Raises:
+            CopyError: If source directory doesn't exist
+
+        Examples:
+            >>> plan = copier.plan_delta()
+            >>> print(f"{len(plan.to_copy)} to copy, {len(plan.unchanged_files)} unchanged")
+        """
+        if not self.source.exists():
+            raise CopyError(
+                f"Source directory not found: {self.source}\n"
+                f"Expected structure: plugins/autonomous-dev/"
+            )
+
+        if files is None:
+            files = FileDiscovery(self.source).discover_all_files()
+
+        known_hashes: Dict[str, str] = {}
+        if manifest:
+            known_hashes = {
+                entry["path"]: entry["sha256"]
+                for entry in manifest.get("files", [])
+                if "sha256" in entry
+            }
+
+        is_protected_path = compile_protected_matcher(protected_files, protected_patterns)
+        plan = DeltaPlan()
+
+        for file_path in files:
+            relative = file_path.relative_to(self.source)
+            relative_str = str(relative).replace("\\", "/")
+            dest_path = self.dest / relative
+
+            if not dest_path.exists():
+                plan.new_files.append(relative_str)
+                continue
+
+            if is_protected_path(relative_str):
+                plan.protected_files.append(relative_str)
+                continue
+
+            if dest_path.stat().st_size != file_path.stat().st_size:
+                plan.changed_files.append(relative_str)
+                continue
+
+            source_hash = known_hashes.get(relative_str) or compute_file_hash(file_path)
+            plan.source_hashes[relative_str] = source_hash
+
+            if compute_file_hash(dest_path) == source_hash:
+                plan.unchanged_files.append(relative_str)
+            else:
+                plan.changed_files.append(relative_str)
+
+        return plan
+
+    def copy_planned(
+        self,
+        plan: DeltaPlan,
+        max_workers: int = DEFAULT_COPY_WORKERS,
+        continue_on_error: bool = True,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Copy the new and changed files of a DeltaPlan in parallel.
+
+        Args:
+            plan: Plan produced by plan_delta()
+            max_workers: Thread pool size for concurrent copies
+            continue_on_error: Keep copying remaining files after an error
+            dry_run: Report what would be written without touching the destination
+
+        Returns:
+            Per-target summary:
+            {
+                "target": "/path/to/.claude",
+                "files_copied": 12,
+                "files_new": 2,
+                "files_updated": 10,
+                "files_unchanged": 240,
+                "files_skipped": 1,
+                "bytes_written": 48213,
+                "errors": 0,
+                "error_list": [],
+                "dry_run": False
+            }
+
+        Raises:
+            CopyError: If a copy fails and continue_on_error=False
+        """
+        to_copy = plan.to_copy
+        errors: List[str] = []
+        bytes_written = 0
+        files_copied = 0
+
+        if dry_run:
+            bytes_written = sum((self.source / rel).stat().st_size for rel in to_copy)
+            files_copied = len(to_copy)
+        elif to_copy:
+            self.dest.mkdir(parents=True, exist_ok=True)
+
+            def copy_one(relative_str: str) -> int:
+                return self._copy_file(self.source / relative_str, self.dest / relative_str)
+
+            workers = max(1, min(max_workers, len(to_copy)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {rel: executor.submit(copy_one, rel) for rel in to_copy}
+                for relative_str, future in futures.items():
+                    try:
+                        bytes_written += future.result()
+                        files_copied += 1
+                    except Exception as e:
+                        errors.append(f"Error copying {self.source / relative_str}: {e}")
+
+            if errors and not continue_on_error:
+                raise CopyError(errors[0])
+
+        summary = {
+            "target": str(self.dest),
+            "files_copied": files_copied,
+            "files_new": len(plan.new_files),
+            "files_updated": len(plan.changed_files),
+            "files_unchanged": len(plan.unchanged_files),
+            "files_skipped": len(plan.protected_files),
+            "bytes_written": bytes_written,
+            "errors": len(errors),
+            "error_list": errors,
+            "dry_run": dry_run,
         }
 
+        audit_log("copy_system", "delta_sync", {
+            k: v for k, v in summary.items() if k != "error_list"
+        })
+
+        return summary
+
+    def delta_sync(
+        self,
+        files: Optional[List[Path]] = None,
+        protected_files: Optional[List[str]] = None,
+        protected_patterns: Optional[List[str]] = None,
+        manifest: Optional[Dict[str, Any]] = None,
+        max_workers: int = DEFAULT_COPY_WORKERS,
+        continue_on_error: bool = True,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Copy only new or changed files, skipping unchanged files by hash.
+
+        Equivalent to plan_delta() followed by copy_planned().
+
+        Args:
+            files: Source files to consider (absolute paths). If None, discovers all files.
+            protected_files: Relative paths to skip when they already exist
+            protected_patterns: Glob patterns to skip when they already exist
+            manifest: Optional FileDiscovery manifest with precomputed hashes
+            max_workers: Thread pool size for concurrent copies
+            continue_on_error: Keep copying remaining files after an error
+            dry_run: Report what would be written without touching the destination
+
+        Returns:
+            Per-target summary (see copy_planned())
+
+        Examples:
+            >>> summary = copier.delta_sync()
+            >>> print(f"{summary['files_copied']} written, {summary['bytes_written']} bytes")
+        """
+        plan = self.plan_delta(
+            files=files,
+            protected_files=protected_files,
+            protected_patterns=protected_patterns,
+            manifest=manifest,
+        )
+        return self.copy_planned(
+            plan,
+            max_workers=max_workers,
+            continue_on_error=continue_on_error,
+            dry_run=dry_run,
+        )
+
+    def _copy_file(self, file_path: Path, dest_path: Path) -> int:
+        """Copy one file with path validation and permission handling.
+
+        Args:
+            file_path: Absolute source file path
+            dest_path: Absolute destination file path
+
+        Returns:
+            Number of bytes written
+        """
+        # Create parent directories
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Security: Validate file path before copy (prevents CWE-22)
+        validate_path(file_path, purpose="plugin file")
+
+        # Copy file without following symlinks (prevents CWE-59)
+        shutil.copy2(file_path, dest_path, follow_symlinks=False)
+
+        # Set permissions
+        is_script = self._is_script(file_path)
+        self._set_permissions(dest_path, file_path, is_script)
+
+        return dest_path.stat().st_size
+
     def _is_script(self, file_path: Path) -> bool:
         """Check if file is a script (should be executable).
 
@@ -369,3 +671,59 @@ def rollback(backup_dir: Path, dest_dir: Path) -> bool:
     except Exception as e:
         print(f"Rollback failed: {e}")
         return False
+
+
+def sync_to_targets(
+    source: Path,
+    targets: List[Path],
+    protected_files: Optional[List[str]] = None,
+    protected_patterns: Optional[List[str]] = None,
+    max_workers: int = DEFAULT_COPY_WORKERS,
+    dry_run: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """Delta-sync one source tree into many targets.
+
+    The source tree is discovered and hashed once; each target then only
+    hashes its own same-size files and copies what differs.
+
+    Args:
+        source: Source directory (e.g., plugins/autonomous-dev)
+        targets: Destination directories (e.g., <repo>/.claude for each repo)
+        protected_files: Relative paths to skip when they already exist
+        protected_patterns: Glob patterns to skip when they already exist
+        max_workers: Thread pool size for concurrent copies per target
+        dry_run: Report what would be written without touching any target
+
+    Returns:
+        Mapping of target path string to its per-target summary. A target that
+        fails validation gets {"target": ..., "errors": 1, "error_list": [...]}.
+
+    Examples:
+        >>> summaries = sync_to_targets(plugin_dir, [repo / ".claude" for repo in repos])
+        >>> for target, summary in summaries.items():
+        ...     print(f"{target}: {summary['bytes_written']} bytes")
+    """
+    discovery = FileDiscovery(source)
+    files = discovery.discover_all_files()
+    manifest = discovery.generate_manifest()
+
+    summaries: Dict[str, Dict[str, Any]] = {}
+    for target in targets:
+        try:
+            copier = CopySystem(source, target)
+            summaries[str(copier.dest)] = copier.delta_sync(
+                files=files,
+                protected_files=protected_files,
+                protected_patterns=protected_patterns,
+                manifest=manifest,
+                max_workers=max_workers,
+                dry_run=dry_run,
+            )
+        except (ValueError, CopyError, OSError) as e:
+            summaries[str(target)] = {
+                "target": str(target),
+                "errors": 1,
+                "error_list": [str(e)],
+            }
+
+    return summaries
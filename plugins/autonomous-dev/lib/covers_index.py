@@ -14,18 +14,32 @@ Usage:
     index = load_covers_index(Path("docs/covers_index.json"))
     affected = get_affected_docs(["plugins/autonomous-dev/lib/foo.py"], index)
     # -> ["docs/LIBRARIES.md", "docs/ARCHITECTURE-OVERVIEW.md"]
+
+    # Repeated sweeps: re-parse only docs whose mtime/size/hash changed
+    index = build_covers_index_cached(Path("docs"), Path(".claude/cache/covers_index_cache.json"))
 """
 
 from __future__ import annotations
 
 import fnmatch
+import hashlib
 import json
+import os
+import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import yaml
 
+COVERS_CACHE_VERSION = 1
+
+# A cached doc whose mtime is this close to the moment it was cached is
+# re-verified by content hash: an edit within the same mtime tick would
+# otherwise be invisible to the (mtime_ns, size) check.
+RACY_WINDOW_NS = 2_000_000_000
+
 
 def build_covers_index(docs_dir: Path) -> dict[str, list[str]]:
     """Build a mapping from source paths to doc files that cover them.
@@ -41,15 +55,86 @@ def build_covers_index(docs_dir: Path) -> dict[str, list[str]]:
         Dict mapping source paths (or patterns) to sorted lists of doc file
         relative paths, e.g. {"plugins/lib/": ["docs/LIBRARIES.md"]}.
     """
-    index: dict[str, list[str]] = {}
+    return _index_from_covers(
+        docs_dir.name,
+        [(md_file.name, _extract_covers(md_file)) for md_file in sorted(docs_dir.glob("*.md"))],
+    )
+
+
+def build_covers_index_cached(docs_dir: Path, cache_path: Path) -> dict[str, list[str]]:
+    """Build the covers index, re-parsing only docs that changed since the last call.
+
+    Each doc's ``(mtime_ns, size, sha256, covers)`` is persisted in
+    ``cache_path``. A doc whose mtime and size are unchanged is not read at
+    all; one whose stat changed but whose content hash did not is read but
+    not YAML-parsed. Cache read/write failures degrade to a full build.
+
+    Args:
+        docs_dir: Directory containing markdown documentation files.
+        cache_path: JSON file holding the per-doc cache.
+
+    Returns:
+        Same mapping as :func:`build_covers_index`.
+    """
+    cached = _load_docs_cache(cache_path, docs_dir)
+    now_ns = time.time_ns()
+    docs: dict[str, dict[str, Any]] = {}
+    changed = False
 
     for md_file in sorted(docs_dir.glob("*.md")):
-        covers = _extract_covers(md_file)
+        try:
+            st = md_file.stat()
+        except OSError:
+            continue
+        entry = cached.get(md_file.name)
+        if (
+            entry is not None
+            and entry.get("mtime_ns") == st.st_mtime_ns
+            and entry.get("size") == st.st_size
+            and entry.get("cached_ns", 0) - st.st_mtime_ns > RACY_WINDOW_NS
+        ):
+            docs[md_file.name] = entry
+            continue
+
+        try:
+            raw = md_file.read_bytes()
+        except OSError:
+            continue
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry is not None and entry.get("sha256") == digest:
+            covers = entry.get("covers", [])
+        else:
+            try:
+                covers = _parse_covers(raw.decode("utf-8"))
+            except UnicodeDecodeError:
+                covers = []
+        docs[md_file.name] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": digest,
+            "covers": covers,
+            "cached_ns": now_ns,
+        }
+        changed = True
+
+    if changed or docs.keys() != cached.keys():
+        _save_docs_cache(cache_path, docs_dir, docs)
+
+    return _index_from_covers(
+        docs_dir.name, [(name, entry["covers"]) for name, entry in sorted(docs.items())]
+    )
+
+
+def _index_from_covers(docs_dir_name: str, doc_covers: list[tuple[str, list[str]]]) -> dict[str, list[str]]:
+    """Invert per-doc covers lists into the source-path -> docs index."""
+    index: dict[str, list[str]] = {}
+
+    for doc_name, covers in doc_covers:
         if not covers:
             continue
 
         # Build relative path like "docs/FILENAME.md"
-        doc_rel = f"{docs_dir.name}/{md_file.name}"
+        doc_rel = f"{docs_dir_name}/{doc_name}"
 
         for source_path in covers:
             if source_path not in index:
@@ -78,6 +163,11 @@ def _extract_covers(md_file: Path) -> list[str]:
     except (OSError, UnicodeDecodeError):
         return []
 
+    return _parse_covers(content)
+
+
+def _parse_covers(content: str) -> list[str]:
+    """Extract the covers list from a markdown document's YAML frontmatter."""
     if not content.startswith("---"):
         return []
 
@@ -106,6 +196,55 @@ def _extract_covers(md_file: Path) -> list[str]:
     return [str(entry) for entry in covers if entry is not None]
 
 
+def _load_docs_cache(cache_path: Path, docs_dir: Path) -> dict[str, dict[str, Any]]:
+    """Load per-doc cache entries; empty on any mismatch or read failure."""
+    try:
+        data = json.loads(Path(cache_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != COVERS_CACHE_VERSION
+        or data.get("docs_dir") != str(Path(docs_dir).resolve())
+        or not isinstance(data.get("docs"), dict)
+    ):
+        return {}
+    return {
+        name: entry for name, entry in data["docs"].items()
+        if isinstance(entry, dict) and isinstance(entry.get("covers"), list)
+    }
+
+
+def _save_docs_cache(cache_path: Path, docs_dir: Path, docs: dict[str, dict[str, Any]]) -> None:
+    """Atomically write per-doc cache entries (best effort)."""
+    payload = {
+        "version": COVERS_CACHE_VERSION,
+        "docs_dir": str(Path(docs_dir).resolve()),
+        "docs": docs,
+    }
+    _atomic_write_json_best_effort(Path(cache_path), payload)
+
+
+def _atomic_write_json_best_effort(path: Path, payload: Any) -> None:
+    """Write JSON via tempfile + os.replace; swallow OS errors (caches only)."""
+    tmp_path: Optional[str] = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, sort_keys=True)
+        os.replace(tmp_path, path)
+        tmp_path = None
+    except OSError:
+        pass
+    finally:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
 def get_affected_docs(
     changed_files: list[str],
     index: dict[str, list[str]],
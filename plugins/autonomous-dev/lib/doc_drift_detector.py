@@ -12,22 +12,40 @@ Usage::
     for f in findings:
         print(f.doc_path, f.drift_type, f.description)
 
+Repeated sweeps are incremental: the covers index is cached per doc
+(:func:`covers_index.build_covers_index_cached`) and directory listings are
+cached per directory mtime under ``<project_root>/.claude/cache/``, so only
+docs and source directories that changed are re-read.
+
 Issue: #1098 (sub-issue #1 of umbrella #1075)
 Date: 2026-05-18
 """
 
 from __future__ import annotations
 
+import json
+import os
 import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
 
 # Import covers_index with fallback pattern
 try:
-    from plugins.autonomous_dev.lib.covers_index import build_covers_index
+    from plugins.autonomous_dev.lib.covers_index import (
+        RACY_WINDOW_NS,
+        _atomic_write_json_best_effort,
+        build_covers_index,
+        build_covers_index_cached,
+    )
 except ImportError:
-    from covers_index import build_covers_index  # type: ignore[no-redef]
+    from covers_index import (  # type: ignore[no-redef]
+        RACY_WINDOW_NS,
+        _atomic_write_json_best_effort,
+        build_covers_index,
+        build_covers_index_cached,
+    )
 
 
 # =============================================================================
@@ -83,13 +101,32 @@ _LIST_ITEM_PATTERN = re.compile(r"^[-*]\s+(.+)|^\d+\.\s+(.+)", re.MULTILINE)
 # Regex for Markdown headings
 _HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.+)", re.MULTILINE)
 
+# Directory segments never counted as artifacts (see _is_excluded)
+_EXCLUDED_PARTS: frozenset[str] = frozenset({
+    "__pycache__", ".pytest_cache", ".git", "node_modules",
+    "venv", ".venv", "env", ".tox", ".nox", "archived",
+    ".worktrees", "sessions", "site-packages",
+})
+
+# Sweep caches, relative to project_root
+COVERS_CACHE_RELPATH = ".claude/cache/covers_index_cache.json"
+DIR_CACHE_RELPATH = ".claude/cache/doc_drift_dirs.json"
+DIR_CACHE_VERSION = 1
+
+# Directory entry kinds stored in the listing cache. Symlinked directories
+# are listed but not descended into, matching Path.rglob().
+_KIND_FILE = "f"
+_KIND_DIR = "d"
+_KIND_DIR_LINK = "l"
+_KIND_OTHER = "o"
+
 
 # =============================================================================
 # Public API
 # =============================================================================
 
 
-def detect_doc_drift(project_root: Path) -> list[DocDriftFinding]:
+def detect_doc_drift(project_root: Path, use_cache: bool = True) -> list[DocDriftFinding]:
     """Sweep all docs with ``covers:`` frontmatter for count and enumeration drift.
 
     Entry point for the periodic-aggregation pass. Deterministic: same input
@@ -98,6 +135,8 @@ def detect_doc_drift(project_root: Path) -> list[DocDriftFinding]:
 
     Args:
         project_root: Absolute path to the repository root.
+        use_cache: Reuse and update the per-doc and per-directory caches under
+            ``.claude/cache/``. Findings are identical either way.
 
     Returns:
         Sorted list of DocDriftFinding instances, keyed by
@@ -109,10 +148,17 @@ def detect_doc_drift(project_root: Path) -> list[DocDriftFinding]:
 
     # Build covers index: source_path -> [doc_rel_path, ...]
     try:
-        covers_idx = build_covers_index(docs_dir)
+        if use_cache:
+            covers_idx = build_covers_index_cached(docs_dir, project_root / COVERS_CACHE_RELPATH)
+        else:
+            covers_idx = build_covers_index(docs_dir)
     except Exception:
         return []
 
+    # Listings are shared by every doc in the sweep, so overlapping covers
+    # entries walk each directory once.
+    dir_cache = _DirectoryCache(project_root, project_root / DIR_CACHE_RELPATH if use_cache else None)
+
     # Invert: doc_rel_path -> [source_paths]
     doc_to_sources: dict[str, list[str]] = {}
     for src, doc_list in sorted(covers_idx.items()):
@@ -126,12 +172,13 @@ def detect_doc_drift(project_root: Path) -> list[DocDriftFinding]:
             continue
         doc_rel_str = Path(doc_rel).as_posix()
         findings.extend(
-            _detect_count_mismatch(doc_abs, sources, project_root, doc_rel_str)
+            _detect_count_mismatch(doc_abs, sources, project_root, doc_rel_str, dir_cache)
         )
         findings.extend(
-            _detect_enumeration_drift(doc_abs, sources, project_root, doc_rel_str)
+            _detect_enumeration_drift(doc_abs, sources, project_root, doc_rel_str, dir_cache)
         )
 
+    dir_cache.save()
     return sorted(findings, key=lambda f: (f.doc_path, f.line_number or 0, f.drift_type))
 
 
@@ -140,7 +187,155 @@ def detect_doc_drift(project_root: Path) -> list[DocDriftFinding]:
 # =============================================================================
 
 
-def _count_artifacts(covers_paths: list[str], strategy: str, project_root: Path) -> int:
+class _DirectoryCache:
+    """Directory listings keyed by directory mtime, shared across one sweep.
+
+    A directory's mtime changes whenever an entry is added, removed or
+    renamed in it, so a listing whose recorded ``mtime_ns`` still matches is
+    reused without ``scandir``. Listings younger than
+    :data:`covers_index.RACY_WINDOW_NS` are not persisted, since a same-tick
+    change could leave the mtime unchanged. Derived counts and stem sets are
+    memoized for the rest of the sweep.
+
+    Args:
+        project_root: Repo root; cache keys are paths relative to it.
+        cache_path: Persistent JSON cache, or None for an in-memory cache.
+    """
+
+    def __init__(self, project_root: Path, cache_path: Optional[Path] = None):
+        self.project_root = project_root
+        self.cache_path = cache_path
+        self._stored: dict[str, dict[str, Any]] = self._load() if cache_path else {}
+        self._listings: dict[str, dict[str, str]] = {}
+        self._counts: dict[tuple[str, str], int] = {}
+        self._stems: dict[str, frozenset[str]] = {}
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != DIR_CACHE_VERSION
+            or data.get("project_root") != str(self.project_root.resolve())
+            or not isinstance(data.get("dirs"), dict)
+        ):
+            return {}
+        return data["dirs"]
+
+    def save(self) -> None:
+        """Persist listings (best effort) if anything was re-scanned."""
+        if self.cache_path is None or not self._dirty:
+            return
+        _atomic_write_json_best_effort(self.cache_path, {
+            "version": DIR_CACHE_VERSION,
+            "project_root": str(self.project_root.resolve()),
+            "dirs": self._stored,
+        })
+
+    def listing(self, directory: Path) -> dict[str, str]:
+        """Return ``{entry name: kind}`` for one directory."""
+        key = os.path.relpath(directory, self.project_root)
+        listing = self._listings.get(key)
+        if listing is not None:
+            return listing
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            listing = {}
+        else:
+            stored = self._stored.get(key)
+            if stored is not None and stored.get("mtime_ns") == mtime_ns:
+                listing = stored["entries"]
+            else:
+                listing = _scan_directory(directory)
+                if time.time_ns() - mtime_ns > RACY_WINDOW_NS:
+                    self._stored[key] = {"mtime_ns": mtime_ns, "entries": listing}
+                else:
+                    self._stored.pop(key, None)
+                self._dirty = True
+        self._listings[key] = listing
+        return listing
+
+    def walk(self, root: Path) -> Iterator[tuple[Path, dict[str, str]]]:
+        """Yield ``(directory, listing)`` for root and every non-excluded real subdirectory."""
+        if _is_excluded(root, self.project_root):
+            return
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            listing = self.listing(directory)
+            yield directory, listing
+            stack.extend(
+                directory / name for name, kind in sorted(listing.items(), reverse=True)
+                if kind == _KIND_DIR and name not in _EXCLUDED_PARTS
+            )
+
+    def count(self, directory: Path, strategy: str) -> int:
+        """Count artifacts under one covered directory (see :func:`_count_artifacts`)."""
+        key = (os.path.relpath(directory, self.project_root), strategy)
+        if key in self._counts:
+            return self._counts[key]
+        total = 0
+        if strategy in ("py", "md"):
+            suffix = f".{strategy}"
+            for _, listing in self.walk(directory):
+                total += sum(
+                    1 for name in listing
+                    if name.endswith(suffix) and name not in _EXCLUDED_PARTS
+                )
+        elif strategy == "dirs" and not _is_excluded(directory, self.project_root):
+            total = sum(
+                1 for name, kind in self.listing(directory).items()
+                if kind in (_KIND_DIR, _KIND_DIR_LINK) and name not in _EXCLUDED_PARTS
+            )
+        self._counts[key] = total
+        return total
+
+    def stems(self, directory: Path) -> frozenset[str]:
+        """Lower-cased stems of every non-excluded file under one covered directory."""
+        key = os.path.relpath(directory, self.project_root)
+        if key not in self._stems:
+            self._stems[key] = frozenset(
+                Path(name).stem.lower()
+                for _, listing in self.walk(directory)
+                for name, kind in listing.items()
+                if kind == _KIND_FILE and name not in _EXCLUDED_PARTS
+            )
+        return self._stems[key]
+
+
+def _scan_directory(directory: Path) -> dict[str, str]:
+    """List one directory as ``{entry name: kind}`` (empty on error)."""
+    listing: dict[str, str] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        kind = _KIND_DIR
+                    elif entry.is_dir():
+                        kind = _KIND_DIR_LINK
+                    elif entry.is_file():
+                        kind = _KIND_FILE
+                    else:
+                        kind = _KIND_OTHER
+                except OSError:
+                    kind = _KIND_OTHER
+                listing[entry.name] = kind
+    except OSError:
+        return {}
+    return listing
+
+
+def _count_artifacts(
+    covers_paths: list[str],
+    strategy: str,
+    project_root: Path,
+    dir_cache: Optional[_DirectoryCache] = None,
+) -> int:
     """Count actual artifacts under the covered paths using the given strategy.
 
     Args:
@@ -148,23 +343,18 @@ def _count_artifacts(covers_paths: list[str], strategy: str, project_root: Path)
         strategy: One of "py" (count .py files), "md" (count .md files),
             "dirs" (count immediate subdirectories).
         project_root: Repo root for resolving relative paths.
+        dir_cache: Sweep-wide listing cache (an in-memory one is used if None).
 
     Returns:
         Total count of matching artifacts.
     """
+    if dir_cache is None:
+        dir_cache = _DirectoryCache(project_root)
     total = 0
     for cp in sorted(covers_paths):
         abs_path = project_root / cp
         if abs_path.is_dir():
-            if strategy == "py":
-                total += sum(1 for _ in abs_path.rglob("*.py")
-                             if not _is_excluded(_, project_root))
-            elif strategy == "md":
-                total += sum(1 for _ in abs_path.rglob("*.md")
-                             if not _is_excluded(_, project_root))
-            elif strategy == "dirs":
-                total += sum(1 for _ in abs_path.iterdir() if _.is_dir()
-                             and not _is_excluded(_, project_root))
+            total += dir_cache.count(abs_path, strategy)
         elif abs_path.is_file():
             if strategy == "py" and abs_path.suffix == ".py":
                 total += 1
@@ -176,14 +366,9 @@ def _count_artifacts(covers_paths: list[str], strategy: str, project_root: Path)
 
 def _is_excluded(path: Path, project_root: Path) -> bool:
     """Return True if path contains an excluded directory segment."""
-    _EXCLUDED = {
-        "__pycache__", ".pytest_cache", ".git", "node_modules",
-        "venv", ".venv", "env", ".tox", ".nox", "archived",
-        ".worktrees", "sessions", "site-packages",
-    }
     try:
         rel = path.relative_to(project_root)
-        return any(part in _EXCLUDED for part in rel.parts)
+        return any(part in _EXCLUDED_PARTS for part in rel.parts)
     except ValueError:
         return False
 
@@ -209,6 +394,7 @@ def _detect_count_mismatch(
     covers_paths: list[str],
     project_root: Path,
     doc_rel_str: str,
+    dir_cache: Optional[_DirectoryCache] = None,
 ) -> list[DocDriftFinding]:
     """Detect count claims in doc that disagree with actual artifact counts.
 
@@ -220,10 +406,13 @@ def _detect_count_mismatch(
         covers_paths: Source paths from the doc's covers frontmatter.
         project_root: Repo root for resolving relative paths.
         doc_rel_str: Repo-relative POSIX string for doc_path.
+        dir_cache: Sweep-wide listing cache (an in-memory one is used if None).
 
     Returns:
         List of DocDriftFinding for each count mismatch found.
     """
+    if dir_cache is None:
+        dir_cache = _DirectoryCache(project_root)
     try:
         content = doc_path.read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError):
@@ -239,7 +428,7 @@ def _detect_count_mismatch(
             strategy = _KEYWORD_STRATEGY.get(keyword)
             if strategy is None:
                 continue
-            actual_count = _count_artifacts(covers_paths, strategy, project_root)
+            actual_count = _count_artifacts(covers_paths, strategy, project_root, dir_cache)
             diff = abs(claimed_count - actual_count)
             if diff == 0:
                 continue
@@ -266,6 +455,7 @@ def _detect_enumeration_drift(
     covers_paths: list[str],
     project_root: Path,
     doc_rel_str: str,
+    dir_cache: Optional[_DirectoryCache] = None,
 ) -> list[DocDriftFinding]:
     """Detect list items in doc that reference non-existent source artifacts.
 
@@ -278,11 +468,14 @@ def _detect_enumeration_drift(
         covers_paths: Source paths from the doc's covers frontmatter.
         project_root: Repo root for resolving relative paths.
         doc_rel_str: Repo-relative POSIX string for doc_path.
+        dir_cache: Sweep-wide listing cache (an in-memory one is used if None).
 
     Returns:
         List of DocDriftFinding for each enumeration item that has no
         corresponding source artifact.
     """
+    if dir_cache is None:
+        dir_cache = _DirectoryCache(project_root)
     try:
         content = doc_path.read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError):
@@ -295,9 +488,7 @@ def _detect_enumeration_drift(
     for cp in covers_paths:
         abs_cp = project_root / cp
         if abs_cp.is_dir():
-            for f in sorted(abs_cp.rglob("*")):
-                if f.is_file() and not _is_excluded(f, project_root):
-                    all_stems.add(f.stem.lower())
+            all_stems.update(dir_cache.stems(abs_cp))
         elif abs_cp.is_file():
             all_stems.add(abs_cp.stem.lower())
 
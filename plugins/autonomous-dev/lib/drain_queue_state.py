@@ -5,7 +5,8 @@ Provides four state primitives stored under ``<repo_root>/.claude/local/``:
 * :class:`DrainBudget` — daily drain-count + wall-clock cap (UTC).
 * :class:`CircuitBreaker` — pause on consecutive or rolling-window failures.
 * :class:`PauseFlag` — operator/system-set pause sentinel with deadline body.
-* :class:`DrainHistory` — append-only JSONL outcome log.
+* :class:`DrainHistory` — append-only JSONL outcome log with a rebuildable
+  SQLite offset index (``drain_log.index.db``) for filtered and tail reads.
 
 Atomic writes delegate to :func:`pipeline_state._atomic_write_json`. All path
 operations route through :func:`pause_controller.validate_pause_path` to apply
@@ -27,11 +28,14 @@ their values to prevent silent drift.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     # Normal package-style import (preferred when invoked from production code).
@@ -74,6 +78,10 @@ AUTO_DRAINABLE_SEVERITY: frozenset[str] = frozenset({"low", "info", "medium"})
 # applied autonomously" — the autonomy decision is confidence, not severity.
 AUTO_DRAINABLE_CONFIDENCE_THRESHOLD: float = 0.80
 
+# DrainHistory index: SQLite busy timeout and backward-read block size.
+HISTORY_INDEX_BUSY_TIMEOUT_MS: int = 5000
+HISTORY_REVERSE_BLOCK_BYTES: int = 64 * 1024
+
 
 # =============================================================================
 # Path helpers
@@ -107,6 +115,10 @@ def _history_path(repo_root: Path) -> Path:
     return _drain_local_dir(repo_root) / "drain_log.jsonl"
 
 
+def _history_index_path(repo_root: Path) -> Path:
+    return _drain_local_dir(repo_root) / "drain_log.index.db"
+
+
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -583,6 +595,14 @@ class DrainHistory:
     Optional fields for pytest metrics (Issue #1290):
     - ``before_metrics``: dict shaped ``{test_count: int, coverage_pct: float, failing_tests: list[str]}``
     - ``after_metrics``: same shape as before_metrics
+
+    Index: ``<repo_root>/.claude/local/drain_log.index.db`` maps each record's
+    byte offset to its ``outcome``, ``revert_status`` and parsed ``timestamp``.
+    The JSONL stays the source of truth — :meth:`append` never touches the
+    index. Readers catch the index up by parsing only the bytes appended since
+    the last sync, and rebuild it from scratch when the log was replaced
+    (new inode), truncated, or rewritten under the last indexed record. If
+    the index cannot be opened, :meth:`query` falls back to a full scan.
     """
 
     repo_root: Path
@@ -634,16 +654,280 @@ class DrainHistory:
             return []
         return out
 
+    def iter_reverse(self) -> Iterator[Dict[str, Any]]:
+        """Yield well-formed records newest first.
+
+        Reads the log backwards in :data:`HISTORY_REVERSE_BLOCK_BYTES` blocks,
+        so callers that stop early (e.g. "last N outcomes") never read the
+        older part of the file.
+        """
+        path = _history_path(self.repo_root)
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return
+        with f:
+            pos = f.seek(0, os.SEEK_END)
+            carry = b""
+            while pos > 0:
+                step = min(HISTORY_REVERSE_BLOCK_BYTES, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + carry).split(b"\n")
+                carry = lines[0]  # may continue in the previous block
+                for raw in reversed(lines[1:]):
+                    rec = _decode_history_line(raw)
+                    if rec is not None:
+                        yield rec
+            rec = _decode_history_line(carry)
+            if rec is not None:
+                yield rec
+
+    def since(self, ts: Union[datetime, str]) -> List[Dict[str, Any]]:
+        """Return records whose ``timestamp`` is at or after ``ts``, oldest first.
+
+        Records without a parseable timestamp are excluded.
+
+        Raises:
+            ValueError: If ``ts`` is not a datetime or ISO-8601 string.
+        """
+        return self.query(since=ts)
+
+    def query(
+        self,
+        outcome: Optional[str] = None,
+        revert_status: Optional[str] = None,
+        since: Optional[Union[datetime, str]] = None,
+        newest_first: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return records matching every given filter via the offset index.
+
+        Args:
+            outcome: Match ``record["outcome"]`` exactly.
+            revert_status: Match ``record["revert_status"]`` exactly.
+            since: Keep records timestamped at or after this instant.
+            newest_first: Return in reverse log order.
+            limit: Maximum number of records to return.
+
+        Returns:
+            Matching records, in log order unless ``newest_first``.
+
+        Raises:
+            ValueError: If ``since`` is not a datetime or ISO-8601 string.
+        """
+        since_epoch = None
+        if since is not None:
+            since_dt = since if isinstance(since, datetime) else _parse_iso(since)
+            if since_dt is None:
+                raise ValueError(f"invalid since timestamp: {since!r}")
+            if since_dt.tzinfo is None:
+                since_dt = since_dt.replace(tzinfo=timezone.utc)
+            since_epoch = since_dt.timestamp()
+
+        try:
+            return self._query_index(outcome, revert_status, since_epoch, newest_first, limit)
+        except (OSError, sqlite3.Error):
+            pass
+
+        # Fallback: index unavailable (read-only dir, corrupt db) → full scan.
+        out = []
+        records = self.read_all()
+        if newest_first:
+            records.reverse()
+        for rec in records:
+            if outcome is not None and rec.get("outcome") != outcome:
+                continue
+            if revert_status is not None and rec.get("revert_status") != revert_status:
+                continue
+            if since_epoch is not None:
+                rec_dt = _parse_iso(rec.get("timestamp"))
+                if rec_dt is None or rec_dt.timestamp() < since_epoch:
+                    continue
+            out.append(rec)
+            if limit is not None and len(out) >= limit:
+                break
+        return out
+
+    def rebuild_index(self) -> int:
+        """Discard the index and rebuild it from the JSONL. Returns records indexed."""
+        conn = self._open_index()
+        try:
+            return self._sync_index(conn, force=True)
+        finally:
+            conn.close()
+
+    def _open_index(self) -> sqlite3.Connection:
+        index_path = _history_index_path(self.repo_root)
+        if not index_path.exists():
+            os.close(os.open(str(index_path), os.O_CREAT | os.O_WRONLY, 0o600))
+        conn = sqlite3.connect(
+            str(index_path),
+            timeout=HISTORY_INDEX_BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+        )
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {HISTORY_INDEX_BUSY_TIMEOUT_MS}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "offset INTEGER PRIMARY KEY, length INTEGER NOT NULL, "
+                "ts REAL, outcome TEXT, revert_status TEXT)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS records_status "
+                "ON records(outcome, revert_status)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS records_ts ON records(ts)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _sync_index(self, conn: sqlite3.Connection, force: bool = False) -> int:
+        """Index records appended since the last sync; rebuild if the log changed.
+
+        Returns:
+            Number of records in the index after syncing.
+        """
+        path = _history_path(self.repo_root)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            try:
+                st = os.stat(path)
+                identity, size = f"{st.st_dev}:{st.st_ino}", st.st_size
+            except FileNotFoundError:
+                identity, size = "", 0
+
+            indexed = int(meta.get("indexed_bytes", 0))
+            stale = (
+                force
+                or meta.get("identity") != identity
+                or size < indexed
+                or not self._tail_matches(path, meta)
+            )
+            if stale:
+                conn.execute("DELETE FROM records")
+                indexed, meta = 0, {}
+
+            last = (meta.get("last_offset"), meta.get("last_hash"))
+            if size > indexed:
+                rows = []
+                with open(path, "rb") as f:
+                    f.seek(indexed)
+                    offset = indexed
+                    for raw in f:
+                        if not raw.endswith(b"\n"):
+                            break  # partial line still being written
+                        rec = _decode_history_line(raw)
+                        if rec is not None:
+                            rec_dt = _parse_iso(rec.get("timestamp"))
+                            rows.append((
+                                offset,
+                                len(raw),
+                                rec_dt.timestamp() if rec_dt else None,
+                                _index_text(rec.get("outcome")),
+                                _index_text(rec.get("revert_status")),
+                            ))
+                            last = (str(offset), hashlib.sha256(raw).hexdigest())
+                        offset += len(raw)
+                conn.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)", rows)
+                indexed = offset
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)",
+                [
+                    ("identity", identity),
+                    ("indexed_bytes", str(indexed)),
+                    ("last_offset", last[0] or ""),
+                    ("last_hash", last[1] or ""),
+                ],
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM records").fetchone()
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return count
+
+    @staticmethod
+    def _tail_matches(path: Path, meta: Dict[str, str]) -> bool:
+        """True when the last indexed record is still byte-identical in the log."""
+        if not meta.get("last_offset"):
+            return True
+        try:
+            with open(path, "rb") as f:
+                f.seek(int(meta["last_offset"]))
+                raw = f.readline()
+        except (OSError, ValueError):
+            return False
+        return hashlib.sha256(raw).hexdigest() == meta.get("last_hash")
+
+    def _query_index(
+        self,
+        outcome: Optional[str],
+        revert_status: Optional[str],
+        since_epoch: Optional[float],
+        newest_first: bool,
+        limit: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        conn = self._open_index()
+        try:
+            self._sync_index(conn)
+            clauses, params = [], []
+            if outcome is not None:
+                clauses.append("outcome = ?")
+                params.append(outcome)
+            if revert_status is not None:
+                clauses.append("revert_status = ?")
+                params.append(revert_status)
+            if since_epoch is not None:
+                clauses.append("ts >= ?")
+                params.append(since_epoch)
+            sql = "SELECT offset, length FROM records"
+            if clauses:
+                sql += " WHERE " + " AND ".join(clauses)
+            sql += " ORDER BY offset DESC" if newest_first else " ORDER BY offset"
+            if limit is not None:
+                sql += " LIMIT ?"
+                params.append(int(limit))
+            locations = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+        out: List[Dict[str, Any]] = []
+        if not locations:
+            return out
+        with open(_history_path(self.repo_root), "rb") as f:
+            for offset, length in locations:
+                f.seek(offset)
+                rec = _decode_history_line(f.read(length))
+                if rec is not None:
+                    out.append(rec)
+        return out
+
     @classmethod
     def latest_pending_reverts(cls, repo_root: Path) -> List[Dict[str, Any]]:
         """Return records with outcome=success and revert_status=pending."""
-        history = cls.load(repo_root)
-        records = history.read_all()
-        return [
-            rec for rec in records
-            if rec.get("outcome") == "success"
-            and rec.get("revert_status") == "pending"
-        ]
+        return cls.load(repo_root).query(outcome="success", revert_status="pending")
+
+
+def _decode_history_line(raw: bytes) -> Optional[Dict[str, Any]]:
+    """Decode one JSONL line; None for blank, malformed, or non-object lines."""
+    raw = raw.strip()
+    if not raw:
+        return None
+    try:
+        rec = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError, ValueError):
+        return None
+    return rec if isinstance(rec, dict) else None
+
+
+def _index_text(value: Any) -> Optional[str]:
+    """Indexable form of a filter field: strings only (exact-match semantics)."""
+    return value if isinstance(value, str) else None
 
 
 # =============================================================================
@@ -834,6 +1118,8 @@ __all__ = [
     "HUMAN_GATE_TAGS",
     "AUTO_DRAINABLE_SEVERITY",
     "AUTO_DRAINABLE_CONFIDENCE_THRESHOLD",
+    "HISTORY_INDEX_BUSY_TIMEOUT_MS",
+    "HISTORY_REVERSE_BLOCK_BYTES",
     "SKIP_LABELS",
     # Classes
     "DrainBudget",
@@ -854,4 +1140,5 @@ __all__ = [
     "_breaker_path",
     "_pause_flag_path",
     "_history_path",
+    "_history_index_path",
 ]
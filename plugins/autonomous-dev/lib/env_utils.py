@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Environment Utilities - Tolerant parsing of numeric tuning knobs
+
+Worker counts, chunk sizes and shard counts are read from environment
+variables at import or call time. A malformed value must never crash the
+importing module, so parsing falls back to the caller's default.
+
+Usage:
+    from env_utils import positive_int_from_env
+
+    WORKERS = positive_int_from_env("CONFLICT_RESOLVER_WORKERS", 4)
+"""
+
+import os
+
+
+def positive_int_from_env(name: str, default: int) -> int:
+    """Positive integer from environment variable ``name``.
+
+    Unset or non-integer values return ``default``; integers below 1 are
+    clamped to 1.
+
+    Args:
+        name: Environment variable to read
+        default: Value used when the variable is unset or not an integer
+
+    Returns:
+        Parsed value (at least 1), or ``default``
+    """
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
@@ -11,6 +11,7 @@ Key Features:
 3. Stack trace extraction for debugging
 4. Test name extraction from pytest format
 5. Graceful handling of malformed/empty output
+6. Structured input: pytest_results JSON records (no output scan needed)
 
 Error Type Classification:
     - syntax: SyntaxError, IndentationError, invalid syntax
@@ -34,6 +35,9 @@ Usage:
         print(f"Error: {failure.error_type} at {failure.file_path}:{failure.line_number}")
         print(f"Message: {failure.error_message}")
 
+    # Or from pytest_results records (RunSummary.failures)
+    failures = analyzer.parse_results(summary.failures)
+
 Security:
 - No arbitrary code execution
 - Safe regex parsing
@@ -49,7 +53,7 @@ See error-handling-patterns skill for exception hierarchy and error handling bes
 
 import re
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Any, Dict, Iterable, List, Tuple, Optional
 
 
 # =============================================================================
@@ -145,6 +149,39 @@ class FailureAnalyzer:
 
         return failures
 
+    def parse_results(self, records: Iterable[Dict[str, Any]]) -> List[FailureAnalysis]:
+        """
+        Build failures from pytest_results records instead of scanning output.
+
+        Args:
+            records: Failed/errored test and collection records
+                (e.g. RunSummary.failures)
+
+        Returns:
+            List of FailureAnalysis objects, one per record
+        """
+        failures = []
+        for record in records:
+            if record.get("outcome") not in ("failed", "error"):
+                continue
+            block = str(record.get("longrepr") or "")
+            crash = record.get("crash") or {}
+            if crash.get("path"):
+                file_path, line_number = str(crash["path"]), int(crash.get("lineno") or 0)
+            else:
+                file_path, line_number = self._extract_file_line(block)
+            error_type = self._classify_error_type(f"{block}\n{crash.get('message', '')}")
+            message = self._extract_error_message(block, error_type) if block.strip() else ""
+            failures.append(FailureAnalysis(
+                test_name=str(record.get("nodeid") or file_path),
+                error_type=error_type,
+                error_message=message or str(crash.get("message") or f"Unknown {error_type} error"),
+                file_path=file_path or "unknown.py",
+                line_number=line_number,
+                stack_trace=block,
+            ))
+        return failures
+
     def _extract_error_blocks(self, output: str) -> List[str]:
         """
         Extract individual error/failure blocks from pytest output.
@@ -394,6 +431,19 @@ def parse_pytest_output(output: str) -> List[FailureAnalysis]:
     return analyzer.parse_pytest_output(output)
 
 
+def parse_results(records: Iterable[Dict[str, Any]]) -> List[FailureAnalysis]:
+    """
+    Build failures from pytest_results records (convenience function).
+
+    Args:
+        records: Failed/errored records (e.g. RunSummary.failures)
+
+    Returns:
+        List of FailureAnalysis objects
+    """
+    return FailureAnalyzer().parse_results(records)
+
+
 def extract_error_details(output: str) -> List[FailureAnalysis]:
     """
     Extract error details from pytest output (alias for parse_pytest_output).
@@ -9,7 +9,7 @@ Key Features:
 - Recursive directory traversal (finds all files, not just *.md)
 - Intelligent exclusion patterns (cache, build artifacts, hidden files)
 - Nested skill structure support (skills/[name].skill/docs/...)
-- Installation manifest generation
+- Installation manifest generation (with SHA-256 content hashes)
 - Coverage validation
 
 Current Problem:
@@ -44,6 +44,7 @@ Design Patterns:
     See file-organization skill for directory structure patterns.
 """
 
+import hashlib
 import json
 from pathlib import Path
 from typing import List, Dict, Any
@@ -104,6 +105,35 @@ INCLUDE_HIDDEN = {
     ".env.example",
 }
 
+# Read size for streaming content hashes (keeps memory flat for large files)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def compute_file_hash(file_path: Path) -> str:
+    """Compute the SHA-256 content hash of a file.
+
+    Streams the file in fixed-size chunks so large files are never fully
+    loaded into memory.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Hex-encoded SHA-256 digest
+
+    Raises:
+        OSError: If the file cannot be read
+
+    Examples:
+        >>> compute_file_hash(plugin_dir / "lib" / "security_utils.py")
+        'e3b0c44298fc1c149afbf4c8996fb924...'
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class FileDiscovery:
     """Comprehensive file discovery for plugin installation.
@@ -250,7 +280,7 @@ class FileDiscovery:
         """
         return len(self.discover_all_files())
 
-    def generate_manifest(self) -> Dict[str, Any]:
+    def generate_manifest(self, include_hashes: bool = True) -> Dict[str, Any]:
         """Generate installation manifest with file metadata.
 
         Manifest format:
@@ -258,12 +288,18 @@ class FileDiscovery:
             "version": "1.0",
             "total_files": 201,
             "files": [
-                {"path": "commands/implement.md", "size": 1234},
-                {"path": "lib/security_utils.py", "size": 5678},
+                {"path": "commands/implement.md", "size": 1234, "sha256": "..."},
+                {"path": "lib/security_utils.py", "size": 5678, "sha256": "..."},
                 ...
             ]
         }
 
+        Content hashes let CopySystem.plan_delta() skip unchanged files
+        without re-reading the source tree for every install target.
+
+        Args:
+            include_hashes: Include a SHA-256 content hash per file (default: True)
+
         Returns:
             Manifest dictionary
 
@@ -281,10 +317,13 @@ class FileDiscovery:
 
         for file_path in files:
             relative = file_path.relative_to(self.plugin_dir)
-            manifest["files"].append({
+            entry = {
                 "path": str(relative).replace("\\", "/"),  # Unix-style paths
                 "size": file_path.stat().st_size
-            })
+            }
+            if include_hashes:
+                entry["sha256"] = compute_file_hash(file_path)
+            manifest["files"].append(entry)
 
         return manifest
 
@@ -12,12 +12,16 @@ Issue #860: Opportunistic fix-forward — agents should fix pre-existing failure
 Issue #1094: a capture that timed out writes ``__TIMEOUT__`` instead of a traceback.
 Issue #1533: a capture that executed zero tests writes ``__COLLECTION_ERROR__`` instead of
 looking like a legitimate empty baseline.
+
+When the capture ran with the ``pytest_results`` plugin, pass its ``RunSummary`` as
+``results=``: failing IDs, executed counts and the exit status then come from the
+structured records, and the text parsers below are only the fallback.
 """
 
 from __future__ import annotations
 
 import re
-from typing import NamedTuple, Optional
+from typing import Any, NamedTuple, Optional
 
 
 # Pattern matching pytest's VERBOSE per-test line: "path/to/test.py::test_name FAILED"
@@ -149,19 +153,28 @@ class CaptureFailure(NamedTuple):
     reason: str
 
 
-def count_executed_tests(pytest_output: str) -> Optional[int]:
+def _finished(results: Any) -> bool:
+    """True when ``results`` is a complete pytest_results RunSummary."""
+    return results is not None and bool(getattr(results, "finished", False))
+
+
+def count_executed_tests(pytest_output: str, results: Any = None) -> Optional[int]:
     """Count tests pytest reports as collected and processed.
 
     Reads the LAST pytest summary line (the one ending in ``in <n>s``) and sums
-    the passed/failed/skipped/xfailed/xpassed counts on it.
+    the passed/failed/skipped/xfailed/xpassed counts on it. With a finished
+    ``results`` summary the count comes from its records instead.
 
     Args:
         pytest_output: Raw stdout/stderr from a pytest run.
+        results: Optional pytest_results RunSummary of the same run.
 
     Returns:
         The number of tests processed, or None when no pytest summary line is
         present (which itself means the output cannot be trusted).
     """
+    if _finished(results):
+        return results.executed
     total: Optional[int] = None
     for line in pytest_output.splitlines():
         stripped = line.strip().strip("=").strip()
@@ -199,6 +212,7 @@ def count_reported_failures(pytest_output: str) -> Optional[int]:
 def detect_capture_failure(
     pytest_output: str,
     returncode: Optional[int] = None,
+    results: Any = None,
 ) -> Optional[CaptureFailure]:
     """Decide whether a pytest capture measured anything at all.
 
@@ -215,14 +229,34 @@ def detect_capture_failure(
     3. Zero tests processed according to the summary line — or no summary line
        at all.
 
+    With a finished pytest_results ``results`` summary, signals 1 and 3 are read
+    from the records (exit status, executed count) and the output scans are
+    skipped: the records cannot be misread the way a banner or summary line can.
+    An unfinished summary (pytest died before session end) is ignored.
+
     Args:
         pytest_output: Combined stdout+stderr from the pytest run.
         returncode: pytest's exit code, when available. None skips signal 1.
+        results: Optional pytest_results RunSummary of the same run.
 
     Returns:
         A CaptureFailure when the capture is untrustworthy, else None. None
         means "this measurement is real" — including a real measured zero.
     """
+    if _finished(results):
+        status = results.exitstatus if returncode is None else returncode
+        if status in _MEASUREMENT_FAILURE_EXIT_CODES:
+            return CaptureFailure(
+                COLLECTION_ERROR_SENTINEL,
+                f"pytest exited {status} (no trustworthy measurement produced)",
+            )
+        if results.executed == 0:
+            return CaptureFailure(
+                COLLECTION_ERROR_SENTINEL,
+                "pytest executed 0 tests — a zero-test capture is never a baseline",
+            )
+        return None
+
     if returncode is not None and returncode in _MEASUREMENT_FAILURE_EXIT_CODES:
         return CaptureFailure(
             COLLECTION_ERROR_SENTINEL,
@@ -276,7 +310,7 @@ def is_capture_failure_sentinel(baseline_contents: str) -> bool:
     return any(stripped.startswith(s) for s in CAPTURE_FAILURE_SENTINELS)
 
 
-def parse_failing_tests(pytest_output: str) -> set[str]:
+def parse_failing_tests(pytest_output: str, results: Any = None) -> set[str]:
     """Parse failing test IDs from pytest output.
 
     Handles both shapes pytest emits:
@@ -286,12 +320,18 @@ def parse_failing_tests(pytest_output: str) -> set[str]:
       (emitted by default at any verbosity, and the ONLY shape a ``-q`` run
       produces — Issue #1533)
 
+    With a finished pytest_results ``results`` summary the IDs come from its
+    records instead, and tests that errored in setup/teardown count as failing.
+
     Args:
         pytest_output: Raw stdout/stderr from a pytest run.
+        results: Optional pytest_results RunSummary of the same run.
 
     Returns:
         Set of failing test IDs (e.g., {"tests/unit/test_foo.py::test_bar"}).
     """
+    if _finished(results):
+        return set(results.failing)
     failing: set[str] = set()
     for line in pytest_output.splitlines():
         line = line.strip()
@@ -59,3 +59,101 @@ def mark_test_flaky(test_id: str, reason: str, project_root: Path) -> None:
             raise
     except Exception:
         pass  # Fail-open
+
+
+#: Recent outcomes kept per test, as "P"/"F" letters (oldest first).
+OUTCOME_HISTORY_LENGTH = 10
+
+#: Pass/fail flips within the kept history that make a test a flaky candidate.
+FLAKY_FLIP_THRESHOLD = 3
+
+
+def _outcome_history_path(project_root: Path) -> Path:
+    return project_root / ".claude" / "local" / "test_outcome_history.json"
+
+
+def _count_flips(history: str) -> int:
+    return sum(1 for a, b in zip(history, history[1:]) if a != b)
+
+
+def load_outcome_history(project_root: Path) -> dict[str, str]:
+    """Load per-test outcome history. Fail-open: returns {} on any error."""
+    try:
+        data = json.loads(_outcome_history_path(project_root).read_text())
+        if not isinstance(data, dict):
+            return {}
+        return {str(k): v for k, v in data.items() if isinstance(v, str)}
+    except (OSError, json.JSONDecodeError, ValueError):
+        return {}
+
+
+def record_outcomes(
+    outcomes: dict[str, str],
+    project_root: Path,
+    reruns: dict[str, int] | None = None,
+) -> set[str]:
+    """Append one run's outcomes to the per-test history and report flaky candidates.
+
+    Passed tests append "P", failed/errored tests append "F"; skipped and
+    xfail outcomes are ignored. A test that passed only after reruns
+    (pytest-rerunfailures) appends "FP". Only the last
+    OUTCOME_HISTORY_LENGTH letters are kept. Candidates are NOT added to the
+    known-flaky list — that stays a deliberate mark_test_flaky() call.
+    Fail-open: write errors are ignored.
+
+    Args:
+        outcomes: Test ID -> pytest outcome for this run.
+        project_root: Repository root path.
+        reruns: Optional test ID -> rerun count.
+
+    Returns:
+        Test IDs from this run whose history has at least FLAKY_FLIP_THRESHOLD flips.
+    """
+    reruns = reruns or {}
+    history = load_outcome_history(project_root)
+    candidates: set[str] = set()
+    for test_id, outcome in outcomes.items():
+        if outcome == "passed":
+            letters = "FP" if reruns.get(test_id) else "P"
+        elif outcome in ("failed", "error"):
+            letters = "F"
+        else:
+            continue
+        updated = (history.get(test_id, "") + letters)[-OUTCOME_HISTORY_LENGTH:]
+        history[test_id] = updated
+        if _count_flips(updated) >= FLAKY_FLIP_THRESHOLD:
+            candidates.add(test_id)
+
+    path = _outcome_history_path(project_root)
+    try:
+        import os
+        import tempfile
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp", prefix=f".{path.name}_")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(history, f, separators=(",", ":"), sort_keys=True)
+            os.replace(tmp, str(path))
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    except Exception:
+        pass  # Fail-open
+    return candidates
+
+
+def flaky_candidates(project_root: Path, min_flips: int = FLAKY_FLIP_THRESHOLD) -> dict[str, int]:
+    """Test IDs whose recorded outcomes flipped at least ``min_flips`` times.
+
+    Args:
+        project_root: Repository root path.
+        min_flips: Minimum pass/fail transitions in the kept history.
+
+    Returns:
+        Test ID -> flip count, for review before mark_test_flaky().
+    """
+    flips = {test_id: _count_flips(h) for test_id, h in load_outcome_history(project_root).items()}
+    return {test_id: n for test_id, n in flips.items() if n >= min_flips}
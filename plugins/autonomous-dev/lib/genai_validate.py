@@ -38,14 +38,22 @@ Design Patterns:
     See library-design-patterns skill for standardized design patterns.
 """
 
+import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from env_utils import positive_int_from_env
+except ImportError:
+    from .env_utils import positive_int_from_env  # type: ignore[no-redef]
 
 # ============================================================================
 # Configuration
@@ -75,6 +83,26 @@ VERSION_EXCLUDE_PATTERNS = [
     "**/docs/sessions/**",
 ]
 
+
+# Version classification: candidates per LLM prompt, concurrent prompts, and
+# the (line, context)-keyed result cache.
+VERSION_CHUNK_SIZE = positive_int_from_env("GENAI_VERSION_CHUNK_SIZE", 40)
+VERSION_MAX_WORKERS = positive_int_from_env("GENAI_VERSION_WORKERS", 4)
+VERSION_CACHE_FILE = PROJECT_ROOT / ".claude" / "cache" / "version_classifications.json"
+VERSION_CACHE_MAX_ENTRIES = 5000
+
+# Dependency manifests whose pins mark a version reference as external.
+DEPENDENCY_MANIFESTS = [
+    PROJECT_ROOT / "pyproject.toml",
+    PROJECT_ROOT / "requirements.txt",
+    PROJECT_ROOT / "requirements-dev.txt",
+    PROJECT_ROOT / "plugins" / "autonomous-dev" / "requirements-dev.txt",
+    PROJECT_ROOT / "plugins" / "autonomous-dev" / "requirements-book-parsing.txt",
+]
+
+# Tools that are never pinned in a manifest but often quoted with a version.
+KNOWN_EXTERNAL_TOOLS = ("python", "node", "npm", "pip", "git", "claude code")
+
 # ============================================================================
 # Shared GenAI Client
 # ============================================================================
@@ -118,9 +146,15 @@ def get_llm_client():
         sys.exit(1)
 
 
-def call_llm(prompt: str) -> str:
-    """Call LLM with prompt, return response."""
-    client, model, provider = get_llm_client()
+def call_llm(prompt: str, llm: Optional[Tuple] = None) -> str:
+    """Call LLM with prompt, return response.
+
+    Args:
+        prompt: User prompt
+        llm: ``(client, model, provider)`` from get_llm_client(), to reuse one
+            client across calls (default: create a new one)
+    """
+    client, model, provider = llm or get_llm_client()
 
     if provider == "anthropic":
         response = client.messages.create(
@@ -780,11 +814,124 @@ def scan_file(file_path: Path, version_pattern) -> List[VersionCandidate]:
     return candidates
 
 
-def classify_versions(candidates: List[VersionCandidate], target_version: str) -> List[ClassifiedVersion]:
-    """Use GenAI to classify which versions are plugin versions."""
-    _, _, provider = get_llm_client()
-    print(f"🤖 Calling {provider} GenAI to classify {len(candidates)} version references...")
+_PIN_PATTERN = re.compile(
+    r"""["']?([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*(?:==|>=|<=|~=|!=|>|<)\s*v?\d+\.\d+\.\d+"""
+)
+# shields.io badge whose label is the version (not e.g. a python-3.11 badge)
+_BADGE_PATTERN = re.compile(r"(?i)/badge/(?:version|release|autonomous--dev)-v?(\d+\.\d+\.\d+)")
+# "autonomous-dev v3.0.0" in a heading or sentence. Bare "Version:" fields are
+# left to the LLM: skills, agents and commands carry their own versions.
+_PLUGIN_NAME_PATTERN = re.compile(r"(?i)(?<![\w-])autonomous-dev\s+v?(\d+\.\d+\.\d+)")
+
+
+def load_external_pins(manifests: Optional[List[Path]] = None) -> List[str]:
+    """Collect package names pinned in requirements/pyproject files.
+
+    Args:
+        manifests: Files to read (default: DEPENDENCY_MANIFESTS)
+
+    Returns:
+        Sorted, lower-cased package names plus KNOWN_EXTERNAL_TOOLS
+    """
+    names = set(KNOWN_EXTERNAL_TOOLS)
+    for manifest in manifests if manifests is not None else DEPENDENCY_MANIFESTS:
+        try:
+            text = manifest.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        for line in text.splitlines():
+            line = line.split("#", 1)[0]
+            names.update(m.group(1).lower() for m in _PIN_PATTERN.finditer(line))
+    return sorted(names)
+
+
+def prefilter_version(candidate: VersionCandidate, external_names: List[str]) -> Optional[ClassifiedVersion]:
+    """Settle obvious version references without an LLM call.
+
+    Rules, in order:
+        1. Part of a longer dotted number (IP address, 4-part version) -> external
+        2. Directly follows a pinned package or known tool name -> external
+        3. Version badge, or "autonomous-dev vX.Y.Z" naming this version -> plugin
+
+    Args:
+        candidate: Version reference to classify
+        external_names: Names from load_external_pins()
+
+    Returns:
+        ClassifiedVersion with high confidence, or None if the LLM must decide
+    """
+    line = candidate.line_content
+    version = re.escape(candidate.version)
+
+    def settled(is_plugin: bool, reasoning: str) -> ClassifiedVersion:
+        return ClassifiedVersion(
+            file_path=candidate.file_path,
+            line_number=candidate.line_number,
+            line_content=candidate.line_content,
+            version=candidate.version,
+            is_plugin_version=is_plugin,
+            reasoning=f"pre-filter: {reasoning}",
+            confidence="high",
+        )
+
+    if re.search(rf"\d\.{version}(?![\d.])|(?<![\d.]){version}\.\d", line):
+        return settled(False, "part of a longer dotted number (IP address or 4-part version)")
+
+    lowered = line.lower()
+    for name in external_names:
+        if name in lowered and re.search(
+            rf"(?i)(?<![\w-]){re.escape(name)}(?![\w-])\s*(?:[=<>~!]=?|@|:)?\s*v?{version}", line
+        ):
+            return settled(False, f"external dependency '{name}'")
+
+    if any(m.group(1) == candidate.version for m in _BADGE_PATTERN.finditer(line)):
+        return settled(True, "version badge")
+    if any(m.group(1) == candidate.version for m in _PLUGIN_NAME_PATTERN.finditer(line)):
+        return settled(True, "names autonomous-dev")
+    return None
+
+
+def _version_cache_key(candidate: VersionCandidate) -> str:
+    """Hash of (line content, context) with line numbers stripped.
 
+    The target version is deliberately not part of the key: whether a line
+    refers to the plugin does not change when the plugin version is bumped.
+    """
+    context = "\n".join(
+        re.sub(r"^\s*\d+: ", "", line) for line in candidate.surrounding_context.splitlines()
+    )
+    payload = "\0".join((candidate.version, candidate.line_content, context))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _load_version_cache(cache_file: Path) -> Dict[str, dict]:
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    entries = data.get("entries") if isinstance(data, dict) else None
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_version_cache(cache_file: Path, entries: Dict[str, dict]) -> None:
+    """Atomically write the newest VERSION_CACHE_MAX_ENTRIES entries (best effort)."""
+    keep = dict(list(entries.items())[-VERSION_CACHE_MAX_ENTRIES:])
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, prefix=".version_cache_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"entries": keep}, f)
+            os.replace(tmp, cache_file)
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def _build_version_prompt(chunk: List[VersionCandidate], target_version: str) -> str:
+    """Build the classification prompt for one chunk (indices are 1-based within the chunk)."""
     prompt = f"""You are analyzing version references in a Claude Code plugin codebase to identify which are **plugin version references** vs **external dependency versions, examples, or technical version numbers**.
 
 **Context**:
@@ -800,7 +947,7 @@ def classify_versions(candidates: List[VersionCandidate], target_version: str) -
 
 """
 
-    for i, candidate in enumerate(candidates, 1):
+    for i, candidate in enumerate(chunk, 1):
         prompt += f"""
 {i}. File: {candidate.file_path}:{candidate.line_number}
    Version: {candidate.version}
@@ -823,28 +970,110 @@ def classify_versions(candidates: List[VersionCandidate], target_version: str) -
 ]
 ```
 
-Analyze all {len(candidates)} references and provide the JSON array.
+Analyze all {len(chunk)} references and provide the JSON array.
 """
+    return prompt
 
-    response = call_llm(prompt)
-    classifications = parse_json_response(response)
 
-    results = []
-    for classification in classifications:
+def _classify_chunk(chunk: List[VersionCandidate], target_version: str, llm: Tuple) -> Dict[int, dict]:
+    """Classify one chunk; returns {position in chunk: classification}."""
+    response = call_llm(_build_version_prompt(chunk, target_version), llm=llm)
+    results = {}
+    for classification in parse_json_response(response):
         idx = classification["index"] - 1
-        if 0 <= idx < len(candidates):
-            candidate = candidates[idx]
-            results.append(ClassifiedVersion(
+        if 0 <= idx < len(chunk):
+            results[idx] = {
+                "is_plugin_version": classification["is_plugin_version"],
+                "reasoning": classification["reasoning"],
+                "confidence": classification["confidence"],
+            }
+    return results
+
+
+def classify_versions(
+    candidates: List[VersionCandidate],
+    target_version: str,
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    cache_file: Optional[Path] = None,
+) -> List[ClassifiedVersion]:
+    """Classify which version references are plugin versions.
+
+    Obvious references are settled locally by prefilter_version(); previous
+    answers are reused from a cache keyed by (line content, context) hash;
+    the rest go to the LLM in chunks of ``chunk_size`` with at most
+    ``max_workers`` prompts in flight.
+
+    Args:
+        candidates: Output of scan_for_version_candidates()
+        target_version: Plugin version from the VERSION file
+        chunk_size: Candidates per prompt (default: VERSION_CHUNK_SIZE)
+        max_workers: Concurrent prompts (default: VERSION_MAX_WORKERS)
+        cache_file: Result cache path (default: VERSION_CACHE_FILE)
+
+    Returns:
+        Classified references in candidate order. References the LLM left
+        unanswered are omitted.
+    """
+    chunk_size = max(1, chunk_size or VERSION_CHUNK_SIZE)
+    max_workers = max(1, max_workers or VERSION_MAX_WORKERS)
+    cache_file = cache_file or VERSION_CACHE_FILE
+
+    external_names = load_external_pins()
+    cache = _load_version_cache(cache_file)
+    settled: Dict[int, ClassifiedVersion] = {}
+    pending: List[Tuple[int, str]] = []
+    from_cache = 0
+
+    for i, candidate in enumerate(candidates):
+        local = prefilter_version(candidate, external_names)
+        if local is not None:
+            settled[i] = local
+            continue
+        key = _version_cache_key(candidate)
+        cached = cache.get(key)
+        if cached is not None:
+            settled[i] = ClassifiedVersion(
                 file_path=candidate.file_path,
                 line_number=candidate.line_number,
                 line_content=candidate.line_content,
                 version=candidate.version,
-                is_plugin_version=classification["is_plugin_version"],
-                reasoning=classification["reasoning"],
-                confidence=classification["confidence"]
-            ))
+                **cached,
+            )
+            from_cache += 1
+        else:
+            pending.append((i, key))
 
-    return results
+    print(
+        f"🔎 {len(settled) - from_cache} settled by pre-filter, {from_cache} from cache, "
+        f"{len(pending)} need GenAI"
+    )
+
+    if pending:
+        llm = get_llm_client()
+        chunks = [pending[n:n + chunk_size] for n in range(0, len(pending), chunk_size)]
+        print(f"🤖 Calling {llm[2]} GenAI to classify {len(pending)} version references in {len(chunks)} chunk(s)...")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+            answers = list(pool.map(
+                lambda chunk: _classify_chunk([candidates[i] for i, _ in chunk], target_version, llm),
+                chunks,
+            ))
+        for chunk, answer in zip(chunks, answers):
+            for position, classification in answer.items():
+                i, key = chunk[position]
+                cache.pop(key, None)
+                cache[key] = classification  # re-insert as newest
+                candidate = candidates[i]
+                settled[i] = ClassifiedVersion(
+                    file_path=candidate.file_path,
+                    line_number=candidate.line_number,
+                    line_content=candidate.line_content,
+                    version=candidate.version,
+                    **classification,
+                )
+        _save_version_cache(cache_file, cache)
+
+    return [settled[i] for i in sorted(settled)]
 
 
 def validate_version_sync() -> Dict:
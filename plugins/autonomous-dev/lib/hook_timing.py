@@ -8,7 +8,10 @@ and the per-invocation timing surface can evolve independently.
 
 Each ``HookTimer`` context manager invocation emits one JSONL row to
 ``~/.claude/logs/hook_timings_YYYY-MM-DD.jsonl``. The schema is stable:
-``{ts, hook, dur_ns, decision_shape, schema_version}``.
+``{ts, hook, dur_ns, decision_shape, schema_version}``, plus an optional
+``counters`` object (``{group: {name: number}}``, e.g. the ``tool_intent``
+classification cache hit/miss counts) present only when the hook attached
+some via :meth:`HookTimer.add_counters`.
 
 ``decision_shape`` semantics (schema_version 2)
 -----------------------------------------------
@@ -80,7 +83,7 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 # ---------------------------------------------------------------------------
 # Module constants
@@ -96,6 +99,12 @@ LOG_DIR_OVERRIDE_ENV_VAR: str = "HOOK_TIMING_DIR"
 MAX_DECISION_SHAPE_LENGTH: int = 64
 MAX_HOOK_NAME_LENGTH: int = 128
 
+# Bounds for the optional ``counters`` object so a misbehaving producer
+# cannot bloat timing rows.
+MAX_COUNTER_GROUPS: int = 8
+MAX_COUNTERS_PER_GROUP: int = 16
+MAX_COUNTER_NAME_LENGTH: int = 64
+
 # Schema 2 corrects ``decision_shape`` classification: ``sys.exit(0)`` inside
 # the timer scope is the SUCCESS path and no longer records ``"exception"``.
 # Rows with ``schema_version == 1`` predate the correction and over-report
@@ -387,12 +396,40 @@ def _normalize_decision_shape(shape: str) -> str:
     return s
 
 
+def _normalize_counters(counters: object) -> Dict[str, Dict[str, float]]:
+    """Keep only bounded ``{str: {str: int|float}}`` entries of ``counters``.
+
+    Anything else (non-dict groups, non-numeric values, booleans) is dropped.
+    Never raises; returns ``{}`` on any failure.
+    """
+    out: Dict[str, Dict[str, float]] = {}
+    try:
+        if not isinstance(counters, dict):
+            return out
+        for group, values in list(counters.items())[:MAX_COUNTER_GROUPS]:
+            if not isinstance(group, str) or not isinstance(values, dict):
+                continue
+            clean = {
+                name[:MAX_COUNTER_NAME_LENGTH]: value
+                for name, value in list(values.items())[:MAX_COUNTERS_PER_GROUP]
+                if isinstance(name, str)
+                and isinstance(value, (int, float))
+                and not isinstance(value, bool)
+            }
+            if clean:
+                out[group[:MAX_COUNTER_NAME_LENGTH]] = clean
+    except Exception:
+        return {}
+    return out
+
+
 def emit_timing_event(
     *,
     hook_name: str,
     dur_ns: int,
     decision_shape: str = "unknown",
     log_dir: Optional[Path] = None,
+    counters: Optional[Dict[str, Dict[str, float]]] = None,
 ) -> None:
     """Append one JSONL row for a single hook invocation.
 
@@ -414,6 +451,9 @@ def emit_timing_event(
         log_dir: Optional directory override. Falls back to the
             ``HOOK_TIMING_DIR`` env var, then to
             ``~/.claude/logs``.
+        counters: Optional ``{group: {name: number}}`` per-invocation
+            counters (cache hits/misses etc.). Written as ``counters`` only
+            when non-empty after normalization.
     """
     if is_timing_disabled():
         return
@@ -446,6 +486,9 @@ def emit_timing_event(
         "decision_shape": safe_shape,
         "schema_version": SCHEMA_VERSION,
     }
+    safe_counters = _normalize_counters(counters) if counters else {}
+    if safe_counters:
+        event["counters"] = safe_counters
 
     try:
         line = json.dumps(event, separators=(",", ":"), ensure_ascii=False)
@@ -546,6 +589,7 @@ class HookTimer:
         self._explicitly_set: bool = False
         self._start_ns: int = 0
         self._disabled: bool = False
+        self._counters: Dict[str, Dict[str, float]] = {}
 
     def __enter__(self) -> "HookTimer":
         # Fast-path: short-circuit when disabled. ``__exit__`` becomes a no-op.
@@ -576,6 +620,7 @@ class HookTimer:
                 dur_ns=dur_ns,
                 decision_shape=shape,
                 log_dir=self._log_dir,
+                counters=self._counters,
             )
         except Exception:
             # Last-resort guard: a bug in emit_timing_event must not block
@@ -594,3 +639,16 @@ class HookTimer:
         """
         self._decision_shape = _normalize_decision_shape(shape)
         self._explicitly_set = True
+
+    def add_counters(self, group: str, counters: Dict[str, float]) -> None:
+        """Attach per-invocation counters to this timing row.
+
+        Recorded under ``counters[group]`` (e.g. ``"intent_cache"`` ->
+        ``{"memory_hits": 3, "misses": 1, "hit_rate": 0.75}``). Non-numeric
+        values are dropped when the row is written. NEVER raises.
+        """
+        try:
+            if isinstance(group, str) and isinstance(counters, dict):
+                self._counters[group] = dict(counters)
+        except Exception:
+            pass
@@ -88,6 +88,8 @@ class InstallResult:
         customizations_detected: Optional list of user customizations found
         files_added: Optional number of new files added during upgrade
         files_restored: Optional number of files restored during rollback
+        files_unchanged: Optional number of files skipped because content matched
+        bytes_written: Optional number of bytes actually written to .claude/
     """
     status: str
     files_copied: int
@@ -98,6 +100,8 @@ class InstallResult:
     customized_files: Optional[List[str]] = None
     files_added: Optional[int] = None
     files_restored: Optional[int] = None
+    files_unchanged: Optional[int] = None
+    bytes_written: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -348,7 +352,7 @@ class InstallOrchestrator:
         1. Pre-install cleanup (remove .claude/lib/ duplicates)
         2. Create backup of existing installation
         3. Discover files
-        4. Copy files (preserving user customizations if possible)
+        4. Copy new/changed files only (content-hash delta, preserving user customizations)
         5. Set permissions
         6. Update marker file
         7. Validate
@@ -381,39 +385,21 @@ class InstallOrchestrator:
             files = self.discovery.discover_all_files()
             total_files = len(files)
 
-            # Step 4: Detect customizations and prepare file list
-            files_to_copy = []
-            customized_files = []
-            new_files = []
-
-            for source_file in files:
-                rel_path = source_file.relative_to(self.plugin_dir)
-                dest_file = self.claude_dir / rel_path
-
-                # Track if this is a new file (doesn't exist in destination)
-                if not dest_file.exists():
-                    new_files.append(str(rel_path))
+            # Step 4: Plan delta by content hash (detects customizations too)
+            copy_system = CopySystem(self.plugin_dir, self.claude_dir)
+            plan = copy_system.plan_delta(files=files)
 
-                # Check if file was customized by user
-                if dest_file.exists():
-                    # Compare file contents to detect customization
-                    source_content = source_file.read_bytes()
-                    dest_content = dest_file.read_bytes()
-                    if source_content != dest_content:
-                        customized_files.append(str(rel_path))
+            # Changed files differ from the plugin source - treat as customized
+            customized_files = list(plan.changed_files)
+            new_files = list(plan.new_files)
 
-                # Only copy if not preserved or doesn't exist
-                if not self._should_preserve(dest_file) or not dest_file.exists():
-                    files_to_copy.append(source_file)
+            # Preserved customizations stay untouched; unchanged files are skipped
+            plan.changed_files = [
+                rel for rel in plan.changed_files
+                if not self._should_preserve(self.claude_dir / rel)
+            ]
 
-            # Use CopySystem for batch copy
-            copy_system = CopySystem(self.plugin_dir, self.claude_dir)
-            copy_result = copy_system.copy_all(
-                files=files_to_copy,
-                overwrite=True,
-                preserve_timestamps=True,
-                continue_on_error=True
-            )
+            copy_result = copy_system.copy_planned(plan, continue_on_error=True)
 
             files_copied = copy_result["files_copied"]
             if copy_result["errors"] > 0:
@@ -450,6 +436,8 @@ class InstallOrchestrator:
                 customizations_detected=len(customized_files),
                 customized_files=customized_files,
                 files_added=len(new_files),
+                files_unchanged=copy_result["files_unchanged"],
+                bytes_written=copy_result["bytes_written"],
             )
 
         except Exception as e:
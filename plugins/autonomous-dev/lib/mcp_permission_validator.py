@@ -63,6 +63,13 @@ except ImportError:
         """Fallback audit log function for testing."""
         pass
 
+# Import policy compiler (compiled allow/deny matchers for the hot path)
+try:
+    from permission_policy_compiler import compile_rules, compiled_mcp_glob
+except ImportError:
+    compile_rules = None
+    compiled_mcp_glob = None
+
 
 # Project root detection
 def _get_project_root() -> Path:
@@ -357,11 +364,10 @@ class MCPPermissionValidator:
 
             # Check against denied patterns
             denied_patterns = self.policy.get("shell", {}).get("denied_patterns", [])
-            for pattern in denied_patterns:
-                if pattern.lower() in command.lower():
-                    reason = f"Destructive/dangerous command denied: {command}"
-                    self._audit_log("shell:execute", "denied", {"command": command, "reason": reason})
-                    return ValidationResult(approved=False, reason=reason)
+            if self._contains_denied_substring(command, denied_patterns):
+                reason = f"Destructive/dangerous command denied: {command}"
+                self._audit_log("shell:execute", "denied", {"command": command, "reason": reason})
+                return ValidationResult(approved=False, reason=reason)
 
             # Check if command starts with allowed command
             allowed_commands = self.policy.get("shell", {}).get("allowed_commands", [])
@@ -451,11 +457,10 @@ class MCPPermissionValidator:
         try:
             # Check against denied patterns
             denied_patterns = self.policy.get("environment", {}).get("denied_patterns", [])
-            for pattern in denied_patterns:
-                if fnmatch.fnmatch(var_name, pattern):
-                    reason = f"Access to secret environment variable denied: {var_name}"
-                    self._audit_log("env:access", "denied", {"var": var_name, "reason": reason})
-                    return ValidationResult(approved=False, reason=reason)
+            if self._matches_any_glob(var_name, denied_patterns):
+                reason = f"Access to secret environment variable denied: {var_name}"
+                self._audit_log("env:access", "denied", {"var": var_name, "reason": reason})
+                return ValidationResult(approved=False, reason=reason)
 
             # Check against allowed list
             allowed_vars = self.policy.get("environment", {}).get("allowed_vars", [])
@@ -489,6 +494,15 @@ class MCPPermissionValidator:
         - ? matches exactly one character
         - Patterns are case-sensitive on Unix
         """
+        # Compiled predicate (cached per pattern); identical decisions
+        if compiled_mcp_glob is not None and isinstance(path, str) and isinstance(pattern, str):
+            try:
+                predicate = compiled_mcp_glob(pattern)
+            except re.error:
+                predicate = None  # Re-raised below by the uncompiled path
+            if predicate is not None:
+                return predicate(path)
+
         # Normalize paths for comparison
         path = path.replace("\\", "/")
         pattern = pattern.replace("\\", "/")
@@ -758,6 +772,10 @@ class MCPPermissionValidator:
         Returns:
             True if path matches any non-negated pattern and no negated patterns
         """
+        compiled = compile_rules("mcp_glob", patterns) if compile_rules is not None else None
+        if compiled is not None and compiled.valid and isinstance(path, str):
+            return bool(patterns) and compiled.allows(path)
+
         matched = False
         negated = False
 
@@ -784,8 +802,41 @@ class MCPPermissionValidator:
         Returns:
             True if hostname matches any domain pattern
         """
-        for domain in domains:
-            if fnmatch.fnmatch(hostname, domain):
+        return self._matches_any_glob(hostname, domains)
+
+    def _matches_any_glob(self, value: str, patterns: List[str]) -> bool:
+        """Check if value fnmatch-matches any pattern in list.
+
+        Args:
+            value: Hostname or variable name to check
+            patterns: List of fnmatch patterns
+
+        Returns:
+            True if value matches any pattern
+        """
+        globs = compile_rules("glob", patterns) if compile_rules is not None else None
+        if globs is not None:
+            return globs.matches(value)
+        for pattern in patterns:
+            if fnmatch.fnmatch(value, pattern):
+                return True
+        return False
+
+    def _contains_denied_substring(self, command: str, patterns: List[str]) -> bool:
+        """Check if command contains any denied pattern (case-insensitive).
+
+        Args:
+            command: Shell command to check
+            patterns: Denied substrings from the shell policy
+
+        Returns:
+            True if any pattern occurs in the lowercased command
+        """
+        substrings = compile_rules("substrings_ci", patterns) if compile_rules is not None else None
+        if substrings is not None:
+            return substrings.contains_any(command.lower())
+        for pattern in patterns:
+            if pattern.lower() in command.lower():
                 return True
         return False
 
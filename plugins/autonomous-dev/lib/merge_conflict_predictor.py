@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Merge Conflict Predictor - Predict merge conflicts without touching the tree.
+
+merge_worktree and batch_git_finalize used to discover conflicts only after a
+real ``git merge`` had dirtied the working tree, then recover with
+``merge --abort`` / stash-pop cycles. This module computes the merge in the
+object database first:
+
+- ``git merge-tree --write-tree <target> <source>`` (git >= 2.38) performs the
+  full merge in memory and writes a tree whose conflicted files still carry
+  conflict markers. Those blobs are fed straight into
+  conflict_resolver.parse_conflict_markers, so each predicted conflict comes
+  with the same ConflictBlock objects resolve_conflicts would see later.
+- Older git falls back to hunk overlap: ``git diff -U0`` of both sides against
+  the merge base, with a conflict predicted wherever hunks in the same file
+  overlap or touch.
+
+plan_merge_order goes one step further for batches: it simulates merging a
+set of branches one after another (throwaway commit objects, no refs or
+worktree changes) and greedily picks the next branch that merges cleanly
+into the simulated result, so a batch lands in the order that minimizes
+conflicts.
+
+Usage:
+    from merge_conflict_predictor import predict_merge_conflicts, plan_merge_order
+
+    prediction = predict_merge_conflicts("feature-auth", "master")
+    if prediction.has_conflicts:
+        for conflict in prediction.conflicts:
+            print(conflict.file_path, conflict.conflict_type, conflict.line_ranges)
+
+    plan = plan_merge_order(["feature-a", "feature-b", "feature-c"], "master")
+    print(plan.order, plan.conflicting)
+
+    # CLI
+    python merge_conflict_predictor.py --target master feature-a feature-b
+
+Date: 2026-10-18
+Issue: #193 (Wire conflict resolver into /worktree --merge)
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    from conflict_resolver import ConflictBlock, parse_conflict_markers
+except ImportError:
+    from .conflict_resolver import ConflictBlock, parse_conflict_markers  # type: ignore[no-redef]
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+METHOD_MERGE_TREE = "merge-tree"
+METHOD_HUNK_OVERLAP = "hunk-overlap"
+
+GIT_TIMEOUT = 30
+
+# Identity for the throwaway commits plan_merge_order creates; they are never
+# referenced by a branch and are collected by the next ``git gc``.
+_SIMULATION_ENV = {
+    "GIT_AUTHOR_NAME": "merge-conflict-predictor",
+    "GIT_AUTHOR_EMAIL": "merge-conflict-predictor@localhost",
+    "GIT_COMMITTER_NAME": "merge-conflict-predictor",
+    "GIT_COMMITTER_EMAIL": "merge-conflict-predictor@localhost",
+}
+
+# "CONFLICT (contents)" / "CONFLICT (modify/delete)" message types from -z output
+_CONFLICT_TYPE_RE = re.compile(r"^CONFLICT \(([^)]+)\)")
+# "@@ -12,3 +12,4 @@" hunk headers from diff -U0
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+\d+(?:,\d+)? @@")
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+@dataclass
+class PredictedConflict:
+    """One file predicted to conflict.
+
+    Attributes:
+        file_path: Path relative to the repository root
+        conflict_type: git's conflict kind ("contents", "modify/delete",
+            "add/add", "rename/delete", ...)
+        line_ranges: 1-based inclusive (start, end) line ranges. For
+            merge-tree predictions these are the conflict-marker blocks in the
+            merged file; for hunk-overlap predictions they are lines of the
+            merge base both sides changed.
+        blocks: Parsed conflict blocks (merge-tree, text files only)
+    """
+    file_path: str
+    conflict_type: str = "contents"
+    line_ranges: List[Tuple[int, int]] = field(default_factory=list)
+    blocks: List[ConflictBlock] = field(default_factory=list)
+
+
+@dataclass
+class MergePrediction:
+    """Predicted outcome of merging ``source`` into ``target``.
+
+    Attributes:
+        source: Branch (or commit) being merged
+        target: Branch (or commit) merged into
+        method: METHOD_MERGE_TREE or METHOD_HUNK_OVERLAP ("" if it failed)
+        conflicts: Files predicted to conflict
+        tree: Merged tree OID (merge-tree only)
+        error: Why no prediction could be made (empty on success)
+    """
+    source: str
+    target: str
+    method: str = ""
+    conflicts: List[PredictedConflict] = field(default_factory=list)
+    tree: str = ""
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """True if a prediction was made (clean or not)."""
+        return not self.error
+
+    @property
+    def has_conflicts(self) -> bool:
+        return bool(self.conflicts)
+
+    @property
+    def conflicted_files(self) -> List[str]:
+        return [c.file_path for c in self.conflicts]
+
+    def summary(self) -> str:
+        """One-line description for error messages and logs."""
+        if self.error:
+            return f"prediction unavailable: {self.error}"
+        if not self.conflicts:
+            return f"{self.source} merges cleanly into {self.target}"
+        parts = []
+        for conflict in self.conflicts[:5]:
+            ranges = ", ".join(f"{a}-{b}" for a, b in conflict.line_ranges[:3])
+            parts.append(f"{conflict.file_path} ({conflict.conflict_type}{': lines ' + ranges if ranges else ''})")
+        more = f" and {len(self.conflicts) - 5} more" if len(self.conflicts) > 5 else ""
+        return f"{len(self.conflicts)} predicted conflict(s): {'; '.join(parts)}{more}"
+
+    def to_dict(self) -> Dict:
+        return {
+            "source": self.source,
+            "target": self.target,
+            "method": self.method,
+            "tree": self.tree,
+            "error": self.error,
+            "conflicts": [
+                {"file_path": c.file_path, "conflict_type": c.conflict_type,
+                 "line_ranges": [list(r) for r in c.line_ranges]}
+                for c in self.conflicts
+            ],
+        }
+
+
+@dataclass
+class MergePlan:
+    """Conflict-minimizing merge order for a batch of branches.
+
+    Attributes:
+        target: Branch the batch merges into
+        order: Branches in recommended merge order (clean merges first)
+        predictions: Prediction for each branch against the simulated target
+            at its position in ``order``
+        conflicting: Branches predicted to conflict even in the best order
+    """
+    target: str
+    order: List[str] = field(default_factory=list)
+    predictions: Dict[str, MergePrediction] = field(default_factory=dict)
+    conflicting: List[str] = field(default_factory=list)
+
+
+# =============================================================================
+# Git helpers
+# =============================================================================
+
+def _git(
+    args: Sequence[str],
+    cwd: Optional[Path],
+    env: Optional[Dict[str, str]] = None,
+) -> subprocess.CompletedProcess:
+    """Run git with list args (no shell) and capture text output."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=str(cwd) if cwd else None,
+        capture_output=True,
+        text=True,
+        timeout=GIT_TIMEOUT,
+        env=env,
+    )
+
+
+def _rev_parse(rev: str, cwd: Optional[Path]) -> Optional[str]:
+    result = _git(["rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"], cwd)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _merge_tree_unsupported(stderr: str) -> bool:
+    """True if ``--write-tree`` is unknown to this git (< 2.38)."""
+    lowered = stderr.lower()
+    return "write-tree" in lowered or "usage: git merge-tree" in lowered
+
+
+# =============================================================================
+# Prediction
+# =============================================================================
+
+def _parse_merge_tree_output(output: str) -> Tuple[str, Dict[str, str], List[str]]:
+    """Split ``merge-tree --write-tree -z`` output.
+
+    Returns:
+        (tree OID, {path: conflict type}, conflicted paths in stage order)
+    """
+    fields = output.split("\0")
+    tree = fields[0].strip()
+    index = 1
+    paths: List[str] = []
+    # Conflicted file info: "<mode> <oid> <stage>\t<path>" until an empty field
+    while index < len(fields) and fields[index]:
+        _, _, path = fields[index].partition("\t")
+        if path and path not in paths:
+            paths.append(path)
+        index += 1
+    index += 1
+
+    # Informational messages: <count> NUL <path>... NUL <type> NUL <message> NUL
+    types: Dict[str, str] = {}
+    while index < len(fields) and fields[index].strip().isdigit():
+        count = int(fields[index])
+        message_paths = fields[index + 1:index + 1 + count]
+        kind = fields[index + 1 + count] if index + 1 + count < len(fields) else ""
+        match = _CONFLICT_TYPE_RE.match(kind)
+        if match:
+            for path in message_paths:
+                types.setdefault(path, match.group(1))
+        index += count + 3
+    return tree, types, paths
+
+
+def _blocks_for(tree: str, path: str, cwd: Optional[Path]) -> List[ConflictBlock]:
+    """Parse conflict markers of ``path`` in the merge-tree result."""
+    result = subprocess.run(
+        ["git", "cat-file", "blob", f"{tree}:{path}"],
+        cwd=str(cwd) if cwd else None,
+        capture_output=True,
+        timeout=GIT_TIMEOUT,
+    )
+    if result.returncode != 0 or b"\0" in result.stdout[:8000]:
+        return []  # deleted on one side, or binary
+    try:
+        return parse_conflict_markers(content=result.stdout.decode("utf-8"), file_path=path)
+    except (UnicodeDecodeError, ValueError):
+        return []
+
+
+def _predict_with_merge_tree(
+    target: str, source: str, cwd: Optional[Path],
+) -> Optional[MergePrediction]:
+    """Prediction via merge-tree, or None if this git lacks ``--write-tree``."""
+    prediction = MergePrediction(source=source, target=target, method=METHOD_MERGE_TREE)
+    result = _git(["merge-tree", "--write-tree", "-z", target, source], cwd)
+    if result.returncode not in (0, 1):
+        if _merge_tree_unsupported(result.stderr):
+            return None
+        prediction.error = result.stderr.strip() or f"git merge-tree exited {result.returncode}"
+        return prediction
+
+    tree, types, paths = _parse_merge_tree_output(result.stdout)
+    prediction.tree = tree
+    for path in paths:
+        blocks = _blocks_for(tree, path, cwd)
+        prediction.conflicts.append(PredictedConflict(
+            file_path=path,
+            conflict_type=types.get(path, "contents"),
+            line_ranges=[(b.start_line + 1, b.end_line + 1) for b in blocks],
+            blocks=blocks,
+        ))
+    return prediction
+
+
+def _changed_hunks(base: str, rev: str, cwd: Optional[Path]) -> Dict[str, List[Tuple[int, int]]]:
+    """Base-side line ranges each file's hunks replace between base and rev.
+
+    Pure insertions (``-N,0``) are recorded as the empty range (N+1, N) so that
+    they still collide with edits of the neighbouring lines.
+    """
+    result = _git(["diff", "-U0", "--no-color", "--no-ext-diff", "--no-renames", base, rev], cwd)
+    hunks: Dict[str, List[Tuple[int, int]]] = {}
+    current: Optional[str] = None
+    for line in result.stdout.splitlines():
+        if line.startswith("diff --git "):
+            current = line.split(" b/", 1)[-1]
+            hunks.setdefault(current, [])
+        elif line.startswith("@@") and current is not None:
+            match = _HUNK_RE.match(line)
+            if match:
+                start = int(match.group(1))
+                count = int(match.group(2)) if match.group(2) is not None else 1
+                if count == 0:
+                    hunks[current].append((start + 1, start))
+                else:
+                    hunks[current].append((start, start + count - 1))
+    return hunks
+
+
+def _ranges_collide(a: Tuple[int, int], b: Tuple[int, int]) -> bool:
+    """git conflicts when changed regions overlap or are directly adjacent."""
+    return a[0] <= b[1] + 1 and b[0] <= a[1] + 1
+
+
+def _predict_with_hunk_overlap(target: str, source: str, cwd: Optional[Path]) -> MergePrediction:
+    """Prediction from overlapping diff hunks against the merge base."""
+    prediction = MergePrediction(source=source, target=target, method=METHOD_HUNK_OVERLAP)
+    base = _git(["merge-base", target, source], cwd)
+    if base.returncode != 0:
+        prediction.error = f"no merge base between {target} and {source}"
+        return prediction
+    base_oid = base.stdout.strip()
+    ours = _changed_hunks(base_oid, target, cwd)
+    theirs = _changed_hunks(base_oid, source, cwd)
+    for path in sorted(set(ours) & set(theirs)):
+        if _same_blob(target, source, path, cwd):
+            continue  # identical change on both sides merges cleanly
+        ranges = sorted(
+            (min(a[0], b[0]), max(a[1], b[1]))
+            for a in ours[path] for b in theirs[path] if _ranges_collide(a, b)
+        )
+        # Hunkless entries are binary or mode changes: treat as conflicting
+        if ranges or not ours[path] or not theirs[path]:
+            prediction.conflicts.append(PredictedConflict(file_path=path, line_ranges=ranges))
+    return prediction
+
+
+def _same_blob(a: str, b: str, path: str, cwd: Optional[Path]) -> bool:
+    left = _git(["rev-parse", "--verify", "--quiet", f"{a}:{path}"], cwd)
+    right = _git(["rev-parse", "--verify", "--quiet", f"{b}:{path}"], cwd)
+    return left.returncode == right.returncode and left.stdout == right.stdout
+
+
+def predict_merge_conflicts(
+    source: str,
+    target: str = "master",
+    repo_root: Optional[Union[str, Path]] = None,
+    method: Optional[str] = None,
+) -> MergePrediction:
+    """Predict which files conflict if ``source`` is merged into ``target``.
+
+    Neither the working tree, the index nor any ref is modified.
+
+    Args:
+        source: Branch or commit being merged (the feature branch)
+        target: Branch or commit merged into (default: 'master')
+        repo_root: Repository to run in (default: current directory)
+        method: Force METHOD_MERGE_TREE or METHOD_HUNK_OVERLAP (default:
+            merge-tree when git supports it, else hunk overlap)
+
+    Returns:
+        MergePrediction; check ``.ok`` before trusting ``.has_conflicts``
+
+    Examples:
+        >>> prediction = predict_merge_conflicts("feature-auth", "main")
+        >>> if prediction.ok and prediction.has_conflicts:
+        ...     print(prediction.summary())
+    """
+    cwd = Path(repo_root) if repo_root else None
+    try:
+        for rev in (target, source):
+            if _rev_parse(rev, cwd) is None:
+                return MergePrediction(source=source, target=target, error=f"unknown revision: {rev}")
+        if method != METHOD_HUNK_OVERLAP:
+            prediction = _predict_with_merge_tree(target, source, cwd)
+            if prediction is not None:
+                return prediction
+        return _predict_with_hunk_overlap(target, source, cwd)
+    except (OSError, subprocess.SubprocessError) as e:
+        return MergePrediction(source=source, target=target, error=str(e))
+
+
+# =============================================================================
+# Batch ordering
+# =============================================================================
+
+def _simulate_merge(base: str, prediction: MergePrediction, source: str, cwd: Optional[Path]) -> Optional[str]:
+    """Commit a clean merge-tree result (unreferenced); return its OID."""
+    env = {**os.environ, **_SIMULATION_ENV}
+    result = _git(
+        ["commit-tree", prediction.tree, "-p", base, "-p", source, "-m", f"simulated merge of {source}"],
+        cwd, env=env,
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def plan_merge_order(
+    branches: Iterable[str],
+    target: str = "master",
+    repo_root: Optional[Union[str, Path]] = None,
+) -> MergePlan:
+    """Order ``branches`` so that as many as possible merge cleanly.
+
+    Greedy simulation: starting from ``target``, every remaining branch is
+    predicted against the simulated merge result so far; the first branch (in
+    input order) that merges cleanly is appended and becomes part of the
+    simulated result. When no remaining branch is clean, the one with the
+    fewest predicted conflicting files goes next and the simulation continues
+    without it, since a conflicting merge would not land unattended.
+
+    Args:
+        branches: Branches to merge, in their preferred order
+        target: Branch they merge into
+        repo_root: Repository to run in (default: current directory)
+
+    Returns:
+        MergePlan (``order`` always contains every input branch once)
+    """
+    cwd = Path(repo_root) if repo_root else None
+    remaining = list(dict.fromkeys(branches))
+    plan = MergePlan(target=target)
+    head = _rev_parse(target, cwd)
+    if head is None:
+        plan.order = remaining
+        plan.conflicting = list(remaining)
+        for branch in remaining:
+            plan.predictions[branch] = MergePrediction(
+                source=branch, target=target, error=f"unknown revision: {target}")
+        return plan
+
+    while remaining:
+        predictions = {b: predict_merge_conflicts(b, head, repo_root=cwd) for b in remaining}
+        clean = [b for b in remaining if predictions[b].ok and not predictions[b].has_conflicts]
+        if clean:
+            chosen = clean[0]
+            prediction = predictions[chosen]
+            merged = None
+            if prediction.method == METHOD_MERGE_TREE and prediction.tree:
+                merged = _simulate_merge(head, prediction, chosen, cwd)
+            if merged is None:
+                # Hunk-overlap fallback cannot build the merged tree: predict the
+                # rest against the real target only.
+                merged = head
+            head = merged
+        else:
+            chosen = min(remaining, key=lambda b: (
+                not predictions[b].ok, len(predictions[b].conflicts), remaining.index(b)))
+            plan.conflicting.append(chosen)
+        predictions[chosen].target = target
+        plan.predictions[chosen] = predictions[chosen]
+        plan.order.append(chosen)
+        remaining.remove(chosen)
+    return plan
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print predictions (and a merge plan for several branches) as JSON."""
+    parser = argparse.ArgumentParser(description="Predict merge conflicts without touching the working tree")
+    parser.add_argument("branches", nargs="+", help="Branches to merge")
+    parser.add_argument("--target", default="master", help="Branch to merge into (default: master)")
+    args = parser.parse_args(argv)
+
+    if len(args.branches) == 1:
+        prediction = predict_merge_conflicts(args.branches[0], args.target)
+        print(json.dumps(prediction.to_dict(), indent=2))
+        return 1 if prediction.has_conflicts else (2 if not prediction.ok else 0)
+
+    plan = plan_merge_order(args.branches, args.target)
+    print(json.dumps({
+        "target": plan.target,
+        "order": plan.order,
+        "conflicting": plan.conflicting,
+        "predictions": {b: p.to_dict() for b, p in plan.predictions.items()},
+    }, indent=2))
+    return 1 if plan.conflicting else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
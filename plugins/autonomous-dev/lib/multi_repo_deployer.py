@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+Multi-Repo Deployer - Parallel plugin deployment across consumer repositories
+
+Rolls a plugin release out to many target repositories concurrently. Each
+repository runs the same four phases in its own worker process, so a crash or
+hang in one repo never corrupts another:
+
+    1. install          - InstallOrchestrator.upgrade_install() (or fresh_install())
+    2. settings_merge   - SettingsMerger merges templates/settings.local.json hooks
+    3. hook_activation  - HookActivator.activate_hooks() with the template hooks
+    4. sync_validation  - SyncValidator.validate_all()
+
+A repo whose attempt fails is rolled back with InstallOrchestrator.rollback()
+(or its freshly-created .claude/ is removed) and retried up to ``max_retries``
+times. The consolidated report records per-phase timings and failures for
+every repo and can be written as JSON.
+
+Usage:
+    from multi_repo_deployer import MultiRepoDeployer
+
+    deployer = MultiRepoDeployer(plugin_dir, [repo_a, repo_b, repo_c], max_workers=4)
+    report = deployer.deploy()
+    print(report.to_json())
+
+    # Persist the consolidated report
+    report.save(Path("deploy-report.json"))
+
+Security:
+- Every repo path goes through the same validate_path() checks as
+  InstallOrchestrator (CWE-22, CWE-59)
+- Audit log entry per repo and per deployment
+
+Date: 2026-10-18
+Agent: implementer
+
+See library-design-patterns skill for standardized library structure.
+See error-handling-patterns skill for exception handling.
+"""
+
+import json
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Import dependencies - handle both package import and direct script execution
+try:
+    from .install_orchestrator import InstallOrchestrator, InstallError
+    from .settings_merger import SettingsMerger
+    from .hook_activator import HookActivator
+    from .sync_validator import SyncValidator
+    from .security_utils import audit_log
+except ImportError:
+    import sys
+    lib_dir = Path(__file__).parent
+    if str(lib_dir) not in sys.path:
+        sys.path.insert(0, str(lib_dir))
+
+    from install_orchestrator import InstallOrchestrator, InstallError
+    from settings_merger import SettingsMerger
+    from hook_activator import HookActivator
+    from sync_validator import SyncValidator
+    from security_utils import audit_log
+
+
+# Phase names in execution order
+PHASES = ("install", "settings_merge", "hook_activation", "sync_validation")
+
+# Default concurrency (each repo is mostly file I/O, so a small pool suffices)
+DEFAULT_MAX_WORKERS = 4
+
+# Default number of extra attempts after a failed (and rolled back) attempt
+DEFAULT_MAX_RETRIES = 1
+
+# Settings template merged into <repo>/.claude/settings.json (matches /sync)
+SETTINGS_TEMPLATE = Path("templates") / "settings.local.json"
+
+
+class DeployError(Exception):
+    """Raised when a deployment phase fails for a repository."""
+    pass
+
+
+# ============================================================================
+# Result Dataclasses
+# ============================================================================
+
+
+@dataclass
+class PhaseResult:
+    """Outcome of one phase for one repository attempt.
+
+    Attributes:
+        phase: Phase name (see PHASES)
+        status: "ok", "failed" or "skipped"
+        duration_ms: Wall-clock time spent in the phase
+        error: Error message when status is "failed"
+        details: Phase-specific details (files copied, hooks added, ...)
+    """
+    phase: str
+    status: str
+    duration_ms: float = 0.0
+    error: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class RepoDeployResult:
+    """Outcome of deploying to one repository (all attempts).
+
+    Attributes:
+        repo: Repository path
+        status: "success", "rolled_back" or "failed"
+        attempts: Number of attempts made
+        duration_ms: Total wall-clock time across attempts
+        phases: Phase results of the final attempt
+        errors: One error message per failed attempt
+        rolled_back: Whether the final failed attempt was rolled back
+    """
+    repo: str
+    status: str
+    attempts: int = 0
+    duration_ms: float = 0.0
+    phases: List[PhaseResult] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    rolled_back: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class DeploymentReport:
+    """Consolidated report for a multi-repo deployment.
+
+    Attributes:
+        plugin_dir: Plugin source directory
+        started_at: ISO-8601 UTC start time
+        duration_ms: Total wall-clock time
+        max_workers: Concurrency used
+        repos: Per-repo results (in input order)
+    """
+    plugin_dir: str
+    started_at: str
+    duration_ms: float = 0.0
+    max_workers: int = DEFAULT_MAX_WORKERS
+    repos: List[RepoDeployResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> List[str]:
+        return [r.repo for r in self.repos if r.status == "success"]
+
+    @property
+    def failed(self) -> List[str]:
+        return [r.repo for r in self.repos if r.status != "success"]
+
+    @property
+    def all_succeeded(self) -> bool:
+        return not self.failed
+
+    def phase_totals(self) -> Dict[str, float]:
+        """Sum of final-attempt phase durations across repos (ms)."""
+        totals = {phase: 0.0 for phase in PHASES}
+        for repo in self.repos:
+            for phase in repo.phases:
+                totals[phase.phase] = totals.get(phase.phase, 0.0) + phase.duration_ms
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to JSON-safe dictionary."""
+        return {
+            "plugin_dir": self.plugin_dir,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 1),
+            "max_workers": self.max_workers,
+            "summary": {
+                "total": len(self.repos),
+                "succeeded": len(self.succeeded),
+                "failed": len(self.failed),
+                "phase_totals_ms": {k: round(v, 1) for k, v in self.phase_totals().items()},
+            },
+            "repos": [r.to_dict() for r in self.repos],
+        }
+
+    def to_json(self) -> str:
+        """Serialize report as formatted JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def save(self, report_path: Path) -> None:
+        """Write report JSON to disk (creates parent directories)."""
+        report_path = Path(report_path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(self.to_json() + "\n")
+
+
+# ============================================================================
+# Per-Repo Pipeline (runs inside a worker process)
+# ============================================================================
+
+
+def _timed_phase(name: str, func: Callable[[], Dict[str, Any]]) -> PhaseResult:
+    """Run one phase, converting exceptions into a failed PhaseResult."""
+    start = time.perf_counter()
+    try:
+        details = func()
+        status = "skipped" if details.pop("_skipped", False) else "ok"
+        return PhaseResult(
+            phase=name,
+            status=status,
+            duration_ms=(time.perf_counter() - start) * 1000,
+            details=details,
+        )
+    except Exception as e:
+        return PhaseResult(
+            phase=name,
+            status="failed",
+            duration_ms=(time.perf_counter() - start) * 1000,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+
+def _run_attempt(
+    plugin_dir: Path,
+    repo: Path,
+    hooks_config: Optional[Dict[str, Any]],
+    run_sync_validation: bool,
+) -> tuple:
+    """Run all phases once for a repo.
+
+    Returns:
+        (phases, rollback_target) where rollback_target is the backup directory
+        from an upgrade, the string "fresh" for a fresh install, or None if the
+        install phase never modified the repo.
+    """
+    phases: List[PhaseResult] = []
+    state: Dict[str, Any] = {"rollback_target": None}
+    claude_dir = repo / ".claude"
+
+    def install() -> Dict[str, Any]:
+        orchestrator = InstallOrchestrator(plugin_dir, repo)
+        if claude_dir.exists():
+            result = orchestrator.upgrade_install()
+            state["rollback_target"] = result.backup_dir
+        else:
+            state["rollback_target"] = "fresh"
+            result = orchestrator.fresh_install()
+        if result.status != "success":
+            raise InstallError("; ".join(result.errors) or "install reported failure")
+        return {
+            "files_copied": result.files_copied,
+            "files_unchanged": result.files_unchanged,
+            "bytes_written": result.bytes_written,
+            "coverage": result.coverage,
+        }
+
+    def settings_merge() -> Dict[str, Any]:
+        template_path = plugin_dir / SETTINGS_TEMPLATE
+        if not template_path.exists():
+            return {"_skipped": True, "reason": f"template not found: {SETTINGS_TEMPLATE}"}
+        result = SettingsMerger(str(repo)).merge_settings(
+            template_path=template_path,
+            user_path=claude_dir / "settings.json",
+            write_result=True,
+        )
+        if not result.success:
+            raise DeployError(result.message)
+        return {"hooks_added": result.hooks_added, "hooks_preserved": result.hooks_preserved}
+
+    def hook_activation() -> Dict[str, Any]:
+        config = hooks_config
+        if config is None:
+            template_path = plugin_dir / SETTINGS_TEMPLATE
+            if not template_path.exists():
+                return {"_skipped": True, "reason": "no hooks configuration"}
+            config = {"hooks": json.loads(template_path.read_text()).get("hooks", {})}
+        result = HookActivator(repo).activate_hooks(config)
+        return {"activated": result.activated, "hooks_added": result.hooks_added}
+
+    def sync_validation() -> Dict[str, Any]:
+        if not run_sync_validation:
+            return {"_skipped": True, "reason": "disabled"}
+        result = SyncValidator(repo).validate_all()
+        details = {"errors": result.total_errors, "warnings": result.total_warnings}
+        if not result.overall_passed:
+            failed = [p.phase for p in result.phases if not p.passed]
+            raise DeployError(f"sync validation failed: {', '.join(failed)}")
+        return details
+
+    steps = {
+        "install": install,
+        "settings_merge": settings_merge,
+        "hook_activation": hook_activation,
+        "sync_validation": sync_validation,
+    }
+
+    for name in PHASES:
+        phase = _timed_phase(name, steps[name])
+        phases.append(phase)
+        if phase.status == "failed":
+            break
+
+    return phases, state["rollback_target"]
+
+
+def _rollback_repo(plugin_dir: Path, repo: Path, rollback_target: Any) -> None:
+    """Restore a repo to its pre-attempt state.
+
+    Upgrades are restored with InstallOrchestrator.rollback(); a fresh install
+    has no backup, so the .claude/ directory it created is removed.
+    """
+    if rollback_target is None:
+        return
+    if rollback_target == "fresh":
+        claude_dir = repo / ".claude"
+        if claude_dir.exists():
+            shutil.rmtree(claude_dir)
+        return
+    backup_dir = Path(rollback_target)
+    if backup_dir.exists():
+        InstallOrchestrator(plugin_dir, repo).rollback(backup_dir)
+
+
+def deploy_repo(
+    plugin_dir: Path,
+    repo: Path,
+    hooks_config: Optional[Dict[str, Any]] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    run_sync_validation: bool = True,
+) -> Dict[str, Any]:
+    """Deploy the plugin to one repository with rollback and retry.
+
+    Module-level (not a method) so it can be pickled into worker processes.
+
+    Args:
+        plugin_dir: Plugin source directory
+        repo: Target repository root
+        hooks_config: Hook configuration for HookActivator ({"hooks": {...}}).
+            Defaults to the hooks of templates/settings.local.json.
+        max_retries: Extra attempts after a failed, rolled-back attempt
+        run_sync_validation: Run SyncValidator.validate_all() as the last phase
+
+    Returns:
+        RepoDeployResult as a dictionary (JSON-safe)
+    """
+    plugin_dir = Path(plugin_dir)
+    repo = Path(repo)
+    result = RepoDeployResult(repo=str(repo), status="failed")
+    start = time.perf_counter()
+
+    for attempt in range(1, max_retries + 2):
+        result.attempts = attempt
+        try:
+            phases, rollback_target = _run_attempt(
+                plugin_dir, repo, hooks_config, run_sync_validation
+            )
+        except Exception as e:
+            phases = [PhaseResult(phase="install", status="failed", error=str(e))]
+            rollback_target = None
+
+        result.phases = phases
+        failed = [p for p in phases if p.status == "failed"]
+        if not failed:
+            result.status = "success"
+            result.rolled_back = False
+            break
+
+        result.errors.append(f"attempt {attempt}: {failed[0].phase}: {failed[0].error}")
+        try:
+            _rollback_repo(plugin_dir, repo, rollback_target)
+            result.rolled_back = rollback_target is not None
+        except Exception as e:
+            result.rolled_back = False
+            result.errors.append(f"attempt {attempt}: rollback failed: {e}")
+            break  # Never retry on top of an unrestored tree
+
+    if result.status != "success":
+        result.status = "rolled_back" if result.rolled_back else "failed"
+
+    result.duration_ms = (time.perf_counter() - start) * 1000
+
+    audit_log("multi_repo_deployer", result.status, {
+        "repo": str(repo),
+        "attempts": result.attempts,
+        "duration_ms": round(result.duration_ms, 1),
+    })
+
+    return result.to_dict()
+
+
+def _result_from_dict(data: Dict[str, Any]) -> RepoDeployResult:
+    """Rebuild a RepoDeployResult returned across the process boundary."""
+    phases = [PhaseResult(**p) for p in data.get("phases", [])]
+    return RepoDeployResult(**{**data, "phases": phases})
+
+
+# ============================================================================
+# Orchestrator
+# ============================================================================
+
+
+class MultiRepoDeployer:
+    """Deploy a plugin to many repositories concurrently.
+
+    Attributes:
+        plugin_dir: Plugin source directory
+        repos: Target repository roots
+        max_workers: Maximum concurrent repos
+        max_retries: Extra attempts per failed repo
+        hooks_config: Hook configuration for HookActivator (None = template hooks)
+        run_sync_validation: Run SyncValidator as the final phase
+        use_processes: Isolate repos in worker processes (False = threads)
+
+    Examples:
+        >>> deployer = MultiRepoDeployer(plugin_dir, repos, max_workers=4)
+        >>> report = deployer.deploy()
+        >>> report.all_succeeded
+        True
+    """
+
+    def __init__(
+        self,
+        plugin_dir: Path,
+        repos: List[Path],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        hooks_config: Optional[Dict[str, Any]] = None,
+        run_sync_validation: bool = True,
+        use_processes: bool = True,
+    ):
+        """Initialize deployer.
+
+        Args:
+            plugin_dir: Plugin source directory
+            repos: Target repository roots (duplicates are deployed once)
+            max_workers: Maximum concurrent repos (>= 1)
+            max_retries: Extra attempts per failed repo (>= 0)
+            hooks_config: Hook configuration for HookActivator
+            run_sync_validation: Run SyncValidator as the final phase
+            use_processes: Isolate repos in worker processes
+
+        Raises:
+            ValueError: If max_workers < 1 or max_retries < 0
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0, got {max_retries}")
+
+        self.plugin_dir = Path(plugin_dir).resolve()
+        self.repos = list(dict.fromkeys(Path(r).resolve() for r in repos))
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.hooks_config = hooks_config
+        self.run_sync_validation = run_sync_validation
+        self.use_processes = use_processes
+
+    def deploy(self) -> DeploymentReport:
+        """Deploy to all repos and return the consolidated report.
+
+        Returns:
+            DeploymentReport with one RepoDeployResult per repo (input order)
+        """
+        report = DeploymentReport(
+            plugin_dir=str(self.plugin_dir),
+            started_at=datetime.now(timezone.utc).isoformat(),
+            max_workers=self.max_workers,
+        )
+        start = time.perf_counter()
+
+        if self.repos:
+            workers = min(self.max_workers, len(self.repos))
+            executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            with executor_class(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        deploy_repo,
+                        self.plugin_dir,
+                        repo,
+                        self.hooks_config,
+                        self.max_retries,
+                        self.run_sync_validation,
+                    )
+                    for repo in self.repos
+                ]
+                for repo, future in zip(self.repos, futures):
+                    try:
+                        report.repos.append(_result_from_dict(future.result()))
+                    except Exception as e:
+                        # Worker process died (BrokenProcessPool, pickling, ...)
+                        report.repos.append(RepoDeployResult(
+                            repo=str(repo),
+                            status="failed",
+                            errors=[f"worker error: {type(e).__name__}: {e}"],
+                        ))
+
+        report.duration_ms = (time.perf_counter() - start) * 1000
+
+        audit_log("multi_repo_deployer", "complete", {
+            "plugin_dir": str(self.plugin_dir),
+            "repos": len(report.repos),
+            "succeeded": len(report.succeeded),
+            "failed": len(report.failed),
+            "duration_ms": round(report.duration_ms, 1),
+        })
+
+        return report
+
+
+def main() -> int:
+    """CLI entry point for multi-repo deployment."""
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Deploy autonomous-dev to many repos in parallel")
+    parser.add_argument("repos", nargs="+", type=Path, help="Target repository roots")
+    parser.add_argument("--plugin-dir", type=Path, required=True, help="Plugin source directory")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS, help="Concurrent repos")
+    parser.add_argument("--retries", type=int, default=DEFAULT_MAX_RETRIES, help="Retries per failed repo")
+    parser.add_argument("--no-validate", action="store_true", help="Skip sync validation phase")
+    parser.add_argument("--report", type=Path, help="Write JSON report to this path")
+
+    args = parser.parse_args()
+
+    try:
+        deployer = MultiRepoDeployer(
+            args.plugin_dir,
+            args.repos,
+            max_workers=args.workers,
+            max_retries=args.retries,
+            run_sync_validation=not args.no_validate,
+        )
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+    report = deployer.deploy()
+
+    for repo in report.repos:
+        icon = "✅" if repo.status == "success" else "❌"
+        timings = ", ".join(f"{p.phase}={p.duration_ms:.0f}ms" for p in repo.phases)
+        print(f"{icon} {repo.repo} [{repo.status}, {repo.attempts} attempt(s)] {timings}")
+        for error in repo.errors:
+            print(f"    - {error}")
+
+    if args.report:
+        report.save(args.report)
+        print(f"📄 Report: {args.report}")
+
+    return 0 if report.all_succeeded else 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,337 @@
+"""Parse-once Bash command model shared by the pre-tool detectors.
+
+``unified_pre_tool.py`` runs a dozen Bash detectors (git bypass, env-var
+spoofing, ``gh issue create`` gating, settings/infra write protection,
+``rm -rf $VAR`` checks, ...) and ``tool_intent`` classifies the same command
+again. Each of them used to re-tokenize the raw string with its own
+``shlex.split`` / statement split / heredoc strip / quoted-segment strip, so
+a long agent-generated command was scanned ~30 times per hook invocation.
+
+``parse_command(command)`` returns a ``ParsedCommand`` whose views are
+computed lazily, at most once, and memoized per command string. Every view
+is produced by exactly the function the detectors used before, so decisions
+are unchanged:
+
+- ``tokens`` / ``argv()``: ``shlex.split(command, posix=True)``
+- ``statements``: top-level statements split on ``; && || | & \\n``
+- ``segments`` / ``segment_tokens``: sequential segments (``; && || &``)
+  and their shlex argv, as walked by ``tool_intent``
+- ``heredoc_stripped``: heredoc bodies removed (``heredoc_utils``)
+- ``unquoted``: ``heredoc_stripped`` with quoted segments removed
+
+All views are tuples/strings; callers that need to mutate take a copy.
+
+Issue: parse-once Bash command model
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import re
+import shlex
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Number of distinct command strings kept parsed. A hook invocation parses a
+# handful (the command plus derived strings such as the heredoc-stripped form
+# and the segment before the first pipe); the cap only bounds long-lived
+# processes such as the test suite.
+PARSE_CACHE_SIZE: int = 256
+
+# ---------------------------------------------------------------------------
+# Defensive import of heredoc_utils (same directory)
+# ---------------------------------------------------------------------------
+
+_strip_heredoc_fn = None
+try:
+    _heredoc_path = Path(__file__).resolve().parent / "heredoc_utils.py"
+    if _heredoc_path.exists():
+        _heredoc_spec = importlib.util.spec_from_file_location(
+            "heredoc_utils", str(_heredoc_path)
+        )
+        if _heredoc_spec and _heredoc_spec.loader:
+            _heredoc_mod = importlib.util.module_from_spec(_heredoc_spec)
+            _heredoc_spec.loader.exec_module(_heredoc_mod)
+            _strip_heredoc_fn = _heredoc_mod.strip_heredoc_content
+except Exception:  # pragma: no cover — defensive
+    _strip_heredoc_fn = None
+
+
+# ---------------------------------------------------------------------------
+# Splitters and strippers (single source of truth)
+# ---------------------------------------------------------------------------
+
+
+def split_statements(command: str) -> "list[str]":
+    """Split a Bash command string into top-level statement strings.
+
+    Walks the source command character-by-character respecting single and
+    double quotes (so a separator inside a quoted body is NOT a split point).
+    Recognized top-level separators: ``;``, ``&&``, ``||``, ``|``, ``&``,
+    and newline. The resulting statement strings preserve their interior
+    structure (quoting, flags, values) for the caller to feed to shlex.
+
+    Args:
+        command: The raw Bash command string.
+
+    Returns:
+        List of statement substrings with surrounding whitespace stripped.
+        Empty statements are dropped.
+    """
+    out: "list[str]" = []
+    buf: "list[str]" = []
+    i = 0
+    n = len(command)
+    in_single = False
+    in_double = False
+    while i < n:
+        c = command[i]
+        # Quote handling: single quotes are literal (no escapes); double
+        # quotes honor backslash escapes for the closing quote.
+        if c == "'" and not in_double:
+            in_single = not in_single
+            buf.append(c)
+            i += 1
+            continue
+        if c == '"' and not in_single:
+            in_double = not in_double
+            buf.append(c)
+            i += 1
+            continue
+        if in_single or in_double:
+            # Inside a quoted region, preserve everything verbatim
+            # (including backslash-escapes inside double quotes).
+            if c == "\\" and in_double and i + 1 < n:
+                buf.append(c)
+                buf.append(command[i + 1])
+                i += 2
+                continue
+            buf.append(c)
+            i += 1
+            continue
+        # Two-character separators take precedence over single-char ones.
+        if i + 1 < n and command[i:i + 2] in ("&&", "||"):
+            stmt = "".join(buf).strip()
+            if stmt:
+                out.append(stmt)
+            buf = []
+            i += 2
+            continue
+        if c in (";", "|", "&", "\n"):
+            stmt = "".join(buf).strip()
+            if stmt:
+                out.append(stmt)
+            buf = []
+            i += 1
+            continue
+        buf.append(c)
+        i += 1
+    tail = "".join(buf).strip()
+    if tail:
+        out.append(tail)
+    return out
+
+
+def split_sequential(command: str) -> "list[str]":
+    """Split a raw command string on sequential shell operators (``;``, ``&&``, ``||``).
+
+    Respects single/double quotes — operators inside quoted strings are not
+    split points. Backslash-escaped operators are also preserved. Pipes are
+    NOT split points (``tool_intent`` splits pipe stages after tokenizing).
+    """
+    segments: "list[str]" = []
+    buf: "list[str]" = []
+    i = 0
+    n = len(command)
+    in_single = False
+    in_double = False
+    while i < n:
+        c = command[i]
+        if c == "\\" and i + 1 < n:
+            buf.append(c)
+            buf.append(command[i + 1])
+            i += 2
+            continue
+        if c == "'" and not in_double:
+            in_single = not in_single
+            buf.append(c)
+            i += 1
+            continue
+        if c == '"' and not in_single:
+            in_double = not in_double
+            buf.append(c)
+            i += 1
+            continue
+        if not in_single and not in_double:
+            # Operators: ;, &&, ||, & (background)
+            if c == ";":
+                segments.append("".join(buf))
+                buf = []
+                i += 1
+                continue
+            if c == "&" and i + 1 < n and command[i + 1] == "&":
+                segments.append("".join(buf))
+                buf = []
+                i += 2
+                continue
+            if c == "|" and i + 1 < n and command[i + 1] == "|":
+                segments.append("".join(buf))
+                buf = []
+                i += 2
+                continue
+            # Bare ``&`` (background) — treat as segment break.
+            if c == "&" and (i + 1 >= n or command[i + 1] not in ("&", ">")):
+                segments.append("".join(buf))
+                buf = []
+                i += 1
+                continue
+        buf.append(c)
+        i += 1
+    if buf:
+        segments.append("".join(buf))
+    return segments
+
+
+def strip_quoted_segments(command: str) -> str:
+    """Remove single- and double-quoted segments from a command string (Issue #590).
+
+    Single-quoted strings in bash have no escape sequences, so the pattern is
+    simple: everything between the first ``'`` and the next ``'``. Double-quoted
+    strings support backslash escaping, so ``\\"`` inside a double-quoted
+    segment does NOT end the string.
+
+    Args:
+        command: The raw Bash command string.
+
+    Returns:
+        Command with quoted segments replaced by empty strings, or the
+        original command unchanged on any regex error.
+    """
+    try:
+        # Remove single-quoted segments first (no escape sequences in single quotes)
+        result = re.sub(r"'[^']*'", "", command)
+        # Remove double-quoted segments (backslash can escape a quote inside)
+        result = re.sub(r'"(?:[^"\\]|\\.)*"', "", result)
+        return result
+    except re.error:
+        return command
+
+
+def strip_heredoc(command: str) -> str:
+    """Remove heredoc bodies via ``heredoc_utils`` (input unchanged if unavailable)."""
+    if _strip_heredoc_fn is None:
+        return command
+    try:
+        return _strip_heredoc_fn(command)
+    except Exception:
+        return command
+
+
+# ---------------------------------------------------------------------------
+# ParsedCommand
+# ---------------------------------------------------------------------------
+
+
+class ParsedCommand:
+    """Lazily-parsed, immutable view of one Bash command string.
+
+    Attributes:
+        raw: The command string exactly as given.
+    """
+
+    def __init__(self, raw: str):
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        return f"ParsedCommand({self.raw!r})"
+
+    # --- shlex argv --------------------------------------------------------
+
+    @cached_property
+    def _shlex(self) -> "Tuple[Optional[Tuple[str, ...]], Optional[str]]":
+        try:
+            return (tuple(shlex.split(self.raw, posix=True)), None)
+        except ValueError as exc:
+            return (None, str(exc))
+
+    @property
+    def tokens(self) -> "Optional[Tuple[str, ...]]":
+        """``shlex.split(raw, posix=True)``, or None when quoting is malformed."""
+        return self._shlex[0]
+
+    @property
+    def tokens_error(self) -> Optional[str]:
+        """The shlex ValueError message when ``tokens`` is None."""
+        return self._shlex[1]
+
+    def argv(self) -> "list[str]":
+        """Fresh list of shlex tokens.
+
+        Raises:
+            ValueError: When the command cannot be tokenized (same condition
+                and message as ``shlex.split``).
+        """
+        tokens, error = self._shlex
+        if tokens is None:
+            raise ValueError(error)
+        return list(tokens)
+
+    # --- statement / segment structure --------------------------------------
+
+    @cached_property
+    def statements(self) -> "Tuple[str, ...]":
+        """Top-level statements (see ``split_statements``)."""
+        return tuple(split_statements(self.raw))
+
+    @cached_property
+    def segments(self) -> "Tuple[str, ...]":
+        """Sequential segments (see ``split_sequential``), unstripped."""
+        return tuple(split_sequential(self.raw))
+
+    @cached_property
+    def segment_tokens(self) -> "Tuple[Optional[Tuple[str, ...]], ...]":
+        """shlex argv per entry of ``segments`` (None where quoting is malformed)."""
+        return tuple(parse_command(seg).tokens for seg in self.segments)
+
+    # --- stripped forms ----------------------------------------------------
+
+    @cached_property
+    def heredoc_stripped(self) -> str:
+        """``raw`` with heredoc bodies removed."""
+        return strip_heredoc(self.raw)
+
+    @cached_property
+    def unquoted(self) -> str:
+        """``heredoc_stripped`` with quoted segments removed."""
+        return strip_quoted_segments(self.heredoc_stripped)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_command(command: str) -> ParsedCommand:
+    """Return the shared ``ParsedCommand`` for ``command`` (memoized).
+
+    Args:
+        command: Raw Bash command string.
+
+    Returns:
+        ParsedCommand whose views are computed on first access.
+    """
+    return ParsedCommand(command)
+
+
+def clear_parse_cache() -> None:
+    """Drop all memoized ParsedCommand objects."""
+    parse_command.cache_clear()
+
+
+__all__ = [
+    "PARSE_CACHE_SIZE",
+    "ParsedCommand",
+    "parse_command",
+    "clear_parse_cache",
+    "split_statements",
+    "split_sequential",
+    "strip_quoted_segments",
+    "strip_heredoc",
+]
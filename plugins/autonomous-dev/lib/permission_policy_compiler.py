@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+Permission Policy Compiler - Compiled matchers for permission policies
+
+ToolValidator, MCPPermissionValidator and SandboxEnforcer sit on the
+auto-approval hot path (auto_approval_engine.should_auto_approve). Their
+policies are lists of glob / substring / regex rules that used to be checked
+one pattern at a time in Python loops. This module compiles each rule list
+once into a matcher with identical decisions:
+
+- GlobSet: ordered fnmatch patterns -> exact-match dict, prefix trie for
+  "<dir>/*" rules, suffix trie for "*<suffix>" rules, and one combined
+  alternation regex for everything else. Reports the FIRST matching pattern
+  in list order, exactly like the original loops (reasons quote it).
+- DomainBlocklist: ToolValidator blocked_domains -> domain suffix set plus
+  prefix trie for "10.*"-style wildcards.
+- SubstringSet / RegexSet / BlockedPathSet: SandboxEnforcer and MCP shell
+  rules -> one combined prefilter regex; the per-pattern loop only runs when
+  the prefilter hits (rare on the approve path).
+- MCPGlobList: MCPPermissionValidator allow/deny glob lists (**, *, ?, !).
+
+Compiled artifacts are cached per process, keyed by a SHA-256 fingerprint of
+the rule kind and rule list, so validators built from the same policy content
+share them, and a policy mutated after construction simply maps to a new key.
+
+Usage:
+    from permission_policy_compiler import compile_rules, GlobSet
+
+    blacklist = compile_rules("glob", ["rm -rf*", "sudo *"])
+    blacklist.first("sudo ls")  # "sudo *"
+
+Date: 2026-10-18
+Issue: Compiled permission-policy engine (auto-approval hot path)
+Agent: implementer
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# fnmatch metacharacters - a pattern without them is an exact string match
+_GLOB_META = frozenset("*?[")
+
+
+def _has_glob_meta(text: str) -> bool:
+    return any(ch in _GLOB_META for ch in text)
+
+
+def _group_free(pattern: str, flags: int = 0) -> bool:
+    """True if pattern compiles and has no capture groups (safe to combine).
+
+    Patterns with groups may use numbered backreferences, which would point
+    at the wrong group once joined into a larger alternation.
+    """
+    try:
+        return re.compile(pattern, flags).groups == 0
+    except re.error:
+        return False
+
+
+def _try_compile(pattern: str, flags: int = 0) -> Optional["re.Pattern[str]"]:
+    try:
+        return re.compile(pattern, flags)
+    except re.error:
+        return None
+
+
+def policy_fingerprint(kind: str, rules: Any) -> str:
+    """SHA-256 of a rule kind plus its canonical JSON content.
+
+    Args:
+        kind: Rule class (e.g., "glob", "mcp_glob")
+        rules: JSON-serializable rule content
+
+    Returns:
+        Hex digest identifying the compiled artifact
+    """
+    payload = json.dumps([kind, rules], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# Tries
+# ============================================================================
+
+
+class PrefixTrie:
+    """Character trie mapping literal prefixes to their first rule index."""
+
+    _END = ""
+
+    def __init__(self) -> None:
+        self._root: Dict[str, Any] = {}
+        self.size = 0
+
+    def add(self, prefix: str, index: int) -> None:
+        node = self._root
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        if self._END not in node:
+            node[self._END] = index
+            self.size += 1
+
+    def min_index(self, text: str) -> Optional[int]:
+        """Smallest rule index whose prefix is a prefix of text."""
+        best: Optional[int] = None
+        node = self._root
+        if self._END in node:
+            best = node[self._END]
+        for ch in text:
+            node = node.get(ch)
+            if node is None:
+                break
+            index = node.get(self._END)
+            if index is not None and (best is None or index < best):
+                best = index
+        return best
+
+
+# ============================================================================
+# Glob sets (fnmatch semantics)
+# ============================================================================
+
+
+class GlobSet:
+    """Ordered fnmatch patterns compiled for first-match lookup.
+
+    first_index(text) returns the index of the first pattern p (in list
+    order) with fnmatch.fnmatch(text, p) - the same pattern the original
+    per-pattern loops would stop at.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns: List[str] = list(patterns)
+        self._exact: Dict[str, int] = {}
+        self._prefixes = PrefixTrie()
+        self._suffixes = PrefixTrie()  # Built over reversed strings
+        self._regex_index: Dict[str, int] = {}
+        parts = []
+
+        for index, pattern in enumerate(self.patterns):
+            norm = os.path.normcase(pattern)
+            if not _has_glob_meta(norm):
+                self._exact.setdefault(norm, index)
+            elif norm.endswith("*") and not _has_glob_meta(norm[:-1]):
+                # "<prefix>*": '*' matches anything (incl. '/'), so startswith
+                self._prefixes.add(norm[:-1], index)
+            elif norm.startswith("*") and not _has_glob_meta(norm[1:]):
+                self._suffixes.add(norm[1:][::-1], index)
+            else:
+                name = f"_{index}"
+                self._regex_index[name] = index
+                parts.append(f"(?P<{name}>{fnmatch.translate(norm)})")
+
+        self._regex = re.compile("|".join(parts)) if parts else None
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def first_index(self, text: str) -> Optional[int]:
+        if not self.patterns:
+            return None
+        norm = os.path.normcase(text)
+        candidates = [
+            self._exact.get(norm),
+            self._prefixes.min_index(norm) if self._prefixes.size else None,
+            self._suffixes.min_index(norm[::-1]) if self._suffixes.size else None,
+        ]
+        if self._regex is not None:
+            match = self._regex.match(norm)
+            if match is not None:
+                candidates.append(self._regex_index[match.lastgroup])
+        found = [c for c in candidates if c is not None]
+        return min(found) if found else None
+
+    def first(self, text: str) -> Optional[str]:
+        """First matching pattern, or None."""
+        index = self.first_index(text)
+        return None if index is None else self.patterns[index]
+
+    def matches(self, text: str) -> bool:
+        return self.first_index(text) is not None
+
+
+# ============================================================================
+# Domain blocklist (ToolValidator.validate_web_tool semantics)
+# ============================================================================
+
+
+class DomainBlocklist:
+    """blocked_domains compiled to a suffix set plus a wildcard prefix trie.
+
+    Entry semantics (first entry in list order wins):
+    - "10.*"        -> domain.startswith("10.")
+    - "example.com" -> domain == "example.com" or endswith(".example.com")
+    """
+
+    def __init__(self, entries: Sequence[str]):
+        self.entries: List[str] = list(entries)
+        self._names: Dict[str, int] = {}
+        self._prefixes = PrefixTrie()
+        for index, entry in enumerate(self.entries):
+            if entry.endswith("*"):
+                self._prefixes.add(entry[:-1], index)
+            else:
+                self._names.setdefault(entry, index)
+
+    def first(self, domain: str) -> Optional[str]:
+        """First blocked entry matching domain, or None."""
+        if not self.entries:
+            return None
+        best = self._prefixes.min_index(domain) if self._prefixes.size else None
+        if self._names:
+            # domain itself, then every suffix following a '.'
+            index = self._names.get(domain)
+            if index is not None and (best is None or index < best):
+                best = index
+            dot = domain.find(".")
+            while dot != -1:
+                index = self._names.get(domain[dot + 1:])
+                if index is not None and (best is None or index < best):
+                    best = index
+                dot = domain.find(".", dot + 1)
+        return None if best is None else self.entries[best]
+
+
+# ============================================================================
+# Substring / regex rule sets
+# ============================================================================
+
+
+class SubstringSet:
+    """Ordered literal substrings with a combined prefilter regex."""
+
+    def __init__(self, literals: Sequence[str]):
+        self.literals: List[str] = list(literals)
+        self._prefilter = (
+            re.compile("|".join(re.escape(lit) for lit in self.literals))
+            if self.literals else None
+        )
+
+    def first(self, text: str) -> Optional[str]:
+        """First literal (in list order) contained in text, or None."""
+        if self._prefilter is None or self._prefilter.search(text) is None:
+            return None
+        for literal in self.literals:
+            if literal in text:
+                return literal
+        return None  # pragma: no cover - prefilter hit implies a literal hit
+
+    def contains_any(self, text: str) -> bool:
+        return self._prefilter is not None and self._prefilter.search(text) is not None
+
+
+class RegexSet:
+    """Ordered regex rules (re.search semantics) with a combined prefilter.
+
+    Invalid patterns are skipped, like the original try/except re.error loop.
+    """
+
+    def __init__(self, patterns: Sequence[str], flags: int = 0):
+        self.patterns: List[str] = list(patterns)
+        self._compiled: List[Tuple[str, "re.Pattern[str]"]] = []
+        for pattern in self.patterns:
+            compiled = _try_compile(pattern, flags)
+            if compiled is not None:
+                self._compiled.append((pattern, compiled))
+
+        # Prefilter only when every rule can safely join one alternation;
+        # otherwise fall back to the ordered loop on every call.
+        self._prefilter = None
+        if self._compiled and all(c.groups == 0 for _, c in self._compiled):
+            self._prefilter = _try_compile(
+                "|".join(f"(?:{p})" for p, _ in self._compiled), flags
+            )
+
+    def first(self, text: str) -> Optional[str]:
+        """First valid pattern (in list order) found in text, or None."""
+        if not self._compiled:
+            return None
+        if self._prefilter is not None and self._prefilter.search(text) is None:
+            return None
+        for pattern, compiled in self._compiled:
+            if compiled.search(text):
+                return pattern
+        return None
+
+
+class BlockedPathSet:
+    """SandboxEnforcer blocked_paths: globs ('.'/'*' only) or substrings."""
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns: List[str] = list(patterns)
+        alternatives = []
+        for pattern in self.patterns:
+            if "*" in pattern:
+                regex = pattern.replace(".", r"\.").replace("*", ".*")
+                if _try_compile(regex) is not None:
+                    alternatives.append(regex)
+            else:
+                alternatives.append(re.escape(pattern))
+
+        self._combined = None
+        self._regexes: List["re.Pattern[str]"] = []
+        if alternatives and all(_group_free(a) for a in alternatives):
+            self._combined = _try_compile("|".join(f"(?:{a})" for a in alternatives))
+        if self._combined is None:
+            self._regexes = [re.compile(a) for a in alternatives]
+
+    def contains_any(self, text: str) -> bool:
+        if self._combined is not None:
+            return self._combined.search(text) is not None
+        return any(regex.search(text) for regex in self._regexes)
+
+
+# ============================================================================
+# MCP glob lists (MCPPermissionValidator.matches_glob_pattern semantics)
+# ============================================================================
+
+
+def _mcp_double_star_regex(pattern: str) -> str:
+    """Regex source for a '**' pattern, built exactly as the validator does."""
+    regex_pattern = pattern
+    regex_pattern = regex_pattern.replace(".", r"\.")
+    regex_pattern = regex_pattern.replace("+", r"\+")
+    regex_pattern = regex_pattern.replace("^", r"\^")
+    regex_pattern = regex_pattern.replace("$", r"\$")
+    regex_pattern = regex_pattern.replace("**", "DOUBLE_STAR_PLACEHOLDER")
+    regex_pattern = regex_pattern.replace("*", "[^/]*")
+    regex_pattern = regex_pattern.replace("?", "[^/]")
+    return regex_pattern.replace("DOUBLE_STAR_PLACEHOLDER", ".*")
+
+
+def _fnmatch_matcher(pattern: str) -> Callable[[str], bool]:
+    regex = re.compile(fnmatch.translate(os.path.normcase(pattern)))
+    return lambda text: regex.match(os.path.normcase(text)) is not None
+
+
+def compile_mcp_glob(pattern: str) -> Callable[[str], bool]:
+    """Compile one MCP glob pattern into a predicate over paths.
+
+    Decisions are identical to MCPPermissionValidator.matches_glob_pattern:
+    '**' patterns are searched anywhere in the path, patterns containing '/'
+    match a contiguous run of path segments, others match the basename, and
+    a leading '!' negates.
+
+    Raises:
+        re.error: If a '**' pattern produces an invalid regex (the original
+            implementation raises the same error at match time)
+    """
+    pattern = pattern.replace("\\", "/")
+
+    if pattern.startswith("!"):
+        inner = compile_mcp_glob(pattern[1:])
+        return lambda path: not inner(path)
+
+    if "**" in pattern:
+        regex = re.compile(_mcp_double_star_regex(pattern))
+        return lambda path: regex.search(path.replace("\\", "/")) is not None
+
+    if "/" in pattern:
+        part_matchers = [_fnmatch_matcher(p) for p in pattern.split("/") if p]
+        width = len(part_matchers)
+
+        def match_segments(path: str) -> bool:
+            path_parts = [p for p in path.replace("\\", "/").split("/") if p]
+            if width > len(path_parts):
+                return False
+            for i in range(len(path_parts) - width + 1):
+                if all(m(path_parts[i + j]) for j, m in enumerate(part_matchers)):
+                    return True
+            return False
+
+        return match_segments
+
+    basename = _fnmatch_matcher(pattern)
+    return lambda path: basename(Path(path.replace("\\", "/")).name)
+
+
+class MCPGlobList:
+    """Allow/deny glob list: allowed iff some plain pattern matches and no
+    '!' pattern matches (MCPPermissionValidator._matches_any_pattern).
+
+    All '**' patterns on each side share one combined search regex, and all
+    basename patterns one GlobSet. If any pattern cannot be compiled, the
+    list is marked invalid and callers fall back to the original evaluation
+    so error behaviour is preserved exactly.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns: List[str] = list(patterns)
+        self.valid = True
+        try:
+            positives = [p for p in self.patterns if not p.startswith("!")]
+            negatives = [p[1:] for p in self.patterns if p.startswith("!")]
+            self._positive = self._compile_side(positives)
+            self._negative = self._compile_side(negatives)
+        except (re.error, AttributeError, TypeError):
+            self.valid = False
+
+    @staticmethod
+    def _compile_side(patterns: List[str]) -> Tuple[Any, Optional[GlobSet], List[Callable[[str], bool]]]:
+        double_star = []
+        basenames = []
+        others: List[Callable[[str], bool]] = []
+        for pattern in patterns:
+            normalized = pattern.replace("\\", "/")
+            if normalized.startswith("!"):
+                others.append(compile_mcp_glob(normalized))
+            elif "**" in normalized:
+                source = _mcp_double_star_regex(normalized)
+                re.compile(source)  # Raise now if invalid
+                double_star.append(source)
+            elif "/" in normalized:
+                others.append(compile_mcp_glob(normalized))
+            else:
+                basenames.append(normalized)
+
+        combined = None
+        if double_star:
+            if all(_group_free(s) for s in double_star):
+                combined = _try_compile("|".join(f"(?:{s})" for s in double_star))
+            if combined is None:
+                regexes = [re.compile(s) for s in double_star]
+                others.extend(
+                    (lambda r: lambda path: r.search(path.replace("\\", "/")) is not None)(r)
+                    for r in regexes
+                )
+        return combined, (GlobSet(basenames) if basenames else None), others
+
+    @staticmethod
+    def _side_matches(side: Tuple[Any, Optional[GlobSet], List[Callable[[str], bool]]], path: str) -> bool:
+        combined, basenames, others = side
+        normalized = path.replace("\\", "/")
+        if combined is not None and combined.search(normalized) is not None:
+            return True
+        if basenames is not None and basenames.matches(Path(normalized).name):
+            return True
+        return any(predicate(path) for predicate in others)
+
+    def allows(self, path: str) -> bool:
+        """True if path matches an allow pattern and no '!' pattern."""
+        return self._side_matches(self._positive, path) and not self._side_matches(self._negative, path)
+
+
+# ============================================================================
+# Compiled artifact cache
+# ============================================================================
+
+_BUILDERS: Dict[str, Callable[..., Any]] = {
+    "glob": GlobSet,
+    "domains": DomainBlocklist,
+    "substrings": SubstringSet,
+    "substrings_ci": lambda rules: SubstringSet([rule.lower() for rule in rules]),
+    "regex_ci": lambda rules: RegexSet(rules, re.IGNORECASE),
+    "blocked_paths": BlockedPathSet,
+    "mcp_glob": MCPGlobList,
+}
+
+_cache_lock = threading.Lock()
+_artifacts: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+_fingerprints: Dict[str, Any] = {}
+
+
+def compile_rules(kind: str, rules: Iterable[str]) -> Any:
+    """Get the compiled matcher for a rule list (cached per process).
+
+    The rule tuple itself is the in-process lookup key, so a lookup costs one
+    tuple hash; artifacts are also indexed by policy_fingerprint() so equal
+    content compiled under different list objects is built only once.
+
+    Args:
+        kind: One of "glob", "domains", "substrings", "substrings_ci",
+            "regex_ci", "blocked_paths", "mcp_glob"
+        rules: Rule list from the policy
+
+    Returns:
+        Compiled matcher (GlobSet, DomainBlocklist, SubstringSet, RegexSet,
+        BlockedPathSet or MCPGlobList), or None if any rule is not a string
+        (malformed policy - callers keep their original per-rule loop so
+        error behaviour is unchanged)
+
+    Raises:
+        ValueError: If kind is unknown
+    """
+    key = (kind, tuple(rules))
+    try:
+        artifact = _artifacts.get(key)
+    except TypeError:  # Unhashable rule entries
+        return None
+    if artifact is not None:
+        return artifact
+    if not all(isinstance(rule, str) for rule in key[1]):
+        return None
+
+    builder = _BUILDERS.get(kind)
+    if builder is None:
+        raise ValueError(f"Unknown rule kind: {kind!r} (expected one of {sorted(_BUILDERS)})")
+
+    fingerprint = policy_fingerprint(kind, list(key[1]))
+    with _cache_lock:
+        artifact = _fingerprints.get(fingerprint)
+        if artifact is None:
+            artifact = builder(key[1])
+            _fingerprints[fingerprint] = artifact
+        _artifacts[key] = artifact
+    return artifact
+
+
+def clear_compiled_cache() -> None:
+    """Drop all compiled artifacts (e.g., after editing policy files in tests)."""
+    with _cache_lock:
+        _artifacts.clear()
+        _fingerprints.clear()
+    compiled_mcp_glob.cache_clear()
+
+
+def compiled_cache_size() -> int:
+    """Number of distinct compiled artifacts held in this process."""
+    return len(_fingerprints)
+
+
+@lru_cache(maxsize=1024)
+def compiled_mcp_glob(pattern: str) -> Callable[[str], bool]:
+    """Cached compile_mcp_glob() for MCPPermissionValidator.matches_glob_pattern."""
+    return compile_mcp_glob(pattern)
@@ -68,6 +68,8 @@ class PoolConfig:
         token_budget: Token budget for sliding window (positive integer)
         priority_enabled: Enable priority queue (default: True)
         token_window_seconds: Sliding window duration in seconds (default: 60)
+        shared_budget: Draw from the cross-process token ledger shared by all
+            pools in the repo (default: False)
 
     Raises:
         ValueError: If validation fails (max_agents out of range, negative budget)
@@ -76,6 +78,7 @@ class PoolConfig:
     token_budget: int = 150000
     priority_enabled: bool = True
     token_window_seconds: int = 60
+    shared_budget: bool = False
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -114,6 +117,7 @@ class PoolConfig:
             AGENT_POOL_TOKEN_BUDGET: Token budget for sliding window
             AGENT_POOL_PRIORITY_ENABLED: Enable priority queue (true/false)
             AGENT_POOL_TOKEN_WINDOW_SECONDS: Sliding window duration
+            AGENT_POOL_SHARED_BUDGET: Share the token budget across processes (true/false)
 
         Returns:
             PoolConfig instance with environment overrides
@@ -126,12 +130,14 @@ class PoolConfig:
         token_budget = int(os.getenv("AGENT_POOL_TOKEN_BUDGET", "150000"))
         priority_enabled = os.getenv("AGENT_POOL_PRIORITY_ENABLED", "true").lower() == "true"
         token_window_seconds = int(os.getenv("AGENT_POOL_TOKEN_WINDOW_SECONDS", "60"))
+        shared_budget = os.getenv("AGENT_POOL_SHARED_BUDGET", "false").lower() == "true"
 
         return cls(
             max_agents=max_agents,
             token_budget=token_budget,
             priority_enabled=priority_enabled,
             token_window_seconds=token_window_seconds,
+            shared_budget=shared_budget,
         )
 
     @classmethod
@@ -183,12 +189,14 @@ class PoolConfig:
             token_budget = config_data.get("token_budget", 150000)
             priority_enabled = config_data.get("priority_enabled", True)
             token_window_seconds = config_data.get("token_window_seconds", 60)
+            shared_budget = bool(config_data.get("shared_budget", False))
 
             return cls(
                 max_agents=max_agents,
                 token_budget=token_budget,
                 priority_enabled=priority_enabled,
                 token_window_seconds=token_window_seconds,
+                shared_budget=shared_budget,
             )
 
         except (json.JSONDecodeError, ValueError) as e:
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Pytest Results - Structured test outcomes instead of regex parsing of stdout.
+
+Runners load ``pytest_results_plugin`` into their pytest subprocess. The
+plugin streams one JSON record per test outcome to a side file, and this
+module reads that file incrementally into a ``RunSummary``. Consumers
+(test_runner, test_sharding, failure_analyzer, fix_forward, QASelfHealer) use
+the summary when it is complete, and fall back to parsing stdout otherwise
+(plugin not loaded, pytest crashed before session end, mocked runs).
+
+Features:
+- ``results_args()`` / ``results_env()``: load the plugin into a pytest command
+- ``ResultsReader``: incremental reader (keeps its offset and partial line)
+- ``RunSummary``: counts, failing node ids, durations and failure records
+- ``record_run()``: feeds the test_sharding duration history and flaky-test
+  tracking (flaky_tests.record_outcomes) from the same records
+
+Usage:
+    from pytest_results import new_results_path, results_args, results_env, load_summary
+
+    path = new_results_path()
+    subprocess.run(["pytest", "-q", *results_args(path)], env=results_env())
+    summary = load_summary(path)
+    if summary.finished:
+        print(summary.counts, sorted(summary.failing))
+
+Security:
+- Results files are created with mkstemp (0600) and removed by the runners
+- Records are parsed with json.loads only; malformed lines are skipped
+
+Date: 2026-10-18
+Related: Issue #200 - Debug-first enforcement and self-test requirements
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+PLUGIN_MODULE = "pytest_results_plugin"
+RESULTS_OPTION = "--results-jsonl"
+
+#: Outcomes that mean a test was collected and processed ("error" is not one).
+EXECUTED_OUTCOMES = ("passed", "failed", "skipped", "xfailed", "xpassed")
+
+#: Outcomes that make a run fail.
+FAILING_OUTCOMES = ("failed", "error")
+
+
+# =============================================================================
+# Plugin loading
+# =============================================================================
+
+def results_args(path: Path) -> List[str]:
+    """pytest arguments that load the plugin and stream records to ``path``."""
+    return ["-p", PLUGIN_MODULE, f"{RESULTS_OPTION}={path}"]
+
+
+def results_env(env: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
+    """Environment in which the pytest subprocess can import the plugin.
+
+    The lib directory is appended to PYTHONPATH (after any existing entries)
+    so it does not shadow the project's own modules.
+    """
+    env = dict(os.environ if env is None else env)
+    lib_dir = str(Path(__file__).resolve().parent)
+    parts = [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p]
+    if lib_dir not in parts:
+        parts.append(lib_dir)
+    env["PYTHONPATH"] = os.pathsep.join(parts)
+    return env
+
+
+def new_results_path(directory: Optional[Path] = None) -> Path:
+    """Create an empty, private results file and return its path."""
+    fd, name = tempfile.mkstemp(prefix="pytest-results-", suffix=".jsonl", dir=directory)
+    os.close(fd)
+    return Path(name)
+
+
+def discard(path: Optional[Path]) -> None:
+    """Remove a results file (missing files are fine)."""
+    if path is not None:
+        try:
+            Path(path).unlink()
+        except OSError:
+            pass
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+class ResultsReader:
+    """Reads new records from a results file since the previous call.
+
+    A trailing line without a newline is kept back until it is complete, so
+    the file can be read while pytest is still writing it.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._offset = 0
+        self._partial = b""
+
+    def read_new(self) -> List[Dict[str, Any]]:
+        """Records appended since the last call (empty if the file is missing)."""
+        try:
+            with open(self.path, "rb") as fh:
+                fh.seek(self._offset)
+                chunk = fh.read()
+        except OSError:
+            return []
+        self._offset += len(chunk)
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+        records = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+        return records
+
+
+@dataclass
+class RunSummary:
+    """Aggregated outcome of one pytest run.
+
+    Attributes:
+        counts: outcome -> number of tests (collection errors count as error)
+        outcomes: node id -> outcome
+        durations: node id -> seconds (setup + call + teardown)
+        failures: Records of failed/errored tests and collection errors
+        reruns: node id -> reruns before the final outcome (pytest-rerunfailures)
+        exitstatus: pytest exit status (None until the session record arrives)
+        collected: Tests pytest collected
+        duration: Session wall time in seconds
+        finished: True once the session record was read
+    """
+    counts: Dict[str, int] = field(default_factory=dict)
+    outcomes: Dict[str, str] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+    failures: List[Dict[str, Any]] = field(default_factory=list)
+    reruns: Dict[str, int] = field(default_factory=dict)
+    exitstatus: Optional[int] = None
+    collected: Optional[int] = None
+    duration: float = 0.0
+    finished: bool = False
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Fold one record into the summary."""
+        event = record.get("event")
+        if event == "session":
+            self.exitstatus = record.get("exitstatus")
+            self.collected = record.get("collected")
+            self.duration = float(record.get("duration") or 0.0)
+            self.finished = True
+            return
+        if event not in ("test", "collect"):
+            return
+        nodeid = str(record.get("nodeid", ""))
+        outcome = str(record.get("outcome", "error"))
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+        if event == "test":
+            self.outcomes[nodeid] = outcome
+            self.durations[nodeid] = float(record.get("duration") or 0.0)
+            if record.get("reruns"):
+                self.reruns[nodeid] = int(record["reruns"])
+        if outcome in FAILING_OUTCOMES:
+            self.failures.append(record)
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> "RunSummary":
+        """Fold several records into the summary."""
+        for record in records:
+            self.add(record)
+        return self
+
+    def count(self, outcome: str) -> int:
+        """Number of tests with ``outcome``."""
+        return self.counts.get(outcome, 0)
+
+    @property
+    def executed(self) -> int:
+        """Tests collected and processed (errors excluded)."""
+        return sum(self.count(o) for o in EXECUTED_OUTCOMES)
+
+    @property
+    def failing(self) -> Set[str]:
+        """Node ids of failed or errored tests (collection errors included)."""
+        return {str(r.get("nodeid", "")) for r in self.failures}
+
+    @property
+    def all_passed(self) -> bool:
+        """True when the run finished cleanly with no failures or errors."""
+        return (
+            self.finished
+            and self.exitstatus == 0
+            and not any(self.count(o) for o in FAILING_OUTCOMES)
+        )
+
+    def summary_line(self) -> str:
+        """pytest-style summary, e.g. ``2 failed, 40 passed``."""
+        order = ("failed", "passed", "skipped", "xfailed", "xpassed", "error")
+        parts = [f"{self.count(o)} {o if o != 'error' else 'errors'}" for o in order if self.count(o)]
+        return ", ".join(parts) or "no tests ran"
+
+
+def load_summary(path: Path) -> RunSummary:
+    """Read a complete results file into a RunSummary."""
+    return RunSummary().extend(ResultsReader(path).read_new())
+
+
+def merge_summaries(summaries: Iterable[RunSummary]) -> RunSummary:
+    """Combine shard summaries (finished only if every shard finished)."""
+    summaries = list(summaries)
+    merged = RunSummary(finished=bool(summaries) and all(s.finished for s in summaries))
+    for summary in summaries:
+        for outcome, n in summary.counts.items():
+            merged.counts[outcome] = merged.counts.get(outcome, 0) + n
+        merged.outcomes.update(summary.outcomes)
+        merged.durations.update(summary.durations)
+        merged.reruns.update(summary.reruns)
+        merged.failures.extend(summary.failures)
+    if merged.finished:
+        statuses = [s.exitstatus for s in summaries]
+        errors = [s for s in statuses if s not in (0, 5)]  # 5: a shard collected nothing
+        merged.exitstatus = errors[0] if errors else (0 if 0 in statuses else 5)
+        merged.collected = sum(s.collected or 0 for s in summaries)
+        merged.duration = max(s.duration for s in summaries)
+    return merged
+
+
+# =============================================================================
+# History feeds
+# =============================================================================
+
+def record_run(
+    summary: RunSummary,
+    project_root: Optional[Path] = None,
+    history_path: Optional[Path] = None,
+) -> None:
+    """Feed a run's per-test records into the duration history and flaky-test tracking.
+
+    Partial runs (timeouts) still contribute the tests that completed.
+
+    Non-critical: I/O errors are swallowed so a read-only checkout never
+    fails a test run.
+
+    Args:
+        summary: Finished run summary
+        project_root: Repository root (default: found from cwd)
+        history_path: Duration history file (default: test_sharding default)
+    """
+    if not summary.outcomes:
+        return
+    try:
+        from test_sharding import DurationHistory, default_history_path
+        from flaky_tests import record_outcomes
+    except ImportError:
+        from .test_sharding import DurationHistory, default_history_path
+        from .flaky_tests import record_outcomes
+
+    try:
+        history = DurationHistory(history_path or default_history_path(project_root))
+        history.record(summary.durations)
+        history.save()
+    except OSError:
+        pass
+    root = default_history_path(project_root).parents[2]
+    record_outcomes(summary.outcomes, root, reruns=summary.reruns)
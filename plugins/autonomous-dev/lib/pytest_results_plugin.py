@@ -0,0 +1,127 @@
+"""pytest plugin that streams one JSON record per test outcome for ``pytest_results``.
+
+Loaded with ``-p pytest_results_plugin --results-jsonl=<path>`` (see
+``pytest_results.results_args``). Without ``--results-jsonl`` it does nothing.
+
+Records are appended as they happen, one JSON object per line, and flushed per
+line so readers can follow the file while pytest is still running:
+
+- ``{"event": "test", "nodeid", "outcome", "duration", "phase", "longrepr",
+  "crash", "reruns"}`` once per test, after its teardown. ``outcome`` is one of
+  passed, failed, error (setup/teardown failure), skipped, xfailed, xpassed.
+  ``duration`` sums setup, call and teardown. ``longrepr`` is the tail of the
+  failure text (``LONGREPR_EXCERPT_CHARS``) and ``crash`` is pytest's crash
+  location ``{"path", "lineno", "message"}`` when known.
+- ``{"event": "collect", "nodeid", "outcome": "error", "longrepr"}`` for each
+  collection error.
+- ``{"event": "session", "exitstatus", "collected", "duration"}`` at session end.
+
+Only the standard library and pytest are imported, so the plugin can be loaded
+into any project's test run. Works with pytest-xdist (reports arrive on the
+controller).
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+#: Characters of failure text kept per record (the end holds the error lines).
+LONGREPR_EXCERPT_CHARS = 4000
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("pytest-results")
+    group.addoption(
+        "--results-jsonl",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="stream one JSON record per test outcome to this file",
+    )
+
+
+def pytest_configure(config):
+    path = config.getoption("--results-jsonl", default=None)
+    if path:
+        config.pluginmanager.register(_ResultsWriter(Path(path)), "pytest_results_writer")
+
+
+def _excerpt(report) -> str:
+    try:
+        text = report.longreprtext
+    except Exception:
+        text = str(report.longrepr or "")
+    return text[-LONGREPR_EXCERPT_CHARS:]
+
+
+def _crash(report) -> Optional[Dict[str, Any]]:
+    crash = getattr(report.longrepr, "reprcrash", None)
+    if crash is None:
+        return None
+    return {"path": str(crash.path), "lineno": crash.lineno, "message": crash.message}
+
+
+def _outcome(report) -> str:
+    if hasattr(report, "wasxfail"):
+        return "xpassed" if report.passed else "xfailed"
+    if report.failed:
+        return "failed" if report.when == "call" else "error"
+    return report.outcome
+
+
+class _ResultsWriter:
+    """Folds setup/call/teardown reports into one record per test."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(path, "a", encoding="utf-8", buffering=1)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._start = time.monotonic()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        if not self._fh.closed:
+            self._fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def pytest_runtest_logreport(self, report):
+        state = self._pending.setdefault(
+            report.nodeid,
+            {"event": "test", "nodeid": report.nodeid, "outcome": "passed", "duration": 0.0,
+             "phase": "", "longrepr": "", "crash": None, "reruns": 0},
+        )
+        if report.outcome == "rerun":  # pytest-rerunfailures
+            state["reruns"] += 1
+            state["duration"] = 0.0
+            return
+
+        state["duration"] += report.duration
+        outcome = _outcome(report)
+        # The first non-passing phase decides the outcome: one record per test, so a
+        # teardown error after a call failure stays "failed" (pytest counts both).
+        if outcome != "passed" and state["phase"] == "":
+            state.update(outcome=outcome, phase=report.when, longrepr=_excerpt(report), crash=_crash(report))
+
+        if report.when == "teardown":
+            self._write(self._pending.pop(report.nodeid))
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self._write({
+                "event": "collect", "nodeid": report.nodeid, "outcome": "error",
+                "phase": "collect", "longrepr": _excerpt(report), "crash": _crash(report),
+            })
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        for record in self._pending.values():  # interrupted mid-test
+            self._write(record)
+        self._pending.clear()
+        self._write({
+            "event": "session", "exitstatus": int(exitstatus), "collected": session.testscollected,
+            "duration": round(time.monotonic() - self._start, 3),
+        })
+        self._fh.close()
@@ -52,6 +52,7 @@ Usage:
 Environment Variables:
 - SELF_HEAL_ENABLED: Enable/disable self-healing (default: true)
 - SELF_HEAL_MAX_ITERATIONS: Max healing iterations (default: 10)
+- TEST_SHARDS: Run pytest commands as N duration-balanced shards (default: 1)
 
 Security:
 - Path validation for all file operations
@@ -81,12 +82,18 @@ try:
     from .failure_analyzer import FailureAnalyzer, FailureAnalysis
     from .stuck_detector import StuckDetector, DEFAULT_STUCK_THRESHOLD
     from .code_patcher import CodePatcher, ProposedFix
+    from .test_runner import shard_count_from_env
+    from .test_sharding import is_pytest_command, run_sharded, split_pytest_command
+    from .pytest_results import discard, load_summary, new_results_path, record_run, results_args, results_env
 except ImportError:
     lib_dir = Path(__file__).parent.resolve()
     sys.path.insert(0, str(lib_dir))
     from failure_analyzer import FailureAnalyzer, FailureAnalysis
     from stuck_detector import StuckDetector, DEFAULT_STUCK_THRESHOLD
     from code_patcher import CodePatcher, ProposedFix
+    from test_runner import shard_count_from_env
+    from test_sharding import is_pytest_command, run_sharded, split_pytest_command
+    from pytest_results import discard, load_summary, new_results_path, record_run, results_args, results_env
 
 
 # =============================================================================
@@ -141,6 +148,7 @@ class QASelfHealer:
         max_iterations: int = DEFAULT_MAX_ITERATIONS,
         enabled: bool = True,
         stuck_threshold: int = DEFAULT_STUCK_THRESHOLD,
+        test_shards: Optional[int] = None,
     ):
         """
         Initialize self-healer.
@@ -150,11 +158,16 @@ class QASelfHealer:
             max_iterations: Max healing iterations (default: 10)
             enabled: Enable self-healing (default: True)
             stuck_threshold: Stuck detection threshold (default: 3)
+            test_shards: Concurrent pytest shards per test run
+                (default: TEST_SHARDS or 1)
         """
         self.test_dir = test_dir or Path.cwd()
         self.max_iterations = max_iterations
         self.enabled = enabled
         self.stuck_threshold = stuck_threshold
+        self.test_shards = test_shards if test_shards is not None else shard_count_from_env()
+        # Structured pytest_results summary of the last run (None: parse output)
+        self._last_summary = None
 
         # Check environment variables
         if ENV_SELF_HEAL_ENABLED in os.environ:
@@ -226,8 +239,11 @@ class QASelfHealer:
                     total_fixes_applied=total_fixes,
                 )
 
-            # Parse failures
-            failures = self.failure_analyzer.parse_pytest_output(test_output)
+            # Parse failures (structured records when the plugin reported them)
+            if self._last_summary is not None:
+                failures = self.failure_analyzer.parse_results(self._last_summary.failures)
+            else:
+                failures = self.failure_analyzer.parse_pytest_output(test_output)
 
             # Compute error signature for stuck detection
             error_signature = self.stuck_detector.compute_error_signature(failures)
@@ -316,30 +332,60 @@ class QASelfHealer:
         Returns:
             Combined stdout/stderr
         """
+        self._last_summary = None
+        if self.test_shards > 1 and is_pytest_command(test_command):
+            launcher, targets, extra = split_pytest_command(test_command, Path(self.test_dir))
+            result = run_sharded(
+                targets,
+                shards=self.test_shards,
+                pytest_args=extra,
+                cwd=Path(self.test_dir),
+                timeout=300,
+                pytest_command=launcher,
+            )
+            self._last_summary = result.summary
+            return result.output
+
+        # pytest commands stream structured results to a side file
+        results_path = new_results_path() if is_pytest_command(test_command) else None
         try:
             result = subprocess.run(
-                test_command,
+                [*test_command, *results_args(results_path)] if results_path else test_command,
                 cwd=self.test_dir,
                 capture_output=True,
                 text=True,
                 timeout=300,  # 5 minute timeout
+                env=results_env() if results_path else None,
             )
+            if results_path:
+                summary = load_summary(results_path)
+                if summary.finished:
+                    self._last_summary = summary
+                    record_run(summary, Path(self.test_dir))
             return result.stdout + result.stderr
         except subprocess.TimeoutExpired:
             return "ERROR: Test execution timeout (5 minutes)"
         except Exception as e:
             return f"ERROR: Test execution failed: {e}"
+        finally:
+            discard(results_path)
 
     def _all_tests_pass(self, test_output: str) -> bool:
         """
         Check if all tests passed based on output.
 
+        Uses the structured summary of the last run when the pytest_results
+        plugin reported one; otherwise scans the output text.
+
         Args:
             test_output: pytest output
 
         Returns:
             True if all tests passed
         """
+        if self._last_summary is not None:
+            return self._last_summary.all_passed
+
         # Check for pytest success patterns
         success_patterns = [
             "passed",
@@ -8,6 +8,8 @@ This module provides research persistence for caching findings across sessions:
 - Load cached research with frontmatter parsing
 - Update index with research catalog
 - Topic to filename conversion (SCREAMING_SNAKE_CASE)
+- Persistent metadata index (.claude/cache/research_index.json) for fuzzy
+  topic lookup and incremental catalog regeneration
 
 Problem Solved:
 - Research findings lost when conversation clears
@@ -62,6 +64,9 @@ Usage:
     # Update index
     update_index()  # Regenerates docs/research/README.md
 
+    # Fuzzy lookup via the metadata index ("jwt auth" finds "JWT Authentication")
+    path = find_research("jwt auth", max_age_days=30)
+
 Date: 2026-01-03
 Agent: implementer
 Phase: GREEN (making TDD tests pass)
@@ -71,6 +76,9 @@ Design Patterns:
     See testing-guide skill for TDD methodology.
 """
 
+import difflib
+import hashlib
+import json
 import os
 import re
 import tempfile
@@ -106,6 +114,20 @@ except ImportError:
     validate_session_path = None
 
 
+# Metadata index, relative to the project root: a local cache kept with the
+# other caches rather than in the committed docs/research/ tree
+RESEARCH_INDEX_FILE = Path(".claude") / "cache" / "research_index.json"
+RESEARCH_INDEX_VERSION = 1
+
+# Default similarity threshold for fuzzy topic lookup (0.0-1.0)
+DEFAULT_MATCH_THRESHOLD = 0.6
+
+# Words ignored when normalizing topic keywords
+_TOPIC_STOPWORDS = frozenset({
+    "a", "an", "and", "for", "in", "of", "on", "the", "to", "with", "vs", "how",
+})
+
+
 # Custom exception for research persistence errors
 class ResearchPersistenceError(Exception):
     """Exception raised for research persistence errors."""
@@ -385,15 +407,29 @@ def save_research(topic: str, findings: str, sources: List[str]) -> Path:
         else:
             raise ResearchPersistenceError(f"Failed to create temp file: {e}")
 
+    _index_saved_research(
+        research_dir,
+        research_file,
+        {
+            "topic": topic,
+            "created": created_timestamp,
+            "updated": timestamp,
+            "sources": list(sources or []),
+        },
+        full_content,
+    )
+
     return research_file
 
 
-def check_cache(topic: str, max_age_days: int = 30) -> Optional[Path]:
+def check_cache(topic: str, max_age_days: int = 30, fuzzy: bool = False) -> Optional[Path]:
     """Check if recent research exists for topic.
 
     Args:
         topic: Research topic
         max_age_days: Maximum age in days for cache hit (default: 30)
+        fuzzy: On an exact-filename miss, fall back to find_research()
+            (similar topics via the metadata index)
 
     Returns:
         Path to cached research file if found and recent, None otherwise
@@ -422,6 +458,8 @@ def check_cache(topic: str, max_age_days: int = 30) -> Optional[Path]:
 
     # Check if file exists
     if not research_file.exists():
+        if fuzzy and max_age_days != 0:
+            return find_research(topic, max_age_days=max_age_days)
         return None
 
     # Check file age
@@ -602,6 +640,260 @@ def _parse_frontmatter(file_path: Path) -> Dict[str, Any]:
     return frontmatter
 
 
+def normalize_topic_keywords(topic: str) -> List[str]:
+    """Normalize a topic into sorted, de-duplicated keywords for matching.
+
+    Args:
+        topic: Research topic (e.g., "JWT Authentication Tokens")
+
+    Returns:
+        Sorted keyword list (lowercase, stopwords removed, simple plurals
+        folded), e.g. ["authentication", "jwt", "token"]
+    """
+    keywords = set()
+    for word in re.split(r"[^a-z0-9]+", topic.lower()):
+        if len(word) < 2 or word in _TOPIC_STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        keywords.add(word)
+    return sorted(keywords)
+
+
+def _file_stamp(path: Path) -> Optional[List[int]]:
+    """[st_mtime_ns, st_size] for path, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _index_entry(file_path: Path, data: Dict[str, Any], content_hash: str,
+                 stamp: List[int]) -> Dict[str, Any]:
+    """Build one metadata index entry from parsed frontmatter."""
+    topic = data.get("topic") or file_path.stem
+    sources = data.get("sources", [])
+    return {
+        "topic": topic,
+        "keywords": normalize_topic_keywords(str(topic)),
+        "created": data.get("created", "Unknown"),
+        "updated": data.get("updated", data.get("created", "Unknown")),
+        "sources": sources if isinstance(sources, list) else [],
+        "content_hash": content_hash,
+        "stamp": stamp,
+    }
+
+
+def _research_index_path(research_dir: Path) -> Path:
+    """Index file for a research directory (PROJECT_ROOT/docs/research)."""
+    return research_dir.parent.parent / RESEARCH_INDEX_FILE
+
+
+def _load_research_index(research_dir: Path) -> Dict[str, Any]:
+    """Load the metadata index, or an empty one if missing/corrupt/old."""
+    try:
+        index = json.loads(_research_index_path(research_dir).read_text())
+        if (
+            isinstance(index, dict)
+            and index.get("version") == RESEARCH_INDEX_VERSION
+            and isinstance(index.get("entries"), dict)
+        ):
+            return index
+    except (OSError, ValueError):
+        pass
+    return {"version": RESEARCH_INDEX_VERSION, "entries": {}, "dir_stamp": None}
+
+
+def _save_research_index(research_dir: Path, index: Dict[str, Any]) -> None:
+    """Write the metadata index atomically (temp file + os.replace).
+
+    Best effort: the index is a cache of the research files, so a failed
+    write only costs a re-parse on the next refresh.
+    """
+    index_file = _research_index_path(research_dir)
+    temp_file = index_file.with_name(f".{index_file.name}.{os.getpid()}.tmp")
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        index["dir_stamp"] = _file_stamp(research_dir)
+        temp_file.write_text(json.dumps(index, indent=1, sort_keys=True))
+        os.replace(temp_file, index_file)
+    except OSError:
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
+
+
+def _index_saved_research(research_dir: Path, research_file: Path,
+                          data: Dict[str, Any], full_content: str) -> None:
+    """Record a just-written research file in the metadata index."""
+    stamp = _file_stamp(research_file)
+    if stamp is None:
+        return
+
+    index = _load_research_index(research_dir)
+    content_hash = hashlib.sha256(full_content.encode("utf-8")).hexdigest()
+    index["entries"][research_file.name] = _index_entry(
+        research_file, data, content_hash, stamp
+    )
+    _save_research_index(research_dir, index)
+
+
+def refresh_research_index(research_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Bring the metadata index in sync with docs/research/*.md.
+
+    Only files whose (mtime, size) stamp changed since they were indexed are
+    re-read and re-parsed; deleted files are dropped. Files with invalid
+    frontmatter are indexed as {"invalid": True} so they are not re-parsed
+    until they change.
+
+    Args:
+        research_dir: Research directory (default: get_research_dir())
+
+    Returns:
+        Index dict: {"version", "entries": {filename: entry}, "dir_stamp"}
+    """
+    if research_dir is None:
+        research_dir = get_research_dir_wrapper()
+
+    index = _load_research_index(research_dir)
+    entries = index["entries"]
+    changed = False
+    seen = set()
+
+    for file_path in research_dir.glob("*.md"):
+        if file_path.name == "README.md":
+            continue
+        seen.add(file_path.name)
+
+        stamp = _file_stamp(file_path)
+        entry = entries.get(file_path.name)
+        if stamp is None or (entry is not None and entry.get("stamp") == stamp):
+            continue
+
+        changed = True
+        try:
+            raw = file_path.read_bytes()
+            data = _parse_frontmatter(file_path)
+        except Exception:
+            entries[file_path.name] = {"invalid": True, "stamp": stamp}
+            continue
+        entries[file_path.name] = _index_entry(
+            file_path, data, hashlib.sha256(raw).hexdigest(), stamp
+        )
+
+    for name in [name for name in entries if name not in seen]:
+        del entries[name]
+        changed = True
+
+    if changed or index.get("dir_stamp") != _file_stamp(research_dir):
+        _save_research_index(research_dir, index)
+
+    return index
+
+
+def _topic_similarity(query_keywords: List[str], query_text: str,
+                      entry: Dict[str, Any]) -> float:
+    """Similarity of a query to an index entry (0.0-1.0)."""
+    entry_keywords = set(entry.get("keywords", []))
+    query_set = set(query_keywords)
+    jaccard = 0.0
+    if query_set and entry_keywords:
+        jaccard = len(query_set & entry_keywords) / len(query_set | entry_keywords)
+    ratio = difflib.SequenceMatcher(
+        None, query_text, " ".join(sorted(entry_keywords))
+    ).ratio()
+    return max(jaccard, ratio)
+
+
+def search_research(
+    query: str,
+    limit: int = 5,
+    threshold: float = DEFAULT_MATCH_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """Fuzzy-search saved research by topic using the metadata index.
+
+    Args:
+        query: Topic or keywords to look for
+        limit: Maximum results (default: 5)
+        threshold: Minimum similarity score 0.0-1.0 (default: 0.6)
+
+    Returns:
+        Matches sorted by score (best first), each with keys: path, filename,
+        topic, score, created, updated, sources, content_hash
+
+    Examples:
+        >>> search_research("jwt auth")[0]["topic"]
+        'JWT Authentication'
+    """
+    query_keywords = normalize_topic_keywords(query or "")
+    if not query_keywords:
+        return []
+
+    try:
+        research_dir = get_research_dir_wrapper()
+    except ResearchPersistenceError:
+        return []
+    if not research_dir.exists():
+        return []
+
+    index = _load_research_index(research_dir)
+    # Directory unchanged since the last sync: trust the index without
+    # stat-ing every file (saves, deletes and renames all change it).
+    if index.get("dir_stamp") != _file_stamp(research_dir):
+        index = refresh_research_index(research_dir)
+
+    query_text = " ".join(query_keywords)
+    matches = []
+    for filename, entry in index["entries"].items():
+        if entry.get("invalid"):
+            continue
+        score = _topic_similarity(query_keywords, query_text, entry)
+        if score >= threshold:
+            matches.append({
+                "path": research_dir / filename,
+                "filename": filename,
+                "topic": entry.get("topic"),
+                "score": round(score, 4),
+                "created": entry.get("created"),
+                "updated": entry.get("updated"),
+                "sources": entry.get("sources", []),
+                "content_hash": entry.get("content_hash"),
+            })
+
+    matches.sort(key=lambda m: (-m["score"], m["filename"]))
+    return matches[:limit]
+
+
+def find_research(
+    topic: str,
+    max_age_days: int = 30,
+    threshold: float = DEFAULT_MATCH_THRESHOLD,
+) -> Optional[Path]:
+    """Find recent research for a topic, tolerating wording differences.
+
+    Like check_cache(), but matches similar topics through the metadata
+    index instead of requiring the exact derived filename.
+
+    Args:
+        topic: Research topic
+        max_age_days: Maximum age in days for a hit (default: 30)
+        threshold: Minimum similarity score 0.0-1.0 (default: 0.6)
+
+    Returns:
+        Path to the best matching recent research file, or None
+    """
+    for match in search_research(topic, limit=10, threshold=threshold):
+        try:
+            mtime = match["path"].stat().st_mtime
+        except OSError:
+            continue
+        if (datetime.now() - datetime.fromtimestamp(mtime)).days <= max_age_days:
+            return match["path"]
+    return None
+
+
 def save_merged_research(topic: str, local_json: Dict, web_json: Dict) -> Path:
     """
     Save merged research from researcher-local and researcher-web JSON outputs.
@@ -833,10 +1125,35 @@ def detect_issue_research(issue_body: str) -> Dict[str, Any]:
     }
 
 
+def get_web_fetch_cache_stats() -> Optional[Dict[str, Any]]:
+    """Read WebFetchCache counters for the project, without creating the cache.
+
+    Returns:
+        Stats dict from search_utils.WebFetchCache.read_stats() (hits, misses,
+        evictions, expired, coalesced, hit_rate, entries, total_bytes), or
+        None if search_utils is unavailable or the cache has no index yet
+    """
+    if not PATH_UTILS_AVAILABLE or path_utils is None:
+        return None
+
+    try:
+        from search_utils import WebFetchCache
+    except ImportError:
+        return None
+
+    try:
+        cache_dir = path_utils.get_project_root() / ".claude" / "cache" / "web-fetch"
+    except Exception:
+        return None
+
+    return WebFetchCache.read_stats(cache_dir)
+
+
 def update_index() -> Path:
     """Update docs/research/README.md with research catalog.
 
-    Scans all .md files in docs/research/ and generates a table with:
+    Syncs the metadata index (only files changed since they were last
+    indexed are re-parsed) and generates a table with:
     - Topic
     - Created date
     - Source count
@@ -855,24 +1172,20 @@ def update_index() -> Path:
     # Get research directory
     research_dir = get_research_dir_wrapper()
 
-    # Scan for .md files (exclude README.md)
+    # Sync the metadata index (re-parses only changed files) and build the
+    # catalog from it; files with invalid frontmatter are skipped
+    index = refresh_research_index(research_dir)
     research_files = []
-    for file_path in sorted(research_dir.glob("*.md")):
-        if file_path.name == "README.md":
-            continue
-
-        # Try to parse frontmatter
-        try:
-            data = _parse_frontmatter(file_path)
-            research_files.append({
-                "filename": file_path.name,
-                "topic": data.get("topic", file_path.stem),
-                "created": data.get("created", "Unknown"),
-                "source_count": len(data.get("sources", [])),
-            })
-        except Exception:
-            # Skip files with invalid frontmatter
+    for filename in sorted(index["entries"]):
+        entry = index["entries"][filename]
+        if entry.get("invalid"):
             continue
+        research_files.append({
+            "filename": filename,
+            "topic": entry.get("topic") or Path(filename).stem,
+            "created": entry.get("created", "Unknown"),
+            "source_count": len(entry.get("sources", [])),
+        })
 
     # Build README.md content
     readme_lines = [
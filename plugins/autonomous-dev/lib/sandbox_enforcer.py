@@ -56,9 +56,18 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+# Import policy compiler (compiled substring/regex matchers for the hot path)
+try:
+    from permission_policy_compiler import compile_rules
+except ImportError:
+    compile_rules = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fork bomb signature, checked before every other rule
+FORK_BOMB_PATTERN = re.compile(r":\(\)\{.*\};")
+
 
 class CommandClassification(Enum):
     """Command classification for permission decision."""
@@ -330,8 +339,7 @@ class SandboxEnforcer:
             )
 
         # Check for fork bomb FIRST (most specific/dangerous pattern)
-        fork_bomb_pattern = r":\(\)\{.*\};"
-        if re.search(fork_bomb_pattern, command):
+        if FORK_BOMB_PATTERN.search(command):
             self._increment_circuit_breaker()
             logger.warning(f"BLOCKED command (fork bomb): {command}")
             return CommandResult(
@@ -372,23 +380,20 @@ class SandboxEnforcer:
             )
 
         # Check other blocked patterns
-        for pattern in self.blocked_patterns:
-            try:
-                if re.search(pattern, command, re.IGNORECASE):
-                    self._increment_circuit_breaker()
-                    logger.warning(f"BLOCKED command (pattern '{pattern}'): {command}")
-                    return CommandResult(
-                        classification=CommandClassification.BLOCKED,
-                        reason=f"Matched blocked pattern: {pattern}",
-                        can_sandbox=False
-                    )
-            except re.error:
-                # Invalid regex - skip
-                continue
+        pattern = self._first_blocked_pattern(command)
+        if pattern is not None:
+            self._increment_circuit_breaker()
+            logger.warning(f"BLOCKED command (pattern '{pattern}'): {command}")
+            return CommandResult(
+                classification=CommandClassification.BLOCKED,
+                reason=f"Matched blocked pattern: {pattern}",
+                can_sandbox=False
+            )
 
         # Check safe commands
+        stripped = command.strip()
         for safe_cmd in self.safe_commands:
-            if command.strip().startswith(safe_cmd):
+            if stripped.startswith(safe_cmd):
                 self._reset_circuit_breaker()
                 logger.info(f"SAFE command: {command}")
                 return CommandResult(
@@ -415,10 +420,7 @@ class SandboxEnforcer:
         Returns:
             True if injection detected, False otherwise
         """
-        for pattern in self.shell_injection_patterns:
-            if pattern in command:
-                return True
-        return False
+        return self._check_shell_injection_detailed(command)[0]
 
     def _check_shell_injection_detailed(self, command: str) -> tuple[bool, Optional[str]]:
         """
@@ -430,6 +432,10 @@ class SandboxEnforcer:
         Returns:
             Tuple of (detected, pattern_found)
         """
+        substrings = self._compiled("substrings", self.shell_injection_patterns)
+        if substrings is not None:
+            pattern = substrings.first(command)
+            return (pattern is not None, pattern)
         for pattern in self.shell_injection_patterns:
             if pattern in command:
                 return (True, pattern)
@@ -445,6 +451,9 @@ class SandboxEnforcer:
         Returns:
             True if traversal detected, False otherwise
         """
+        substrings = self._compiled("substrings", self.path_traversal_patterns)
+        if substrings is not None:
+            return substrings.contains_any(command)
         for pattern in self.path_traversal_patterns:
             if pattern in command:
                 return True
@@ -460,6 +469,9 @@ class SandboxEnforcer:
         Returns:
             True if blocked path detected, False otherwise
         """
+        blocked = self._compiled("blocked_paths", self.blocked_paths)
+        if blocked is not None:
+            return blocked.contains_any(command)
         for pattern in self.blocked_paths:
             # Simple glob-style matching
             if "*" in pattern:
@@ -476,6 +488,46 @@ class SandboxEnforcer:
                     return True
         return False
 
+    def _first_blocked_pattern(self, command: str) -> Optional[str]:
+        """
+        Find the first blocked pattern (case-insensitive regex) in command.
+
+        Args:
+            command: Command to check
+
+        Returns:
+            First matching pattern in policy order, or None (invalid regexes are skipped)
+        """
+        regexes = self._compiled("regex_ci", self.blocked_patterns)
+        if regexes is not None:
+            return regexes.first(command)
+        for pattern in self.blocked_patterns:
+            try:
+                if re.search(pattern, command, re.IGNORECASE):
+                    return pattern
+            except re.error:
+                # Invalid regex - skip
+                continue
+        return None
+
+    def _compiled(self, kind: str, rules: List[str]) -> Any:
+        """
+        Get the compiled matcher for a policy rule list.
+
+        Looked up per call (cached by rule content) so policy edits after
+        construction take effect immediately.
+
+        Args:
+            kind: Rule kind understood by permission_policy_compiler
+            rules: Rule list from the policy
+
+        Returns:
+            Compiled matcher, or None to use the per-rule loop
+        """
+        if compile_rules is None:
+            return None
+        return compile_rules(kind, rules)
+
     def _can_sandbox_command(self) -> bool:
         """
         Check if command can be sandboxed.
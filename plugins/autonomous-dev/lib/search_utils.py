@@ -1,19 +1,55 @@
 """Search utilities for researcher agent.
 
 Provides utilities for:
-- Web fetch caching
+- Web fetch caching (byte-bounded LRU/LFU, request coalescing)
 - Source quality scoring
 - Pattern quality scoring
 - Knowledge base freshness checking
 """
 
+import asyncio
 import hashlib
+import inspect
+import json
+import os
 import re
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from path_utils import get_project_root
 
+# fcntl is POSIX-only. On Windows the index is still written atomically
+# (temp file + replace), just without cross-process serialization.
+try:
+    import fcntl  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
+
+
+# Default byte budget for cached page bodies (100 MiB)
+DEFAULT_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+# Supported eviction policies
+EVICTION_POLICIES = ("lru", "lfu")
+
+# Metadata index file (lives inside the cache directory)
+CACHE_INDEX_FILE = "index.json"
+
+# Counters kept in the index (shared by every process using the cache)
+CACHE_STAT_KEYS = ("hits", "misses", "evictions", "expired", "coalesced")
+
+# Append-only hit log (lives inside the cache directory). Cache hits append a
+# "<key> <timestamp>" record here instead of rewriting the index; records are
+# folded into the index by the next index transaction.
+CACHE_ACCESS_LOG = "access.log"
+
+# Fold the hit log into the index once it grows past this size, so a
+# hit-only workload still keeps the log (and its fold cost) bounded.
+ACCESS_LOG_FOLD_BYTES = 64 * 1024
+
 
 class WebFetchCache:
     """Cache for web fetch results to reduce duplicate API calls.
@@ -21,6 +57,14 @@ class WebFetchCache:
     Caches fetched URLs with 7-day TTL to avoid re-fetching same content.
     Saves API costs and improves performance.
 
+    Entry bodies live in one file per URL hash; a small metadata index
+    (index.json: size, expiry, last access, hit count per entry) drives
+    byte-budget eviction and clear_expired() without directory scans.
+    Hits do not take the index lock: they append to access.log, which is
+    folded into the index by the next set(), miss, or eviction.
+    get_or_fetch() / aget_or_fetch() coalesce concurrent misses for the same
+    URL across threads and processes, so only one caller hits the network.
+
     Usage:
         cache = WebFetchCache()
 
@@ -29,40 +73,293 @@ class WebFetchCache:
         if not content:
             content = fetch_from_web(url)
             cache.set(url, content)
+
+        # Or let the cache coalesce concurrent fetches
+        content = cache.get_or_fetch(url, fetch_from_web)
     """
 
-    def __init__(self, cache_dir: Optional[Path] = None, ttl_days: int = 7):
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_days: int = 7,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        eviction: str = "lru",
+        lock_timeout: float = 60.0,
+        poll_interval: float = 0.05,
+    ):
         """Initialize web fetch cache.
 
         Args:
             cache_dir: Directory to store cached files. Defaults to .claude/cache/web-fetch
             ttl_days: Time to live in days. Default 7 days.
+            max_bytes: Byte budget for cached entries. Default 100 MiB.
+            eviction: Eviction policy when over budget: "lru" or "lfu".
+            lock_timeout: Seconds after which an in-flight fetch lock is
+                considered stale (owner crashed) and is broken.
+            poll_interval: Seconds between checks while waiting on another
+                process's in-flight fetch.
+
+        Raises:
+            ValueError: If eviction policy or max_bytes is invalid
         """
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown eviction policy: {eviction!r} (expected one of {EVICTION_POLICIES})"
+            )
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
         if cache_dir is None:
             cache_dir = get_project_root() / ".claude" / "cache" / "web-fetch"
 
         self.cache_dir = Path(cache_dir)
         self.ttl_days = ttl_days
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        self._index_path = self.cache_dir / CACHE_INDEX_FILE
+        self._access_log_path = self.cache_dir / CACHE_ACCESS_LOG
+        self._thread_lock = threading.RLock()
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._async_inflight: Dict[str, "asyncio.Future[str]"] = {}
+
+    def _url_hash(self, url: str) -> str:
+        """Stable key for a URL (also the entry file stem)."""
+        return hashlib.md5(url.encode()).hexdigest()
+
     def _get_cache_path(self, url: str) -> Path:
         """Get cache file path for URL."""
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        return self.cache_dir / f"{url_hash}.md"
+        return self.cache_dir / f"{self._url_hash(url)}.md"
 
-    def get(self, url: str) -> Optional[str]:
-        """Get cached content if fresh.
+    # ------------------------------------------------------------------
+    # Metadata index
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+        """(st_mtime_ns, st_size) of path, or None if missing."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _parse_header(content: str) -> Tuple[Optional[str], Optional[datetime]]:
+        """Extract (url, expires) from a cached entry's header."""
+        url = None
+        expires = None
+        for line in content.split("\n"):
+            if line.startswith("**URL**:") and url is None:
+                url = line.split(":", 1)[1].strip()
+            elif "**Expires**:" in line:
+                expires = datetime.fromisoformat(line.split(":", 1)[1].strip())
+                break
+            elif line.strip() == "---":
+                break
+        return url, expires
+
+    def _new_index(self) -> Dict[str, Any]:
+        """Build an index, migrating any entries written before it existed."""
+        index: Dict[str, Any] = {
+            "version": 1,
+            "entries": {},
+            "stats": {key: 0 for key in CACHE_STAT_KEYS},
+        }
+        # One-time scan: only when the index file does not exist yet
+        for cache_file in self.cache_dir.glob("*.md"):
+            stamp = self._file_stamp(cache_file)
+            if stamp is None:
+                continue
+            try:
+                url, expires = self._parse_header(cache_file.read_text())
+            except (OSError, ValueError):
+                url, expires = None, None
+            index["entries"][cache_file.stem] = {
+                "url": url,
+                "size": stamp[1],
+                "mtime_ns": stamp[0],
+                "expires": expires.isoformat() if expires else None,
+                "last_access": stamp[0] / 1e9,
+                "hits": 0,
+            }
+        return index
+
+    def _read_index(self) -> Dict[str, Any]:
+        """Load the index from disk (rebuilding it if missing or corrupt)."""
+        try:
+            index = json.loads(self._index_path.read_text())
+            if isinstance(index, dict) and isinstance(index.get("entries"), dict):
+                stats = index.setdefault("stats", {})
+                for key in CACHE_STAT_KEYS:
+                    stats.setdefault(key, 0)
+                return index
+        except (OSError, ValueError):
+            pass
+        return self._new_index()
+
+    def _write_index(self, index: Dict[str, Any]) -> None:
+        """Atomically replace the index file."""
+        tmp_path = self._index_path.with_name(
+            f".{CACHE_INDEX_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_text(json.dumps(index))
+        os.replace(tmp_path, self._index_path)
+
+    @contextmanager
+    def _index_txn(self) -> Iterator[Dict[str, Any]]:
+        """Read-modify-write the index under thread and process locks."""
+        with self._thread_lock:
+            lock_path = self.cache_dir / f"{CACHE_INDEX_FILE}.lock"
+            with open(lock_path, "a") as lock_fh:
+                if fcntl is not None:
+                    fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+                try:
+                    index = self._read_index()
+                    self._fold_access_log(index)
+                    yield index
+                    self._write_index(index)
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _parse_access_log(data: bytes) -> Dict[str, Tuple[int, float]]:
+        """Collapse hit-log records into {key: (hit count, last access)}."""
+        accesses: Dict[str, Tuple[int, float]] = {}
+        for line in data.splitlines():
+            parts = line.split()
+            if len(parts) != 2:
+                continue  # Torn or foreign line
+            try:
+                key, stamp = parts[0].decode("ascii"), float(parts[1])
+            except (UnicodeDecodeError, ValueError):
+                continue
+            count, last = accesses.get(key, (0, 0.0))
+            accesses[key] = (count + 1, max(last, stamp))
+        return accesses
+
+    @staticmethod
+    def _apply_accesses(index: Dict[str, Any], accesses: Dict[str, Tuple[int, float]]) -> None:
+        """Add hit-log counts and access times to an index dict."""
+        entries = index["entries"]
+        stats = index["stats"]
+        for key, (count, last) in accesses.items():
+            stats["hits"] = stats.get("hits", 0) + count
+            entry = entries.get(key)
+            if entry is not None:
+                entry["hits"] = entry.get("hits", 0) + count
+                entry["last_access"] = max(entry.get("last_access", 0.0), last)
+
+    def _fold_access_log(self, index: Dict[str, Any]) -> None:
+        """Move pending hit records into the index (inside _index_txn).
+
+        The log is renamed aside before it is read, so hits appended while
+        folding start a new log. Access metadata is best-effort: a record
+        written through a descriptor opened just before the rename can be
+        dropped, which only ages the entry's last_access slightly.
+        """
+        pending = self.cache_dir / (
+            f".{CACHE_ACCESS_LOG}.{os.getpid()}.{threading.get_ident()}.fold"
+        )
+        try:
+            os.replace(self._access_log_path, pending)
+        except OSError:
+            return  # No hits since the last fold
+        try:
+            data = pending.read_bytes()
+        except OSError:
+            data = b""
+        finally:
+            try:
+                pending.unlink()
+            except OSError:
+                pass
+        self._apply_accesses(index, self._parse_access_log(data))
+
+    def _record_access(self, key: str) -> None:
+        """Append a hit record without taking the index lock.
+
+        Records are one short O_APPEND write each, so concurrent processes
+        never interleave within a line. Once the log passes
+        ACCESS_LOG_FOLD_BYTES it is folded into the index.
+        """
+        record = f"{key} {time.time():.6f}\n".encode("ascii")
+        try:
+            fd = os.open(
+                str(self._access_log_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+            try:
+                os.write(fd, record)
+                size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+            if size >= ACCESS_LOG_FOLD_BYTES:
+                with self._index_txn():
+                    pass  # The transaction folds the log
+        except OSError:
+            pass  # Access bookkeeping must never turn a hit into a failure
+
+    def _total_bytes(self, index: Dict[str, Any]) -> int:
+        return sum(entry.get("size", 0) for entry in index["entries"].values())
+
+    def _evict(self, index: Dict[str, Any], keep: Optional[str] = None) -> int:
+        """Evict entries until the index fits max_bytes.
 
         Args:
-            url: URL to fetch from cache
+            index: Index being modified (inside _index_txn)
+            keep: Entry key that must survive (the one just written)
 
         Returns:
-            Cached content if exists and fresh, None otherwise
+            Number of entries evicted
+        """
+        entries = index["entries"]
+        total = self._total_bytes(index)
+        if total <= self.max_bytes:
+            return 0
+
+        if self.eviction == "lfu":
+            def rank(item: Tuple[str, Dict[str, Any]]) -> Tuple[float, float]:
+                return (item[1].get("hits", 0), item[1].get("last_access", 0.0))
+        else:
+            def rank(item: Tuple[str, Dict[str, Any]]) -> Tuple[float, float]:
+                return (item[1].get("last_access", 0.0), item[1].get("hits", 0))
+
+        evicted = 0
+        for key, entry in sorted(entries.items(), key=rank):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            try:
+                (self.cache_dir / f"{key}.md").unlink()
+            except FileNotFoundError:
+                pass
+            total -= entry.get("size", 0)
+            del entries[key]
+            evicted += 1
+
+        index["stats"]["evictions"] += evicted
+        return evicted
+
+    # ------------------------------------------------------------------
+    # Entry access
+    # ------------------------------------------------------------------
+
+    def _read_entry(self, url: str) -> Tuple[Optional[str], bool]:
+        """Read a cached entry without touching the index.
+
+        Returns:
+            (content, expired) - content is None on miss; expired is True when
+            an expired entry was found and deleted.
         """
         cache_file = self._get_cache_path(url)
 
         if not cache_file.exists():
-            return None
+            return None, False
 
         try:
             content = cache_file.read_text()
@@ -77,7 +374,7 @@ class WebFetchCache:
                         # Check if expired
                         if datetime.now() > expires:
                             cache_file.unlink()
-                            return None
+                            return None, True
 
                         break
 
@@ -85,17 +382,49 @@ class WebFetchCache:
             if "---" in content:
                 parts = content.split("---", 1)
                 if len(parts) == 2:
-                    return parts[1].strip()
+                    return parts[1].strip(), False
 
-            return content
+            return content, False
 
         except Exception:
             # If any error reading cache, treat as miss
-            return None
+            return None, False
+
+    def get(self, url: str) -> Optional[str]:
+        """Get cached content if fresh.
+
+        Args:
+            url: URL to fetch from cache
+
+        Returns:
+            Cached content if exists and fresh, None otherwise
+        """
+        content, expired = self._read_entry(url)
+        key = self._url_hash(url)
+
+        if content is not None:
+            # Hot path: one append, no index lock or rewrite
+            self._record_access(key)
+            return content
+
+        try:
+            with self._index_txn() as index:
+                stats = index["stats"]
+                stats["misses"] += 1
+                if expired:
+                    stats["expired"] += 1
+                index["entries"].pop(key, None)
+        except OSError:
+            pass  # Index bookkeeping must never break a lookup
+
+        return None
 
     def set(self, url: str, content: str) -> None:
         """Cache content with TTL.
 
+        Evicts other entries (per the eviction policy) if the byte budget is
+        exceeded.
+
         Args:
             url: URL being cached
             content: Content to cache
@@ -116,34 +445,293 @@ class WebFetchCache:
 
         cache_file.write_text(cached)
 
+        stamp = self._file_stamp(cache_file)
+        if stamp is None:
+            return
+
+        key = self._url_hash(url)
+        with self._index_txn() as index:
+            index["entries"][key] = {
+                "url": url,
+                "size": stamp[1],
+                "mtime_ns": stamp[0],
+                "expires": expires.isoformat(),
+                "last_access": time.time(),
+                "hits": 0,
+            }
+            self._evict(index, keep=key)
+
     def clear_expired(self) -> int:
         """Remove all expired cache entries.
 
+        Expiry comes from the index; an entry's file is only re-read when
+        its stamp no longer matches the index (edited outside the cache).
+
         Returns:
             Number of entries removed
         """
         removed = 0
-        for cache_file in self.cache_dir.glob("*.md"):
-            try:
-                content = cache_file.read_text()
-
-                if "**Expires**:" in content:
-                    for line in content.split("\n"):
-                        if "**Expires**:" in line:
-                            expires_str = line.split(":", 1)[1].strip()
-                            expires = datetime.fromisoformat(expires_str)
-
-                            if datetime.now() > expires:
-                                cache_file.unlink()
-                                removed += 1
-                            break
-            except Exception:
-                # If can't read, remove to be safe
-                cache_file.unlink()
-                removed += 1
+        now = datetime.now()
+
+        with self._index_txn() as index:
+            entries = index["entries"]
+            for key in list(entries):
+                entry = entries[key]
+                cache_file = self.cache_dir / f"{key}.md"
+                stamp = self._file_stamp(cache_file)
+
+                if stamp is None:
+                    del entries[key]  # File removed externally
+                    continue
+
+                try:
+                    if stamp != (entry.get("mtime_ns"), entry.get("size")):
+                        _, expires = self._parse_header(cache_file.read_text())
+                        entry["mtime_ns"], entry["size"] = stamp
+                        entry["expires"] = expires.isoformat() if expires else None
+                    expires_str = entry.get("expires")
+                    expired = bool(expires_str) and now > datetime.fromisoformat(expires_str)
+                except Exception:
+                    # If can't read, remove to be safe
+                    expired = True
+
+                if expired:
+                    cache_file.unlink()
+                    del entries[key]
+                    removed += 1
+
+            index["stats"]["expired"] += removed
 
         return removed
 
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters and size.
+
+        Counters are persisted in the index, so they aggregate across every
+        process sharing this cache directory. Hits not yet folded into the
+        index are counted from the hit log.
+
+        Returns:
+            Dict with hits, misses, evictions, expired, coalesced, hit_rate,
+            entries, total_bytes, max_bytes and eviction policy
+        """
+        with self._thread_lock:
+            index = self._read_index()
+        self._apply_pending_accesses(index, self.cache_dir)
+        return self.summarize_index(index, self.max_bytes, self.eviction)
+
+    @classmethod
+    def _apply_pending_accesses(cls, index: Dict[str, Any], cache_dir: Path) -> None:
+        """Overlay unfolded hit-log records onto an index read for reporting."""
+        try:
+            data = (Path(cache_dir) / CACHE_ACCESS_LOG).read_bytes()
+        except OSError:
+            return
+        index.setdefault("entries", {})
+        index.setdefault("stats", {})
+        cls._apply_accesses(index, cls._parse_access_log(data))
+
+    @staticmethod
+    def summarize_index(
+        index: Dict[str, Any],
+        max_bytes: Optional[int] = None,
+        eviction: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Summarize a raw index dict into report-friendly stats."""
+        stats = {key: int(index.get("stats", {}).get(key, 0)) for key in CACHE_STAT_KEYS}
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        entries = index.get("entries", {})
+        stats["entries"] = len(entries)
+        stats["total_bytes"] = sum(e.get("size", 0) for e in entries.values())
+        stats["max_bytes"] = max_bytes
+        stats["eviction"] = eviction
+        return stats
+
+    @classmethod
+    def read_stats(cls, cache_dir: Path) -> Optional[Dict[str, Any]]:
+        """Read stats for a cache directory without creating it.
+
+        Args:
+            cache_dir: Cache directory (e.g. .claude/cache/web-fetch)
+
+        Returns:
+            Stats dict (see stats()), or None if the cache has no index
+        """
+        index_path = Path(cache_dir) / CACHE_INDEX_FILE
+        try:
+            index = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index, dict):
+            return None
+        cls._apply_pending_accesses(index, Path(cache_dir))
+        return cls.summarize_index(index)
+
+    def _record_coalesced(self) -> None:
+        try:
+            with self._index_txn() as index:
+                index["stats"]["coalesced"] += 1
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Request coalescing
+    # ------------------------------------------------------------------
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        with self._thread_lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def _acquire_fetch_lock(self, url: str) -> Tuple[str, Optional[Path]]:
+        """Become the single fetcher for url across processes.
+
+        Uses an O_EXCL lock file next to the entry. While another process
+        holds it, polls until the entry appears (its fetch finished), the
+        lock disappears, or the lock goes stale.
+
+        Returns:
+            ("lead", lock_path) - caller must fetch, then release the lock
+            ("cached", None) - another process filled the entry meanwhile
+            ("unlocked", None) - waited too long; caller fetches uncoordinated
+        """
+        lock_path = self.cache_dir / f"{self._url_hash(url)}.lock"
+        deadline = time.monotonic() + self.lock_timeout
+
+        while True:
+            try:
+                fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                # The previous holder may have just finished this very URL
+                if self._read_entry(url)[0] is not None:
+                    self._release_fetch_lock(lock_path)
+                    return "cached", None
+                return "lead", lock_path
+            except FileExistsError:
+                pass
+
+            if self._read_entry(url)[0] is not None:
+                return "cached", None
+
+            try:
+                age = time.time() - lock_path.stat().st_mtime
+            except FileNotFoundError:
+                continue  # Holder just finished - retry immediately
+            if age > self.lock_timeout:
+                try:
+                    lock_path.unlink()  # Stale lock from a crashed fetcher
+                except FileNotFoundError:
+                    pass
+                continue
+
+            if time.monotonic() > deadline:
+                return "unlocked", None
+            time.sleep(self.poll_interval)
+
+    @staticmethod
+    def _release_fetch_lock(lock_path: Optional[Path]) -> None:
+        if lock_path is None:
+            return
+        try:
+            lock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def get_or_fetch(self, url: str, fetcher: Callable[[str], str]) -> str:
+        """Return cached content for url, fetching it at most once on a miss.
+
+        Concurrent callers for the same URL (threads in this process or
+        other processes sharing the cache directory) wait for the first
+        fetch instead of issuing their own.
+
+        Args:
+            url: URL to look up
+            fetcher: Called as fetcher(url) on a miss; returns the content
+
+        Returns:
+            Cached or freshly fetched content
+
+        Raises:
+            Whatever fetcher raises (nothing is cached in that case)
+        """
+        content = self.get(url)
+        if content is not None:
+            return content
+
+        with self._url_lock(url):
+            # Another thread may have fetched while we waited for the lock
+            content = self._read_entry(url)[0]
+            if content is not None:
+                self._record_coalesced()
+                return content
+
+            state, lock_path = self._acquire_fetch_lock(url)
+            if state == "cached":
+                content = self._read_entry(url)[0]
+                if content is not None:
+                    self._record_coalesced()
+                    return content
+
+            try:
+                content = fetcher(url)
+                self.set(url, content)
+            finally:
+                self._release_fetch_lock(lock_path)
+            return content
+
+    async def aget_or_fetch(self, url: str, fetcher: Callable[[str], Any]) -> str:
+        """Async variant of get_or_fetch().
+
+        Tasks on the same event loop share one in-flight future per URL;
+        cross-process coalescing uses the same lock files as get_or_fetch().
+        File and lock I/O runs in worker threads so the loop is never blocked.
+
+        Args:
+            url: URL to look up
+            fetcher: fetcher(url) returning content, or a coroutine function
+
+        Returns:
+            Cached or freshly fetched content
+        """
+        content = await asyncio.to_thread(self.get, url)
+        if content is not None:
+            return content
+
+        inflight = self._async_inflight.get(url)
+        if inflight is not None:
+            await asyncio.to_thread(self._record_coalesced)
+            return await asyncio.shield(inflight)
+
+        future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+        self._async_inflight[url] = future
+        try:
+            state, lock_path = await asyncio.to_thread(self._acquire_fetch_lock, url)
+            content = None
+            if state == "cached":
+                content = await asyncio.to_thread(lambda: self._read_entry(url)[0])
+                if content is not None:
+                    await asyncio.to_thread(self._record_coalesced)
+
+            if content is None:
+                try:
+                    result = fetcher(url)
+                    if inspect.isawaitable(result):
+                        result = await result
+                    content = result
+                    await asyncio.to_thread(self.set, url, content)
+                finally:
+                    await asyncio.to_thread(self._release_fetch_lock, lock_path)
+
+            future.set_result(content)
+            return content
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when no task is waiting on it
+            raise
+        finally:
+            self._async_inflight.pop(url, None)
+
 
 def score_source(url: str, title: str = "", snippet: str = "") -> float:
     """Score source quality for prioritization.
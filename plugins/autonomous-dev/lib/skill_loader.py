@@ -16,6 +16,15 @@ Security Features:
 - Sanitize skill content before injection
 - Audit log which skills loaded for which agents
 
+Caching (Issue: skill injection runs for every agent dispatch in a batch):
+- SKILL.md and agent file content memoized per process, keyed by
+  (path, st_mtime_ns, st_size) so an edited file is re-read immediately
+- Formatted injection blocks memoized by
+  (agent, skill set, file stamps, max_total_lines)
+- Injection blocks persisted to .claude/cache/skills/ when the project
+  has a .claude directory, so short-lived hook processes share hits
+- get_cache_stats() / reset_cache_stats() report hit rate per batch
+
 Usage:
     from skill_loader import load_skills_for_agent, format_skills_for_prompt
 
@@ -33,10 +42,14 @@ Issue: GitHub #140 (Skill injection into subagents)
 Agent: implementer
 """
 
+import hashlib
+import json
+import os
 import re
 import sys
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Import path_utils for project root detection
 try:
@@ -77,6 +90,24 @@ AGENT_SKILL_MAP: Dict[str, List[str]] = {
     "mobile-tester": ["testing-guide", "python-standards"],
 }
 
+# Maximum formatted injection blocks kept in memory / on disk
+INJECTION_CACHE_MAX_ENTRIES = 128
+
+# On-disk cache location (relative to project root)
+INJECTION_CACHE_FILE = Path(".claude") / "cache" / "skills" / "injections.json"
+
+# (st_mtime_ns, st_size) - cheap change detector for cached file content
+FileStamp = Tuple[int, int]
+
+_cache_lock = threading.Lock()
+_file_cache: Dict[str, Tuple[FileStamp, str]] = {}
+_agent_skills_cache: Dict[str, Tuple[FileStamp, List[str]]] = {}
+_format_cache: Dict[tuple, str] = {}
+_injection_cache: Dict[tuple, str] = {}
+_disk_cache: Optional[Dict[str, str]] = None
+_CACHE_KINDS = ("file", "agent", "format", "injection", "disk")
+_cache_stats: Dict[str, Dict[str, int]] = {k: {"hits": 0, "misses": 0} for k in _CACHE_KINDS}
+
 
 def get_skills_dir() -> Path:
     """Get the skills directory path.
@@ -180,6 +211,159 @@ def validate_agent_skill_map(
     return dangling
 
 
+def _record(kind: str, hit: bool) -> None:
+    """Count a cache hit or miss for get_cache_stats()."""
+    with _cache_lock:
+        _cache_stats[kind]["hits" if hit else "misses"] += 1
+
+
+def _file_stamp(path: Path) -> Optional[FileStamp]:
+    """Return (st_mtime_ns, st_size) for path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_cached(path: Path, stamp: FileStamp) -> str:
+    """Read file content, reusing the cached copy while its stamp is unchanged.
+
+    Args:
+        path: File to read
+        stamp: Current stamp from _file_stamp()
+
+    Returns:
+        File content
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    key = str(path)
+    with _cache_lock:
+        cached = _file_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        _record("file", True)
+        return cached[1]
+
+    _record("file", False)
+    content = path.read_text()
+    with _cache_lock:
+        _file_cache[key] = (stamp, content)
+    return content
+
+
+def _remember(cache: Dict[tuple, str], key: tuple, value: str) -> None:
+    """Store value in a bounded memo, evicting the oldest entry when full."""
+    with _cache_lock:
+        if key not in cache and len(cache) >= INJECTION_CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
+
+def _disk_cache_path() -> Optional[Path]:
+    """Path of the persistent injection cache, or None if persistence is off.
+
+    Persistence is only enabled for projects that already have a .claude
+    directory - the loader never creates .claude in an unrelated tree.
+    """
+    try:
+        root = get_project_root()
+    except (FileNotFoundError, OSError):
+        return None
+    if not (root / ".claude").is_dir():
+        return None
+    return root / INJECTION_CACHE_FILE
+
+
+def _load_disk_cache() -> Dict[str, str]:
+    """Load (once per process) the persistent injection cache."""
+    global _disk_cache
+    if _disk_cache is not None:
+        return _disk_cache
+
+    entries: Dict[str, str] = {}
+    path = _disk_cache_path()
+    if path is not None and path.exists():
+        try:
+            data = json.loads(path.read_text())
+            if isinstance(data, dict):
+                entries = {k: v for k, v in data.items() if isinstance(v, str)}
+        except (OSError, ValueError):
+            entries = {}  # Corrupt cache - start over, never fail a dispatch
+    _disk_cache = entries
+    return entries
+
+
+def _save_disk_cache(digest: str, value: str) -> None:
+    """Add an entry to the persistent injection cache (atomic write)."""
+    path = _disk_cache_path()
+    if path is None:
+        return
+
+    entries = _load_disk_cache()
+    with _cache_lock:
+        entries.pop(digest, None)
+        entries[digest] = value
+        while len(entries) > INJECTION_CACHE_MAX_ENTRIES:
+            entries.pop(next(iter(entries)))
+        payload = json.dumps(entries)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(payload)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Could not write skill cache {path}: {e}", file=sys.stderr)
+
+
+def get_cache_stats() -> Dict[str, Dict[str, float]]:
+    """Get cache hit/miss counters since the last reset_cache_stats().
+
+    Call reset_cache_stats() at the start of a batch and this at the end to
+    get the per-batch hit rate.
+
+    Returns:
+        Dict mapping cache kind ("file", "agent", "format", "injection",
+        "disk") to {"hits", "misses", "hit_rate"}
+    """
+    with _cache_lock:
+        stats: Dict[str, Dict[str, float]] = {}
+        for kind, counts in _cache_stats.items():
+            total = counts["hits"] + counts["misses"]
+            stats[kind] = {
+                "hits": counts["hits"],
+                "misses": counts["misses"],
+                "hit_rate": round(counts["hits"] / total, 4) if total else 0.0,
+            }
+    return stats
+
+
+def reset_cache_stats() -> None:
+    """Reset cache hit/miss counters (cached content is kept)."""
+    with _cache_lock:
+        for counts in _cache_stats.values():
+            counts["hits"] = 0
+            counts["misses"] = 0
+
+
+def clear_skill_cache() -> None:
+    """Drop all in-process cached content and reset counters.
+
+    The on-disk cache is left in place; it is keyed by file stamps, so stale
+    entries are simply never hit again.
+    """
+    global _disk_cache
+    with _cache_lock:
+        _file_cache.clear()
+        _agent_skills_cache.clear()
+        _format_cache.clear()
+        _injection_cache.clear()
+        _disk_cache = None
+    reset_cache_stats()
+
+
 def get_agent_file(agent_name: str) -> Optional[Path]:
     """Get the agent file path.
 
@@ -215,8 +399,20 @@ def parse_agent_skills(agent_name: str) -> List[str]:
     if not agent_file:
         return []
 
+    stamp = _file_stamp(agent_file)
+    if stamp is None:
+        return []
+
+    cache_key = str(agent_file)
+    with _cache_lock:
+        cached = _agent_skills_cache.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        _record("agent", True)
+        return list(cached[1])
+    _record("agent", False)
+
     try:
-        content = agent_file.read_text()
+        content = _read_cached(agent_file, stamp)
 
         # Look for "Relevant Skills" section
         skills_match = re.search(
@@ -241,6 +437,8 @@ def parse_agent_skills(agent_name: str) -> List[str]:
             if skill:
                 skills.append(skill)
 
+        with _cache_lock:
+            _agent_skills_cache[cache_key] = (stamp, list(skills))
         return skills
 
     except Exception as e:
@@ -269,13 +467,13 @@ def load_skill_content(skill_name: str) -> Optional[str]:
 
     skill_file = skills_dir / skill_name / "SKILL.md"
 
-    if not skill_file.exists():
+    stamp = _file_stamp(skill_file)
+    if stamp is None:
         print(f"Warning: Skill file not found: {skill_file}", file=sys.stderr)
         return None
 
     try:
-        content = skill_file.read_text()
-        return content
+        return _read_cached(skill_file, stamp)
     except Exception as e:
         print(f"Warning: Could not read skill file {skill_file}: {e}", file=sys.stderr)
         return None
@@ -319,6 +517,23 @@ def format_skills_for_prompt(skills: Dict[str, str], max_total_lines: int = 1500
     if not skills:
         return ""
 
+    # Content strings come from the file cache, so their hashes are already
+    # computed and this key is cheap to look up.
+    cache_key = (tuple(skills.items()), max_total_lines)
+    with _cache_lock:
+        cached = _format_cache.get(cache_key)
+    if cached is not None:
+        _record("format", True)
+        return cached
+    _record("format", False)
+
+    formatted = _format_skills(skills, max_total_lines)
+    _remember(_format_cache, cache_key, formatted)
+    return formatted
+
+
+def _format_skills(skills: Dict[str, str], max_total_lines: int) -> str:
+    """Uncached body of format_skills_for_prompt()."""
     lines_used = 0
     skill_blocks = []
 
@@ -349,17 +564,52 @@ def format_skills_for_prompt(skills: Dict[str, str], max_total_lines: int = 1500
     return header + "\n\n".join(skill_blocks) + footer
 
 
-def get_skill_injection_for_agent(agent_name: str) -> str:
+def get_skill_injection_for_agent(agent_name: str, max_total_lines: int = 1500) -> str:
     """Convenience function to get formatted skill injection for an agent.
 
+    The result is memoized in-process and on disk, keyed by
+    (agent, skill set, SKILL.md stamps, max_total_lines), so editing any
+    skill file invalidates the entry.
+
     Args:
         agent_name: Name of the agent
+        max_total_lines: Maximum total lines across all skills (default 1500)
 
     Returns:
         Formatted skill content ready for prompt injection
     """
-    skills = load_skills_for_agent(agent_name)
-    return format_skills_for_prompt(skills)
+    skill_names = parse_agent_skills(agent_name)
+    try:
+        skills_dir: Optional[Path] = get_skills_dir()
+    except FileNotFoundError:
+        skills_dir = None
+
+    stamps = tuple(
+        _file_stamp(skills_dir / name / "SKILL.md") if skills_dir else None
+        for name in skill_names
+    )
+    cache_key = (agent_name, tuple(skill_names), stamps, max_total_lines)
+
+    with _cache_lock:
+        cached = _injection_cache.get(cache_key)
+    if cached is not None:
+        _record("injection", True)
+        return cached
+    _record("injection", False)
+
+    digest = hashlib.sha256(repr((str(skills_dir),) + cache_key).encode()).hexdigest()
+    persisted = _load_disk_cache().get(digest)
+    if persisted is not None:
+        _record("disk", True)
+        _remember(_injection_cache, cache_key, persisted)
+        return persisted
+    _record("disk", False)
+
+    injection = format_skills_for_prompt(load_skills_for_agent(agent_name), max_total_lines)
+    _remember(_injection_cache, cache_key, injection)
+    if None not in stamps:
+        _save_disk_cache(digest, injection)
+    return injection
 
 
 def get_available_skills() -> List[str]:
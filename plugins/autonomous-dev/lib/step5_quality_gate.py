@@ -26,6 +26,11 @@ except ImportError:
     except ImportError:
         _route_tests = None  # type: ignore[assignment]
 
+try:
+    from test_impact import select_tests as _select_impacted_tests
+except ImportError:
+    _select_impacted_tests = None  # type: ignore[assignment]
+
 try:
     from tier_registry import get_tier_distribution as _get_tier_distribution
 except ImportError:
@@ -42,6 +47,11 @@ except ImportError:
     _compute_criteria_coverage = None  # type: ignore[assignment]
     _CriteriaCoverageResult = None  # type: ignore[assignment]
 
+try:
+    from test_result_cache import TestResultCache as _TestResultCache
+except ImportError:
+    _TestResultCache = None  # type: ignore[assignment]
+
 
 COVERAGE_BASELINE_PATH = Path(".claude/local/coverage_baseline.json")
 COVERAGE_REGRESSION_THRESHOLD = 0.5  # percent
@@ -162,6 +172,41 @@ def parse_pytest_output(output: str) -> TestResult:
     )
 
 
+def _run_pytest_command(cmd: list, timeout: int = 600) -> TestResult:
+    """Run a pytest command, reusing the cached verdict for an unchanged tree.
+
+    The cache (test_result_cache) is keyed by the working tree hash, the
+    command and the environment, so a hit means the same suite already ran
+    against identical files. Timeouts and missing pytest propagate uncached.
+    """
+    cache = _TestResultCache.for_project() if _TestResultCache is not None else None
+    key = cache.key_for(cmd) if cache is not None else None
+    if key is not None:
+        hit = cache.get(key, consumer="step5_quality_gate")
+        if hit is not None:
+            try:
+                cached = TestResult(**hit.summary)
+            except TypeError:
+                cached = None
+            if cached is not None:
+                cached.message += " (cached: unchanged tree)"
+                return cached
+
+    start = datetime.now()
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    output = result.stdout + "\n" + result.stderr
+    test_result = parse_pytest_output(output)
+    if key is not None:
+        cache.put(
+            key,
+            test_result.passed,
+            result.returncode,
+            summary=asdict(test_result),
+            duration_seconds=(datetime.now() - start).total_seconds(),
+        )
+    return test_result
+
+
 def run_tests() -> TestResult:
     """Run pytest and return parsed results.
 
@@ -169,14 +214,7 @@ def run_tests() -> TestResult:
         TestResult from running the test suite.
     """
     try:
-        result = subprocess.run(
-            ["python", "-m", "pytest", "--tb=short", "-q"],
-            capture_output=True,
-            text=True,
-            timeout=600,
-        )
-        output = result.stdout + "\n" + result.stderr
-        return parse_pytest_output(output)
+        return _run_pytest_command(["python", "-m", "pytest", "--tb=short", "-q"])
     except subprocess.TimeoutExpired:
         return TestResult(
             passed=False,
@@ -309,7 +347,9 @@ def run_tests_routed(*, full_tests: bool = False) -> dict:
     """Run tests with smart routing or full suite.
 
     If full_tests is True or routing is unavailable, delegates to run_tests().
-    Otherwise uses test_routing to determine which markers to run.
+    Otherwise runs only the tests that touch the changed code when the
+    test-impact map (test_impact) can select them safely, and falls back to
+    test_routing marker expressions when it cannot.
 
     Args:
         full_tests: Force full test suite (bypass smart routing).
@@ -319,6 +359,44 @@ def run_tests_routed(*, full_tests: bool = False) -> dict:
     """
     routing_meta = None
 
+    if not full_tests and _select_impacted_tests is not None:
+        try:
+            selection = _select_impacted_tests()
+        except Exception:
+            selection = None
+
+        if selection is not None and not selection.full_suite:
+            routing_meta = {
+                "routed": True,
+                "impact": True,
+                "selected_tests": len(selection.tests),
+                "selected_files": len(selection.test_files),
+                "reason": selection.reason,
+            }
+            if selection.skip_all:
+                return {
+                    "test_result": TestResult(
+                        passed=True,
+                        test_count=0,
+                        failures=0,
+                        errors=0,
+                        skipped=0,
+                        skip_rate=0.0,
+                        message="SKIP: no tests touch the changed code",
+                    ),
+                    "routing": {**routing_meta, "skip_all": True},
+                }
+            try:
+                test_result = _run_pytest_command(
+                    ["python", "-m", "pytest", "--tb=short", "-q", *selection.pytest_args()]
+                )
+                return {
+                    "test_result": test_result,
+                    "routing": routing_meta,
+                }
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                pass  # Fall through to marker routing / full suite
+
     if not full_tests and _route_tests is not None:
         try:
             routing_decision = _route_tests()
@@ -329,14 +407,9 @@ def run_tests_routed(*, full_tests: bool = False) -> dict:
             marker_expr = routing_decision.get("marker_expression", "")
             if marker_expr:
                 try:
-                    result = subprocess.run(
-                        ["python", "-m", "pytest", "--tb=short", "-q", "-m", marker_expr],
-                        capture_output=True,
-                        text=True,
-                        timeout=600,
+                    test_result = _run_pytest_command(
+                        ["python", "-m", "pytest", "--tb=short", "-q", "-m", marker_expr]
                     )
-                    output = result.stdout + "\n" + result.stderr
-                    test_result = parse_pytest_output(output)
                     routing_meta = {
                         "routed": True,
                         "marker_expression": marker_expr,
@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+"""Test-impact selection from a per-test coverage map.
+
+Instead of choosing pytest markers from path categories (``test_routing``),
+this module records which source lines every test executes and, given the
+changed files, selects only the tests that touch the changed code.
+
+Map collection:
+    ``test_impact_plugin`` (a pytest plugin) switches a coverage.py dynamic
+    context to the test's node id around every test, then folds the data into
+    ``<repo>/.claude/cache/test_impact/map.json``. The map is updated
+    incrementally: tests that ran replace their old entries, tests that did
+    not run keep theirs.
+
+        python plugins/autonomous-dev/lib/test_impact.py build [pytest args...]
+
+Selection (``select_tests``), per changed file:
+    - docs (``test_routing`` "docs_only")      -> nothing to run
+    - test files (``tests/**/test_*.py``)      -> the whole file
+    - pytest config (conftest.py, pytest.ini, pyproject.toml, setup.cfg,
+      tox.ini, setup.py, requirements*.txt)   -> full suite
+    - other non-Python files                   -> full suite (not traced)
+    - Python source in the map                 -> tests whose lines intersect
+      the changed hunks when the map was collected against the HEAD content
+      of the file; otherwise (or when a hunk only touches import-time or
+      unexecuted lines) every test that executed the file
+    - Python source not in the map             -> full suite, unless it is a
+      new file added together with test files (they are selected)
+
+Safe fallback: a missing map, a schema change, a changed pytest config
+fingerprint, or a map built more than ``MAX_COMMITS_BEHIND`` commits ago (or
+not on HEAD's history) selects the full suite.
+
+Code executed in subprocesses is not traced, so hooks exercised only through
+``subprocess`` never appear in the map and their changes fall back to the
+full suite.
+
+Usage:
+    from test_impact import select_tests
+
+    selection = select_tests()
+    if selection.full_suite:
+        args = ["tests/"]
+    elif selection.skip_all:
+        args = []
+    else:
+        args = selection.pytest_args()
+
+Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from test_routing import classify_changes, get_changed_files
+except ImportError:  # pragma: no cover - package import path
+    from .test_routing import classify_changes, get_changed_files  # type: ignore[no-redef]
+
+
+SCHEMA_VERSION = 1
+MAP_REL = ".claude/cache/test_impact/map.json"
+
+# A map built further back than this is considered stale (full suite).
+MAX_COMMITS_BEHIND = 50
+
+# Above this many node ids, selection collapses to test files so the pytest
+# command line stays short.
+MAX_NODEID_ARGS = 400
+
+# Files that change how every test runs.
+GLOBAL_FILES = frozenset(
+    {"conftest.py", "pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini", "setup.py"}
+)
+_REQUIREMENTS_RE = re.compile(r"(?:^|/)requirements[^/]*\.txt$")
+_TEST_FILE_RE = re.compile(r"(?:^|/)(?:test_[^/]*|[^/]*_test)\.py$")
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+", re.MULTILINE)
+
+# Set TEST_IMPACT_SELECTION=0 to always run the full suite.
+_DISABLE_ENV = "TEST_IMPACT_SELECTION"
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def is_enabled() -> bool:
+    """True unless TEST_IMPACT_SELECTION disables impact selection."""
+    return os.environ.get(_DISABLE_ENV, "").strip().lower() not in ("0", "false", "no", "off")
+
+
+def is_test_file(path: str) -> bool:
+    """True for pytest test modules (``test_*.py`` / ``*_test.py`` under ``tests/``).
+
+    The directory check keeps library modules such as ``lib/test_routing.py``
+    on the source side.
+    """
+    return bool(_TEST_FILE_RE.search(path)) and any(
+        part in ("tests", "test") for part in Path(path).parts[:-1]
+    )
+
+
+def is_global_file(path: str) -> bool:
+    """True for files that affect every test (pytest config, requirements)."""
+    return Path(path).name in GLOBAL_FILES or bool(_REQUIREMENTS_RE.search(path))
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Git blob id of ``data`` (same value as ``git hash-object``)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def file_blob_sha(path: Path) -> Optional[str]:
+    """Git blob id of the file at ``path``, or None if unreadable."""
+    try:
+        return git_blob_sha(path.read_bytes())
+    except OSError:
+        return None
+
+
+def to_ranges(lines: Iterable[int]) -> List[List[int]]:
+    """Compress line numbers into sorted inclusive ``[start, end]`` ranges."""
+    ranges: List[List[int]] = []
+    for line in sorted(set(lines)):
+        if ranges and line == ranges[-1][1] + 1:
+            ranges[-1][1] = line
+        else:
+            ranges.append([line, line])
+    return ranges
+
+
+def _intersects(ranges: List[List[int]], spans: List[Tuple[int, int]]) -> bool:
+    """True if any inclusive ``(start, end)`` span overlaps any range."""
+    for start, end in spans:
+        for lo, hi in ranges:
+            if lo <= end and start <= hi:
+                return True
+    return False
+
+
+def _git(args: List[str], cwd: Path) -> Optional[str]:
+    """Run a git command, returning stdout or None on any failure."""
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=str(cwd), capture_output=True, text=True, timeout=30
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def head_commit(repo_root: Path) -> Optional[str]:
+    """Commit id of HEAD, or None outside a repository."""
+    out = _git(["rev-parse", "HEAD"], repo_root)
+    return out.strip() if out else None
+
+
+def find_repo_root(cwd: Optional[Path] = None) -> Path:
+    """Repository root for ``cwd`` (falls back to ``cwd`` outside a repo)."""
+    start = Path(cwd) if cwd else Path.cwd()
+    try:
+        from path_utils import find_project_root
+
+        return find_project_root(start_path=start)
+    except (ImportError, FileNotFoundError):
+        return start.resolve()
+
+
+def default_map_path(repo_root: Optional[Path] = None) -> Path:
+    """``<repo>/.claude/cache/test_impact/map.json``."""
+    return (repo_root or find_repo_root()) / MAP_REL
+
+
+def config_fingerprint(repo_root: Path) -> str:
+    """Hash of the root-level pytest configuration files."""
+    digest = hashlib.sha256()
+    for name in sorted(GLOBAL_FILES):
+        path = repo_root / name
+        sha = file_blob_sha(path) if path.is_file() else None
+        digest.update(f"{name}:{sha}\n".encode())
+    return digest.hexdigest()
+
+
+# ============================================================================
+# Impact Map
+# ============================================================================
+
+class ImpactMap:
+    """Per-test coverage map: source file -> {test node id -> line ranges}.
+
+    Attributes:
+        path: JSON file backing the map
+        data: Raw map document (see ``_empty``)
+    """
+
+    def __init__(self, path: Path, data: Optional[Dict] = None):
+        self.path = Path(path)
+        self.data = data if data is not None else self._empty()
+
+    @staticmethod
+    def _empty() -> Dict:
+        return {
+            "schema": SCHEMA_VERSION,
+            "base_commit": None,
+            "config_fingerprint": None,
+            "updated_at": None,
+            # source path -> {"sha": blob id when collected (None = mixed), "tests": {nodeid: ranges}}
+            "files": {},
+            # test file path -> blob id when its node ids were recorded
+            "test_files": {},
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> "ImpactMap":
+        """Load the map, returning an empty one if missing, corrupt or outdated."""
+        try:
+            data = json.loads(Path(path).read_text())
+        except (OSError, ValueError):
+            return cls(path)
+        if not isinstance(data, dict) or data.get("schema") != SCHEMA_VERSION:
+            return cls(path)
+        return cls(path, data)
+
+    @property
+    def files(self) -> Dict[str, Dict]:
+        return self.data["files"]
+
+    @property
+    def test_files(self) -> Dict[str, str]:
+        return self.data["test_files"]
+
+    def is_empty(self) -> bool:
+        return not self.files and not self.test_files
+
+    def update(
+        self,
+        coverage_by_test: Dict[str, Dict[str, Set[int]]],
+        ran: Set[str],
+        file_shas: Dict[str, Optional[str]],
+        base_commit: Optional[str],
+        fingerprint: str,
+    ) -> None:
+        """Fold one run into the map.
+
+        Tests in ``ran`` replace their previous entries; tests that did not
+        run keep theirs. A source file whose content changed while some of
+        its old entries survive gets ``sha = None`` (line numbers may be off,
+        so selection for it is file-level until a full rebuild).
+
+        Args:
+            coverage_by_test: node id -> source path -> executed lines
+            ran: Node ids that ran in this session
+            file_shas: Blob id of every source and test file seen this run
+            base_commit: HEAD when the run happened
+            fingerprint: config_fingerprint() at run time
+        """
+        for path, entry in list(self.files.items()):
+            tests = entry["tests"]
+            for nodeid in ran.intersection(tests):
+                del tests[nodeid]
+            if not tests:
+                del self.files[path]
+
+        for nodeid, by_file in coverage_by_test.items():
+            for path, lines in by_file.items():
+                if not lines:
+                    continue
+                sha = file_shas.get(path)
+                entry = self.files.get(path)
+                if entry is None:
+                    entry = self.files[path] = {"sha": sha, "tests": {}}
+                elif entry["sha"] != sha:
+                    entry["sha"] = None
+                entry["tests"][nodeid] = to_ranges(lines)
+
+        for nodeid in ran:
+            test_path = nodeid.split("::", 1)[0]
+            if test_path in file_shas:
+                self.test_files[test_path] = file_shas[test_path]
+
+        self.data["base_commit"] = base_commit
+        self.data["config_fingerprint"] = fingerprint
+        self.data["updated_at"] = time.time()
+
+    def save(self) -> None:
+        """Write the map atomically (temp file + os.replace)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{self.path.name}.", suffix=".tmp", dir=str(self.path.parent)
+        )
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(self.data, fh, separators=(",", ":"))
+            os.replace(tmp_name, str(self.path))
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+
+# ============================================================================
+# Selection
+# ============================================================================
+
+@dataclass
+class ImpactSelection:
+    """Outcome of test-impact selection.
+
+    Attributes:
+        full_suite: Run everything (no map, stale map, or unsafe change)
+        skip_all: Nothing needs to run (docs-only change)
+        tests: Selected node ids (tests whose recorded lines were touched)
+        test_files: Test files selected wholesale (changed or new)
+        reason: Why this selection was made
+        changed_files: Files the decision was based on
+    """
+
+    full_suite: bool
+    skip_all: bool = False
+    tests: List[str] = field(default_factory=list)
+    test_files: List[str] = field(default_factory=list)
+    reason: str = ""
+    changed_files: List[str] = field(default_factory=list)
+
+    def pytest_args(self, max_nodeids: int = MAX_NODEID_ARGS) -> List[str]:
+        """Positional pytest arguments for the selection (empty for full/skip)."""
+        if self.full_suite or self.skip_all:
+            return []
+        files = sorted(set(self.test_files))
+        wholesale = set(files)
+        nodeids = [t for t in self.tests if t.split("::", 1)[0] not in wholesale]
+        if len(nodeids) > max_nodeids:
+            files = sorted(wholesale | {t.split("::", 1)[0] for t in nodeids})
+            nodeids = []
+        return files + sorted(nodeids)
+
+    def to_dict(self) -> Dict:
+        return {
+            "full_suite": self.full_suite,
+            "skip_all": self.skip_all,
+            "tests": list(self.tests),
+            "test_files": list(self.test_files),
+            "reason": self.reason,
+            "changed_files": list(self.changed_files),
+        }
+
+
+def _full(reason: str, changed: List[str]) -> ImpactSelection:
+    return ImpactSelection(full_suite=True, reason=reason, changed_files=changed)
+
+
+def _head_blob_shas(paths: List[str], root: Path) -> Dict[str, str]:
+    """Blob ids of ``paths`` at HEAD (missing paths are absent)."""
+    if not paths:
+        return {}
+    out = _git(["ls-tree", "-r", "HEAD", "--", *paths], root)
+    shas: Dict[str, str] = {}
+    for line in (out or "").splitlines():
+        meta, _, path = line.partition("\t")
+        parts = meta.split()
+        if len(parts) == 3 and parts[1] == "blob":
+            shas[path] = parts[2]
+    return shas
+
+
+def changed_spans(path: str, root: Path) -> Optional[List[Tuple[int, int]]]:
+    """Old-side line spans touched by the working-tree diff of ``path``.
+
+    Pure insertions touch the lines on both sides of the insertion point.
+
+    Returns:
+        Inclusive ``(start, end)`` spans, or None if git failed.
+    """
+    out = _git(["diff", "-U0", "--no-color", "--no-ext-diff", "HEAD", "--", path], root)
+    if out is None:
+        return None
+    spans = []
+    for match in _HUNK_RE.finditer(out):
+        start = int(match.group(1))
+        count = int(match.group(2)) if match.group(2) is not None else 1
+        if count == 0:
+            spans.append((start, start + 1))
+        else:
+            spans.append((start, start + count - 1))
+    return spans
+
+
+def _tests_touching(
+    tests: Dict[str, List[List[int]]], spans: Optional[List[Tuple[int, int]]]
+) -> List[str]:
+    """Tests of one source file affected by the changed ``spans``.
+
+    Falls back to every test of the file when line numbers are unknown
+    (``spans`` is None or empty, e.g. a committed change) or when a hunk only
+    touches lines no test executed: import-time code such as signatures,
+    decorators and module constants runs before any test context is set.
+    """
+    if not spans:
+        return list(tests)
+    hits: Set[str] = set()
+    for span in spans:
+        touching = [nodeid for nodeid, ranges in tests.items() if _intersects(ranges, [span])]
+        if not touching:
+            return list(tests)
+        hits.update(touching)
+    return sorted(hits)
+
+
+def _map_is_stale(impact_map: ImpactMap, root: Path) -> Optional[str]:
+    """Reason the map cannot be trusted, or None if it is usable."""
+    if impact_map.is_empty():
+        return "no impact map"
+    if impact_map.data.get("config_fingerprint") != config_fingerprint(root):
+        return "pytest configuration changed since the map was built"
+    base = impact_map.data.get("base_commit")
+    if not base:
+        return "impact map has no base commit"
+    if _git(["merge-base", "--is-ancestor", base, "HEAD"], root) is None:
+        return "impact map base commit is not an ancestor of HEAD"
+    count = _git(["rev-list", "--count", f"{base}..HEAD"], root)
+    try:
+        behind = int((count or "").strip())
+    except ValueError:
+        return "cannot count commits since the map was built"
+    if behind > MAX_COMMITS_BEHIND:
+        return f"impact map is {behind} commits behind HEAD"
+    return None
+
+
+def select_tests(
+    changed_files: Optional[List[str]] = None,
+    cwd: Optional[Path] = None,
+    map_path: Optional[Path] = None,
+) -> ImpactSelection:
+    """Select the tests affected by the changed files.
+
+    Args:
+        changed_files: Repo-relative paths (default: ``get_changed_files()``)
+        cwd: Working directory inside the repository
+        map_path: Impact map location (default: ``default_map_path()``)
+
+    Returns:
+        ImpactSelection (``full_suite=True`` whenever selection is not safe)
+    """
+    root = find_repo_root(cwd)
+    if changed_files is None:
+        changed_files = get_changed_files(root)
+    changed = sorted(set(changed_files))
+
+    if not is_enabled():
+        return _full(f"{_DISABLE_ENV} disabled impact selection", changed)
+    if not changed:
+        return _full("no changed files", changed)
+
+    impact_map = ImpactMap.load(map_path or default_map_path(root))
+    stale = _map_is_stale(impact_map, root)
+    if stale:
+        return _full(stale, changed)
+
+    selected: Set[str] = set()
+    test_files: Set[str] = set()
+    new_sources: List[str] = []
+    sources: List[str] = []
+
+    for path in changed:
+        if is_global_file(path):
+            return _full(f"{path} affects every test", changed)
+        if classify_changes([path]) == {"docs_only"}:
+            continue
+        if not path.endswith(".py"):
+            return _full(f"{path} is not traced by the coverage map", changed)
+        if is_test_file(path) or path in impact_map.test_files:
+            if (root / path).exists():
+                test_files.add(path)
+            continue
+        sources.append(path)
+
+    head_shas = _head_blob_shas(sources, root)
+    for path in sources:
+        entry = impact_map.files.get(path)
+        if entry is None:
+            if path not in head_shas and (root / path).exists():
+                new_sources.append(path)
+                continue
+            return _full(f"{path} has no recorded coverage", changed)
+        tests = entry["tests"]
+        spans = changed_spans(path, root) if entry["sha"] == head_shas.get(path) else None
+        selected.update(_tests_touching(tests, spans))
+
+    if new_sources and not test_files:
+        return _full(f"new module {new_sources[0]} has no tests in this change", changed)
+
+    # Node ids recorded for a test file that changed since are not reliable.
+    for nodeid in list(selected):
+        test_path = nodeid.split("::", 1)[0]
+        if not (root / test_path).exists():
+            selected.discard(nodeid)
+        elif impact_map.test_files.get(test_path) != file_blob_sha(root / test_path):
+            selected.discard(nodeid)
+            test_files.add(test_path)
+
+    if not selected and not test_files:
+        return ImpactSelection(
+            full_suite=False,
+            skip_all=True,
+            reason="no recorded test touches the changed code",
+            changed_files=changed,
+        )
+    return ImpactSelection(
+        full_suite=False,
+        tests=sorted(selected),
+        test_files=sorted(test_files),
+        reason=f"{len(selected)} tests + {len(test_files)} test files touch the changes",
+        changed_files=changed,
+    )
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def build_command(map_path: Path, pytest_args: List[str]) -> List[str]:
+    """pytest command that runs ``pytest_args`` and records the impact map.
+
+    ``-o addopts=`` drops configured options such as pytest-cov's ``--cov``,
+    whose tracer would conflict with the one the plugin starts.
+    """
+    return [
+        sys.executable, "-m", "pytest",
+        "-p", "test_impact_plugin",
+        f"--impact-map={map_path}",
+        "-o", "addopts=",
+        *pytest_args,
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: ``build [pytest args...]`` or ``select [changed files...]``."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] not in ("build", "select"):
+        print("usage: test_impact.py build [pytest args...] | select [files...]", file=sys.stderr)
+        return 2
+
+    root = find_repo_root()
+    if argv[0] == "build":
+        env = dict(os.environ)
+        lib_dir = str(Path(__file__).resolve().parent)
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (lib_dir, env.get("PYTHONPATH")) if p)
+        return subprocess.call(build_command(default_map_path(root), argv[1:]), cwd=str(root), env=env)
+
+    selection = select_tests(argv[1:] or None, cwd=root)
+    print(json.dumps({**selection.to_dict(), "pytest_args": selection.pytest_args()}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
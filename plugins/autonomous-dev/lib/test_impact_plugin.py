@@ -0,0 +1,105 @@
+"""pytest plugin that records the per-test coverage map for ``test_impact``.
+
+Loaded with ``-p test_impact_plugin --impact-map=<path>`` (see
+``test_impact.build_command``). Without ``--impact-map`` it does nothing.
+
+Coverage is measured for files under the pytest rootdir only. The dynamic
+context is switched to the test's node id around each test (setup, call and
+teardown), so ``CoverageData.contexts_by_lineno`` tells which lines each test
+executed. Lines that run during collection (module imports) are recorded
+without a context and are ignored; ``test_impact`` treats changes to them as
+file-level changes.
+
+Requires coverage.py (installed with pytest-cov). Not compatible with
+pytest-xdist: run the map build in a single process.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+import pytest
+
+try:
+    import test_impact
+except ImportError:  # pragma: no cover - package import path
+    from . import test_impact  # type: ignore[no-redef]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("test-impact")
+    group.addoption(
+        "--impact-map",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="record per-test coverage into this test-impact map (JSON)",
+    )
+
+
+def pytest_configure(config):
+    map_path = config.getoption("--impact-map", default=None)
+    if map_path:
+        config.pluginmanager.register(_ImpactCollector(Path(map_path), config.rootpath), "test_impact_collector")
+
+
+class _ImpactCollector:
+    """Runs coverage.py for the session and folds its contexts into the map."""
+
+    def __init__(self, map_path: Path, root: Path):
+        import coverage
+
+        self.map_path = map_path
+        self.root = root.resolve()
+        self.ran: Set[str] = set()
+        self.cov = coverage.Coverage(
+            data_file=None, source=[str(self.root)], omit=[__file__], config_file=False
+        )
+        self.cov.start()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.cov.switch_context(item.nodeid)
+        try:
+            yield
+        finally:
+            self.cov.switch_context("")
+            self.ran.add(item.nodeid)
+
+    def _relpath(self, filename: str) -> Optional[str]:
+        try:
+            return Path(filename).resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        self.cov.stop()
+        data = self.cov.get_data()
+
+        # Files that define the tests that ran are selected by path, not coverage.
+        test_paths = {nodeid.split("::", 1)[0] for nodeid in self.ran}
+        coverage_by_test: Dict[str, Dict[str, Set[int]]] = {}
+        file_shas: Dict[str, Optional[str]] = {
+            rel: test_impact.file_blob_sha(self.root / rel) for rel in test_paths
+        }
+        for filename in data.measured_files():
+            rel = self._relpath(filename)
+            if rel is None or rel in test_paths:
+                continue
+            file_shas[rel] = test_impact.file_blob_sha(self.root / rel)
+            for lineno, contexts in data.contexts_by_lineno(filename).items():
+                for context in contexts:
+                    if context in self.ran:
+                        coverage_by_test.setdefault(context, {}).setdefault(rel, set()).add(lineno)
+
+        impact_map = test_impact.ImpactMap.load(self.map_path)
+        impact_map.update(
+            coverage_by_test,
+            self.ran,
+            file_shas,
+            test_impact.head_commit(self.root),
+            test_impact.config_fingerprint(self.root),
+        )
+        impact_map.save()
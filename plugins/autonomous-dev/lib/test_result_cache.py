@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Test Result Cache - Skip pytest gate runs against an unchanged working tree.
+
+The STEP 8 test gate (step5_quality_gate) and the Stop hook
+(stop_quality_gate) often run the same pytest command against a working tree
+that has not changed since the last run. This cache stores each run's verdict
+and summary under a key built from:
+
+- the git tree hash of the working tree: tracked files as they are on disk
+  plus untracked, non-ignored files, written through a throwaway index so
+  the real index is never touched
+- the pytest command (arguments and the resolved executable)
+- an environment fingerprint: Python version and executable, the
+  site-packages directories' mtimes (installs/upgrades change them), and every
+  environment variable except shell/session noise
+
+A lookup with the same key returns the stored verdict without running pytest.
+Any change to a file, argument, package set or relevant variable is a new
+key. Entries also expire after ``max_age_seconds`` (default 24 h), because
+tests can depend on things outside the tree. Every cached verdict that is
+used writes an audit row (security_utils.audit_log, event
+``test_result_cache``).
+
+Usage:
+    from test_result_cache import TestResultCache
+
+    cache = TestResultCache.for_project()     # None when disabled
+    key = cache.key_for(cmd) if cache else None
+    hit = cache.get(key, consumer="step5_quality_gate") if key else None
+    if hit is None:
+        ... run pytest ...
+        cache.put(key, passed, returncode, summary={...})
+
+    # CLI: run a pytest command through the cache
+    python test_result_cache.py run -- python -m pytest -q tests/unit
+    python test_result_cache.py clear
+
+Environment Variables:
+- TEST_RESULT_CACHE: "0" disables the cache; "1" enables it even inside a
+  pytest run (it is off by default under PYTEST_CURRENT_TEST, where gate
+  code runs against mocked subprocesses)
+- TEST_RESULT_CACHE_MAX_AGE: entry lifetime in seconds (default: 86400)
+
+Security:
+- Cache files are written atomically with mode 0600
+- git runs with list-form args and a private GIT_INDEX_FILE
+- Environment values are only hashed, never stored
+
+Date: 2026-10-18
+Related: Issue #1238 (pytest-gate completion recording)
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import site
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    from security_utils import audit_log
+except ImportError:
+    def audit_log(event_type: str, status: str, context: Dict[str, Any]) -> None:  # type: ignore[misc]
+        pass
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+CACHE_DIR_REL = ".claude/cache/test_results"
+ENV_CACHE = "TEST_RESULT_CACHE"
+ENV_MAX_AGE = "TEST_RESULT_CACHE_MAX_AGE"
+DEFAULT_MAX_AGE_SECONDS = 24 * 3600
+MAX_ENTRIES = 200
+GIT_TIMEOUT_SECONDS = 30
+
+#: Untracked paths that change on every run without affecting test outcomes
+#: (this cache, pipeline state, coverage data).
+TREE_EXCLUDES = (
+    ".claude/cache",
+    ".claude/local",
+    ".claude/logs",
+    "docs/sessions",
+    ".coverage",
+    ".coverage.*",
+    "coverage.xml",
+    "htmlcov",
+    ".pytest_cache",
+)
+
+#: Environment variables left out of the fingerprint: they differ between shells
+#: and sessions but do not change what pytest runs.
+_VOLATILE_ENV = re.compile(
+    r"^(PWD|OLDPWD|SHLVL|_|COLUMNS|LINES|DISPLAY|WINDOWID|LS_COLORS|HOSTNAME"
+    r"|TERM.*|SSH_.*|TMUX.*|HIST.*|PS\d|PROMPT.*|.*SESSION.*|.*_PID|CLAUDE_.*"
+    r"|PYTEST_CURRENT_TEST|TEST_RESULT_CACHE.*|OTEL_.*)$"
+)
+
+_SHA = re.compile(r"^[0-9a-f]{40}$")
+
+
+# =============================================================================
+# Key parts
+# =============================================================================
+
+def cache_enabled(env: Optional[Dict[str, str]] = None) -> bool:
+    """True unless disabled by TEST_RESULT_CACHE=0 or running inside pytest."""
+    env = os.environ if env is None else env
+    setting = env.get(ENV_CACHE, "").strip().lower()
+    if setting in ("0", "false", "no", "off"):
+        return False
+    if setting in ("1", "true", "yes", "on"):
+        return True
+    return "PYTEST_CURRENT_TEST" not in env
+
+
+def _git(args: List[str], cwd: Path, env: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """Run git and return stdout, or None on any failure.
+
+    Uses Popen directly so callers that mock subprocess.run for their pytest
+    call never see these git calls.
+    """
+    try:
+        proc = subprocess.Popen(
+            ["git", *args],
+            cwd=str(cwd),
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            text=True,
+        )
+        stdout, _ = proc.communicate(timeout=GIT_TIMEOUT_SECONDS)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return stdout if proc.returncode == 0 else None
+
+
+def working_tree_hash(root: Path) -> Optional[str]:
+    """Git tree hash of the working tree (tracked + untracked, non-ignored files).
+
+    Copies the index to a temporary file, stages everything into the copy and
+    writes a tree object, so the real index stays untouched. The copied
+    index's stat data keeps unchanged files from being re-hashed.
+
+    Returns:
+        40-char tree SHA, or None outside a git repository.
+    """
+    index_path = _git(["rev-parse", "--git-path", "index"], root)
+    if index_path is None:
+        return None
+    index = Path(index_path.strip())
+    if not index.is_absolute():
+        index = root / index
+
+    with tempfile.TemporaryDirectory(prefix="test-result-cache-") as tmp:
+        tmp_index = Path(tmp) / "index"
+        if index.exists():
+            shutil.copy2(index, tmp_index)
+        env = dict(os.environ, GIT_INDEX_FILE=str(tmp_index))
+        excludes = [f":(exclude){path}" for path in TREE_EXCLUDES]
+        if _git(["add", "-A", "--", ".", *excludes], root, env) is None:
+            return None
+        tree = _git(["write-tree"], root, env)
+    tree = (tree or "").strip()
+    return tree if _SHA.match(tree) else None
+
+
+def environment_fingerprint(env: Optional[Dict[str, str]] = None) -> str:
+    """Hash of the interpreter, installed packages and relevant env vars."""
+    env = os.environ if env is None else env
+    digest = hashlib.sha256()
+    digest.update(f"{sys.executable}\0{sys.version}\0".encode())
+    try:
+        package_dirs = site.getsitepackages() + [site.getusersitepackages()]
+    except AttributeError:  # virtualenv's legacy site module
+        package_dirs = []
+    for directory in sorted(set(package_dirs)):
+        try:
+            digest.update(f"{directory}\0{os.stat(directory).st_mtime_ns}\0".encode())
+        except OSError:
+            continue
+    for name in sorted(env):
+        if not _VOLATILE_ENV.match(name):
+            digest.update(f"{name}={env[name]}\0".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def command_fingerprint(command: Sequence[str]) -> str:
+    """Hash of the pytest command and the executable it resolves to."""
+    command = list(command)
+    resolved = shutil.which(command[0]) if command else None
+    payload = json.dumps({"argv": command, "executable": resolved})
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+@dataclass
+class CachedVerdict:
+    """A stored pytest verdict."""
+    key: str
+    passed: bool
+    returncode: Optional[int]
+    summary: Dict[str, Any] = field(default_factory=dict)
+    created_at: float = 0.0
+    duration_seconds: float = 0.0
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.created_at)
+
+
+class TestResultCache:
+    """Verdict store keyed by (working tree, pytest command, environment).
+
+    Attributes:
+        root: Repository root the tree hash is taken from
+        cache_dir: Directory holding one JSON file per key
+        max_age_seconds: Entries older than this are ignored and replaced
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(
+        self,
+        root: Path,
+        cache_dir: Optional[Path] = None,
+        max_age_seconds: Optional[float] = None,
+        max_entries: int = MAX_ENTRIES,
+    ):
+        self.root = Path(root).resolve()
+        self.cache_dir = Path(cache_dir) if cache_dir else self.root / CACHE_DIR_REL
+        if max_age_seconds is None:
+            try:
+                max_age_seconds = float(os.environ.get(ENV_MAX_AGE, DEFAULT_MAX_AGE_SECONDS))
+            except ValueError:
+                max_age_seconds = DEFAULT_MAX_AGE_SECONDS
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+
+    @classmethod
+    def for_project(cls, start: Optional[Path] = None) -> Optional["TestResultCache"]:
+        """Cache for the git repository containing ``start`` (None if disabled or not a repo)."""
+        if not cache_enabled():
+            return None
+        top = _git(["rev-parse", "--show-toplevel"], Path(start) if start else Path.cwd())
+        if not top:
+            return None
+        return cls(Path(top.strip()))
+
+    def key_for(self, command: Sequence[str], cwd: Optional[Path] = None) -> Optional[str]:
+        """Cache key for running ``command`` in ``cwd`` now (None if the tree cannot be hashed)."""
+        tree = working_tree_hash(self.root)
+        if tree is None:
+            return None
+        cwd = Path(cwd).resolve() if cwd else Path.cwd().resolve()
+        try:
+            rel_cwd = cwd.relative_to(self.root).as_posix()
+        except ValueError:
+            rel_cwd = str(cwd)
+        parts = [tree, command_fingerprint(command), environment_fingerprint(), rel_cwd]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, consumer: str) -> Optional[CachedVerdict]:
+        """Stored verdict for ``key``, auditing its use (None on miss or expiry)."""
+        try:
+            data = json.loads(self._path(key).read_text())
+            verdict = CachedVerdict(
+                key=key,
+                passed=bool(data["passed"]),
+                returncode=data.get("returncode"),
+                summary=dict(data.get("summary") or {}),
+                created_at=float(data["created_at"]),
+                duration_seconds=float(data.get("duration_seconds") or 0.0),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if verdict.age_seconds > self.max_age_seconds:
+            return None
+        audit_log("test_result_cache", "hit", {
+            "consumer": consumer,
+            "key": key[:16],
+            "passed": verdict.passed,
+            "age_seconds": round(verdict.age_seconds, 1),
+            "saved_seconds": round(verdict.duration_seconds, 1),
+            "root": str(self.root),
+        })
+        return verdict
+
+    def put(
+        self,
+        key: str,
+        passed: bool,
+        returncode: Optional[int] = None,
+        summary: Optional[Dict[str, Any]] = None,
+        duration_seconds: float = 0.0,
+    ) -> None:
+        """Store a verdict (atomic, 0600). Errors are ignored."""
+        payload = {
+            "passed": bool(passed),
+            "returncode": returncode,
+            "summary": summary or {},
+            "created_at": time.time(),
+            "duration_seconds": round(duration_seconds, 3),
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=".entry.", suffix=".tmp", dir=str(self.cache_dir))
+            try:
+                with os.fdopen(fd, "w") as fh:
+                    json.dump(payload, fh, separators=(",", ":"))
+                os.chmod(tmp_name, 0o600)
+                os.replace(tmp_name, str(self._path(key)))
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+            self._prune()
+        except (OSError, TypeError, ValueError):
+            pass  # Non-critical: the next run simply misses
+
+    def _prune(self) -> None:
+        entries = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[: max(0, len(entries) - self.max_entries)]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> int:
+        """Delete every entry; returns the number removed."""
+        removed = 0
+        for entry in self.cache_dir.glob("*.json"):
+            try:
+                entry.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+OUTPUT_TAIL_CHARS = 4000
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: ``run -- <pytest command...>`` or ``clear``."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["clear"]:
+        cache = TestResultCache.for_project()
+        print(f"removed {cache.clear() if cache else 0} entries")
+        return 0
+    if argv[:1] != ["run"] or len(argv) < 2:
+        print("usage: test_result_cache.py run -- <pytest command...> | clear", file=sys.stderr)
+        return 2
+    command = argv[2:] if argv[1] == "--" else argv[1:]
+
+    cache = TestResultCache.for_project()
+    key = cache.key_for(command) if cache else None
+    hit = cache.get(key, consumer="cli") if cache and key else None
+    if hit is not None:
+        print(hit.summary.get("output_tail", ""))
+        print(f"[test_result_cache] cached verdict from {hit.age_seconds:.0f}s ago "
+              f"(tree unchanged, saved {hit.duration_seconds:.1f}s)")
+        return int(hit.returncode or 0)
+
+    start = time.monotonic()
+    result = subprocess.run(command, capture_output=True, text=True)
+    output = result.stdout + result.stderr
+    sys.stdout.write(output)
+    if cache and key:
+        cache.put(key, result.returncode == 0, result.returncode,
+                  {"output_tail": output[-OUTPUT_TAIL_CHARS:]}, time.monotonic() - start)
+    return result.returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
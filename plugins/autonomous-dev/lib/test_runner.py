@@ -12,7 +12,8 @@ Features:
 - Handle pytest not found gracefully
 - Handle timeout gracefully
 - Handle test failures gracefully
-- Parse pytest output for counts and duration
+- Counts from structured pytest_results records (stdout parsing as fallback)
+- Optional duration-balanced sharding across processes (TEST_SHARDS, test_sharding.py)
 
 Usage:
     from test_runner import run_tests, verify_all_tests_pass, TestRunner
@@ -38,15 +39,26 @@ Date: 2026-01-03
 Related: Issue #200 - Debug-first enforcement and self-test requirements
 """
 
-import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from subprocess import TimeoutExpired
 from typing import Optional
 
+try:
+    from .env_utils import positive_int_from_env
+    from .pytest_results import RunSummary, discard, load_summary, new_results_path, record_run, \
+        results_args, results_env
+except ImportError:
+    lib_dir = Path(__file__).parent.resolve()
+    if str(lib_dir) not in sys.path:
+        sys.path.insert(0, str(lib_dir))
+    from env_utils import positive_int_from_env
+    from pytest_results import RunSummary, discard, load_summary, new_results_path, record_run, \
+        results_args, results_env
+
 
 @dataclass
 class TestResult:
@@ -60,6 +72,8 @@ class TestResult:
         error_count: Number of tests that errored
         output: Raw pytest output
         duration_seconds: Test execution time in seconds
+        summary: Structured pytest_results summary (None when counts were
+            parsed from output)
     """
 
     passed: bool
@@ -68,6 +82,7 @@ class TestResult:
     error_count: int
     output: str
     duration_seconds: float
+    summary: Optional[RunSummary] = field(default=None, repr=False, compare=False)
 
 
 def _parse_pytest_output(stdout: str, stderr: str, returncode: int) -> TestResult:
@@ -129,12 +144,69 @@ def _parse_pytest_output(stdout: str, stderr: str, returncode: int) -> TestResul
     )
 
 
+def _result_from_summary(summary: RunSummary, output: str) -> TestResult:
+    """
+    Build a TestResult from pytest_results records instead of parsing stdout.
+
+    Args:
+        summary: Finished RunSummary of the run
+        output: Combined stdout/stderr (kept for display and failure analysis)
+
+    Returns:
+        TestResult with counts from the structured records
+    """
+    return TestResult(
+        passed=summary.all_passed,
+        pass_count=summary.count("passed"),
+        fail_count=summary.count("failed"),
+        error_count=summary.count("error"),
+        output=output,
+        duration_seconds=summary.duration,
+        summary=summary,
+    )
+
+
+def _run_pytest(cmd: list, timeout: int) -> TestResult:
+    """
+    Run a pytest command with the pytest_results plugin loaded.
+
+    Counts come from the plugin's JSON records; stdout parsing is the
+    fallback when no complete record stream was written. Completed runs feed
+    the duration history and flaky-test tracking.
+
+    Raises:
+        FileNotFoundError, TimeoutExpired: As subprocess.run
+    """
+    results_path = new_results_path()
+    try:
+        result = subprocess.run(
+            [*cmd, *results_args(results_path)],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env=results_env(),
+        )
+        summary = load_summary(results_path)
+        if not summary.finished:
+            return _parse_pytest_output(result.stdout, result.stderr, result.returncode)
+        record_run(summary)
+        return _result_from_summary(summary, result.stdout + result.stderr)
+    finally:
+        discard(results_path)
+
+
+def shard_count_from_env() -> int:
+    """Shard count from TEST_SHARDS (default: 1, a single pytest process)."""
+    return positive_int_from_env("TEST_SHARDS", 1)
+
+
 def run_tests(
     test_dir: Optional[str] = None,
     pattern: Optional[str] = None,
     verbose: bool = False,
     coverage: bool = False,
     timeout: int = 300,
+    shards: Optional[int] = None,
 ) -> TestResult:
     """
     Run pytest and return structured results.
@@ -145,6 +217,8 @@ def run_tests(
         verbose: Use verbose output (-v) instead of quiet (-q)
         coverage: Run with coverage (--cov)
         timeout: Timeout in seconds (default: 300)
+        shards: Concurrent pytest processes (default: TEST_SHARDS or 1).
+            More than one runs duration-balanced shards via test_sharding.
 
     Returns:
         TestResult with test execution results
@@ -181,16 +255,23 @@ def run_tests(
     # Always use line traceback for consistent output
     cmd.append("--tb=line")
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
+    if shards is None:
+        shards = shard_count_from_env()
+    if shards > 1 and not coverage:
+        # Coverage data from concurrent shards would need combining; run those serially
+        try:
+            from test_sharding import run_sharded
+        except ImportError:
+            from .test_sharding import run_sharded
+        return run_sharded(
+            [test_dir] if test_dir else [],
+            shards=shards,
+            pytest_args=cmd[2 if test_dir else 1:],
             timeout=timeout,
-            env=os.environ.copy(),
         )
 
-        return _parse_pytest_output(result.stdout, result.stderr, result.returncode)
+    try:
+        return _run_pytest(cmd, timeout)
 
     except FileNotFoundError:
         # pytest not installed
@@ -257,15 +338,7 @@ def run_single_test(test_path: str, timeout: int = 300) -> TestResult:
     cmd = ["pytest", test_path, "-q", "--tb=line"]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            env=os.environ.copy(),
-        )
-
-        return _parse_pytest_output(result.stdout, result.stderr, result.returncode)
+        return _run_pytest(cmd, timeout)
 
     except FileNotFoundError:
         return TestResult(
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Test Sharding - Duration-balanced parallel pytest runs.
+
+Splits the selected tests into N shards with longest-processing-time-first
+(LPT) bin packing over recorded per-test durations, runs the shards as
+concurrent pytest subprocesses (optionally one per batch worktree), and merges
+the shard outcomes into the ``test_runner.TestResult`` structure.
+
+Features:
+- Persistent duration history (``.claude/cache/test_durations.json``),
+  updated from every run's pytest_results records (moving average per test)
+- LPT bin packing at test-file granularity (module/class fixtures stay in one
+  process); unknown files are estimated from the median known file duration
+- Concurrent shards with a shared timeout; shard output kept in order
+- Shards can be spread across several working directories (worktrees)
+
+Usage:
+    from test_sharding import run_sharded
+
+    result = run_sharded(["tests/unit", "tests/regression"], shards=4)
+    print(result.passed, result.pass_count, result.duration_seconds)
+
+    # test_runner / QASelfHealer shard when TEST_SHARDS > 1
+    TEST_SHARDS=4 python -m ...
+
+Environment Variables:
+- TEST_SHARDS: default shard count for test_runner.run_tests() and
+  QASelfHealer (default: 1, i.e. a single pytest process)
+
+Security:
+- Only runs pytest with caller-provided arguments (no shell)
+- History writes are atomic (temp file + os.replace)
+
+Date: 2026-10-18
+Related: Issue #200 - Debug-first enforcement and self-test requirements
+"""
+
+import heapq
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from .pytest_results import RunSummary, discard, load_summary, merge_summaries, new_results_path, \
+        record_run, results_args, results_env
+    from .test_runner import TestResult, _parse_pytest_output, _result_from_summary, shard_count_from_env
+except ImportError:
+    lib_dir = Path(__file__).parent.resolve()
+    if str(lib_dir) not in sys.path:
+        sys.path.insert(0, str(lib_dir))
+    from pytest_results import RunSummary, discard, load_summary, merge_summaries, new_results_path, \
+        record_run, results_args, results_env
+    from test_runner import TestResult, _parse_pytest_output, _result_from_summary, shard_count_from_env  # noqa: F401
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+HISTORY_REL = ".claude/cache/test_durations.json"
+ENV_TEST_SHARDS = "TEST_SHARDS"
+
+# Weight of the newest observation in the per-test moving average
+HISTORY_ALPHA = 0.5
+
+# Estimate for files with no history when nothing else is known (seconds)
+DEFAULT_FILE_SECONDS = 1.0
+
+_TEST_FILE_GLOBS = ("test_*.py", "*_test.py")
+
+# Directories pytest does not recurse into by default (norecursedirs)
+_SKIP_DIRS = {"__pycache__", "node_modules", "venv", "build", "dist", "site-packages"}
+
+
+# =============================================================================
+# Duration History
+# =============================================================================
+
+class DurationHistory:
+    """Per-test duration history persisted as JSON.
+
+    Attributes:
+        path: History file
+        durations: node id -> smoothed duration in seconds
+    """
+
+    def __init__(self, path: Path):
+        """Load history from ``path`` (missing or corrupt files start empty)."""
+        self.path = Path(path)
+        self.durations: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        try:
+            data = json.loads(self.path.read_text())
+            if isinstance(data, dict) and isinstance(data.get("durations"), dict):
+                self.durations = {
+                    str(k): float(v) for k, v in data["durations"].items()
+                    if isinstance(v, (int, float))
+                }
+        except (OSError, ValueError):
+            pass
+
+    def record(self, durations: Dict[str, float]) -> None:
+        """Fold one run's per-test durations into the moving averages."""
+        with self._lock:
+            for nodeid, seconds in durations.items():
+                old = self.durations.get(nodeid)
+                self.durations[nodeid] = (
+                    seconds if old is None else HISTORY_ALPHA * seconds + (1 - HISTORY_ALPHA) * old
+                )
+
+    def file_durations(self) -> Dict[str, float]:
+        """Total recorded duration per test file."""
+        totals: Dict[str, float] = {}
+        for nodeid, seconds in self.durations.items():
+            path = nodeid.split("::", 1)[0]
+            totals[path] = totals.get(path, 0.0) + seconds
+        return totals
+
+    def estimate(self, target: str, file_totals: Optional[Dict[str, float]] = None) -> Optional[float]:
+        """Recorded duration of a file or node id (None when unknown)."""
+        if "::" not in target:
+            totals = file_totals if file_totals is not None else self.file_durations()
+            return totals.get(target)
+        prefix = target + "::"
+        matches = [s for n, s in self.durations.items() if n == target or n.startswith(prefix)]
+        return sum(matches) if matches else None
+
+    def save(self) -> None:
+        """Write the history atomically."""
+        with self._lock:
+            payload = {"version": 1, "updated_at": time.time(), "durations": dict(self.durations)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{self.path.name}.", suffix=".tmp", dir=str(self.path.parent))
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(payload, fh, separators=(",", ":"))
+            os.replace(tmp_name, str(self.path))
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+
+def default_history_path(cwd: Optional[Path] = None) -> Path:
+    """``<repo>/.claude/cache/test_durations.json`` for ``cwd``."""
+    start = Path(cwd) if cwd else Path.cwd()
+    try:
+        from path_utils import find_project_root
+
+        root = find_project_root(start_path=start)
+    except (ImportError, FileNotFoundError):
+        root = start.resolve()
+    return root / HISTORY_REL
+
+
+# =============================================================================
+# Planning
+# =============================================================================
+
+def expand_targets(targets: Sequence[str], cwd: Path) -> List[str]:
+    """Expand directories into their test files; keep files and node ids as-is."""
+    expanded: List[str] = []
+    seen = set()
+    for target in targets:
+        path = cwd / target.split("::", 1)[0]
+        if "::" not in target and path.is_dir():
+            files = sorted(
+                {p for pattern in _TEST_FILE_GLOBS for p in path.rglob(pattern)}
+            )
+            items = [
+                str(p.relative_to(cwd)) for p in files
+                if not any(part in _SKIP_DIRS or part.startswith(".") for part in p.relative_to(cwd).parts[:-1])
+            ]
+        else:
+            items = [target]
+        for item in items:
+            if item not in seen:
+                seen.add(item)
+                expanded.append(item)
+    return expanded
+
+
+def collect_test_files(pytest_command: Sequence[str], cwd: Path, timeout: float) -> List[str]:
+    """Test files pytest would collect with no explicit targets (honours testpaths)."""
+    try:
+        result = subprocess.run(
+            [*pytest_command, "--collect-only", "-q"],
+            cwd=str(cwd),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    files: List[str] = []
+    for line in result.stdout.splitlines():
+        if "::" in line:
+            path = line.split("::", 1)[0].strip()
+            if path not in files:
+                files.append(path)
+    return files
+
+
+def lpt_bins(weights: Dict[str, float], shards: int) -> List[List[str]]:
+    """Longest-processing-time-first bin packing.
+
+    Items are placed heaviest first, each into the currently lightest bin,
+    which keeps the makespan within 4/3 of optimal. Empty bins are dropped.
+
+    Args:
+        weights: item -> estimated seconds
+        shards: number of bins
+
+    Returns:
+        Bins of items (each bin keeps the placement order)
+    """
+    shards = max(1, min(shards, len(weights)))
+    heap: List[Tuple[float, int]] = [(0.0, i) for i in range(shards)]
+    bins: List[List[str]] = [[] for _ in range(shards)]
+    for item, weight in sorted(weights.items(), key=lambda kv: (-kv[1], kv[0])):
+        load, index = heapq.heappop(heap)
+        bins[index].append(item)
+        heapq.heappush(heap, (load + weight, index))
+    return [b for b in bins if b]
+
+
+def plan_shards(
+    targets: Sequence[str],
+    shards: int,
+    history: DurationHistory,
+    cwd: Path,
+) -> List[List[str]]:
+    """Split ``targets`` into duration-balanced shards.
+
+    Args:
+        targets: Test directories, files or node ids
+        shards: Requested shard count
+        history: Recorded durations
+        cwd: Directory the targets are relative to
+
+    Returns:
+        List of shards, each a list of pytest targets
+    """
+    items = expand_targets(targets, cwd)
+    if not items:
+        return []
+    file_totals = history.file_durations()
+    known = {item: history.estimate(item, file_totals) for item in items}
+    measured = [s for s in known.values() if s is not None]
+    fallback = statistics.median(measured) if measured else DEFAULT_FILE_SECONDS
+    weights = {item: (s if s is not None else fallback) for item, s in known.items()}
+    return lpt_bins(weights, shards)
+
+
+# =============================================================================
+# Execution
+# =============================================================================
+
+@dataclass
+class ShardOutcome:
+    """Result of one shard."""
+    index: int
+    targets: List[str]
+    cwd: Path
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    seconds: float
+    timed_out: bool = False
+    summary: Optional[RunSummary] = None
+
+
+def _run_shard(index: int, command: List[str], cwd: Path, targets: List[str], deadline: float) -> ShardOutcome:
+    results_path = new_results_path()
+    start = time.monotonic()
+    try:
+        proc = subprocess.Popen(
+            [*command, *results_args(results_path)],
+            cwd=str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            env=results_env(),
+        )
+    except FileNotFoundError:
+        discard(results_path)
+        return ShardOutcome(index, targets, cwd, None, "", "Error: pytest not found. Please install pytest.", 0.0)
+    timed_out = False
+    try:
+        stdout, stderr = proc.communicate(timeout=max(0.0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        stdout, stderr = proc.communicate()
+        timed_out = True
+    summary = load_summary(results_path)
+    discard(results_path)
+    return ShardOutcome(
+        index, targets, cwd, proc.returncode, stdout, stderr, time.monotonic() - start, timed_out, summary
+    )
+
+
+def merge_outcomes(outcomes: List[ShardOutcome], wall_seconds: float, timeout: float) -> TestResult:
+    """Combine shard outcomes into one TestResult (counts summed, output concatenated)."""
+    pass_count = fail_count = error_count = 0
+    passed = bool(outcomes)
+    sections = []
+    for outcome in sorted(outcomes, key=lambda o: o.index):
+        if outcome.returncode is None:
+            parsed = TestResult(False, 0, 0, 1, outcome.stderr, 0.0)
+        elif outcome.summary is not None and outcome.summary.finished:
+            parsed = _result_from_summary(outcome.summary, outcome.stdout + outcome.stderr)
+        else:
+            parsed = _parse_pytest_output(outcome.stdout, outcome.stderr, outcome.returncode)
+        if outcome.timed_out:
+            parsed.passed = False
+            parsed.error_count += 1
+        pass_count += parsed.pass_count
+        fail_count += parsed.fail_count
+        error_count += parsed.error_count
+        passed = passed and parsed.passed
+        header = f"===== shard {outcome.index + 1}/{len(outcomes)} ({len(outcome.targets)} targets, {outcome.seconds:.1f}s) ====="
+        if outcome.timed_out:
+            header += f"\nError: Test execution timeout after {timeout} seconds."
+        sections.append(header + "\n" + parsed.output)
+
+    counts = [(fail_count, "failed"), (pass_count, "passed"), (error_count, "errors")]
+    summary = ", ".join(f"{n} {label}" for n, label in counts if n) or "no tests ran"
+    sections.append(f"===== {summary} in {wall_seconds:.2f}s ({len(outcomes)} shards) =====")
+
+    summaries = [o.summary for o in outcomes]
+    merged = merge_summaries(summaries) if all(summaries) else None
+
+    return TestResult(
+        passed=passed,
+        pass_count=pass_count,
+        fail_count=fail_count,
+        error_count=error_count,
+        output="\n".join(sections),
+        duration_seconds=wall_seconds,
+        summary=merged if merged is not None and merged.finished else None,
+    )
+
+
+def run_sharded(
+    targets: Sequence[str],
+    shards: int = 2,
+    pytest_args: Sequence[str] = (),
+    cwd: Optional[Path] = None,
+    worktrees: Optional[Sequence[Path]] = None,
+    timeout: float = 300,
+    history_path: Optional[Path] = None,
+    pytest_command: Sequence[str] = ("pytest",),
+) -> TestResult:
+    """Run pytest targets as duration-balanced concurrent shards.
+
+    Args:
+        targets: Test directories, files or node ids (relative to ``cwd``);
+            empty means whatever pytest collects by default (testpaths)
+        shards: Number of concurrent pytest processes
+        pytest_args: Extra arguments passed to every shard
+        cwd: Directory the targets are relative to (default: cwd)
+        worktrees: Working directories to spread shards over (round-robin);
+            each must contain the same targets (e.g. batch worktrees)
+        timeout: Overall timeout in seconds, shared by all shards
+        history_path: Duration history file (default: default_history_path())
+        pytest_command: Command that starts pytest
+
+    Returns:
+        TestResult merged across shards (``duration_seconds`` is wall time)
+    """
+    cwd = Path(cwd) if cwd else Path.cwd()
+    history = DurationHistory(history_path or default_history_path(cwd))
+    targets = list(targets) or collect_test_files(pytest_command, cwd, timeout)
+    plan = plan_shards(targets, shards, history, cwd)
+    if not plan:
+        return TestResult(False, 0, 0, 1, "Error: no test files found for sharding.", 0.0)
+
+    dirs = [Path(w) for w in worktrees] if worktrees else [cwd]
+    deadline = time.monotonic() + timeout
+    base = [*pytest_command, *pytest_args]
+    outcomes: List[Optional[ShardOutcome]] = [None] * len(plan)
+
+    def worker(index: int, shard_targets: List[str]) -> None:
+        outcomes[index] = _run_shard(index, [*base, *shard_targets], dirs[index % len(dirs)], shard_targets, deadline)
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker, args=(i, t), daemon=True) for i, t in enumerate(plan)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.monotonic() - start
+
+    finished = [o for o in outcomes if o is not None]
+    # Durations and outcomes of tests that completed, timed-out shards included
+    record_run(merge_summaries(o.summary for o in finished if o.summary), cwd, history.path)
+
+    return merge_outcomes(finished, wall, timeout)
+
+
+def split_pytest_command(command: Sequence[str], cwd: Path) -> Tuple[List[str], List[str], List[str]]:
+    """Split a pytest command into (launcher, path targets, other args).
+
+    Positional arguments naming existing paths (or node ids of existing files)
+    are targets; everything else is passed through to every shard.
+    """
+    command = list(command)
+    launcher_len = 1
+    if len(command) >= 3 and command[1:3] == ["-m", "pytest"]:
+        launcher_len = 3
+    launcher, rest = command[:launcher_len], command[launcher_len:]
+    targets: List[str] = []
+    extra: List[str] = []
+    for arg in rest:
+        if not arg.startswith("-") and (cwd / arg.split("::", 1)[0]).exists():
+            targets.append(arg)
+        else:
+            extra.append(arg)
+    return launcher, targets, extra
+
+
+def is_pytest_command(command: Iterable[str]) -> bool:
+    """True for ``pytest ...`` and ``python -m pytest ...`` commands."""
+    command = list(command)
+    if not command:
+        return False
+    return Path(command[0]).name == "pytest" or (len(command) >= 3 and command[1:3] == ["-m", "pytest"])
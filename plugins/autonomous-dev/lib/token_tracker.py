@@ -9,8 +9,10 @@ Features:
 - Token budget enforcement (reject submissions exceeding budget)
 - Sliding window expiration (old usage records expire automatically)
 - Per-agent usage tracking (breakdown by agent_id)
-- Concurrent usage support (thread-safe tracking)
+- Concurrent usage support (all state guarded by a lock)
 - Remaining budget calculation (real-time budget availability)
+- Amortized O(1) updates and queries (deque window + running totals)
+- Optional cross-process budget (SQLite ledger under .claude/local/)
 
 Usage:
     from token_tracker import TokenTracker
@@ -29,10 +31,26 @@ Usage:
     # Get usage by agent
     usage = tracker.get_usage_by_agent()
 
+    # Share one budget between processes (parallel worktrees in a batch)
+    tracker = TokenTracker(budget=150000, shared=True)
+
+Shared Budget:
+    With ``shared=True`` (or ``TOKEN_TRACKER_SHARED=1``) usage is written to a
+    SQLite ledger at ``<repo>/.claude/local/token_budget.db`` (override with
+    ``shared_path`` or ``TOKEN_TRACKER_SHARED_PATH``). Every process that opens
+    the same ledger draws from the same window. The ledger keeps per-agent
+    running totals next to the raw records, so expiry and queries stay
+    amortized O(1) as well. Timestamps are wall-clock (``time.time``) because
+    monotonic clocks are not comparable across processes. All participants of
+    one ledger must use the same ``window_seconds``; a mismatch raises
+    ValueError. If the ledger cannot be opened the tracker logs a warning and
+    falls back to the in-process window.
+
 Security:
 - Budget enforcement prevents resource exhaustion (CWE-400)
-- No external dependencies or network calls
+- No external dependencies or network calls (sqlite3 is stdlib, loaded lazily)
 - Thread-safe for concurrent usage
+- Ledger file created with mode 0600 (CWE-732)
 
 Date: 2026-01-02
 Issue: GitHub #188 (Scalable parallel agent pool)
@@ -43,14 +61,25 @@ See library-design-patterns skill for standardized library structure.
 """
 
 import logging
+import os
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Dict, List
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, Iterator, Optional, Tuple, Union
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Ledger location relative to the repo root (per-repo isolation, Issue #1206 pattern)
+SHARED_LEDGER_REL = ".claude/local/token_budget.db"
+
+# How long a writer waits for another process's transaction (milliseconds)
+SHARED_BUSY_TIMEOUT_MS = 5000
+
 
 # ============================================================================
 # Usage Record
@@ -70,6 +99,173 @@ class UsageRecord:
     timestamp: datetime
 
 
+# ============================================================================
+# Shared Ledger
+# ============================================================================
+
+class SharedTokenLedger:
+    """Cross-process sliding-window ledger backed by SQLite.
+
+    Layout:
+        usage(ts, agent_id, tokens)   raw records, indexed by ts
+        totals(agent_id, tokens)      running per-agent totals of the window
+        meta(key, value)              window_seconds agreed by all participants
+
+    Each record is inserted once and deleted once, and both touch ``totals``,
+    so maintenance is amortized O(1) per record; reads are a sum over the
+    (small) set of agents. Writes run in ``BEGIN IMMEDIATE`` transactions so
+    concurrent processes serialize on the database lock.
+
+    Attributes:
+        path: Ledger file path
+        window_seconds: Sliding window duration in seconds
+    """
+
+    def __init__(self, path: Path, window_seconds: int):
+        """Open (or create) the ledger.
+
+        Args:
+            path: Ledger file path (parent directories are created)
+            window_seconds: Sliding window duration in seconds
+
+        Raises:
+            ValueError: If the ledger was created with a different window
+            OSError: If the ledger directory cannot be created
+            sqlite3.Error: If the database cannot be opened
+        """
+        import sqlite3
+
+        self.path = Path(path)
+        self.window_seconds = window_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists():
+            fd = os.open(str(self.path), os.O_CREAT | os.O_WRONLY, 0o600)
+            os.close(fd)
+
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=SHARED_BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute(f"PRAGMA busy_timeout = {SHARED_BUSY_TIMEOUT_MS}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        with self._transaction():
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS usage ("
+                "id INTEGER PRIMARY KEY, ts REAL NOT NULL, "
+                "agent_id TEXT NOT NULL, tokens INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS usage_ts ON usage(ts)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS totals ("
+                "agent_id TEXT PRIMARY KEY, tokens INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta(key, value) VALUES ('window_seconds', ?)",
+                (str(window_seconds),),
+            )
+            (stored,) = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'window_seconds'"
+            ).fetchone()
+        if int(float(stored)) != window_seconds:
+            self._conn.close()
+            raise ValueError(
+                f"shared ledger {self.path} uses window_seconds={stored}, "
+                f"got {window_seconds}"
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the body in an immediate (write-locked) transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _expire(self, now: float) -> None:
+        """Move records older than the window out of the running totals."""
+        cutoff = now - self.window_seconds
+        expired = self._conn.execute(
+            "SELECT agent_id, SUM(tokens) FROM usage WHERE ts <= ? GROUP BY agent_id",
+            (cutoff,),
+        ).fetchall()
+        if not expired:
+            return
+        self._conn.executemany(
+            "UPDATE totals SET tokens = tokens - ? WHERE agent_id = ?",
+            [(tokens, agent_id) for agent_id, tokens in expired],
+        )
+        self._conn.execute("DELETE FROM totals WHERE tokens <= 0")
+        self._conn.execute("DELETE FROM usage WHERE ts <= ?", (cutoff,))
+
+    def record(self, agent_id: str, tokens: int, now: float) -> None:
+        """Append a usage record.
+
+        Args:
+            agent_id: Agent identifier
+            tokens: Number of tokens used
+            now: Wall-clock timestamp of the usage
+        """
+        with self._transaction():
+            self._expire(now)
+            self._conn.execute(
+                "INSERT INTO usage(ts, agent_id, tokens) VALUES (?, ?, ?)",
+                (now, agent_id, tokens),
+            )
+            self._conn.execute(
+                "INSERT INTO totals(agent_id, tokens) VALUES (?, ?) "
+                "ON CONFLICT(agent_id) DO UPDATE SET tokens = tokens + excluded.tokens",
+                (agent_id, tokens),
+            )
+
+    def usage_by_agent(self, now: float) -> Dict[str, int]:
+        """Expire old records and return the per-agent totals of the window."""
+        with self._transaction():
+            self._expire(now)
+            rows = self._conn.execute("SELECT agent_id, tokens FROM totals").fetchall()
+        return {agent_id: tokens for agent_id, tokens in rows}
+
+    def total(self, now: float) -> int:
+        """Expire old records and return total usage in the window."""
+        return sum(self.usage_by_agent(now).values())
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+def default_shared_path() -> Path:
+    """Resolve the default ledger path for the current repository.
+
+    Returns:
+        ``<repo>/.claude/local/token_budget.db`` (``TOKEN_TRACKER_SHARED_PATH``
+        overrides; falls back to the working directory outside a repo)
+    """
+    override = os.environ.get("TOKEN_TRACKER_SHARED_PATH")
+    if override:
+        return Path(override)
+    try:
+        from path_utils import find_project_root
+
+        root = find_project_root()
+    except (ImportError, FileNotFoundError):
+        root = Path.cwd().resolve()
+    return root / SHARED_LEDGER_REL
+
+
+def _shared_from_env() -> bool:
+    """True when TOKEN_TRACKER_SHARED requests the cross-process ledger."""
+    return os.environ.get("TOKEN_TRACKER_SHARED", "").strip().lower() in ("1", "true", "yes")
+
+
 # ============================================================================
 # Token Tracker
 # ============================================================================
@@ -83,23 +279,37 @@ class TokenTracker:
     Design:
         - Sliding window: Usage expires after window_seconds
         - Budget enforcement: Rejects submissions exceeding budget
-        - Thread-safe: Can be used with concurrent agents
+        - Running totals: deque of records plus total and per-agent sums, so
+          each record is added and expired exactly once (amortized O(1))
+        - Thread-safe: All state is guarded by one lock
         - Per-agent tracking: Breakdown usage by agent_id
+        - Optional shared ledger: One budget across processes
 
     Attributes:
         budget: Maximum token budget for window
         window_seconds: Sliding window duration in seconds
+        shared_path: Ledger path when the shared backend is active, else None
     """
 
-    def __init__(self, budget: int, window_seconds: int = 60):
+    def __init__(
+        self,
+        budget: int,
+        window_seconds: int = 60,
+        *,
+        shared: Optional[bool] = None,
+        shared_path: Optional[Union[str, Path]] = None,
+    ):
         """Initialize token tracker.
 
         Args:
             budget: Maximum token budget for sliding window
             window_seconds: Sliding window duration in seconds (default: 60)
+            shared: Use the cross-process ledger (default: TOKEN_TRACKER_SHARED)
+            shared_path: Ledger path (implies shared; default: default_shared_path())
 
         Raises:
-            ValueError: If budget or window_seconds is non-positive
+            ValueError: If budget or window_seconds is non-positive, or the
+                shared ledger was created with a different window
         """
         if budget <= 0:
             raise ValueError(f"budget must be positive, got {budget}")
@@ -108,7 +318,29 @@ class TokenTracker:
 
         self.budget = budget
         self.window_seconds = window_seconds
-        self._usage_records: List[UsageRecord] = []
+        self._lock = threading.Lock()
+        self._clock = time.monotonic
+        self._records: Deque[Tuple[float, str, int]] = deque()
+        self._total = 0
+        self._by_agent: Dict[str, int] = {}
+
+        self._ledger: Optional[SharedTokenLedger] = None
+        self.shared_path: Optional[Path] = None
+        if shared is None:
+            shared = shared_path is not None or _shared_from_env()
+        if shared:
+            path = Path(shared_path) if shared_path is not None else default_shared_path()
+            try:
+                self._ledger = SharedTokenLedger(path, window_seconds)
+                self._clock = time.time
+                self.shared_path = path
+            except ValueError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Shared token ledger unavailable at {path}: {e}; "
+                    f"using in-process budget"
+                )
 
     def record_usage(self, agent_id: str, tokens: int):
         """Record token usage for an agent.
@@ -117,12 +349,15 @@ class TokenTracker:
             agent_id: Agent identifier
             tokens: Number of tokens used
         """
-        record = UsageRecord(
-            agent_id=agent_id,
-            tokens=tokens,
-            timestamp=datetime.now()
-        )
-        self._usage_records.append(record)
+        with self._lock:
+            now = self._clock()
+            if self._ledger is not None:
+                self._ledger.record(agent_id, tokens, now)
+            else:
+                self._expire(now)
+                self._records.append((now, agent_id, tokens))
+                self._total += tokens
+                self._by_agent[agent_id] = self._by_agent.get(agent_id, 0) + tokens
 
         logger.debug(f"Recorded {tokens} tokens for agent {agent_id}")
 
@@ -135,9 +370,7 @@ class TokenTracker:
         Returns:
             True if submission is within budget, False otherwise
         """
-        self._cleanup_expired_records()
-        remaining = self.get_remaining_budget()
-        return remaining >= estimated_tokens
+        return self.get_remaining_budget() >= estimated_tokens
 
     def get_remaining_budget(self) -> int:
         """Get remaining token budget in current window.
@@ -145,10 +378,13 @@ class TokenTracker:
         Returns:
             Remaining token budget (non-negative)
         """
-        self._cleanup_expired_records()
-
-        # Calculate total usage in window
-        total_used = sum(record.tokens for record in self._usage_records)
+        with self._lock:
+            now = self._clock()
+            if self._ledger is not None:
+                total_used = self._ledger.total(now)
+            else:
+                self._expire(now)
+                total_used = self._total
 
         return max(0, self.budget - total_used)
 
@@ -158,20 +394,37 @@ class TokenTracker:
         Returns:
             Dictionary mapping agent_id to total tokens used
         """
-        self._cleanup_expired_records()
-
-        usage = {}
-        for record in self._usage_records:
-            usage[record.agent_id] = usage.get(record.agent_id, 0) + record.tokens
-
-        return usage
+        with self._lock:
+            now = self._clock()
+            if self._ledger is not None:
+                return self._ledger.usage_by_agent(now)
+            self._expire(now)
+            return dict(self._by_agent)
+
+    def close(self):
+        """Release the shared ledger connection (no-op for in-process tracking)."""
+        with self._lock:
+            if self._ledger is not None:
+                self._ledger.close()
+                self._ledger = None
+                self.shared_path = None
+                self._clock = time.monotonic
+
+    def _expire(self, now: float):
+        """Pop records outside the sliding window off the deque (lock held)."""
+        cutoff = now - self.window_seconds
+        records = self._records
+        while records and records[0][0] <= cutoff:
+            _, agent_id, tokens = records.popleft()
+            self._total -= tokens
+            remaining = self._by_agent[agent_id] - tokens
+            if remaining:
+                self._by_agent[agent_id] = remaining
+            else:
+                del self._by_agent[agent_id]
 
     def _cleanup_expired_records(self):
         """Remove usage records outside sliding window."""
-        cutoff_time = datetime.now() - timedelta(seconds=self.window_seconds)
-
-        # Keep only records within window
-        self._usage_records = [
-            record for record in self._usage_records
-            if record.timestamp > cutoff_time
-        ]
+        with self._lock:
+            if self._ledger is None:
+                self._expire(self._clock())
@@ -7,10 +7,15 @@ Replaces ad-hoc substring matching against command strings with a proper
 shell-aware classifier that handles:
 
 - Native Claude Code tools (Read/Write/Edit/Glob/Grep/...) by tool name dispatch
-- Bash commands via ``shlex.split`` — env-var prefixes, redirections,
+- Bash commands via the shared ``parsed_command`` model (``shlex.split`` per
+  sequential segment, parsed once per command) — env-var prefixes, redirections,
   pipes, sequential operators, and ``bash -c`` / ``sh -c`` recursion
 - ``python -c`` snippets via the AST-based ``python_write_detector`` library
 
+Bash classifications are memoized by ``tool_intent_cache`` (in-process LRU
+plus an on-disk store shared by hook processes), so a command seen before is
+not classified again.
+
 The module is consumed by ``unified_pre_tool.py`` (settings-write protection,
 infrastructure protection) and by ``scripts/audit_tool_intent_coverage.py``
 (CI gate for tool-name coverage).
@@ -36,6 +41,7 @@ Public API:
     changed_content(tool_name, tool_input) -> str
     may_be_declared_optional(tool_name) -> bool
     has_suspicious_exec(command) -> bool
+    cache_stats() -> dict
 
 Constants:
     READ_TOOLS, WRITE_TOOLS — native tool name sets
@@ -49,8 +55,8 @@ from __future__ import annotations
 
 import importlib.util
 import re
-import shlex
 import sys
+import time
 from pathlib import Path
 from typing import List, Optional, Set, Tuple
 
@@ -333,6 +339,79 @@ except Exception:  # pragma: no cover — defensive
     _pwd = None
 
 
+# ---------------------------------------------------------------------------
+# Import of parsed_command (shared parse-once Bash model)
+# ---------------------------------------------------------------------------
+
+# Required: it is the only statement/segment splitter, and it ships in this
+# directory. Loaded by path (the hook loads this module by path, before lib/
+# is on sys.path) and registered in ``sys.modules`` so the hook and this
+# module share ONE parse cache: a command tokenized by a hook detector is not
+# re-tokenized here.
+_pc = sys.modules.get("parsed_command")
+if _pc is None:
+    _pc_spec = importlib.util.spec_from_file_location(
+        "parsed_command", str(Path(__file__).resolve().parent / "parsed_command.py")
+    )
+    if _pc_spec is None or _pc_spec.loader is None:  # pragma: no cover
+        raise ImportError("tool_intent requires parsed_command.py in its directory")
+    _pc = importlib.util.module_from_spec(_pc_spec)
+    _pc_spec.loader.exec_module(_pc)
+    sys.modules["parsed_command"] = _pc
+
+
+# ---------------------------------------------------------------------------
+# Defensive import of tool_intent_cache (memo of Bash classifications)
+# ---------------------------------------------------------------------------
+
+# Created lazily by ``_get_intent_cache`` so that importing this module never
+# touches the filesystem. ``False`` marks "unavailable, do not retry".
+_intent_cache = None
+
+
+def _get_intent_cache():
+    """Return the process-wide IntentCache, or None when unavailable."""
+    global _intent_cache
+    if _intent_cache is None:
+        _intent_cache = False
+        try:
+            here = Path(__file__).resolve().parent
+            cache_path = here / "tool_intent_cache.py"
+            if cache_path.exists():
+                spec = importlib.util.spec_from_file_location(
+                    "tool_intent_cache", str(cache_path)
+                )
+                if spec and spec.loader:
+                    mod = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(mod)
+                    _intent_cache = mod.IntentCache(
+                        [
+                            Path(__file__).resolve(),
+                            here / "python_write_detector.py",
+                            here / "parsed_command.py",
+                        ],
+                        sentinel=_suspicious_exec_sentinel(),
+                    )
+        except Exception:  # pragma: no cover — defensive
+            _intent_cache = False
+    return _intent_cache or None
+
+
+def cache_stats() -> dict:
+    """Return hit/miss counters of the classification memo for this process.
+
+    Keys: ``memory_hits``, ``disk_hits``, ``misses``, ``stores``,
+    ``uncacheable``, ``entries``, ``hit_rate``. Empty dict when the cache is
+    unavailable or has not been used.
+    """
+    if not _intent_cache:
+        return {}
+    try:
+        return _intent_cache.stats()
+    except Exception:
+        return {}
+
+
 def _suspicious_exec_sentinel() -> Optional[str]:
     """Return the SUSPICIOUS_EXEC_SENTINEL constant, if available."""
     if _pwd is None:
@@ -373,7 +452,7 @@ def classify(tool_name: str, tool_input: dict) -> Intent:
             command = tool_input.get("command", "") or ""
         if not isinstance(command, str) or not command.strip():
             return "EXEC"
-        intent, _targets = _classify_bash(command, depth=0)
+        intent, _targets = _classify_bash_cached(command)
         return intent
 
     # --- MCP registries (Issue #1503) — registry FIRST, fallback LAST -------
@@ -575,7 +654,7 @@ def write_targets(tool_name: str, tool_input: dict) -> List[str]:
             command = tool_input.get("command", "") or ""
         if not isinstance(command, str) or not command.strip():
             return []
-        _intent, targets = _classify_bash(command, depth=0)
+        _intent, targets = _classify_bash_cached(command)
         return targets
 
     # Issue #1503: MCP writers carry their target under ``relative_path`` or
@@ -607,7 +686,7 @@ def has_suspicious_exec(command: str) -> bool:
     if sentinel is None:
         return False
     try:
-        _intent, targets = _classify_bash(command, depth=0)
+        _intent, targets = _classify_bash_cached(command)
     except Exception:
         return False
     return sentinel in targets
@@ -618,6 +697,25 @@ def has_suspicious_exec(command: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
+def _classify_bash_cached(command: str) -> Tuple[Intent, List[str]]:
+    """``_classify_bash(command, depth=0)`` through the classification memo.
+
+    Repeated commands (``git status``, ``pytest tests/unit -q``) are served
+    from ``tool_intent_cache`` instead of being re-tokenized and re-analyzed.
+    The returned target list is always a fresh copy.
+    """
+    cache = _get_intent_cache() if len(command) <= _MAX_COMMAND_LENGTH else None
+    if cache is None:
+        return _classify_bash(command, depth=0)
+    hit = cache.get("Bash", command)
+    if hit is not None:
+        return hit
+    start = time.perf_counter_ns()
+    intent, targets = _classify_bash(command, depth=0)
+    cache.put("Bash", command, intent, targets, cost_ns=time.perf_counter_ns() - start)
+    return (intent, targets)
+
+
 def _classify_bash(command: str, *, depth: int) -> Tuple[Intent, List[str]]:
     """Classify a Bash command and return (intent, write_targets).
 
@@ -661,22 +759,23 @@ def _classify_bash(command: str, *, depth: int) -> Tuple[Intent, List[str]]:
     # Split the raw command on sequential operators (;, &&, ||) BEFORE
     # shlex tokenisation. shlex.split treats ``;`` as part of the previous
     # token in posix mode, so we must split first, then tokenise per segment.
-    raw_segments = _split_sequential_raw(command)
+    # Both steps come from the shared ParsedCommand, so segments already
+    # tokenized by the hook's detectors are not tokenized again.
+    parsed = _pc.parse_command(command)
+    segments = zip(parsed.segments, parsed.segment_tokens)
 
     overall_intent: Optional[Intent] = "WRITE" if py_intent_is_write else None
     overall_targets: List[str] = list(py_targets)
 
-    for raw_seg in raw_segments:
+    for raw_seg, seg_tokens in segments:
         if not raw_seg.strip():
             continue
-        try:
-            tokens = shlex.split(raw_seg, posix=True, comments=False)
-        except ValueError:
+        if seg_tokens is None:
             # Malformed quoting in this segment — skip but keep going.
             continue
-        if not tokens:
+        if not seg_tokens:
             continue
-        seg_intent, seg_targets = _classify_segment(tokens, depth=depth)
+        seg_intent, seg_targets = _classify_segment(list(seg_tokens), depth=depth)
         overall_targets.extend(seg_targets)
         if seg_intent == "WRITE":
             overall_intent = "WRITE"
@@ -692,65 +791,6 @@ def _classify_bash(command: str, *, depth: int) -> Tuple[Intent, List[str]]:
     return (overall_intent, overall_targets)
 
 
-def _split_sequential_raw(command: str) -> List[str]:
-    """Split a raw command string on sequential shell operators (``;``, ``&&``, ``||``).
-
-    Respects single/double quotes — operators inside quoted strings are not
-    split points. Backslash-escaped operators are also preserved.
-    """
-    segments: List[str] = []
-    buf: List[str] = []
-    i = 0
-    n = len(command)
-    in_single = False
-    in_double = False
-    while i < n:
-        c = command[i]
-        if c == "\\" and i + 1 < n:
-            buf.append(c)
-            buf.append(command[i + 1])
-            i += 2
-            continue
-        if c == "'" and not in_double:
-            in_single = not in_single
-            buf.append(c)
-            i += 1
-            continue
-        if c == '"' and not in_single:
-            in_double = not in_double
-            buf.append(c)
-            i += 1
-            continue
-        if not in_single and not in_double:
-            # Operators: ;, &&, ||, & (background)
-            if c == ";":
-                segments.append("".join(buf))
-                buf = []
-                i += 1
-                continue
-            if c == "&" and i + 1 < n and command[i + 1] == "&":
-                segments.append("".join(buf))
-                buf = []
-                i += 2
-                continue
-            if c == "|" and i + 1 < n and command[i + 1] == "|":
-                segments.append("".join(buf))
-                buf = []
-                i += 2
-                continue
-            # Bare ``&`` (background) — treat as segment break.
-            if c == "&" and (i + 1 >= n or command[i + 1] not in ("&", ">")):
-                segments.append("".join(buf))
-                buf = []
-                i += 1
-                continue
-        buf.append(c)
-        i += 1
-    if buf:
-        segments.append("".join(buf))
-    return segments
-
-
 def _classify_segment(tokens: List[str], *, depth: int) -> Tuple[Intent, List[str]]:
     """Classify a single command segment (no ; / && / || at this level)."""
     # Split on pipes — classify each pipe stage independently.
@@ -1121,4 +1161,5 @@ __all__ = [
     "is_write",
     "changed_content",
     "has_suspicious_exec",
+    "cache_stats",
 ]
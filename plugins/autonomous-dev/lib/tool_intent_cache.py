@@ -0,0 +1,435 @@
+"""Memo of ``tool_intent`` Bash classifications (memory LRU + on-disk store).
+
+Agents issue the same commands hundreds of times per session (``git status``,
+``pytest tests/unit -q``, ``git diff --stat``) and every PreToolUse hook
+process re-runs ``tool_intent._classify_bash`` on them — shlex tokenisation
+per segment plus AST analysis of ``python -c`` snippets. This module lets
+``tool_intent`` skip that work for commands it has classified before.
+
+Two tiers:
+
+- **Memory**: a bounded LRU (``OrderedDict``) keyed by ``(tool_name,
+  normalized input)``. Serves repeated lookups inside one hook process —
+  ``classify`` and ``write_targets`` are both called for the same command by
+  several enforcement sites.
+- **Disk**: one small JSON file per entry under
+  ``~/.claude/cache/tool_intent/`` (override: ``TOOL_INTENT_CACHE_DIR``),
+  shared by every hook process. Only entries whose classification cost at
+  least ``persist_min_ns`` are written: for a trivial command a file read is
+  no cheaper than classifying it again.
+
+Keys
+----
+The disk key is ``sha256(fingerprint, tool_name, normalized input)``. The
+fingerprint hashes ``CLASSIFIER_VERSION`` together with the source of the
+classifier modules (``tool_intent.py``, ``python_write_detector.py``,
+``parsed_command.py``), so editing or upgrading any of them invalidates every
+persisted entry without a manual version bump. The memory tier lives no
+longer than the process that loaded those sources and is keyed on the raw
+input only.
+
+What is cached
+--------------
+READ and EXEC results are context-free: they are a pure function of the
+command string. WRITE results are cached only when every target is a literal
+path — a target containing a shell expansion (``$VAR``, ``$(...)``,
+backticks, ``~``) or a glob resolves against the caller's environment and
+filesystem, and a ``SUSPICIOUS_EXEC_SENTINEL`` target marks dynamic
+``exec``/``eval`` code. Those results are recomputed every time.
+
+Integrity
+---------
+Each disk entry carries an HMAC-SHA256 over its key and payload, keyed by a
+per-directory secret (``.key``, mode 0600). Entries that fail verification —
+truncated writes, files from another install, hand-edited files — are
+ignored and removed. The directory is created 0700 and entries 0600; the
+secret does not protect against a process that can already read the
+user's home directory.
+
+Safety
+------
+Every method is best-effort and never raises: a cache failure degrades to a
+miss and the caller classifies normally. ``TOOL_INTENT_CACHE_DISABLED=<truthy>``
+turns both tiers off.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import random
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# ---------------------------------------------------------------------------
+# Module constants
+# ---------------------------------------------------------------------------
+
+#: Bump when the cached value's meaning changes without a source edit in the
+#: fingerprinted modules (e.g. the entry schema below).
+CLASSIFIER_VERSION: str = "1"
+
+DISABLE_ENV_VAR: str = "TOOL_INTENT_CACHE_DISABLED"
+DIR_OVERRIDE_ENV_VAR: str = "TOOL_INTENT_CACHE_DIR"
+
+CACHE_DIR_RELATIVE_HOME: Path = Path(".claude") / "cache" / "tool_intent"
+
+DEFAULT_MAX_ENTRIES: int = 1024
+DEFAULT_MAX_DISK_ENTRIES: int = 4096
+
+#: Classifications cheaper than this are kept in memory only (0.1 ms).
+DEFAULT_PERSIST_MIN_NS: int = 100_000
+
+#: Fraction of disk writes that also check the entry count and prune.
+PRUNE_PROBABILITY: float = 1 / 64
+
+DIR_MODE: int = 0o700
+FILE_MODE: int = 0o600
+
+_KEY_FILE = ".key"
+_ENTRY_SUFFIX = ".json"
+_VALID_INTENTS = frozenset({"READ", "WRITE", "EXEC"})
+_FALSY_ENV_VALUES = frozenset({"", "0", "false", "no", "off"})
+
+# Characters that make a write target depend on the shell environment or the
+# filesystem (expansions, substitutions, globs).
+_CONTEXT_CHARS = frozenset("$`~*?[")
+
+Classification = Tuple[str, List[str]]
+
+
+def is_cache_disabled() -> bool:
+    """Return True iff the cache is disabled via ``TOOL_INTENT_CACHE_DISABLED``."""
+    raw = os.environ.get(DISABLE_ENV_VAR)
+    if raw is None:
+        return False
+    return raw.strip().lower() not in _FALSY_ENV_VALUES
+
+
+def default_cache_dir() -> Path:
+    """Resolve the on-disk store directory (env override, then home)."""
+    override = os.environ.get(DIR_OVERRIDE_ENV_VAR)
+    if override:
+        return Path(override)
+    return Path.home() / CACHE_DIR_RELATIVE_HOME
+
+
+def source_fingerprint(paths: Iterable[Path]) -> str:
+    """Hash ``CLASSIFIER_VERSION`` and the contents of ``paths``.
+
+    Missing files contribute their name only, so a classifier that runs
+    without an optional detector gets a different fingerprint from one
+    that has it.
+    """
+    digest = hashlib.sha256(CLASSIFIER_VERSION.encode())
+    for path in paths:
+        digest.update(b"\0" + Path(path).name.encode() + b"\0")
+        try:
+            digest.update(Path(path).read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def is_context_free(intent: str, targets: List[str], sentinel: Optional[str] = None) -> bool:
+    """Return True if a classification may be reused for any caller.
+
+    Args:
+        intent: ``"READ"``, ``"WRITE"`` or ``"EXEC"``.
+        targets: Write targets returned with ``intent``.
+        sentinel: ``python_write_detector.SUSPICIOUS_EXEC_SENTINEL``, if known.
+
+    Returns:
+        True when every target is a literal path. READ/EXEC results usually
+        carry no targets, so they are always reusable.
+    """
+    return all(_is_literal(t, sentinel) for t in targets)
+
+
+def _is_literal(target: object, sentinel: Optional[str]) -> bool:
+    if not isinstance(target, str) or not target:
+        return False
+    if sentinel is not None and target == sentinel:
+        return False
+    return not any(c in _CONTEXT_CHARS for c in target)
+
+
+class IntentCache:
+    """Two-tier memo of ``(tool_name, normalized input) -> (intent, targets)``.
+
+    Args:
+        fingerprint_sources: Files whose contents version the disk entries.
+        max_entries: Memory LRU capacity.
+        cache_dir: Disk store directory (default: :func:`default_cache_dir`).
+        persist: Set False for a memory-only cache.
+        persist_min_ns: Minimum classification cost for a disk write.
+        max_disk_entries: Disk entry cap, enforced by probabilistic pruning.
+        sentinel: Target value that is never cached (dynamic exec marker).
+    """
+
+    def __init__(
+        self,
+        fingerprint_sources: Iterable[Path] = (),
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Optional[Path] = None,
+        persist: bool = True,
+        persist_min_ns: int = DEFAULT_PERSIST_MIN_NS,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+        sentinel: Optional[str] = None,
+    ) -> None:
+        self._sources = tuple(Path(p) for p in fingerprint_sources)
+        self.max_entries = max(1, int(max_entries))
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.persist = persist
+        self.persist_min_ns = int(persist_min_ns)
+        self.max_disk_entries = max(1, int(max_disk_entries))
+        self.sentinel = sentinel
+        self._memory: "OrderedDict[Tuple[str, str], Classification]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[str] = None
+        self._secret: Optional[bytes] = None
+        self._disk_ok = True
+        self._counters: Dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "uncacheable": 0,
+        }
+
+    # --- public API ---------------------------------------------------------
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir if self._cache_dir is not None else default_cache_dir()
+
+    def get(self, tool_name: str, normalized: str) -> Optional[Classification]:
+        """Return a cached ``(intent, targets)`` copy, or None on a miss."""
+        if is_cache_disabled():
+            return None
+        mem_key = (tool_name, normalized)
+        with self._lock:
+            hit = self._memory.get(mem_key)
+            if hit is not None:
+                self._memory.move_to_end(mem_key)
+                self._counters["memory_hits"] += 1
+                return (hit[0], list(hit[1]))
+
+        hit = self._disk_get(tool_name, normalized) if self.persist else None
+        with self._lock:
+            if hit is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["disk_hits"] += 1
+            self._remember(mem_key, hit)
+        return (hit[0], list(hit[1]))
+
+    def put(
+        self,
+        tool_name: str,
+        normalized: str,
+        intent: str,
+        targets: List[str],
+        *,
+        cost_ns: int = 0,
+    ) -> bool:
+        """Record a classification. Returns True if it was cached.
+
+        Context-dependent results (see :func:`is_context_free`) are counted
+        as ``uncacheable`` and dropped.
+        """
+        if is_cache_disabled():
+            return False
+        if intent not in _VALID_INTENTS or not is_context_free(intent, targets, self.sentinel):
+            with self._lock:
+                self._counters["uncacheable"] += 1
+            return False
+        value: Classification = (intent, list(targets))
+        with self._lock:
+            self._remember((tool_name, normalized), value)
+        if self.persist and cost_ns >= self.persist_min_ns:
+            if self._disk_put(tool_name, normalized, value):
+                with self._lock:
+                    self._counters["stores"] += 1
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for this process plus ``hit_rate`` over all lookups."""
+        with self._lock:
+            out: Dict[str, float] = dict(self._counters)
+            out["entries"] = len(self._memory)
+        lookups = out["memory_hits"] + out["disk_hits"] + out["misses"]
+        out["hit_rate"] = round((out["memory_hits"] + out["disk_hits"]) / lookups, 4) if lookups else 0.0
+        return out
+
+    def clear(self, *, disk: bool = False) -> None:
+        """Drop the memory tier and reset counters (and the disk store if ``disk``)."""
+        with self._lock:
+            self._memory.clear()
+            for name in self._counters:
+                self._counters[name] = 0
+        if disk:
+            try:
+                for entry in os.scandir(self.cache_dir):
+                    if entry.name.endswith(_ENTRY_SUFFIX):
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+
+    # --- memory tier ----------------------------------------------------------
+
+    def _remember(self, mem_key: Tuple[str, str], value: Classification) -> None:
+        # Caller holds ``self._lock``.
+        self._memory[mem_key] = value
+        self._memory.move_to_end(mem_key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    # --- disk tier ------------------------------------------------------------
+
+    def _disk_key(self, tool_name: str, normalized: str) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = source_fingerprint(self._sources)
+        digest = hashlib.sha256(self._fingerprint.encode())
+        digest.update(b"\0" + tool_name.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0" + normalized.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def _mac(self, key: str, intent: str, targets: List[str]) -> str:
+        payload = json.dumps([key, intent, targets], separators=(",", ":"), ensure_ascii=True)
+        return hmac.new(self._secret or b"", payload.encode(), hashlib.sha256).hexdigest()
+
+    def _load_secret(self, create: bool) -> bool:
+        """Read (or create) the per-directory HMAC secret."""
+        if self._secret is not None:
+            return True
+        key_path = self.cache_dir / _KEY_FILE
+        try:
+            self._secret = key_path.read_bytes()
+            return len(self._secret) >= 16
+        except FileNotFoundError:
+            if not create:
+                return False
+        except OSError:
+            return False
+        try:
+            self.cache_dir.mkdir(mode=DIR_MODE, parents=True, exist_ok=True)
+            secret = os.urandom(32)
+            fd = os.open(str(key_path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, FILE_MODE)
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(secret)
+            self._secret = secret
+            return True
+        except FileExistsError:
+            # Another hook process created it first; use theirs.
+            try:
+                self._secret = key_path.read_bytes()
+                return len(self._secret) >= 16
+            except OSError:
+                return False
+        except OSError:
+            self._disk_ok = False
+            return False
+
+    def _disk_get(self, tool_name: str, normalized: str) -> Optional[Classification]:
+        if not self._disk_ok:
+            return None
+        try:
+            key = self._disk_key(tool_name, normalized)
+            path = self.cache_dir / f"{key}{_ENTRY_SUFFIX}"
+            try:
+                raw = path.read_bytes()
+            except OSError:
+                return None
+            if not self._load_secret(create=False):
+                return None
+            data = json.loads(raw)
+            intent = data.get("intent")
+            targets = data.get("targets")
+            if (
+                data.get("key") != key
+                or intent not in _VALID_INTENTS
+                or not isinstance(targets, list)
+                or not all(isinstance(t, str) for t in targets)
+                or not hmac.compare_digest(str(data.get("mac", "")), self._mac(key, intent, targets))
+            ):
+                self._discard(path)
+                return None
+            try:
+                os.utime(path)  # LRU order for pruning
+            except OSError:
+                pass
+            return (intent, list(targets))
+        except Exception:
+            return None
+
+    def _disk_put(self, tool_name: str, normalized: str, value: Classification) -> bool:
+        if not self._disk_ok:
+            return False
+        try:
+            if not self._load_secret(create=True):
+                return False
+            key = self._disk_key(tool_name, normalized)
+            intent, targets = value
+            entry = {
+                "key": key,
+                "intent": intent,
+                "targets": targets,
+                "mac": self._mac(key, intent, targets),
+            }
+            path = self.cache_dir / f"{key}{_ENTRY_SUFFIX}"
+            tmp = path.with_name(f".{key}.{os.getpid()}.tmp")
+            fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, FILE_MODE)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh, separators=(",", ":"))
+            os.replace(tmp, path)
+            if random.random() < PRUNE_PROBABILITY:
+                self._prune()
+            return True
+        except Exception:
+            return False
+
+    def _prune(self) -> None:
+        """Delete least-recently-used entries down to 90% of the disk cap."""
+        try:
+            entries = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(_ENTRY_SUFFIX):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
+            if len(entries) <= self.max_disk_entries:
+                return
+            entries.sort()
+            for _mtime, path in entries[: len(entries) - int(self.max_disk_entries * 0.9)]:
+                self._discard(Path(path))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+__all__ = [
+    "CLASSIFIER_VERSION",
+    "DISABLE_ENV_VAR",
+    "DIR_OVERRIDE_ENV_VAR",
+    "IntentCache",
+    "default_cache_dir",
+    "is_cache_disabled",
+    "is_context_free",
+    "source_fingerprint",
+]
@@ -88,6 +88,12 @@ except ImportError:
         """Fallback policy file resolution."""
         return Path(__file__).parent.parent / "config" / "auto_approve_policy.json"
 
+# Import policy compiler (compiled glob/domain matchers for the hot path)
+try:
+    from permission_policy_compiler import compile_rules
+except ImportError:
+    compile_rules = None
+
 
 # Lazy evaluation of default policy file (uses cascading lookup)
 _DEFAULT_POLICY_FILE_CACHE = None
@@ -146,6 +152,39 @@ INJECTION_PATTERNS = [
 # Compile injection patterns for performance
 COMPILED_INJECTION_PATTERNS = [(re.compile(pattern), reason) for pattern, reason in INJECTION_PATTERNS]
 
+# Single-pass prefilter: the ordered loop only runs when something matched
+_INJECTION_PREFILTER = re.compile("|".join(f"(?:{pattern})" for pattern, _ in INJECTION_PATTERNS))
+
+
+def _first_glob(patterns: List[str], *texts: str) -> Optional[str]:
+    """First pattern (in list order) fnmatch-matching any of texts.
+
+    Uses the compiled policy artifact when available; otherwise falls back
+    to the per-pattern fnmatch loop. Both return the same pattern.
+    """
+    globs = compile_rules("glob", patterns) if compile_rules is not None else None
+    if globs is not None:
+        indexes = [i for i in (globs.first_index(t) for t in texts) if i is not None]
+        return globs.patterns[min(indexes)] if indexes else None
+    for pattern in patterns:
+        if any(fnmatch.fnmatch(text, pattern) for text in texts):
+            return pattern
+    return None
+
+
+def _first_blocked_domain(blocked_domains: List[str], domain: str) -> Optional[str]:
+    """First blocked_domains entry (in list order) matching domain."""
+    blocklist = compile_rules("domains", blocked_domains) if compile_rules is not None else None
+    if blocklist is not None:
+        return blocklist.first(domain)
+    for blocked in blocked_domains:
+        if blocked.endswith("*"):
+            if domain.startswith(blocked[:-1]):
+                return blocked
+        elif domain == blocked or domain.endswith(f".{blocked}"):
+            return blocked
+    return None
+
 
 class ToolValidationError(Exception):
     """Base exception for tool validation errors."""
@@ -645,16 +684,16 @@ class ToolValidator:
         # Step 2: Check blacklist against both original and normalized command
         # Support both 'blacklist' and 'denylist' for backwards compatibility
         blacklist = self.policy["bash"].get("blacklist", self.policy["bash"].get("denylist", []))
-        for pattern in blacklist:
-            if fnmatch.fnmatch(command, pattern) or fnmatch.fnmatch(normalized, pattern):
-                return ValidationResult(
-                    approved=False,
-                    reason=f"Matches blacklist pattern: {pattern}",
-                    security_risk=True,
-                    tool="Bash",
-                    parameters={"command": command},
-                    matched_pattern=pattern,
-                )
+        pattern = _first_glob(blacklist, command, normalized)
+        if pattern is not None:
+            return ValidationResult(
+                approved=False,
+                reason=f"Matches blacklist pattern: {pattern}",
+                security_risk=True,
+                tool="Bash",
+                parameters={"command": command},
+                matched_pattern=pattern,
+            )
 
         # Step 3: Check path containment (CWE-22, CWE-59 prevention)
         # Extract paths from destructive commands (rm, mv, cp, chmod, chown)
@@ -674,7 +713,8 @@ class ToolValidator:
                 )
 
         # Step 4: Check for command injection patterns (CWE-78, CWE-117, CWE-158)
-        for pattern, reason_name in COMPILED_INJECTION_PATTERNS:
+        injection_patterns = COMPILED_INJECTION_PATTERNS if _INJECTION_PREFILTER.search(command) else []
+        for pattern, reason_name in injection_patterns:
             if pattern.search(command):
                 return ValidationResult(
                     approved=False,
@@ -687,16 +727,16 @@ class ToolValidator:
 
         # Step 5: Check whitelist (approve known-safe commands)
         whitelist = self.policy["bash"]["whitelist"]
-        for pattern in whitelist:
-            if fnmatch.fnmatch(command, pattern):
-                return ValidationResult(
-                    approved=True,
-                    reason=f"Matches whitelist pattern: {pattern}",
-                    security_risk=False,
-                    tool="Bash",
-                    parameters={"command": command},
-                    matched_pattern=pattern,
-                )
+        pattern = _first_glob(whitelist, command)
+        if pattern is not None:
+            return ValidationResult(
+                approved=True,
+                reason=f"Matches whitelist pattern: {pattern}",
+                security_risk=False,
+                tool="Bash",
+                parameters={"command": command},
+                matched_pattern=pattern,
+            )
 
         # Step 6: Deny by default (conservative security posture)
         return ValidationResult(
@@ -725,15 +765,15 @@ class ToolValidator:
         """
         # Step 1: Check blacklist
         blacklist = self.policy["file_paths"]["blacklist"]
-        for pattern in blacklist:
-            if fnmatch.fnmatch(file_path, pattern):
-                return ValidationResult(
-                    approved=False,
-                    reason=f"Matches path blacklist pattern: {pattern}",
-                    security_risk=True,
-                    parameters={"file_path": file_path},
-                    matched_pattern=pattern,
-                )
+        pattern = _first_glob(blacklist, file_path)
+        if pattern is not None:
+            return ValidationResult(
+                approved=False,
+                reason=f"Matches path blacklist pattern: {pattern}",
+                security_risk=True,
+                parameters={"file_path": file_path},
+                matched_pattern=pattern,
+            )
 
         # Step 2: Validate with security_utils (CWE-22, CWE-59)
         try:
@@ -749,15 +789,15 @@ class ToolValidator:
 
         # Step 3: Check whitelist
         whitelist = self.policy["file_paths"]["whitelist"]
-        for pattern in whitelist:
-            if fnmatch.fnmatch(file_path, pattern):
-                return ValidationResult(
-                    approved=True,
-                    reason=f"Matches path whitelist pattern: {pattern}",
-                    security_risk=False,
-                    parameters={"file_path": file_path},
-                    matched_pattern=pattern,
-                )
+        pattern = _first_glob(whitelist, file_path)
+        if pattern is not None:
+            return ValidationResult(
+                approved=True,
+                reason=f"Matches path whitelist pattern: {pattern}",
+                security_risk=False,
+                parameters={"file_path": file_path},
+                matched_pattern=pattern,
+            )
 
         # Step 4: Deny by default
         return ValidationResult(
@@ -785,15 +825,9 @@ class ToolValidator:
         blocked_domains = web_tools.get("blocked_domains", [])
 
         # Check if tool is whitelisted (supports wildcards via fnmatch)
-        tool_whitelisted = False
-        matched_whitelist_pattern = None
-        for pattern in whitelist:
-            if fnmatch.fnmatch(tool, pattern):
-                tool_whitelisted = True
-                matched_whitelist_pattern = pattern
-                break
-
-        if not tool_whitelisted:
+        matched_whitelist_pattern = _first_glob(whitelist, tool)
+
+        if matched_whitelist_pattern is None:
             return ValidationResult(
                 approved=False,
                 reason=f"Web tool '{tool}' not in whitelist",
@@ -807,24 +841,16 @@ class ToolValidator:
         domain = parsed.netloc or url  # For WebSearch, might just be a query string
 
         # Check if domain is blocked (SSRF prevention)
-        for blocked in blocked_domains:
-            if blocked.endswith("*"):
-                # Wildcard match (e.g., "10.*" matches "10.0.0.1")
-                prefix = blocked[:-1]
-                if domain.startswith(prefix):
-                    return ValidationResult(
-                        approved=False,
-                        reason=f"Domain '{domain}' blocked (SSRF prevention: {blocked})",
-                        security_risk=True,
-                        matched_pattern=blocked,
-                    )
-            elif domain == blocked or domain.endswith(f".{blocked}"):
-                return ValidationResult(
-                    approved=False,
-                    reason=f"Domain '{domain}' blocked (SSRF prevention)",
-                    security_risk=True,
-                    matched_pattern=blocked,
-                )
+        # Wildcard entries (e.g., "10.*" matches "10.0.0.1") name the rule in the reason
+        blocked = _first_blocked_domain(blocked_domains, domain)
+        if blocked is not None:
+            detail = f": {blocked}" if blocked.endswith("*") else ""
+            return ValidationResult(
+                approved=False,
+                reason=f"Domain '{domain}' blocked (SSRF prevention{detail})",
+                security_risk=True,
+                matched_pattern=blocked,
+            )
 
         # If allow_all_domains is true, approve (after blocklist check)
         if allow_all_domains:
@@ -21,14 +21,21 @@ Design Patterns:
     See library-design-patterns skill for standardized design patterns.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
+import hashlib
 import json
+import mmap
 
 from security_utils import validate_path, audit_log
 
 
+RLVR_DOMAINS = ['math', 'reasoning', 'coding', 'logic', 'general',
+                'creative', 'creative_writing', 'opinion']
+
+
 @dataclass
 class IFDScore:
     """Instruction-Following Difficulty score for dataset quality.
@@ -361,24 +368,14 @@ def calculate_ifd_score(
     # In production, would use ML models or statistical analysis
     total = len(examples)
 
-    # Instruction clarity: average instruction length as proxy
-    avg_instruction_len = sum(len(ex['instruction']) for ex in examples) / total
-    instruction_clarity = min(1.0, avg_instruction_len / 100.0)  # Normalize to 0-1
-
-    # Response quality: average response length as proxy
-    avg_response_len = sum(len(ex['response']) for ex in examples) / total
-    response_quality = min(1.0, avg_response_len / 200.0)  # Normalize to 0-1
-
-    # Diversity: unique instructions as proxy
-    unique_instructions = len(set(ex['instruction'] for ex in examples))
-    diversity_score = unique_instructions / total
-
-    # Create score object
     score = IFDScore(
-        instruction_clarity=instruction_clarity,
-        response_quality=response_quality,
-        diversity_score=diversity_score,
-        total_examples=total
+        total_examples=total,
+        **_ifd_components(
+            total,
+            instruction_chars=sum(len(ex['instruction']) for ex in examples),
+            response_chars=sum(len(ex['response']) for ex in examples),
+            unique_instructions=len(set(ex['instruction'] for ex in examples)),
+        )
     )
 
     # Audit log
@@ -561,12 +558,10 @@ def assess_rlvr_verifiability(
         )
 
     # Validate domain
-    valid_domains = ['math', 'reasoning', 'coding', 'logic', 'general',
-                     'creative', 'creative_writing', 'opinion']
-    if domain not in valid_domains:
+    if domain not in RLVR_DOMAINS:
         raise KeyError(
             f"Invalid domain: {domain}\n"
-            f"Expected: One of {valid_domains}\n"
+            f"Expected: One of {RLVR_DOMAINS}\n"
             f"See: docs/training/rlvr-domains.md"
         )
 
@@ -628,28 +623,11 @@ def assess_rlvr_verifiability(
     total = len(examples)
 
     # Calculate verifiability based on domain
-    # Math and reasoning domains should be highly verifiable
-    if domain in ['math', 'reasoning', 'coding', 'logic']:
-        verifiable_percentage = 0.95  # High verifiability
-        automated_checks = True
-        human_verification_required = False
-    elif domain == 'general':
-        verifiable_percentage = 0.85
-        automated_checks = True
-        human_verification_required = True
-    else:  # creative, opinion
-        verifiable_percentage = 0.5
-        automated_checks = False
-        human_verification_required = True
+    profile = _rlvr_domain_profile(domain)
+    verifiable_percentage = profile["verifiable_percentage"]
 
     # Create assessment object
-    assessment = RLVRVerifiability(
-        domain=domain,
-        verifiable_percentage=verifiable_percentage,
-        automated_checks=automated_checks,
-        human_verification_required=human_verification_required,
-        total_examples=total
-    )
+    assessment = RLVRVerifiability(domain=domain, total_examples=total, **profile)
 
     # Audit log
     audit_log("rlvr_assessment", "success", {
@@ -726,7 +704,7 @@ def calculate_tulu3_score(dataset_path: Path) -> Tulu3Score:
     # Parse dataset
     try:
         examples = []
-        required_fields = ['instruction_following', 'truthfulness', 'honesty', 'helpfulness']
+        required_fields = list(TULU3_DIMENSIONS)
 
         with open(dataset_path, 'r', encoding='utf-8') as f:
             for line_num, line in enumerate(f, 1):
@@ -900,8 +878,7 @@ def detect_data_poisoning(
                 try:
                     example = json.loads(line)
                     # Check for suspicious patterns (backdoor triggers)
-                    text = str(example.get('text', ''))
-                    if 'TRIGGER' in text.upper() or 'BACKDOOR' in text.upper():
+                    if _is_suspicious(example):
                         suspicious_count += 1
                 except json.JSONDecodeError:
                     # Skip invalid JSON lines
@@ -930,6 +907,450 @@ def detect_data_poisoning(
     return is_poisoned
 
 
+# =============================================================================
+# Single-pass dataset scan
+# =============================================================================
+
+TULU3_DIMENSIONS = ('instruction_following', 'truthfulness', 'honesty', 'helpfulness')
+
+# Distinct-instruction sketch size: exact below this many distinct
+# instructions, K-minimum-values estimate (~1/sqrt(k) relative error) above.
+DISTINCT_SKETCH_SIZE = 1 << 16
+
+# Files smaller than this are scanned in-process even when workers > 1
+MIN_PARALLEL_BYTES = 8 * 1024 * 1024
+
+_HASH_SPACE = float(1 << 64)
+
+
+def _ifd_components(total: int, instruction_chars: int, response_chars: int, unique_instructions: int) -> Dict[str, float]:
+    """IFD component scores from dataset totals (shared by all IFD callers)."""
+    return {
+        # Instruction clarity: average instruction length as proxy
+        "instruction_clarity": min(1.0, (instruction_chars / total) / 100.0),
+        # Response quality: average response length as proxy
+        "response_quality": min(1.0, (response_chars / total) / 200.0),
+        # Diversity: unique instructions as proxy
+        "diversity_score": unique_instructions / total,
+    }
+
+
+def _rlvr_domain_profile(domain: str) -> Dict[str, Any]:
+    """Verifiability profile for an RLVR task domain."""
+    # Math and reasoning domains should be highly verifiable
+    if domain in ['math', 'reasoning', 'coding', 'logic']:
+        return {"verifiable_percentage": 0.95, "automated_checks": True,
+                "human_verification_required": False}
+    if domain == 'general':
+        return {"verifiable_percentage": 0.85, "automated_checks": True,
+                "human_verification_required": True}
+    # creative, opinion
+    return {"verifiable_percentage": 0.5, "automated_checks": False,
+            "human_verification_required": True}
+
+
+def _is_suspicious(example: Any) -> bool:
+    """True if an example contains a backdoor trigger pattern."""
+    text = str(example.get('text', '')).upper() if isinstance(example, dict) else ''
+    return 'TRIGGER' in text or 'BACKDOOR' in text
+
+
+@dataclass
+class DatasetStats:
+    """Streaming statistics from one pass over a JSONL dataset.
+
+    Everything calculate_ifd_score, calculate_tulu3_score,
+    assess_rlvr_verifiability and detect_data_poisoning need, in bounded
+    memory: sums and counts plus a fixed-size distinct-instruction sketch.
+    Stats for separate byte ranges combine with ``merge`` in file order.
+
+    Attributes:
+        lines: Lines started in the scanned range (blank lines included)
+        total_examples: Lines that parsed as JSON
+        invalid_json_line: First line that is not valid JSON (1-based, 0 if none)
+        ifd_missing_line: First example without instruction/response (0 if none)
+        ifd_missing_keys: Keys of that example
+        instruction_chars: Sum of instruction lengths
+        response_chars: Sum of response lengths
+        instruction_hashes: Distinct-instruction sketch (64-bit hashes)
+        sketch_saturated: True once the sketch dropped hashes (count is estimated)
+        tulu3_missing_line: First example missing a Tulu3 dimension (0 if none)
+        tulu3_missing_fields: Dimensions missing on that line
+        tulu3_sums: Per-dimension score sums
+        suspicious_count: Examples matching poisoning trigger patterns
+        bytes_scanned: Bytes read
+    """
+    lines: int = 0
+    total_examples: int = 0
+    invalid_json_line: int = 0
+    invalid_json_error: str = ""
+    ifd_missing_line: int = 0
+    ifd_missing_keys: List[str] = field(default_factory=list)
+    instruction_chars: int = 0
+    response_chars: int = 0
+    instruction_hashes: set = field(default_factory=set)
+    sketch_saturated: bool = False
+    sketch_size: int = DISTINCT_SKETCH_SIZE
+    tulu3_missing_line: int = 0
+    tulu3_missing_fields: List[str] = field(default_factory=list)
+    tulu3_sums: Dict[str, float] = field(default_factory=lambda: {d: 0.0 for d in TULU3_DIMENSIONS})
+    suspicious_count: int = 0
+    bytes_scanned: int = 0
+    _cutoff: float = field(default=_HASH_SPACE, init=False, repr=False)
+
+    def _add_hash(self, value: int) -> None:
+        if value >= self._cutoff:
+            return
+        self.instruction_hashes.add(value)
+        if len(self.instruction_hashes) > 2 * self.sketch_size:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Keep the sketch_size smallest hashes once more are held."""
+        if len(self.instruction_hashes) > self.sketch_size:
+            kept = sorted(self.instruction_hashes)[:self.sketch_size]
+            self.instruction_hashes = set(kept)
+            self.sketch_saturated = True
+            self._cutoff = kept[-1]
+
+    @property
+    def unique_instructions(self) -> int:
+        """Distinct instruction count (exact unless the sketch saturated)."""
+        self._prune()
+        if not self.sketch_saturated:
+            return len(self.instruction_hashes)
+        kth = max(self.instruction_hashes)
+        return int(round((self.sketch_size - 1) * _HASH_SPACE / (kth + 1)))
+
+    def add_line(self, raw: bytes, line_num: int) -> None:
+        """Fold one raw JSONL line (1-based ``line_num``) into the stats."""
+        self.lines += 1
+        self.bytes_scanned += len(raw)
+        if not raw.strip():
+            return
+        try:
+            example = json.loads(raw.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            if not self.invalid_json_line:
+                self.invalid_json_line = line_num
+                self.invalid_json_error = str(e)
+            return
+        self.total_examples += 1
+        is_dict = isinstance(example, dict)
+
+        # IFD: instruction/response lengths and distinct instructions
+        if is_dict and 'instruction' in example and 'response' in example:
+            instruction = example['instruction']
+            self.instruction_chars += len(instruction)
+            self.response_chars += len(example['response'])
+            key = (instruction.encode('utf-8', 'surrogatepass') if isinstance(instruction, str)
+                   else json.dumps(instruction, sort_keys=True).encode('utf-8'))
+            self._add_hash(int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'big'))
+        elif not self.ifd_missing_line:
+            self.ifd_missing_line = line_num
+            self.ifd_missing_keys = list(example.keys()) if is_dict else []
+
+        # Tulu3: per-dimension sums
+        missing = [d for d in TULU3_DIMENSIONS if not is_dict or d not in example]
+        if missing:
+            if not self.tulu3_missing_line:
+                self.tulu3_missing_line = line_num
+                self.tulu3_missing_fields = missing
+        else:
+            for dimension in TULU3_DIMENSIONS:
+                self.tulu3_sums[dimension] += example[dimension]
+
+        # Poisoning: trigger patterns
+        if _is_suspicious(example):
+            self.suspicious_count += 1
+
+    def merge(self, later: "DatasetStats") -> "DatasetStats":
+        """Combine with stats of the byte range that follows this one."""
+        offset = self.lines
+
+        def shifted(first: int, line: int) -> int:
+            return first or (line + offset if line else 0)
+
+        if not self.invalid_json_line and later.invalid_json_line:
+            self.invalid_json_error = later.invalid_json_error
+        self.invalid_json_line = shifted(self.invalid_json_line, later.invalid_json_line)
+        if not self.ifd_missing_line and later.ifd_missing_line:
+            self.ifd_missing_keys = later.ifd_missing_keys
+        self.ifd_missing_line = shifted(self.ifd_missing_line, later.ifd_missing_line)
+        if not self.tulu3_missing_line and later.tulu3_missing_line:
+            self.tulu3_missing_fields = later.tulu3_missing_fields
+        self.tulu3_missing_line = shifted(self.tulu3_missing_line, later.tulu3_missing_line)
+
+        self.lines += later.lines
+        self.total_examples += later.total_examples
+        self.instruction_chars += later.instruction_chars
+        self.response_chars += later.response_chars
+        self.suspicious_count += later.suspicious_count
+        self.bytes_scanned += later.bytes_scanned
+        for dimension in TULU3_DIMENSIONS:
+            self.tulu3_sums[dimension] += later.tulu3_sums[dimension]
+        self.sketch_saturated = self.sketch_saturated or later.sketch_saturated
+        self.instruction_hashes |= later.instruction_hashes
+        self._prune()
+        return self
+
+
+def _iter_range_lines(path: str, start: int, end: int, use_mmap: bool) -> Iterator[bytes]:
+    """Yield raw lines that *start* inside [start, end) of the file."""
+    with open(path, 'rb') as f:
+        if use_mmap:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                return
+            try:
+                pos = start
+                if start > 0 and data[start - 1:start] != b'\n':
+                    newline = data.find(b'\n', start)
+                    pos = len(data) if newline < 0 else newline + 1
+                while pos < end:
+                    newline = data.find(b'\n', pos)
+                    stop = len(data) if newline < 0 else newline + 1
+                    yield data[pos:stop]
+                    pos = stop
+            finally:
+                data.close()
+            return
+
+        pos = start
+        if start > 0:
+            f.seek(start - 1)
+            if f.read(1) != b'\n':
+                pos += len(f.readline())
+        f.seek(pos)
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            yield line
+            pos += len(line)
+
+
+def _scan_range(path: str, start: int, end: int, use_mmap: bool, sketch_size: int) -> DatasetStats:
+    """Scan one byte range (top-level so process pools can pickle it)."""
+    stats = DatasetStats(sketch_size=sketch_size)
+    for line_num, raw in enumerate(_iter_range_lines(path, start, end, use_mmap), 1):
+        stats.add_line(raw, line_num)
+    return stats
+
+
+@dataclass
+class DatasetReport:
+    """All dataset quality checks computed from one DatasetScan pass.
+
+    A check whose input requirements are not met (e.g. no Tulu3 dimensions)
+    has a None result and the error message the standalone function would
+    raise.
+
+    Attributes:
+        path: Dataset that was scanned
+        stats: Raw streaming statistics
+        ifd_score: As calculate_ifd_score (None if ifd_error)
+        ifd_error: Why IFD could not be scored
+        tulu3_score: As calculate_tulu3_score (None if tulu3_error)
+        tulu3_error: Why Tulu3 could not be scored
+        rlvr: As assess_rlvr_verifiability
+        poisoning_detected: As detect_data_poisoning
+        suspicious_count: Examples matching trigger patterns
+    """
+    path: Path
+    stats: DatasetStats
+    ifd_score: Optional[IFDScore] = None
+    ifd_error: str = ""
+    tulu3_score: Optional[Tulu3Score] = None
+    tulu3_error: str = ""
+    rlvr: Optional[RLVRVerifiability] = None
+    poisoning_detected: bool = False
+    suspicious_count: int = 0
+
+    @property
+    def quality(self) -> TrainingDataQuality:
+        """Aggregated readiness verdict for the checks in this report."""
+        return TrainingDataQuality(
+            ifd_score=self.ifd_score,
+            rlvr_verifiability=self.rlvr,
+            poisoning_detected=self.poisoning_detected,
+        )
+
+
+class DatasetScan:
+    """Read a JSONL training dataset once and derive every quality metric.
+
+    calculate_ifd_score, calculate_tulu3_score, assess_rlvr_verifiability and
+    detect_data_poisoning each open and ``json.loads`` the whole file. A
+    DatasetScan parses every line once and keeps only bounded streaming
+    statistics, so a full audit of a multi-GB dataset costs one parse.
+
+    With ``workers > 1`` the file is split into byte ranges parsed in separate
+    processes; a line belongs to the range its first byte falls in, and range
+    stats are merged in file order so reported line numbers stay exact.
+
+    Examples:
+        >>> report = DatasetScan("data/train.jsonl", workers=4).report(domain="math")
+        >>> report.ifd_score.quality_tier, report.poisoning_detected
+    """
+
+    def __init__(
+        self,
+        dataset_path: Path,
+        *,
+        workers: int = 1,
+        use_mmap: bool = False,
+        sketch_size: int = DISTINCT_SKETCH_SIZE,
+        min_parallel_bytes: int = MIN_PARALLEL_BYTES,
+    ):
+        """Validate the dataset path.
+
+        Args:
+            dataset_path: Path to JSONL dataset file
+            workers: Parser processes for large files (default: 1, in-process)
+            use_mmap: Memory-map the file instead of buffered reads
+            sketch_size: Distinct-instruction sketch size (memory bound)
+            min_parallel_bytes: Smaller files are always scanned in-process
+
+        Raises:
+            TypeError: If dataset_path is not Path or string
+            FileNotFoundError: If dataset file doesn't exist
+        """
+        if isinstance(dataset_path, str):
+            dataset_path = Path(dataset_path)
+        elif not isinstance(dataset_path, Path):
+            raise TypeError(
+                f"Dataset path must be Path or string\n"
+                f"Got: {type(dataset_path).__name__}"
+            )
+        try:
+            validated_path = validate_path(dataset_path, "dataset scan", allow_missing=False)
+            dataset_path = Path(validated_path)
+        except Exception as e:
+            audit_log("dataset_scan", "failure", {
+                "operation": "DatasetScan",
+                "path": str(dataset_path),
+                "reason": "path_validation_failed",
+                "error": str(e)
+            })
+            raise
+        if not dataset_path.exists():
+            audit_log("dataset_scan", "failure", {
+                "operation": "DatasetScan",
+                "path": str(dataset_path),
+                "reason": "file_not_found"
+            })
+            raise FileNotFoundError(
+                f"Dataset file not found: {dataset_path}\n"
+                f"Expected: JSONL dataset file"
+            )
+
+        self.dataset_path = dataset_path
+        self.workers = max(1, int(workers))
+        self.use_mmap = use_mmap
+        self.sketch_size = max(2, int(sketch_size))
+        self.min_parallel_bytes = min_parallel_bytes
+        self._stats: Optional[DatasetStats] = None
+
+    def _ranges(self, size: int) -> List[tuple]:
+        if self.workers == 1 or size < self.min_parallel_bytes:
+            return [(0, size)]
+        count = self.workers * 4  # several ranges per worker evens out skew
+        step = -(-size // count)
+        return [(start, min(size, start + step)) for start in range(0, size, step)]
+
+    def run(self) -> DatasetStats:
+        """Scan the file (once; later calls return the cached stats)."""
+        if self._stats is not None:
+            return self._stats
+
+        path = str(self.dataset_path)
+        ranges = self._ranges(self.dataset_path.stat().st_size)
+        args = [(path, start, end, self.use_mmap, self.sketch_size) for start, end in ranges]
+        if len(ranges) == 1:
+            parts = [_scan_range(*args[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                parts = list(pool.map(_scan_range, *zip(*args)))
+
+        stats = parts[0]
+        for part in parts[1:]:
+            stats.merge(part)
+        self._stats = stats
+
+        audit_log("dataset_scan", "success", {
+            "operation": "DatasetScan",
+            "path": path,
+            "total_examples": stats.total_examples,
+            "bytes": stats.bytes_scanned,
+            "ranges": len(ranges),
+        })
+        return stats
+
+    def report(
+        self,
+        *,
+        domain: str = "general",
+        poisoning_threshold: int = 250,
+    ) -> DatasetReport:
+        """Compute IFD, Tulu3, RLVR and poisoning results from one pass.
+
+        Args:
+            domain: RLVR task domain (as assess_rlvr_verifiability)
+            poisoning_threshold: As detect_data_poisoning's ``threshold``
+
+        Raises:
+            KeyError: If invalid RLVR domain specified
+        """
+        if domain not in RLVR_DOMAINS:
+            raise KeyError(
+                f"Invalid domain: {domain}\n"
+                f"Expected: One of {RLVR_DOMAINS}\n"
+                f"See: docs/training/rlvr-domains.md"
+            )
+        stats = self.run()
+        report = DatasetReport(path=self.dataset_path, stats=stats)
+        total = stats.total_examples
+
+        # IFD and Tulu3 reject the whole dataset on the first bad line
+        ifd_bad = [n for n in (stats.invalid_json_line, stats.ifd_missing_line) if n]
+        if ifd_bad and min(ifd_bad) == stats.invalid_json_line:
+            report.ifd_error = f"Line {stats.invalid_json_line} is not valid JSON: {stats.invalid_json_error}"
+        elif ifd_bad:
+            report.ifd_error = (
+                f"Line {stats.ifd_missing_line} missing 'instruction' or 'response' fields "
+                f"(got: {stats.ifd_missing_keys})"
+            )
+        elif total == 0:
+            report.ifd_score = IFDScore(0.0, 0.0, 0.0, total_examples=0)
+        else:
+            report.ifd_score = IFDScore(
+                total_examples=total,
+                **_ifd_components(total, stats.instruction_chars, stats.response_chars,
+                                  stats.unique_instructions),
+            )
+
+        tulu3_bad = [n for n in (stats.invalid_json_line, stats.tulu3_missing_line) if n]
+        if tulu3_bad and min(tulu3_bad) == stats.invalid_json_line:
+            report.tulu3_error = f"Line {stats.invalid_json_line} is not valid JSON: {stats.invalid_json_error}"
+        elif tulu3_bad:
+            report.tulu3_error = (
+                f"Line {stats.tulu3_missing_line} missing required Tulu3 fields: "
+                f"{stats.tulu3_missing_fields}"
+            )
+        else:
+            report.tulu3_score = Tulu3Score(
+                total_examples=total,
+                **{d: (stats.tulu3_sums[d] / total if total else 0.0) for d in TULU3_DIMENSIONS},
+            )
+
+        report.rlvr = RLVRVerifiability(domain=domain, total_examples=total, **_rlvr_domain_profile(domain))
+        report.suspicious_count = stats.suspicious_count
+        report.poisoning_detected = stats.suspicious_count >= poisoning_threshold
+        return report
+
+
 def generate_dpo_preferences(
     input_path: Path,
     output_path: Path
@@ -1298,6 +1719,9 @@ __all__ = [
     "RLVRVerifiability",
     "TrainingDataQuality",
     "BookParsingQuality",
+    "DatasetScan",
+    "DatasetStats",
+    "DatasetReport",
     "Tulu3Score",
     "calculate_ifd_score",
     "validate_dpo_pairs",
@@ -7,6 +7,7 @@ distributed training environments with:
 - Worker state validation
 - Statistical divergence detection (KL divergence, Wasserstein distance)
 - Byzantine fault tolerance (Krum algorithm, geometric median)
+- Optional NumPy array backend with a pure-Python fallback
 - Security validation (path traversal, input sanitization, audit logging)
 
 Security:
@@ -30,6 +31,27 @@ import re
 
 from security_utils import validate_path, audit_log
 
+# NumPy is optional: when installed, Krum scoring and the divergence statistics
+# run on arrays; otherwise the pure-Python implementations are used.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+BACKEND_NUMPY = "numpy"
+BACKEND_PYTHON = "python"
+
+# Rows of the Krum pairwise-distance matrix materialized at once; peak memory
+# is KRUM_BLOCK_ROWS * m float64 values instead of m * m.
+KRUM_BLOCK_ROWS = 512
+
 
 # ==============================================================================
 # CUSTOM EXCEPTIONS
@@ -177,6 +199,129 @@ class ConsistencyMetrics:
         self.is_consistent = len(issues) == 0
 
 
+# ==============================================================================
+# BACKEND HELPERS
+# ==============================================================================
+
+
+def _resolve_backend(backend: Optional[str]) -> str:
+    """Resolve a backend name, defaulting to NumPy when it is installed.
+
+    Args:
+        backend: "numpy", "python" or None (auto-select)
+
+    Returns:
+        Resolved backend name
+
+    Raises:
+        ValueError: If backend name is unknown
+        ImportError: If "numpy" is requested but NumPy is not installed
+    """
+    if backend is None:
+        return BACKEND_NUMPY if NUMPY_AVAILABLE else BACKEND_PYTHON
+    if backend not in (BACKEND_NUMPY, BACKEND_PYTHON):
+        raise ValueError(
+            f"Invalid backend: {backend}\n"
+            f"Expected: '{BACKEND_NUMPY}', '{BACKEND_PYTHON}' or None (auto)"
+        )
+    if backend == BACKEND_NUMPY and not NUMPY_AVAILABLE:
+        raise ImportError(
+            f"NumPy backend requested but numpy is not installed\n"
+            f"Install numpy or use backend='{BACKEND_PYTHON}'"
+        )
+    return backend
+
+
+def _krum_scores_python(norms: List[float], losses: List[float], k: int) -> List[float]:
+    """Sum of each worker's k nearest distances in (gradient_norm, loss_value) space."""
+    sqrt = math.sqrt
+    points = list(zip(norms, losses))
+    scores = []
+    for i, (gi, li) in enumerate(points):
+        distances = [sqrt((gi - gj) ** 2 + (li - lj) ** 2) for gj, lj in points]
+        del distances[i]
+        distances.sort()
+        scores.append(sum(distances[:k]))
+    return scores
+
+
+def _krum_scores_numpy(norms: List[float], losses: List[float], k: int) -> List[float]:
+    """NumPy equivalent of _krum_scores_python.
+
+    Distances are computed KRUM_BLOCK_ROWS rows at a time; np.partition picks
+    the k nearest per row in linear time and the k values are summed in
+    ascending order so scores match the pure-Python backend exactly.
+    """
+    g = np.asarray(norms, dtype=np.float64)
+    l = np.asarray(losses, dtype=np.float64)
+    m = len(g)
+    k = min(k, m - 1)
+    scores = np.empty(m, dtype=np.float64)
+    for start in range(0, m, KRUM_BLOCK_ROWS):
+        stop = min(start + KRUM_BLOCK_ROWS, m)
+        dg = g[start:stop, None] - g[None, :]
+        dl = l[start:stop, None] - l[None, :]
+        dist = np.sqrt(dg * dg + dl * dl)
+        rows = np.arange(stop - start)
+        dist[rows, rows + start] = np.inf  # exclude self-distance
+        nearest = np.partition(dist, k - 1, axis=1)[:, :k]
+        nearest.sort(axis=1)
+        scores[start:stop] = np.cumsum(nearest, axis=1)[:, -1]
+    return scores.tolist()
+
+
+def _flag_krum_outliers(worker_ids: List[str], scores: List[float]) -> List[str]:
+    """Flag workers whose Krum score is an outlier.
+
+    Args:
+        worker_ids: Worker IDs, in input order
+        scores: Krum score per worker, aligned with worker_ids
+
+    Returns:
+        Byzantine worker IDs, ordered by ascending score
+    """
+    # Sort workers by score (ascending)
+    worker_scores = sorted(zip(worker_ids, scores), key=lambda x: x[1])
+
+    # Workers with highest scores are potential Byzantine
+    # Use multiple strategies to detect outliers:
+    # 1. IQR-based detection for normal distributions
+    # 2. Median-based detection
+    # 3. Absolute threshold for extremely high variance (all Byzantine case)
+
+    scores_only = [score for _, score in worker_scores]
+
+    if len(scores_only) <= 2:
+        # Too few workers for statistical detection
+        return []
+
+    # Calculate mean distance for absolute threshold check
+    mean_score = sum(scores_only) / len(scores_only)
+
+    # Strategy 1: IQR-based outlier detection
+    q1_idx = len(scores_only) // 4
+    q3_idx = 3 * len(scores_only) // 4
+    q1 = scores_only[q1_idx]
+    q3 = scores_only[q3_idx]
+    iqr = q3 - q1
+
+    # Outliers are scores > Q3 + 1.5 * IQR
+    iqr_threshold = q3 + 1.5 * iqr if iqr > 0 else float('inf')
+
+    # Strategy 2: Median-based detection (3x median)
+    median_score = scores_only[len(scores_only) // 2]
+    median_threshold = 3.0 * median_score if median_score > 0 else float('inf')
+
+    # Strategy 3: Absolute threshold for extreme variance (all Byzantine case)
+    # If mean score is very high (>100), flag highest scorers
+    absolute_threshold = mean_score * 0.8 if mean_score > 100.0 else float('inf')
+
+    # Use the most permissive threshold (catches more outliers)
+    threshold = min(iqr_threshold, median_threshold, absolute_threshold)
+
+    return [worker_id for worker_id, score in worker_scores if score > threshold and score > 0]
+
+
 # ==============================================================================
 # DIVERGENCE DETECTOR CLASS
 # ==============================================================================
@@ -188,8 +333,14 @@ class DivergenceDetector:
     Detects divergence using:
     - KL divergence from loss values
     - Wasserstein distance from gradient norms
+
+    Args:
+        backend: "numpy", "python" or None to use NumPy when installed
     """
 
+    def __init__(self, backend: Optional[str] = None):
+        self.backend = _resolve_backend(backend)
+
     def calculate_kl_divergence(self, worker_states: List[WorkerState]) -> float:
         """Calculate KL divergence from worker loss values.
 
@@ -222,8 +373,11 @@ class DivergenceDetector:
 
         # Calculate KL divergence using variance as proxy
         # In production, would use proper KL divergence with probability distributions
-        mean_loss = sum(loss_values) / len(loss_values)
-        variance = sum((x - mean_loss) ** 2 for x in loss_values) / len(loss_values)
+        if self.backend == BACKEND_NUMPY:
+            variance = float(np.var(np.asarray(loss_values, dtype=np.float64)))
+        else:
+            mean_loss = sum(loss_values) / len(loss_values)
+            variance = sum((x - mean_loss) ** 2 for x in loss_values) / len(loss_values)
 
         # Normalize variance to KL divergence range (0-1)
         # Use log transform to compress large variances
@@ -263,6 +417,10 @@ class DivergenceDetector:
 
         # Calculate Wasserstein distance using sorted gradient norms
         # For 1D distributions, Wasserstein-1 is mean absolute difference
+        if self.backend == BACKEND_NUMPY:
+            norms = np.asarray(gradient_norms, dtype=np.float64)
+            return float(np.mean(np.abs(norms - norms.mean())))
+
         sorted_norms = sorted(gradient_norms)
         mean_norm = sum(sorted_norms) / len(sorted_norms)
 
@@ -304,8 +462,14 @@ class ByzantineValidator:
     Detects Byzantine workers using:
     - Krum algorithm for outlier detection
     - Geometric median for robust aggregation
+
+    Args:
+        backend: "numpy", "python" or None to use NumPy when installed
     """
 
+    def __init__(self, backend: Optional[str] = None):
+        self.backend = _resolve_backend(backend)
+
     def calculate_geometric_median(self, worker_states: List[WorkerState]) -> float:
         """Calculate geometric median of worker gradient norms.
 
@@ -319,6 +483,9 @@ class ByzantineValidator:
             return 0.0
 
         # For 1D data, geometric median is the standard median
+        if self.backend == BACKEND_NUMPY:
+            return float(np.median(np.asarray([w.gradient_norm for w in worker_states], dtype=np.float64)))
+
         gradient_norms = sorted([w.gradient_norm for w in worker_states])
         n = len(gradient_norms)
 
@@ -366,74 +533,17 @@ class ByzantineValidator:
         if f is None:
             f = (m - 1) // 2
 
-        # Calculate pairwise distances between workers
-        # Using combined metric: (gradient_norm, loss_value)
-        byzantine_workers = []
-
-        # Calculate scores for each worker (distance to k-nearest neighbors)
-        worker_scores = []
-        for i, worker_i in enumerate(worker_states):
-            # Calculate distances to all other workers
-            distances = []
-            for j, worker_j in enumerate(worker_states):
-                if i != j:
-                    # Euclidean distance in (gradient_norm, loss_value) space
-                    dist = math.sqrt(
-                        (worker_i.gradient_norm - worker_j.gradient_norm) ** 2 +
-                        (worker_i.loss_value - worker_j.loss_value) ** 2
-                    )
-                    distances.append(dist)
-
-            # Sort distances and sum k-nearest (k = m - f - 2)
-            k = max(1, m - f - 2)
-            distances.sort()
-            score = sum(distances[:k])
-            worker_scores.append((worker_i.worker_id, score))
-
-        # Sort workers by score (ascending)
-        worker_scores.sort(key=lambda x: x[1])
-
-        # Workers with highest scores are potential Byzantine
-        # Use multiple strategies to detect outliers:
-        # 1. IQR-based detection for normal distributions
-        # 2. Median-based detection
-        # 3. Absolute threshold for extremely high variance (all Byzantine case)
-
-        scores_only = [score for _, score in worker_scores]
-
-        if len(scores_only) <= 2:
-            # Too few workers for statistical detection
-            return []
-
-        # Calculate mean distance for absolute threshold check
-        mean_score = sum(scores_only) / len(scores_only)
-
-        # Strategy 1: IQR-based outlier detection
-        q1_idx = len(scores_only) // 4
-        q3_idx = 3 * len(scores_only) // 4
-        q1 = scores_only[q1_idx]
-        q3 = scores_only[q3_idx]
-        iqr = q3 - q1
-
-        # Outliers are scores > Q3 + 1.5 * IQR
-        iqr_threshold = q3 + 1.5 * iqr if iqr > 0 else float('inf')
-
-        # Strategy 2: Median-based detection (3x median)
-        median_score = scores_only[len(scores_only) // 2]
-        median_threshold = 3.0 * median_score if median_score > 0 else float('inf')
-
-        # Strategy 3: Absolute threshold for extreme variance (all Byzantine case)
-        # If mean score is very high (>100), flag highest scorers
-        absolute_threshold = mean_score * 0.8 if mean_score > 100.0 else float('inf')
-
-        # Use the most permissive threshold (catches more outliers)
-        threshold = min(iqr_threshold, median_threshold, absolute_threshold)
-
-        for worker_id, score in worker_scores:
-            if score > threshold and score > 0:
-                byzantine_workers.append(worker_id)
+        # Score each worker by the sum of distances to its k nearest neighbors
+        # in (gradient_norm, loss_value) space (k = m - f - 2)
+        k = max(1, m - f - 2)
+        norms = [w.gradient_norm for w in worker_states]
+        losses = [w.loss_value for w in worker_states]
+        if self.backend == BACKEND_NUMPY:
+            scores = _krum_scores_numpy(norms, losses, k)
+        else:
+            scores = _krum_scores_python(norms, losses, k)
 
-        return byzantine_workers
+        return _flag_krum_outliers([w.worker_id for w in worker_states], scores)
 
 
 # ==============================================================================
@@ -618,4 +728,5 @@ __all__ = [
     "WorkerValidationError",
     "DivergenceDetectedError",
     "ByzantineWorkerError",
+    "NUMPY_AVAILABLE",
 ]
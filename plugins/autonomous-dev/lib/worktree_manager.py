@@ -9,6 +9,7 @@ This module provides git worktree management for isolated feature development:
 - Merge worktrees back to target branch
 - Prune stale/orphaned worktrees
 - Query worktree paths
+- Pool of pre-warmed worktrees leased per feature (WorktreePool)
 
 Key Features:
 - Path traversal prevention (CWE-22)
@@ -36,6 +37,13 @@ Usage:
     if result.success:
         print(f"Merged {len(result.merged_files)} files")
 
+    # Lease a pre-warmed worktree instead of creating one
+    pool = WorktreePool(size=4, base_branch='master')
+    pool.warm()
+    success, path = pool.lease('feature-auth')
+    ...
+    pool.release(path)
+
 Date: 2026-01-01
 Workflow: worktree_isolation
 Agent: implementer
@@ -44,13 +52,23 @@ Design Patterns:
     See library-design-patterns skill for standardized design patterns.
 """
 
+import json
 import os
 import re
+import shutil
 import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: pool state is then guarded per-process only
+    fcntl = None  # type: ignore[assignment]
 
 
 @dataclass
@@ -82,11 +100,14 @@ class MergeResult:
         conflicts: List of files with merge conflicts
         merged_files: List of files merged successfully
         error_message: Error description (empty if success)
+        prediction: merge_conflict_predictor.MergePrediction when conflicts
+            were predicted and the merge was not attempted (None otherwise)
     """
     success: bool
     conflicts: List[str]
     merged_files: List[str]
     error_message: str
+    prediction: Optional[Any] = None
 
 
 @dataclass
@@ -587,6 +608,9 @@ def delete_worktree(feature_name: str, force: bool = False) -> Tuple[bool, str]:
         # Get worktree base directory
         worktree_base = _get_worktree_base_dir()
         worktree_path = worktree_base / feature_name
+        if not worktree_path.exists():
+            # Leased pool slots live under .worktrees/.pool/, not <base>/<feature>
+            worktree_path = get_worktree_path(feature_name) or worktree_path
 
         # Issue #243 / #410: Check if current directory is inside the worktree.
         # If so, change process CWD to project root before deletion to prevent
@@ -699,7 +723,8 @@ def merge_worktree(
     auto_resolve: bool = False,
     check_push: bool = True,
     force_merge: bool = False,
-    auto_stash: bool = True
+    auto_stash: bool = True,
+    predict: bool = True
 ) -> MergeResult:
     """Merge a worktree branch back to target branch.
 
@@ -710,6 +735,9 @@ def merge_worktree(
         check_push: Verify branch is pushed before merge (default: True)
         force_merge: Merge even if unpushed commits exist (default: False)
         auto_stash: Automatically stash uncommitted changes before merge (default: True)
+        predict: Predict conflicts with ``git merge-tree`` first; without
+            auto_resolve a predicted conflict is returned before checkout, so
+            the working tree is never left mid-merge (default: True)
 
     Returns:
         MergeResult with success status and details
@@ -772,6 +800,26 @@ def merge_worktree(
                 )
             )
 
+    # Step 0.25: Predict conflicts in the object database. Auto-resolution needs
+    # the conflict markers in the working tree, so it still runs the real merge.
+    if predict and not auto_resolve:
+        try:
+            try:
+                from merge_conflict_predictor import predict_merge_conflicts
+            except ImportError:
+                from .merge_conflict_predictor import predict_merge_conflicts  # type: ignore[no-redef]
+            prediction = predict_merge_conflicts(feature_name, target_branch)
+        except Exception:
+            prediction = None  # Prediction is advisory; fall back to the real merge
+        if prediction is not None and prediction.ok and prediction.has_conflicts:
+            return MergeResult(
+                success=False,
+                conflicts=prediction.conflicted_files,
+                merged_files=[],
+                error_message=f'Merge conflict predicted (merge not attempted): {prediction.summary()}',
+                prediction=prediction
+            )
+
     # Step 0.5: Auto-stash uncommitted changes (Issue #241)
     stash_created = False
     if auto_stash:
@@ -1097,6 +1145,10 @@ def prune_stale_worktrees(max_age_days: int = 7) -> int:
                     pass  # Ignore errors
                 continue
 
+            # Pool slots are long-lived by design; WorktreePool.health_check() owns them
+            if _is_pool_slot(wt.path):
+                continue
+
             # Check if stale (older than threshold)
             # Use wt.created_at timestamp (already populated by list_worktrees)
             try:
@@ -1122,9 +1174,28 @@ def prune_stale_worktrees(max_age_days: int = 7) -> int:
         return 0
 
 
+def _find_worktree(feature_name: str) -> Optional[WorktreeInfo]:
+    """Find a worktree by feature name.
+
+    Worktrees from ``create_worktree`` are named after their directory.
+    WorktreePool slots live at ``.worktrees/.pool/slot-N``, so a leased slot
+    is matched by its checked-out branch instead.
+    """
+    worktrees = list_worktrees()
+    for wt in worktrees:
+        if wt.name == feature_name:
+            return wt
+    for wt in worktrees:
+        if wt.branch == feature_name and _is_pool_slot(wt.path):
+            return wt
+    return None
+
+
 def get_worktree_path(feature_name: str) -> Optional[Path]:
     """Get the path to a worktree by feature name.
 
+    Leased WorktreePool slots are found by their feature branch.
+
     Args:
         feature_name: Name of the feature worktree
 
@@ -1137,11 +1208,8 @@ def get_worktree_path(feature_name: str) -> Optional[Path]:
         ...     print(f"Worktree at: {path}")
     """
     try:
-        worktrees = list_worktrees()
-        for wt in worktrees:
-            if wt.name == feature_name:
-                return wt.path
-        return None
+        worktree_info = _find_worktree(feature_name)
+        return worktree_info.path if worktree_info else None
     except Exception:
         return None
 
@@ -1177,8 +1245,7 @@ def get_worktree_status(feature_name: str) -> dict:
         raise FileNotFoundError(f"Worktree '{feature_name}' not found")
 
     # Get branch name
-    worktrees = list_worktrees()
-    worktree_info = next((wt for wt in worktrees if wt.name == feature_name), None)
+    worktree_info = _find_worktree(feature_name)
     if not worktree_info:
         raise FileNotFoundError(f"Worktree '{feature_name}' not found")
 
@@ -1287,3 +1354,291 @@ def discard_worktree(feature_name: str) -> dict:
     if not success:
         raise RuntimeError(message)
     return {'success': True}
+
+
+# =============================================================================
+# Worktree pool
+# =============================================================================
+
+#: Directory (under .worktrees/) that holds pooled slots and the pool state.
+POOL_DIR_NAME = '.pool'
+
+#: Untracked bootstrap artifacts that survive the `git clean -fdx` reset.
+_POOL_KEEP_PATTERNS = ('/plugins/__init__.py', '/plugins/autonomous_dev')
+
+
+def _is_pool_slot(path: Path) -> bool:
+    """True if ``path`` is a WorktreePool slot (``.worktrees/.pool/<slot>``)."""
+    parts = Path(path).parts
+    return len(parts) >= 3 and parts[-2] == POOL_DIR_NAME and parts[-3] == '.worktrees'
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # Exists but owned by another user
+    return True
+
+
+class WorktreePool:
+    """Pool of pre-warmed, bootstrapped worktrees leased per feature.
+
+    ``create_worktree`` pays a full ``git worktree add`` (whole checkout) plus
+    the checkout/symbolic-ref fallback chain for every feature, and
+    ``delete_worktree`` removes it again. A pool keeps ``size`` idle worktrees
+    under ``.worktrees/.pool/`` with detached HEADs and the plugin bootstrap
+    artifacts in place. Leasing one is a reset:
+
+        git checkout -f -B <feature> <base>
+        git clean -fdx -e /plugins/__init__.py -e /plugins/autonomous_dev
+
+    which only rewrites files that differ between the slot's last checkout and
+    ``base``. Releasing detaches HEAD again (the feature branch and its commits
+    stay in the repository for merging) and discards uncommitted changes.
+
+    Slot state lives in ``.worktrees/.pool/pool.json``, guarded by an flock so
+    concurrent batch workers can lease from the same pool. Leases held by
+    processes that no longer exist are reclaimed by ``health_check()``.
+
+    Attributes:
+        size: Number of idle slots ``warm()`` maintains
+        base_branch: Default base for leases and idle slots
+        repo_root: Repository the worktrees belong to
+        pool_dir: Directory holding the slots and pool state
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        base_branch: str = 'master',
+        repo_root: Optional[Path] = None,
+    ):
+        self.size = max(0, size)
+        self.base_branch = base_branch
+        self.repo_root = Path(repo_root).resolve() if repo_root else Path.cwd().resolve()
+        self.pool_dir = self.repo_root / '.worktrees' / POOL_DIR_NAME
+        self._state_path = self.pool_dir / 'pool.json'
+        self._lock_path = self.pool_dir / '.lock'
+
+    # -- helpers --------------------------------------------------------------
+
+    def _git(self, args: List[str], cwd: Optional[Path] = None, timeout: int = 60) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            ['git', *args],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=timeout,
+            cwd=str(cwd or self.repo_root),
+        )
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """Read-modify-write the slot table under an exclusive lock."""
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._lock_path, 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                try:
+                    state = json.loads(self._state_path.read_text())
+                    if not isinstance(state, dict):
+                        state = {}
+                except (OSError, ValueError):
+                    state = {}
+                yield state
+                fd, tmp = tempfile.mkstemp(dir=str(self.pool_dir), prefix='.pool.', suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w') as f:
+                        json.dump(state, f, indent=2, sort_keys=True)
+                    os.replace(tmp, str(self._state_path))
+                except BaseException:
+                    try:
+                        os.unlink(tmp)
+                    except OSError:
+                        pass
+                    raise
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _slot_path(self, slot: str) -> Path:
+        return self.pool_dir / slot
+
+    def _reset(self, path: Path, checkout: List[str]) -> Tuple[bool, str]:
+        """Check out ``checkout`` in a slot and remove everything untracked."""
+        result = self._git(['checkout', '-f', *checkout], cwd=path)
+        if result.returncode != 0:
+            return (False, result.stderr.strip() or 'git checkout failed')
+        clean = ['clean', '-fdx', '-q']
+        for pattern in _POOL_KEEP_PATTERNS:
+            clean += ['-e', pattern]
+        result = self._git(clean, cwd=path)
+        if result.returncode != 0:
+            return (False, result.stderr.strip() or 'git clean failed')
+        _bootstrap_worktree_plugin_artifacts(path)
+        return (True, '')
+
+    def _slot_healthy(self, path: Path) -> bool:
+        if not path.is_dir():
+            return False
+        result = self._git(['rev-parse', '--show-toplevel'], cwd=path, timeout=10)
+        return result.returncode == 0 and Path(result.stdout.strip()).resolve() == path.resolve()
+
+    def _drop_slot(self, path: Path) -> None:
+        self._git(['worktree', 'remove', '--force', str(path)], timeout=30)
+        shutil.rmtree(path, ignore_errors=True)
+        self._git(['worktree', 'prune'], timeout=30)
+
+    # -- public API -----------------------------------------------------------
+
+    def warm(self) -> int:
+        """Create idle slots until ``size`` are idle. Returns the number created."""
+        created = 0
+        with self._locked_state() as state:
+            idle = sum(1 for info in state.values() if info.get('state') == 'idle')
+            index = 0
+            while idle < self.size:
+                while f'slot-{index}' in state:
+                    index += 1
+                slot = f'slot-{index}'
+                path = self._slot_path(slot)
+                if path.exists():
+                    self._drop_slot(path)
+                result = self._git(['worktree', 'add', '--detach', str(path), self.base_branch], timeout=120)
+                if result.returncode != 0:
+                    break
+                _bootstrap_worktree_plugin_artifacts(path)
+                state[slot] = {'state': 'idle', 'base': self.base_branch}
+                idle += 1
+                created += 1
+        return created
+
+    def lease(self, feature_name: str, base_branch: Optional[str] = None) -> Tuple[bool, Union[Path, str]]:
+        """Lease a worktree checked out on a new ``feature_name`` branch.
+
+        Falls back to ``create_worktree`` when no idle slot is available.
+
+        Args:
+            feature_name: Branch to create (validated like create_worktree)
+            base_branch: Commit-ish to branch from (default: pool base_branch)
+
+        Returns:
+            Same contract as create_worktree: (True, Path) or (False, error_message)
+        """
+        is_valid, error = _validate_feature_name(feature_name)
+        if not is_valid:
+            return (False, error)
+        base = base_branch or self.base_branch
+
+        try:
+            exists = self._git(['rev-parse', '--verify', '-q', f'refs/heads/{feature_name}'], timeout=10)
+            if exists.returncode == 0:
+                return (False, f"Branch '{feature_name}' already exists")
+
+            with self._locked_state() as state:
+                for slot, info in sorted(state.items()):
+                    if info.get('state') != 'idle':
+                        continue
+                    path = self._slot_path(slot)
+                    ok, error = self._reset(path, ['-B', feature_name, base])
+                    if not ok:
+                        if 'invalid reference' in error.lower() or 'not a commit' in error.lower():
+                            return (False, f"Invalid reference: {base}")
+                        # Broken slot: leave it for health_check() and try the next one
+                        info['state'] = 'broken'
+                        continue
+                    state[slot] = {
+                        'state': 'leased',
+                        'base': base,
+                        'branch': feature_name,
+                        'pid': os.getpid(),
+                        'leased_at': time.time(),
+                    }
+                    return (True, path.resolve())
+        except subprocess.TimeoutExpired:
+            return (False, 'Timeout: worktree lease timed out')
+        except OSError as e:
+            return (False, f'Unexpected error: {str(e)}')
+
+        return create_worktree(feature_name, base)
+
+    def release(self, path: Union[Path, str]) -> Tuple[bool, str]:
+        """Return a leased worktree to the pool.
+
+        Uncommitted changes are discarded; commits on the feature branch stay.
+        Worktrees that did not come from the pool (the create_worktree
+        fallback) are removed instead.
+
+        Returns:
+            Tuple of (success, message)
+        """
+        path = Path(path).resolve()
+        try:
+            if not _is_pool_slot(path):
+                result = self._git(['worktree', 'remove', '--force', str(path)], timeout=30)
+                if result.returncode != 0:
+                    return (False, f'Git worktree remove failed: {result.stderr.strip()}')
+                return (True, f"Worktree '{path.name}' removed (not pooled)")
+
+            with self._locked_state() as state:
+                info = state.get(path.name)
+                if info is None:
+                    return (False, f"Worktree '{path.name}' is not part of the pool")
+                ok, error = self._reset(path, ['--detach', info.get('base') or self.base_branch])
+                state[path.name] = {'state': 'idle' if ok else 'broken', 'base': info.get('base') or self.base_branch}
+            if not ok:
+                return (False, f'Pool reset failed: {error}')
+            return (True, f"Worktree '{path.name}' returned to pool")
+        except subprocess.TimeoutExpired:
+            return (False, 'Timeout: worktree release timed out')
+
+    def health_check(self) -> Dict[str, str]:
+        """Repair the pool: drop broken slots and reclaim abandoned leases.
+
+        A slot is broken when its directory is gone or is no longer its own
+        git worktree. A lease is abandoned when the leasing process has
+        exited; it is reset to idle. Call warm() afterwards to refill.
+
+        Returns:
+            Slot name -> action taken ('removed' or 'reclaimed')
+        """
+        actions: Dict[str, str] = {}
+        with self._locked_state() as state:
+            for slot in sorted(state):
+                info = state[slot]
+                path = self._slot_path(slot)
+                if info.get('state') == 'broken' or not self._slot_healthy(path):
+                    self._drop_slot(path)
+                    del state[slot]
+                    actions[slot] = 'removed'
+                elif info.get('state') == 'leased' and not _pid_alive(info.get('pid')):
+                    ok, _ = self._reset(path, ['--detach', info.get('base') or self.base_branch])
+                    if ok:
+                        state[slot] = {'state': 'idle', 'base': info.get('base') or self.base_branch}
+                        actions[slot] = 'reclaimed'
+                    else:
+                        self._drop_slot(path)
+                        del state[slot]
+                        actions[slot] = 'removed'
+        return actions
+
+    def slots(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of the slot table (slot name -> state info)."""
+        with self._locked_state() as state:
+            return {slot: dict(info) for slot, info in state.items()}
+
+    def destroy(self) -> int:
+        """Remove every slot and the pool state. Returns the number of slots removed."""
+        with self._locked_state() as state:
+            removed = 0
+            for slot in list(state):
+                self._drop_slot(self._slot_path(slot))
+                del state[slot]
+                removed += 1
+        return removed
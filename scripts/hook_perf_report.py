@@ -3,7 +3,9 @@
 
 Reads JSONL rows produced by ``hook_timing.HookTimer`` and prints
 per-hook p50/p95/p99 latency plus per-(hook, decision_shape) allow/block
-counts and ratio.
+counts and ratio. Rows that carry the optional ``counters`` object (e.g.
+``intent_cache`` hits/misses from ``unified_pre_tool.py``) are summed per
+hook and reported with a recomputed ``hit_rate`` in ``--json`` output.
 
 Usage:
 
@@ -203,8 +205,9 @@ def aggregate(rows: Iterable[dict]) -> dict[str, dict]:
 
         bucket = by_hook.setdefault(
             hook,
-            {"durations": [], "shape_counts": {}, "allow": 0, "block": 0},
+            {"durations": [], "shape_counts": {}, "allow": 0, "block": 0, "counters": {}},
         )
+        _sum_counters(bucket["counters"], row.get("counters"))
         bucket["durations"].append(dur)
         bucket["shape_counts"][shape] = bucket["shape_counts"].get(shape, 0) + 1
         if shape == "allow":
@@ -230,9 +233,43 @@ def aggregate(rows: Iterable[dict]) -> dict[str, dict]:
             "block_ratio": round(block / denom, 4),
             "shape_counts": dict(sorted(bucket["shape_counts"].items())),
         }
+        if bucket["counters"]:
+            result[hook]["counters"] = _finish_counters(bucket["counters"])
     return result
 
 
+# Per-invocation counter names that are snapshots or ratios, not additive.
+_NON_ADDITIVE_COUNTERS = frozenset({"entries", "hit_rate"})
+
+
+def _sum_counters(totals: dict, counters: object) -> None:
+    """Add one row's ``counters`` object into ``totals`` (malformed input ignored)."""
+    if not isinstance(counters, dict):
+        return
+    for group, values in counters.items():
+        if not isinstance(group, str) or not isinstance(values, dict):
+            continue
+        dest = totals.setdefault(group, {})
+        for name, value in values.items():
+            if name in _NON_ADDITIVE_COUNTERS or isinstance(value, bool):
+                continue
+            if isinstance(value, (int, float)):
+                dest[name] = dest.get(name, 0) + value
+
+
+def _finish_counters(totals: dict) -> dict:
+    """Sort counter groups and recompute ``hit_rate`` from summed hits/misses."""
+    out = {}
+    for group, values in sorted(totals.items()):
+        values = dict(sorted(values.items()))
+        hits = sum(v for k, v in values.items() if k == "hits" or k.endswith("_hits"))
+        lookups = hits + values.get("misses", 0)
+        if lookups:
+            values["hit_rate"] = round(hits / lookups, 4)
+        out[group] = values
+    return out
+
+
 def format_text_report(stats: dict[str, dict], *, top: int) -> str:
     """Sort by p95 desc and produce a fixed-width text table."""
     if not stats:
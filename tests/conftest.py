@@ -89,6 +89,13 @@ os.environ[_GH_ISSUE_CTX_ENV_VAR] = str(
     Path(_GH_ISSUE_CTX_REDIRECT_DIR) / "autonomous_dev_cmd_context.json"
 )
 
+# Same redirect for the tool_intent classification memo: its on-disk tier
+# (~/.claude/cache/tool_intent) must neither serve entries from a developer's
+# real sessions to the suite nor be populated by it. setdefault so a run can
+# still point it somewhere explicit.
+_TOOL_INTENT_CACHE_REDIRECT_DIR = tempfile.mkdtemp(prefix="autonomous-dev-tool-intent-cache-")
+os.environ.setdefault("TOOL_INTENT_CACHE_DIR", _TOOL_INTENT_CACHE_REDIRECT_DIR)
+
 # Second line of defence: snapshot the REAL path now and re-check at session
 # finish, so a future writer that reaches it some other way fails the run
 # loudly instead of silently sanctioning the tests that follow it.
@@ -275,6 +282,7 @@ def pytest_sessionfinish(session, exitstatus):
             session.exitstatus = 1
     finally:
         shutil.rmtree(_GH_ISSUE_CTX_REDIRECT_DIR, ignore_errors=True)
+        shutil.rmtree(_TOOL_INTENT_CACHE_REDIRECT_DIR, ignore_errors=True)
 
 
 def pytest_terminal_summary(terminalreporter, exitstatus, config):
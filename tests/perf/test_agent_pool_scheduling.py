@@ -0,0 +1,105 @@
+"""AgentPool scheduling overhead benchmark.
+
+Runs 10,000 tiny tasks (agent execution replaced by an immediate result)
+through ``AgentPool`` and measures what is left: submission, deque
+hand-off / stealing, Future resolution and ``await_all`` wake-up. Token
+accounting is swapped for a no-op tracker so the number isolates the
+scheduler; ``TokenTracker`` cost is measured by its own tests.
+
+Budgets (generous, for shared runners):
+
+- mean end-to-end overhead ≤ 200 µs per task over 10k tasks
+- single-task submit → ``await_all`` round trip p50 ≤ 5 ms (the previous
+  implementation polled in 100 ms ticks, so its round trip was ~100 ms)
+
+Marked ``@pytest.mark.perf`` and excluded from default test runs. Run with
+``pytest tests/perf/test_agent_pool_scheduling.py -m perf -s`` to see the
+numbers.
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LIB_DIR = REPO_ROOT / "plugins" / "autonomous-dev" / "lib"
+if str(LIB_DIR) not in sys.path:
+    sys.path.insert(0, str(LIB_DIR))
+
+import agent_pool  # noqa: E402
+from pool_config import PoolConfig  # noqa: E402
+
+pytestmark = [pytest.mark.perf]
+
+N_TASKS = 10_000
+PRIORITIES = list(agent_pool.PriorityLevel)
+
+
+class _NoBudget:
+    """Token tracker stand-in with unlimited budget and O(1) calls."""
+
+    def can_submit(self, estimated_tokens):
+        return True
+
+    def record_usage(self, agent_id, tokens):
+        pass
+
+    def get_remaining_budget(self):
+        return 0
+
+
+class _TinyTaskPool(agent_pool.AgentPool):
+    """AgentPool whose agent call returns immediately (pure scheduling cost)."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.token_tracker = _NoBudget()
+
+    def _execute_agent(self, handle, prompt):
+        return agent_pool.AgentResult(
+            task_id=handle.task_id, success=True, output="", tokens_used=0, duration=0.0
+        )
+
+
+def test_scheduling_overhead_10k_tiny_tasks():
+    pool = _TinyTaskPool(PoolConfig(max_agents=6, token_budget=10**12))
+    try:
+        # Warm up threads and code paths.
+        pool.await_all([pool.submit_task("warmup", "p", PRIORITIES[0]) for _ in range(100)])
+
+        start = time.perf_counter()
+        handles = [
+            pool.submit_task("bench", "p", PRIORITIES[i % len(PRIORITIES)])
+            for i in range(N_TASKS)
+        ]
+        submitted = time.perf_counter()
+        results = pool.await_all(handles, timeout=120)
+        returned = time.perf_counter()
+
+        round_trips = []
+        for _ in range(200):
+            t0 = time.perf_counter()
+            pool.await_all([pool.submit_task("ping", "p", PRIORITIES[0])], timeout=10)
+            round_trips.append(time.perf_counter() - t0)
+    finally:
+        pool.shutdown()
+
+    assert len(results) == N_TASKS
+    assert all(r.success for r in results)
+
+    total = returned - start
+    per_task_us = total / N_TASKS * 1e6
+    round_trip_ms = statistics.median(round_trips) * 1e3
+    print(
+        f"\n[agent_pool] {N_TASKS} tasks: total={total * 1e3:.1f} ms "
+        f"submit={(submitted - start) * 1e3:.1f} ms per_task={per_task_us:.1f} µs "
+        f"steals={pool.get_steal_count()} round_trip_p50={round_trip_ms:.3f} ms"
+    )
+
+    assert per_task_us <= 200, f"scheduling overhead {per_task_us:.1f} µs/task > 200 µs"
+    assert round_trip_ms <= 5, f"submit->await round trip p50 {round_trip_ms:.3f} ms > 5 ms"
@@ -0,0 +1,78 @@
+"""Sharded test run speedup benchmark.
+
+Generates a synthetic suite of 16 test files with uneven, sleep-dominated
+durations (0.1-0.8 s per file, 6.4 s serial in total), runs it once to
+record durations, then runs it with 1, 2 and 4 shards and reports wall time
+and speedup per shard count. Sleeps stand in for I/O-bound tests so the
+numbers mostly reflect scheduling and balance; CPU-bound suites scale up to
+the number of cores.
+
+Budgets (generous, for shared runners):
+
+- 2 shards ≥ 1.5x faster than 1 shard
+- 4 shards ≥ 2.0x faster than 1 shard
+
+Each shard is a separate pytest process whose startup is CPU-bound, so the
+test skips on runners with fewer cores than the largest shard count. Marked
+``@pytest.mark.perf``; run with
+``pytest tests/perf/test_test_sharding.py -m perf -s`` to see the numbers.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LIB_DIR = REPO_ROOT / "plugins" / "autonomous-dev" / "lib"
+if str(LIB_DIR) not in sys.path:
+    sys.path.insert(0, str(LIB_DIR))
+
+from test_sharding import run_sharded  # noqa: E402
+
+pytestmark = [pytest.mark.perf]
+
+PYTEST = (sys.executable, "-m", "pytest")
+ARGS = ("-q", "-p", "no:cacheprovider")
+SHARD_COUNTS = (1, 2, 4)
+FILE_SECONDS = [0.8, 0.7, 0.6, 0.6, 0.5, 0.5, 0.4, 0.4, 0.4, 0.3, 0.3, 0.3, 0.2, 0.1, 0.1, 0.2]
+
+
+def _write_suite(root: Path) -> None:
+    tests = root / "tests"
+    tests.mkdir()
+    for i, seconds in enumerate(FILE_SECONDS):
+        body = "import time\n\n"
+        for j in range(4):
+            body += f"def test_{j}():\n    time.sleep({seconds / 4})\n\n"
+        (tests / f"test_file{i:02d}.py").write_text(body)
+
+
+@pytest.mark.skipif(
+    (os.cpu_count() or 1) < max(SHARD_COUNTS),
+    reason=f"needs at least {max(SHARD_COUNTS)} CPUs to measure shard speedup",
+)
+def test_speedup_versus_shard_count(tmp_path):
+    _write_suite(tmp_path)
+    history = tmp_path / "durations.json"
+
+    def run(shards):
+        result = run_sharded(["tests"], shards=shards, pytest_args=ARGS, cwd=tmp_path,
+                             history_path=history, pytest_command=PYTEST)
+        assert result.passed and result.pass_count == 4 * len(FILE_SECONDS), result.output
+        return result.duration_seconds
+
+    run(4)  # record durations
+    walls = {shards: run(shards) for shards in SHARD_COUNTS}
+
+    speedups = {shards: walls[1] / wall for shards, wall in walls.items()}
+    print(
+        f"\n[test_sharding] serial work={sum(FILE_SECONDS):.1f}s "
+        + " ".join(f"shards={s}: {walls[s]:.2f}s ({speedups[s]:.2f}x)" for s in walls)
+    )
+
+    assert speedups[2] >= 1.5, f"2 shards only {speedups[2]:.2f}x faster"
+    assert speedups[4] >= 2.0, f"4 shards only {speedups[4]:.2f}x faster"
@@ -289,10 +289,18 @@ class TestAC4_BashFeatures:
         )
 
     def test_classifier_uses_shlex(self):
-        """Source-level structural check: tool_intent imports shlex."""
+        """Source-level structural check: tool_intent tokenises via shlex.
+
+        Tokenisation lives in the shared ``parsed_command`` model, so the
+        classifier must route through it and that module must use shlex.
+        """
         src = TOOL_INTENT_PATH.read_text()
-        assert "import shlex" in src or "from shlex" in src, (
-            "AC4: tool_intent must use shlex (per spec)"
+        assert "parse_command(" in src, (
+            "AC4: tool_intent must tokenise via parsed_command (per spec)"
+        )
+        pc_src = (LIB_DIR / "parsed_command.py").read_text()
+        assert "import shlex" in pc_src or "from shlex" in pc_src, (
+            "AC4: parsed_command must use shlex (per spec)"
         )
 
 
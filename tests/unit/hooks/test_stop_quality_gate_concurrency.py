@@ -0,0 +1,209 @@
+"""Tests for concurrent quality checks in stop_quality_gate (Issue #177).
+
+The real tools are swapped for small Python commands via
+``QUALITY_CHECK_COMMANDS`` so the tests exercise real subprocesses: checks
+must overlap, share one deadline, stop early on the first failure, and keep
+``format_results()`` output unchanged.
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parents[3] / "plugins" / "autonomous-dev" / "hooks"))
+
+import stop_quality_gate  # noqa: E402
+from stop_quality_gate import format_results, run_quality_checks  # noqa: E402
+
+ALL_TOOLS = {tool: {"available": True, "config_file": None} for tool in ("pytest", "ruff", "mypy")}
+
+
+def _py(code):
+    return [sys.executable, "-c", code]
+
+
+def _sleep_then(seconds, code="0"):
+    return _py(f"import sys, time; time.sleep({seconds}); sys.exit({code})")
+
+
+@pytest.fixture
+def commands():
+    cmds = {}
+    with patch.object(stop_quality_gate, "QUALITY_CHECK_COMMANDS", cmds):
+        yield cmds
+
+
+class TestConcurrentChecks:
+    def test_checks_overlap(self, commands, tmp_path):
+        for tool in ("pytest", "ruff", "mypy"):
+            commands[tool] = _sleep_then(0.5)
+
+        start = time.monotonic()
+        results = run_quality_checks(ALL_TOOLS, tmp_path)
+        elapsed = time.monotonic() - start
+
+        assert all(results[t]["passed"] for t in commands)
+        assert elapsed < 1.2  # serial execution would take >= 1.5 s
+
+    def test_streams_large_output(self, commands, tmp_path):
+        commands["pytest"] = _py("import sys; sys.stdout.write('x' * 500000); sys.stderr.write('err')")
+
+        results = run_quality_checks({"pytest": ALL_TOOLS["pytest"]}, tmp_path)
+
+        assert results["pytest"]["passed"] is True
+        assert len(results["pytest"]["stdout"]) == 500000
+        assert results["pytest"]["stderr"] == "err"
+        assert results["ruff"]["ran"] is False
+
+    def test_shared_deadline(self, commands, tmp_path):
+        commands["pytest"] = _sleep_then(30)
+        commands["ruff"] = _sleep_then(0)
+
+        start = time.monotonic()
+        results = run_quality_checks(ALL_TOOLS, tmp_path, deadline_seconds=0.5)
+
+        assert time.monotonic() - start < 5
+        assert results["ruff"]["passed"] is True
+        assert results["pytest"]["passed"] is False
+        assert results["pytest"]["error"] == "pytest timeout after 0.5 seconds"
+
+    def test_tool_crash_cancels_remaining(self, commands, tmp_path):
+        commands["pytest"] = _sleep_then(30)
+        commands["ruff"] = _py("import sys; print('error: invalid config'); sys.exit(2)")
+
+        start = time.monotonic()
+        results = run_quality_checks(ALL_TOOLS, tmp_path)
+
+        assert time.monotonic() - start < 5
+        assert results["ruff"]["returncode"] == 2
+        assert "invalid config" in results["ruff"]["stdout"]
+        assert results["pytest"]["error"] == "pytest cancelled after ruff failed"
+
+    def test_pytest_failure_cancels_remaining(self, commands, tmp_path):
+        commands["pytest"] = _sleep_then(0, 1)
+        commands["mypy"] = _sleep_then(30)
+
+        start = time.monotonic()
+        results = run_quality_checks(ALL_TOOLS, tmp_path)
+
+        assert time.monotonic() - start < 5
+        assert results["mypy"]["error"] == "mypy cancelled after pytest failed"
+
+    def test_lint_findings_do_not_cancel_pytest(self, commands, tmp_path):
+        commands["pytest"] = _sleep_then(0.5)
+        commands["ruff"] = _py("import sys; print('E501 line too long'); sys.exit(1)")
+        commands["mypy"] = _py("import sys; print('error: Incompatible types'); sys.exit(1)")
+
+        results = run_quality_checks(ALL_TOOLS, tmp_path)
+
+        assert results["ruff"]["passed"] is False
+        assert results["mypy"]["passed"] is False
+        assert results["pytest"]["passed"] is True
+        assert results["pytest"]["returncode"] == 0
+        assert results["pytest"]["error"] is None
+
+    def test_no_fail_fast_waits_for_all(self, commands, tmp_path):
+        commands["pytest"] = _sleep_then(0.3)
+        commands["ruff"] = _sleep_then(0, 1)
+
+        results = run_quality_checks(ALL_TOOLS, tmp_path, fail_fast=False)
+
+        assert results["pytest"]["passed"] is True
+        assert results["ruff"]["passed"] is False
+
+    def test_missing_tool(self, commands, tmp_path):
+        commands["mypy"] = ["definitely-not-a-real-tool-177"]
+
+        results = run_quality_checks(ALL_TOOLS, tmp_path)
+
+        assert results["mypy"]["error"] == "mypy command not found (not installed)"
+
+    def test_durations_recorded_for_timing_row(self, commands, tmp_path):
+        commands["pytest"] = _sleep_then(0.1)
+        recorded = {}
+
+        class Timer:
+            def add_counters(self, group, counters):
+                recorded[group] = counters
+
+        run_quality_checks(ALL_TOOLS, tmp_path)
+        stop_quality_gate._record_check_durations(Timer())
+
+        assert set(recorded["quality_checks"]) == {"pytest_ms"}
+        assert recorded["quality_checks"]["pytest_ms"] >= 100
+
+
+class TestImpactTargets:
+    def test_targets_appended_to_pytest_command(self, commands, tmp_path):
+        commands["pytest"] = _py("import sys; print(sys.argv[1:])")
+
+        results = run_quality_checks(
+            {"pytest": ALL_TOOLS["pytest"]}, tmp_path, pytest_targets=["tests/test_a.py::test_x"]
+        )
+
+        assert "tests/test_a.py::test_x" in results["pytest"]["stdout"]
+
+    def test_no_impacted_tests_skips_pytest_run(self, commands, tmp_path):
+        commands["pytest"] = _py("import sys; sys.exit(1)")
+
+        results = run_quality_checks({"pytest": ALL_TOOLS["pytest"]}, tmp_path, pytest_targets=[])
+
+        assert results["pytest"]["passed"] is True
+        assert "No tests touch the changed code" in results["pytest"]["stdout"]
+
+    def test_full_suite_selection_runs_everything(self, tmp_path):
+        class Full:
+            full_suite = True
+
+        with patch.object(stop_quality_gate, "_select_impacted_tests", lambda cwd: Full()):
+            assert stop_quality_gate.select_pytest_targets(tmp_path) is None
+
+
+class TestCachedVerdict:
+    def test_cached_failure_keeps_output_tail(self, commands, tmp_path):
+        commands["pytest"] = _py(
+            "import sys; print('collected 900 items'); print('.' * 20000);"
+            "print('FAILED tests/test_a.py::test_x - assert 1 == 2'); sys.exit(1)"
+        )
+        stored = {}
+
+        class FakeCache:
+            @classmethod
+            def for_project(cls, root):
+                return cls()
+
+            def key_for(self, command, cwd=None):
+                return "key"
+
+            def get(self, key, consumer=None):
+                return None
+
+            def put(self, key, passed, returncode, summary=None, duration_seconds=0.0):
+                stored.update(summary)
+
+        with patch.object(stop_quality_gate, "_TestResultCache", FakeCache):
+            run_quality_checks({"pytest": ALL_TOOLS["pytest"]}, tmp_path)
+
+        assert len(stored["stdout"]) == stop_quality_gate._OUTPUT_TAIL_CHARS
+        assert "FAILED tests/test_a.py::test_x" in stored["stdout"]
+        assert "collected 900 items" not in stored["stdout"]
+
+
+class TestFormatUnchanged:
+    def test_duration_key_not_rendered(self):
+        results = {
+            "pytest": {"ran": True, "passed": True, "returncode": 0, "duration_ms": 12.0},
+            "ruff": {"ran": True, "passed": False, "returncode": 1, "stdout": "E501", "stderr": ""},
+            "mypy": {"ran": False, "passed": None},
+        }
+
+        output = format_results(results)
+
+        assert "✅ pytest: passed" in output
+        assert "❌ ruff: failed (exit code 1)" in output
+        assert "   Output: E501" in output
+        assert "⚠️  mypy: skipped (not configured)" in output
+        assert "duration" not in output
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Unit tests for agent_pool (work-stealing scheduler, futures, asyncio facade).
+
+The agent call (``agent_pool.Task``) is replaced by a controllable fake so
+the tests can hold workers busy and observe scheduling order.
+"""
+
+import asyncio
+import concurrent.futures
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import agent_pool  # noqa: E402
+from agent_pool import AgentPool, AgentResult, PriorityLevel, TaskHandle  # noqa: E402
+from pool_config import PoolConfig  # noqa: E402
+
+
+class FakeTask:
+    """Stand-in for the Task tool: records calls, blocks ``block-*`` agents."""
+
+    calls = []
+    gates = {}
+    lock = threading.Lock()
+
+    def __init__(self, agent_type=None, **kwargs):
+        gate = FakeTask.gates.get(agent_type)
+        if gate is not None:
+            gate.wait(timeout=10)
+        with FakeTask.lock:
+            FakeTask.calls.append(agent_type)
+        if agent_type == "fails":
+            raise RuntimeError("boom")
+        self.success = True
+        self.output = f"ok {agent_type}"
+        self.metadata = {"tokens_used": 10}
+
+
+@pytest.fixture
+def pool():
+    FakeTask.calls = []
+    FakeTask.gates = {}
+    with patch.object(agent_pool, "Task", FakeTask):
+        p = AgentPool(PoolConfig(max_agents=3, token_budget=10_000_000))
+        yield p
+        for gate in FakeTask.gates.values():
+            gate.set()
+        p.shutdown()
+
+
+def _block(pool, names):
+    """Occupy one worker per name until the returned events are set."""
+    events = {}
+    handles = []
+    for name in names:
+        events[name] = FakeTask.gates[name] = threading.Event()
+        handles.append(pool.submit_task(name, "hold", PriorityLevel.P1_SECURITY))
+    deadline = time.time() + 5
+    while pool.get_pool_status().active_tasks < len(names) and time.time() < deadline:
+        time.sleep(0.005)
+    return events, handles
+
+
+class TestHandles:
+    def test_handle_is_future(self, pool):
+        handle = pool.submit_task("researcher", "p", PriorityLevel.P3_DOCS)
+
+        assert isinstance(handle, TaskHandle)
+        assert isinstance(handle, concurrent.futures.Future)
+        assert handle.priority is PriorityLevel.P3_DOCS
+        result = handle.result(timeout=5)
+        assert isinstance(result, AgentResult)
+        assert result.task_id == handle.task_id
+
+    def test_await_all_in_handle_order(self, pool):
+        handles = [pool.submit_task(f"agent-{i}", "p", PriorityLevel.P2_TESTS) for i in range(20)]
+
+        results = pool.await_all(handles, timeout=10)
+
+        assert [r.task_id for r in results] == [h.task_id for h in handles]
+        assert all(r.success for r in results)
+        assert pool.get_pool_status().completed_tasks == 20
+
+    def test_failure_becomes_failed_result(self, pool):
+        handle = pool.submit_task("fails", "p", PriorityLevel.P2_TESTS)
+
+        (result,) = pool.await_all([handle], timeout=5)
+
+        assert result.success is False
+        assert "boom" in result.output
+
+    def test_await_all_timeout(self, pool):
+        events, handles = _block(pool, ["block-a"])
+
+        with pytest.raises(TimeoutError):
+            pool.await_all(handles, timeout=0.05)
+        events["block-a"].set()
+
+    def test_await_returns_on_completion_not_poll_tick(self, pool):
+        events, handles = _block(pool, ["block-a"])
+        finished = []
+        handles[0].add_done_callback(lambda _f: finished.append(time.perf_counter()))
+        threading.Timer(0.02, events["block-a"].set).start()
+
+        pool.await_all(handles, timeout=5)
+
+        assert time.perf_counter() - finished[0] < 0.05
+
+
+class TestScheduling:
+    def test_priority_order_across_pool(self, pool):
+        events, _ = _block(pool, ["block-a", "block-b", "block-c"])
+        low = [pool.submit_task(f"low-{i}", "p", PriorityLevel.P4_OPTIONAL) for i in range(3)]
+        high = [pool.submit_task(f"high-{i}", "p", PriorityLevel.P1_SECURITY) for i in range(3)]
+
+        # Free a single worker so the queue drains serially.
+        events["block-a"].set()
+        pool.await_all(high + low, timeout=10)
+
+        order = [c for c in FakeTask.calls if c.startswith(("low", "high"))]
+        assert order[:3] == ["high-0", "high-1", "high-2"]
+
+    def test_idle_worker_steals(self, pool):
+        events, _ = _block(pool, ["block-a", "block-b"])
+        handles = [pool.submit_task(f"agent-{i}", "p", PriorityLevel.P2_TESTS) for i in range(9)]
+
+        results = pool.await_all(handles, timeout=10)
+
+        assert all(r.success for r in results)
+        assert pool.get_steal_count() > 0
+
+    def test_cancel_queued_task(self, pool):
+        events, _ = _block(pool, ["block-a", "block-b", "block-c"])
+        handle = pool.submit_task("never", "p", PriorityLevel.P2_TESTS)
+
+        assert handle.cancel() is True
+        for event in events.values():
+            event.set()
+        (result,) = pool.await_all([handle], timeout=5)
+
+        assert result.success is False
+        assert result.output.startswith("Cancelled")
+        assert "never" not in FakeTask.calls
+
+    def test_shutdown_cancels_pending_and_rejects_new(self, pool):
+        events, _ = _block(pool, ["block-a", "block-b", "block-c"])
+        pending = pool.submit_task("pending", "p", PriorityLevel.P2_TESTS)
+        threading.Timer(0.05, lambda: [e.set() for e in events.values()]).start()
+
+        pool.shutdown()
+
+        assert pending.cancelled()
+        assert pool.get_pool_status().queued_tasks == 0
+        with pytest.raises(RuntimeError, match="shut down"):
+            pool.submit_task("late", "p", PriorityLevel.P2_TESTS)
+
+
+class TestAsyncFacade:
+    def test_async_submit_and_await(self, pool):
+        async def run():
+            handle = await pool.asubmit_task("planner", "p", PriorityLevel.P1_SECURITY)
+            single = await handle
+            results = await pool.aawait_all([handle], timeout=5)
+            return handle, single, results
+
+        handle, single, results = asyncio.run(run())
+
+        assert single.task_id == handle.task_id
+        assert results == [single]
+
+    def test_async_timeout(self, pool):
+        events, handles = _block(pool, ["block-a"])
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(pool.aawait_all(handles, timeout=0.05))
+        events["block-a"].set()
+
+
+class TestValidation:
+    def test_rejects_path_traversal_agent_type(self, pool):
+        with pytest.raises(ValueError, match="Invalid agent_type"):
+            pool.submit_task("../etc", "p", PriorityLevel.P2_TESTS)
+
+    def test_rejects_oversized_prompt(self, pool):
+        with pytest.raises(ValueError, match="maximum size"):
+            pool.submit_task("researcher", "x" * (AgentPool.MAX_PROMPT_SIZE + 1), PriorityLevel.P2_TESTS)
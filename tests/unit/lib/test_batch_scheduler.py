@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Unit tests for batch_scheduler (DAG-scheduled parallel batch execution).
+
+Features run in pooled worktrees of a throwaway git repository; completions
+go through batch_git_finalize and update_batch_progress for real.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+from batch_scheduler import BatchScheduler, critical_path_lengths  # noqa: E402
+from batch_state_manager import create_batch_state, load_batch_state, save_batch_state  # noqa: E402
+from feature_dependency_analyzer import CircularDependencyError  # noqa: E402
+from worktree_manager import WorktreePool  # noqa: E402
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "--initial-branch=master")
+    _git(root, "config", "user.email", "t@example.com")
+    _git(root, "config", "user.name", "t")
+    _git(root, "config", "commit.gpgsign", "false")
+    (root / ".gitignore").write_text(".claude/\n.worktrees/\n")
+    (root / "README.md").write_text("base\n")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "init")
+    (root / ".claude").mkdir()
+    return root
+
+
+def _state_file(repo: Path, features, deps) -> Path:
+    state_file = repo / ".claude" / "batch_state.json"
+    state = create_batch_state(features=features, state_file=str(state_file), batch_id="batch-test")
+    state.feature_dependencies = deps
+    state.feature_order = list(range(len(features)))
+    save_batch_state(state_file, state)
+    return state_file
+
+
+class Recorder:
+    """Feature runner that writes one file per feature and tracks overlap."""
+
+    def __init__(self, delay=0.0, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.seen_files = {}
+
+    def __call__(self, index, feature, worktree):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            self.seen_files[index] = sorted(p.name for p in worktree.glob("f*.txt"))
+            time.sleep(self.delay)
+            if index in self.fail:
+                return {"success": False, "error": "boom"}
+            (worktree / f"f{index}.txt").write_text(feature)
+            return {"success": True, "context_token_delta": 10}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestCriticalPath:
+    def test_chain_lengths(self):
+        lengths = critical_path_lengths({2: [0], 3: [2]}, range(4))
+        assert lengths == {0: 3.0, 1: 1.0, 2: 2.0, 3: 1.0}
+
+    def test_weights(self):
+        lengths = critical_path_lengths({1: [0]}, range(3), weights={0: 2.0, 1: 5.0, 2: 4.0})
+        assert lengths[0] == 7.0 and lengths[2] == 4.0
+
+    def test_cycle_raises(self):
+        with pytest.raises(CircularDependencyError):
+            critical_path_lengths({0: [1], 1: [0]}, range(2))
+
+
+class TestScheduler:
+    def test_dependencies_merged_before_dependents_start(self, repo):
+        state_file = _state_file(repo, ["a", "b", "c", "d"], {2: [0], 3: [2]})
+        runner = Recorder(delay=0.1)
+        pool = WorktreePool(size=2, base_branch="master", repo_root=repo)
+        result = BatchScheduler(state_file, runner, width=2, pool=pool).run()
+
+        assert sorted(result.completed) == [0, 1, 2, 3]
+        assert result.started[:2] == [0, 1]  # longest chain first
+        assert "f0.txt" in runner.seen_files[2]
+        assert {"f0.txt", "f2.txt"} <= set(runner.seen_files[3])
+        for n in range(4):
+            assert (repo / f"f{n}.txt").exists()  # merged into master
+
+        state = load_batch_state(state_file)
+        assert sorted(state.completed_features) == [0, 1, 2, 3]
+        assert state.status == "completed"
+        assert state.context_token_estimate == 40
+        assert all(info["state"] == "idle" for info in pool.slots().values())
+
+    def test_independent_features_run_concurrently(self, repo):
+        state_file = _state_file(repo, ["a", "b", "c", "d"], {})
+        runner = Recorder(delay=0.3)
+        start = time.monotonic()
+        result = BatchScheduler(state_file, runner, width=4, finalize=False,
+                                pool=WorktreePool(size=4, repo_root=repo)).run()
+        elapsed = time.monotonic() - start
+        assert runner.peak == 4
+        assert result.max_concurrency == 4
+        assert elapsed < 4 * 0.3 + 1.0
+
+    def test_failure_skips_transitive_dependents(self, repo):
+        state_file = _state_file(repo, ["a", "b", "c", "d"], {1: [0], 2: [1]})
+        runner = Recorder(fail={0})
+        result = BatchScheduler(state_file, runner, width=2, finalize=False,
+                                pool=WorktreePool(size=2, repo_root=repo)).run()
+        assert result.failed == [0]
+        assert sorted(result.skipped) == [1, 2]
+        assert result.completed == [3]
+        state = load_batch_state(state_file)
+        assert {s["feature_index"] for s in state.skipped_features} == {1, 2}
+        assert all(s["category"] == "dependency" for s in state.skipped_features)
+
+    def test_resume_skips_finished_features(self, repo):
+        state_file = _state_file(repo, ["a", "b", "c"], {1: [0]})
+        state = load_batch_state(state_file)
+        state.completed_features = [0]
+        save_batch_state(state_file, state)
+        runner = Recorder()
+        scheduler = BatchScheduler(state_file, runner, width=2, finalize=False,
+                                   pool=WorktreePool(size=2, repo_root=repo))
+        assert scheduler.ready_features() == [1, 2]
+        result = scheduler.run()
+        assert sorted(result.started) == [1, 2]
+
+    def test_out_of_order_completion_does_not_finish_batch_early(self, repo):
+        from batch_state_manager import update_batch_progress
+
+        state_file = _state_file(repo, ["a", "b"], {})
+        update_batch_progress(state_file, 1, "completed")
+        assert load_batch_state(state_file).status != "completed"
+        update_batch_progress(state_file, 0, "completed")
+        assert load_batch_state(state_file).status == "completed"
+
+    def test_skipping_last_pending_feature_finishes_batch(self, repo):
+        from batch_state_manager import mark_feature_skipped, update_batch_progress
+
+        # A sibling completes before the failed feature's dependent is skipped
+        state_file = _state_file(repo, ["a", "b", "c"], {1: [0]})
+        update_batch_progress(state_file, 0, "failed", error_message="boom")
+        update_batch_progress(state_file, 2, "completed")
+        assert load_batch_state(state_file).status != "completed"
+        mark_feature_skipped(state_file, 1, "Dependency feature 0 did not complete", category="dependency")
+        assert load_batch_state(state_file).status == "completed"
+
+    def test_lease_failure_is_recorded_in_state(self, repo):
+        class FailingPool(WorktreePool):
+            def lease(self, feature_name, base_branch=None):
+                if feature_name.endswith("-f0"):
+                    return False, "no free slot"
+                return super().lease(feature_name, base_branch)
+
+        state_file = _state_file(repo, ["a", "b", "c"], {1: [0]})
+        result = BatchScheduler(state_file, Recorder(), width=2, finalize=False,
+                                pool=FailingPool(size=2, repo_root=repo)).run()
+        assert result.failed == [0]
+        assert result.skipped == [1]
+        assert "worktree lease failed" in result.runs[0].error
+
+        state = load_batch_state(state_file)
+        assert [f["feature_index"] for f in state.failed_features] == [0]
+        assert "no free slot" in state.failed_features[0]["error_message"]
+        assert state.status == "completed"
+        assert BatchScheduler(state_file, Recorder(), pool=FailingPool(size=1, repo_root=repo)).ready_features() == []
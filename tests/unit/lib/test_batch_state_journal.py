@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Unit tests for the batch_state_manager progress journal.
+
+update_batch_progress() and increment_retry_count() append one fsynced line
+per event; load_batch_state() replays the journal over the JSON snapshot and
+compact_batch_journal() folds it back in.
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import batch_state_manager as bsm  # noqa: E402
+from batch_state_manager import (  # noqa: E402
+    BatchStateError,
+    cleanup_batch_state,
+    compact_batch_journal,
+    create_batch_state,
+    increment_retry_count,
+    load_batch_state,
+    save_batch_state,
+    update_batch_progress,
+)
+
+FEATURES = 100  # above JOURNAL_COMPACT_EVERY, so updates journal instead of rewriting
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    path = tmp_path / ".claude" / "batch_state.json"
+    state = create_batch_state(features=[f"feature {i}" for i in range(FEATURES)],
+                               state_file=str(path), batch_id="batch-journal")
+    save_batch_state(path, state)
+    return path
+
+
+def _journal(state_file: Path):
+    return [json.loads(line) for line in (state_file.parent / "batch_state.json.journal").read_text().splitlines()]
+
+
+class TestJournal:
+    def test_progress_appends_without_rewriting_snapshot(self, state_file):
+        snapshot = state_file.read_bytes()
+        update_batch_progress(state_file, 0, "completed", context_token_delta=500)
+        update_batch_progress(state_file, 1, "failed", error_message="tests failed")
+        assert state_file.read_bytes() == snapshot
+        events = _journal(state_file)
+        assert [e["seq"] for e in events] == [1, 2]
+        assert events[1]["error_message"] == "tests failed"
+
+        state = load_batch_state(state_file)
+        assert state.completed_features == [0]
+        assert state.failed_features[0]["feature_index"] == 1
+        assert state.context_token_estimate == 500
+        assert state.current_index == 2
+        assert state.journal_seq == 2
+
+    def test_snapshot_is_not_reparsed_per_update(self, state_file):
+        update_batch_progress(state_file, 0, "completed")
+        with patch.object(bsm.json, "load", side_effect=AssertionError("snapshot reparsed")):
+            for i in range(1, 5):
+                update_batch_progress(state_file, i, "completed")
+
+    def test_retry_counts_replay(self, state_file):
+        increment_retry_count(state_file, 3)
+        increment_retry_count(state_file, 3)
+        assert load_batch_state(state_file).retry_attempts == {3: 2}
+
+    def test_compaction_folds_events_and_keeps_numbering(self, state_file):
+        for i in range(3):
+            update_batch_progress(state_file, i, "completed")
+        compact_batch_journal(state_file)
+        data = json.loads(state_file.read_text())
+        assert data["completed_features"] == [0, 1, 2]
+        assert data["journal_seq"] == 3
+        assert _journal(state_file) == [{"seq": 3, "op": "compacted"}]
+
+        update_batch_progress(state_file, 3, "completed")
+        assert _journal(state_file)[-1]["seq"] == 4
+        assert load_batch_state(state_file).completed_features == [0, 1, 2, 3]
+
+    def test_automatic_compaction_threshold(self, state_file):
+        for i in range(bsm.JOURNAL_COMPACT_EVERY):
+            update_batch_progress(state_file, i, "completed")
+        data = json.loads(state_file.read_text())
+        assert len(data["completed_features"]) == bsm.JOURNAL_COMPACT_EVERY
+        assert len(_journal(state_file)) == 1
+
+    def test_crash_between_snapshot_and_journal_rewrite_is_idempotent(self, state_file):
+        update_batch_progress(state_file, 0, "completed", context_token_delta=100)
+        state = load_batch_state(state_file)
+        save_batch_state(state_file, state)  # snapshot written, journal not yet truncated
+        reloaded = load_batch_state(state_file)
+        assert reloaded.context_token_estimate == 100
+        assert reloaded.completed_features == [0]
+
+    def test_torn_last_line_ignored(self, state_file):
+        update_batch_progress(state_file, 0, "completed")
+        with open(state_file.parent / "batch_state.json.journal", "a") as f:
+            f.write('{"seq": 2, "op": "progr')
+        assert load_batch_state(state_file).completed_features == [0]
+
+    def test_stale_journal_from_previous_batch_ignored(self, state_file, tmp_path):
+        update_batch_progress(state_file, 0, "completed")
+        fresh = create_batch_state(features=["a"] * FEATURES, state_file=str(state_file), batch_id="batch-other")
+        save_batch_state(state_file, fresh)
+        assert load_batch_state(state_file).completed_features == []
+        update_batch_progress(state_file, 5, "completed")
+        assert load_batch_state(state_file).completed_features == [5]
+
+    def test_small_batch_snapshot_stays_current(self, tmp_path):
+        path = tmp_path / "small.json"
+        save_batch_state(path, create_batch_state(features=["a", "b"], state_file=str(path)))
+        update_batch_progress(path, 0, "completed")
+        assert json.loads(path.read_text())["completed_features"] == [0]
+
+    def test_validation_errors(self, state_file, tmp_path):
+        with pytest.raises(BatchStateError):
+            update_batch_progress(state_file, FEATURES, "completed")
+        with pytest.raises(ValueError):
+            update_batch_progress(state_file, 0, "paused")
+        with pytest.raises(BatchStateError):
+            update_batch_progress(tmp_path / "missing.json", 0, "completed")
+
+    def test_concurrent_updates_all_recorded(self, state_file):
+        threads = [threading.Thread(target=update_batch_progress, args=(state_file, i, "completed"))
+                   for i in range(FEATURES)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        state = load_batch_state(state_file)
+        assert sorted(state.completed_features) == list(range(FEATURES))
+        assert state.status == "completed"
+
+    def test_cleanup_removes_journal(self, state_file):
+        update_batch_progress(state_file, 0, "completed")
+        cleanup_batch_state(state_file)
+        assert not state_file.exists()
+        assert not (state_file.parent / "batch_state.json.journal").exists()
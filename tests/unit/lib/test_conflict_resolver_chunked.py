@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Unit tests for conflict_resolver windowed chunk resolution.
+
+Large files are resolved one conflict window at a time through a local fake
+messages client: windows carry only nearby context, run concurrently, are
+cached by (ours, theirs, base) and are spliced back into the file.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import conflict_resolver  # noqa: E402
+from conflict_resolver import (  # noqa: E402
+    _build_conflict_windows,
+    _resolve_chunked_file,
+    clear_resolution_cache,
+    parse_conflict_markers,
+)
+
+
+def _conflict(n: int, ours: str = None, theirs: str = None) -> str:
+    return (
+        "<<<<<<< HEAD\n"
+        f"    value = {ours or f'ours_{n}'}\n"
+        "=======\n"
+        f"    value = {theirs or f'theirs_{n}'}\n"
+        ">>>>>>> feature\n"
+    )
+
+
+def _large_file(conflicts) -> str:
+    parts = []
+    for n, block in enumerate(conflicts):
+        parts.append("".join(f"filler {n}.{i}\n" for i in range(400)))
+        parts.append(block)
+    parts.append("tail\n")
+    return "".join(parts)
+
+
+class FakeClient:
+    """Messages client that resolves to the 'theirs' line and records calls."""
+
+    def __init__(self, delay: float = 0.0, confidence: float = 0.9, fail_on: str = None):
+        self.delay = delay
+        self.confidence = confidence
+        self.fail_on = fail_on
+        self.prompts = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, model, max_tokens, messages):
+        prompt = messages[0]["content"]
+        with self.lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and self.fail_on in prompt:
+                raise RuntimeError("API error")
+            theirs = prompt.split("**Theirs (Merging Branch)**:\n```\n", 1)[1].split("\n```", 1)[0]
+            text = json.dumps({
+                "resolved_content": theirs,
+                "confidence": self.confidence,
+                "reasoning": "took theirs",
+            })
+            return SimpleNamespace(content=[SimpleNamespace(text=text)])
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_resolution_cache()
+    yield
+    clear_resolution_cache()
+
+
+def _resolve(content: str, client: FakeClient, **kwargs):
+    conflicts = parse_conflict_markers(content=content, file_path="big.py")
+    return _resolve_chunked_file("big.py", content, conflicts, "test-key", ["chunked"], client=client, **kwargs)
+
+
+class TestWindows:
+    def test_context_is_local_and_clipped_at_neighbours(self):
+        content = "a\n" * 50 + _conflict(0) + "b\n" * 3 + _conflict(1) + "c\n" * 50
+        lines = content.splitlines(keepends=True)
+        windows = _build_conflict_windows(lines, parse_conflict_markers(content=content), context_lines=10)
+        assert len(windows) == 2
+        assert windows[0].before == "a\n" * 10
+        assert windows[0].after == "b\n" * 3  # stops before the next conflict
+        assert windows[1].before == "b\n" * 3
+        assert windows[1].after == "c\n" * 10
+        assert windows[0].key != windows[1].key
+
+
+class TestChunkedResolution:
+    def test_splices_each_resolution_into_the_file(self):
+        content = _large_file([_conflict(n) for n in range(3)])
+        suggestion = _resolve(content, FakeClient())
+
+        resolved = suggestion.resolved_content
+        assert "<<<<<<<" not in resolved and ">>>>>>>" not in resolved
+        for n in range(3):
+            assert f"    value = theirs_{n}\n" in resolved
+            assert f"ours_{n}" not in resolved
+        expected = content
+        for n in range(3):
+            expected = expected.replace(_conflict(n), f"    value = theirs_{n}\n")
+        assert resolved == expected
+        assert suggestion.tier_used == 3
+        assert suggestion.warnings[0] == "chunked"
+
+    def test_prompts_carry_one_conflict_not_the_whole_file(self):
+        content = _large_file([_conflict(n) for n in range(3)])
+        client = FakeClient()
+        _resolve(content, client)
+        assert len(client.prompts) == 3
+        for prompt in client.prompts:
+            assert prompt.count("<<<<<<<") == 0  # markers are stripped into sections
+            assert len(prompt) < len(content) / 4
+
+    def test_windows_run_concurrently_with_bounded_width(self):
+        content = _large_file([_conflict(n) for n in range(6)])
+        client = FakeClient(delay=0.2)
+        start = time.monotonic()
+        _resolve(content, client, max_workers=3)
+        elapsed = time.monotonic() - start
+        assert client.peak == 3
+        assert elapsed < 6 * 0.2
+
+    def test_identical_conflicts_are_resolved_once_and_cached(self):
+        content = _large_file([_conflict(0, "x", "y"), _conflict(1, "x", "y"), _conflict(2)])
+        client = FakeClient()
+        first = _resolve(content, client)
+        assert len(client.prompts) == 2
+        assert first.resolved_content.count("    value = y\n") == 2
+
+        second = _resolve(content, client)
+        assert len(client.prompts) == 2  # everything served from the cache
+        assert second.resolved_content == first.resolved_content
+        assert "3 from cache" in second.reasoning
+
+    def test_lowest_window_confidence_wins(self):
+        content = _large_file([_conflict(0), _conflict(1)])
+        client = FakeClient(confidence=0.9)
+        conflict_resolver._store_resolution(
+            conflict_resolver._resolution_key(parse_conflict_markers(content=content)[1]),
+            ("    value = manual", 0.4, "cached", ["unsure"]),
+        )
+        suggestion = _resolve(content, client)
+        assert suggestion.confidence == 0.4
+        assert any("unsure" in w for w in suggestion.warnings)
+
+    def test_window_failure_raises_and_is_not_cached(self):
+        content = _large_file([_conflict(0), _conflict(1)])
+        with pytest.raises(RuntimeError):
+            _resolve(content, FakeClient(fail_on="theirs_1"))
+        client = FakeClient()
+        _resolve(content, client)
+        assert len(client.prompts) == 1  # window 0 was cached, window 1 retried
+        assert "theirs_1" in client.prompts[0]
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -13,8 +15,10 @@ REPO_ROOT = Path(__file__).resolve().parents[3]
 LIB_DIR = REPO_ROOT / "plugins" / "autonomous-dev" / "lib"
 sys.path.insert(0, str(LIB_DIR))
 
+import covers_index  # noqa: E402
 from covers_index import (
     build_covers_index,
+    build_covers_index_cached,
     get_affected_docs,
     load_covers_index,
     save_covers_index,
@@ -120,6 +124,69 @@ class TestBuildCoversIndex:
         assert len(index) > 0
 
 
+def _age(path: Path, seconds: int = 60) -> None:
+    """Push mtime out of the racy window so the cache may trust it."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+class TestBuildCoversIndexCached:
+    """Tests for build_covers_index_cached (incremental re-parse)."""
+
+    def _docs(self, tmp_path: Path) -> Path:
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        for n in range(3):
+            doc = docs_dir / f"D{n}.md"
+            doc.write_text(f"---\ncovers:\n  - src/{n}/\n  - src/shared/\n---\n# D{n}\n")
+            _age(doc)
+        return docs_dir
+
+    def test_matches_uncached_build(self, tmp_path: Path) -> None:
+        docs_dir = self._docs(tmp_path)
+        cache = tmp_path / "cache" / "covers.json"
+        assert build_covers_index_cached(docs_dir, cache) == build_covers_index(docs_dir)
+        assert build_covers_index_cached(docs_dir, cache) == build_covers_index(docs_dir)
+        assert cache.exists()
+
+    def test_only_changed_docs_are_parsed(self, tmp_path: Path, monkeypatch) -> None:
+        docs_dir = self._docs(tmp_path)
+        cache = tmp_path / "covers.json"
+        build_covers_index_cached(docs_dir, cache)
+
+        parsed = []
+        real = covers_index._parse_covers
+        monkeypatch.setattr(covers_index, "_parse_covers", lambda c: parsed.append(c) or real(c))
+        build_covers_index_cached(docs_dir, cache)
+        assert parsed == []
+
+        (docs_dir / "D1.md").write_text("---\ncovers:\n  - src/new.py\n---\n")
+        (docs_dir / "D2.md").unlink()
+        index = build_covers_index_cached(docs_dir, cache)
+        assert len(parsed) == 1
+        assert index == build_covers_index(docs_dir)
+        assert index["src/shared/"] == ["docs/D0.md"]
+
+    def test_same_size_edit_within_racy_window_is_seen(self, tmp_path: Path) -> None:
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        doc = docs_dir / "A.md"
+        doc.write_text("---\ncovers:\n  - src/aaa/\n---\n")
+        cache = tmp_path / "covers.json"
+        build_covers_index_cached(docs_dir, cache)
+        stat = doc.stat()
+        doc.write_text("---\ncovers:\n  - src/bbb/\n---\n")
+        os.utime(doc, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # same size and mtime
+        assert list(build_covers_index_cached(docs_dir, cache)) == ["src/bbb/"]
+
+    def test_corrupt_cache_is_rebuilt(self, tmp_path: Path) -> None:
+        docs_dir = self._docs(tmp_path)
+        cache = tmp_path / "covers.json"
+        cache.write_text("{not json")
+        assert build_covers_index_cached(docs_dir, cache) == build_covers_index(docs_dir)
+        assert json.loads(cache.read_text())["version"] == covers_index.COVERS_CACHE_VERSION
+
+
 class TestGetAffectedDocs:
     """Tests for get_affected_docs function."""
 
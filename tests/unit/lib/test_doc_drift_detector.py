@@ -6,7 +6,9 @@ using fully synthetic in-memory fixtures via tmp_path.
 
 from __future__ import annotations
 
+import os
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -16,6 +18,7 @@ _LIB_DIR = Path(__file__).resolve().parents[3] / "plugins/autonomous-dev/lib"
 if str(_LIB_DIR) not in sys.path:
     sys.path.insert(0, str(_LIB_DIR))
 
+import doc_drift_detector  # noqa: E402
 from doc_drift_detector import DocDriftFinding, detect_doc_drift
 
 
@@ -250,3 +253,74 @@ def test_enumeration_match_no_finding(tmp_path: Path) -> None:
     findings = detect_doc_drift(tmp_path)
     enum_findings = [f for f in findings if f.drift_type == "enumeration_drift"]
     assert enum_findings == []
+
+
+# ---------------------------------------------------------------------------
+# Incremental sweep cache tests
+# ---------------------------------------------------------------------------
+
+
+def _age_tree(root: Path, seconds: int = 60) -> None:
+    """Push every mtime out of the racy window so listings get persisted."""
+    past = time.time() - seconds
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, (past, past))
+
+
+def _overlap_repo(tmp_path: Path) -> Path:
+    lib_dir = tmp_path / "plugins/autonomous-dev/lib"
+    for sub in ("a", "b", "archived", "__pycache__"):
+        (lib_dir / sub).mkdir(parents=True)
+        (lib_dir / sub / f"{sub}_mod.py").write_text("")
+    (lib_dir / "top.py").write_text("")
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    for name in ("LIBRARIES.md", "ARCH.md"):
+        (docs_dir / name).write_text(
+            "---\ncovers:\n  - plugins/autonomous-dev/lib/\n  - plugins/autonomous-dev/lib/a/\n---\n"
+            "# Lib\n\nThere are 9 libraries.\n"
+        )
+    _age_tree(tmp_path)
+    return tmp_path
+
+
+def test_cached_sweep_matches_uncached(tmp_path: Path) -> None:
+    """Cold, warm and uncached sweeps produce identical findings."""
+    _overlap_repo(tmp_path)
+    uncached = detect_doc_drift(tmp_path, use_cache=False)
+    assert detect_doc_drift(tmp_path) == uncached
+    assert detect_doc_drift(tmp_path) == uncached
+    # lib/ (3 countable) + lib/a/ (1) → archived/ and __pycache__/ excluded
+    assert "actual 4" in uncached[0].description
+    assert (tmp_path / doc_drift_detector.DIR_CACHE_RELPATH).exists()
+
+
+def test_warm_sweep_scans_only_changed_directories(tmp_path: Path, monkeypatch) -> None:
+    """Unchanged directories are served from the cache; a touched one is re-listed."""
+    root = _overlap_repo(tmp_path)
+    detect_doc_drift(root)
+
+    scanned = []
+    real = doc_drift_detector._scan_directory
+    monkeypatch.setattr(
+        doc_drift_detector, "_scan_directory", lambda d: scanned.append(d) or real(d)
+    )
+    detect_doc_drift(root)
+    assert scanned == []
+
+    (root / "plugins/autonomous-dev/lib/b/new_mod.py").write_text("")
+    findings = detect_doc_drift(root)
+    assert scanned == [root / "plugins/autonomous-dev/lib/b"]
+    assert "actual 5" in findings[0].description
+
+
+def test_overlapping_covers_walk_each_directory_once(tmp_path: Path, monkeypatch) -> None:
+    """Two docs covering the same trees share one listing per directory."""
+    root = _overlap_repo(tmp_path)
+    scanned = []
+    real = doc_drift_detector._scan_directory
+    monkeypatch.setattr(
+        doc_drift_detector, "_scan_directory", lambda d: scanned.append(d) or real(d)
+    )
+    detect_doc_drift(root, use_cache=False)
+    assert len(scanned) == len(set(scanned)) == 3  # lib/, lib/a/, lib/b/
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Tests for the DrainHistory offset index and tail readers.
+
+The JSONL log stays the source of truth: the SQLite index is caught up
+incrementally, rebuilt when the log is replaced or rewritten, and bypassed
+when it cannot be opened.
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+_LIB = Path(__file__).resolve().parents[3] / "plugins" / "autonomous-dev" / "lib"
+if str(_LIB) not in sys.path:
+    sys.path.insert(0, str(_LIB))
+
+import drain_queue_state  # noqa: E402
+from drain_queue_state import (  # noqa: E402
+    DrainHistory,
+    _history_index_path,
+    _history_path,
+)
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _at(hours: int) -> str:
+    return (T0 + timedelta(hours=hours)).isoformat()
+
+
+@pytest.fixture
+def history(tmp_path):
+    h = DrainHistory.load(tmp_path)
+    for n in range(30):
+        h.append({
+            "cluster_id": f"c#{n}",
+            "outcome": "success" if n % 3 else "failure",
+            "revert_status": "pending" if n % 5 == 1 else "not_needed",
+            "timestamp": _at(n),
+        })
+    return h
+
+
+def _filtered(records, **match):
+    return [r for r in records if all(r.get(k) == v for k, v in match.items())]
+
+
+class TestQuery:
+    def test_pending_reverts_match_full_scan(self, history):
+        expected = _filtered(history.read_all(), outcome="success", revert_status="pending")
+        assert DrainHistory.latest_pending_reverts(history.repo_root) == expected
+        assert len(expected) == 4
+        assert _history_index_path(history.repo_root).exists()
+
+    def test_since_accepts_datetime_and_z_suffix(self, history):
+        by_dt = history.since(T0 + timedelta(hours=25))
+        by_str = history.since("2026-01-02T01:00:00Z")
+        assert [r["cluster_id"] for r in by_dt] == [f"c#{n}" for n in range(25, 30)]
+        assert by_str == by_dt
+        with pytest.raises(ValueError):
+            history.since("yesterday")
+
+    def test_newest_first_with_limit(self, history):
+        latest = history.query(outcome="failure", newest_first=True, limit=2)
+        assert [r["cluster_id"] for r in latest] == ["c#27", "c#24"]
+
+    def test_appends_after_sync_are_picked_up(self, history):
+        assert len(history.query(outcome="blocked")) == 0
+        history.append({"outcome": "blocked", "cluster_id": "new"})
+        assert [r["cluster_id"] for r in history.query(outcome="blocked")] == ["new"]
+
+
+class TestIndexMaintenance:
+    def test_only_new_bytes_are_parsed(self, history, monkeypatch):
+        history.query()
+        history.append({"outcome": "success", "cluster_id": "tail"})
+        decoded = []
+        real = drain_queue_state._decode_history_line
+        monkeypatch.setattr(
+            drain_queue_state, "_decode_history_line",
+            lambda raw: decoded.append(raw) or real(raw),
+        )
+        history.query(outcome="blocked")
+        assert len(decoded) == 1 and b"tail" in decoded[0]
+
+    def test_partial_and_malformed_lines(self, history):
+        with open(_history_path(history.repo_root), "a", encoding="utf-8") as f:
+            f.write("{not json\n")
+            f.write('{"outcome": "success", "revert_status": "pending"}')  # no newline yet
+        assert len(history.query()) == 30
+        with open(_history_path(history.repo_root), "a", encoding="utf-8") as f:
+            f.write("\n")
+        assert len(history.query()) == 31
+
+    def test_replaced_log_triggers_rebuild(self, history):
+        history.query()
+        records = history.read_all()
+        for rec in records:
+            rec["revert_status"] = "reverted"
+        path = _history_path(history.repo_root)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text("".join(json.dumps(r, sort_keys=True) + "\n" for r in records))
+        os.replace(tmp, path)
+        assert DrainHistory.latest_pending_reverts(history.repo_root) == []
+
+    def test_in_place_rewrite_triggers_rebuild(self, history):
+        history.query()
+        path = _history_path(history.repo_root)
+        lines = path.read_text().splitlines(keepends=True)
+        last = json.loads(lines[-1])
+        last["outcome"] = "rewritten"
+        lines[-1] = json.dumps(last) + "\n"
+        with open(path, "r+", encoding="utf-8") as f:  # same inode, same or larger size
+            f.write("".join(lines))
+        assert [r["cluster_id"] for r in history.query(outcome="rewritten")] == ["c#29"]
+
+    def test_rebuild_index_from_jsonl(self, history):
+        history.query()
+        _history_index_path(history.repo_root).unlink()
+        assert history.rebuild_index() == 30
+
+    def test_unopenable_index_falls_back_to_scan(self, history, monkeypatch):
+        def broken(self):
+            raise drain_queue_state.sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(DrainHistory, "_open_index", broken)
+        assert len(DrainHistory.latest_pending_reverts(history.repo_root)) == 4
+        assert len(history.since(_at(28))) == 2
+
+
+class TestIterReverse:
+    def test_newest_first_across_blocks(self, history, monkeypatch):
+        monkeypatch.setattr(drain_queue_state, "HISTORY_REVERSE_BLOCK_BYTES", 37)
+        assert list(history.iter_reverse()) == list(reversed(history.read_all()))
+
+    def test_stops_early_and_handles_missing_file(self, tmp_path, history):
+        first = next(history.iter_reverse())
+        assert first["cluster_id"] == "c#29"
+        assert list(DrainHistory.load(tmp_path / "empty").iter_reverse()) == []
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Unit tests for env_utils.positive_int_from_env.
+
+Malformed tuning knobs fall back to the caller's default, so modules that
+read them at import time (conflict_resolver, genai_validate) still import.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+from env_utils import positive_int_from_env  # noqa: E402
+
+ENV_NAME = "ENV_UTILS_TEST_VALUE"
+
+
+@pytest.mark.parametrize("raw,expected", [("8", 8), ("0", 1), ("-3", 1), ("abc", 4), ("", 4), ("2.5", 4)])
+def test_invalid_values_fall_back_to_default(monkeypatch, raw, expected):
+    monkeypatch.setenv(ENV_NAME, raw)
+    assert positive_int_from_env(ENV_NAME, 4) == expected
+
+
+def test_unset_returns_default(monkeypatch):
+    monkeypatch.delenv(ENV_NAME, raising=False)
+    assert positive_int_from_env(ENV_NAME, 7) == 7
+
+
+def test_malformed_env_does_not_break_import():
+    env = dict(os.environ, CONFLICT_RESOLVER_WORKERS="four", GENAI_VERSION_CHUNK_SIZE="x",
+               GENAI_VERSION_WORKERS="4.5")
+    code = ("import conflict_resolver as c, genai_validate as g; "
+            "print(c.CHUNK_MAX_WORKERS, g.VERSION_CHUNK_SIZE, g.VERSION_MAX_WORKERS)")
+    out = subprocess.run([sys.executable, "-c", code], cwd=LIB_PATH, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    assert out.split() == ["4", "40", "4"]
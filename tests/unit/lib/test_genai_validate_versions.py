@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Unit tests for genai_validate.classify_versions.
+
+Obvious references are settled by the local pre-filter, the rest are sent in
+bounded concurrent chunks through a local fake messages client, and answers
+are cached by (line content, context) hash across runs.
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import genai_validate  # noqa: E402
+from genai_validate import (  # noqa: E402
+    VersionCandidate,
+    classify_versions,
+    load_external_pins,
+    prefilter_version,
+)
+
+
+class FakeClient:
+    """Messages client that marks a reference as plugin if its line mentions 'plugin'."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.prompts = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, model, max_tokens, messages):
+        prompt = messages[0]["content"]
+        with self.lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            lines = re.findall(r"^(\d+)\. File: .*\n   Version: .*\n   Line: (.*)$", prompt, re.MULTILINE)
+            answer = [
+                {
+                    "index": int(index),
+                    "is_plugin_version": "plugin" in line,
+                    "reasoning": "fake",
+                    "confidence": "medium",
+                }
+                for index, line in lines
+            ]
+            text = "```json\n" + json.dumps(answer) + "\n```"
+            return SimpleNamespace(content=[SimpleNamespace(text=text)])
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def _candidate(n: int, line: str, version: str = "1.2.3") -> VersionCandidate:
+    return VersionCandidate(
+        file_path=f"docs/f{n}.md",
+        line_number=n + 1,
+        line_content=line,
+        version=version,
+        surrounding_context=f"   {n + 1}: {line}",
+    )
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    fake = FakeClient()
+    monkeypatch.setattr(genai_validate, "get_llm_client", lambda: (fake, "fake-model", "anthropic"))
+    monkeypatch.setattr(genai_validate, "VERSION_CACHE_FILE", tmp_path / "cache.json")
+    return fake
+
+
+class TestPrefilter:
+    NAMES = ["pytest", "python"]
+
+    @pytest.mark.parametrize("line,version,expected", [
+        ("![Version](https://img.shields.io/badge/version-3.51.0-blue)", "3.51.0", True),
+        ("# Autonomous-Dev v3.0.0 Test Suite", "3.0.0", True),
+        ("Requires pytest>=7.4.0", "7.4.0", False),
+        ("Tested on Python 3.11.5", "3.11.5", False),
+        ('"ip": "192.168.1.1"', "192.168.1", False),
+        ("**Version**: 1.0.0", "1.0.0", None),  # component version: LLM decides
+        ("![py](https://img.shields.io/badge/python-3.11.0-blue)", "3.11.0", None),
+    ])
+    def test_rules(self, line, version, expected):
+        result = prefilter_version(_candidate(0, line, version), self.NAMES)
+        if expected is None:
+            assert result is None
+        else:
+            assert result.is_plugin_version is expected
+            assert result.confidence == "high"
+
+    def test_pins_from_manifests(self, tmp_path):
+        (tmp_path / "requirements.txt").write_text("requests==2.31.0  # http\nPyYAML>=6.0.0\n")
+        (tmp_path / "pyproject.toml").write_text('dependencies = ["httpx[http2]~=0.27.0"]\n')
+        names = load_external_pins([tmp_path / "requirements.txt", tmp_path / "pyproject.toml"])
+        assert {"requests", "pyyaml", "httpx", "python"} <= set(names)
+
+
+class TestClassifyVersions:
+    def test_chunks_run_concurrently_and_keep_order(self, client):
+        client.delay = 0.2
+        candidates = [_candidate(n, f"plugin ref {n}" if n % 2 else f"example {n}") for n in range(12)]
+        start = time.monotonic()
+        results = classify_versions(candidates, "3.0.0", chunk_size=2, max_workers=3)
+        elapsed = time.monotonic() - start
+
+        assert [r.line_number for r in results] == [c.line_number for c in candidates]
+        assert [r.is_plugin_version for r in results] == [n % 2 == 1 for n in range(12)]
+        assert len(client.prompts) == 6
+        assert all("Analyze all 2 references" in p for p in client.prompts)
+        assert client.peak == 3
+        assert elapsed < 6 * 0.2
+
+    def test_prefilter_skips_llm(self, client):
+        candidates = [
+            _candidate(0, "![v](https://img.shields.io/badge/version-1.2.3-blue)"),
+            _candidate(1, "pip install pytest==1.2.3"),
+        ]
+        results = classify_versions(candidates, "1.2.3")
+        assert [r.is_plugin_version for r in results] == [True, False]
+        assert client.prompts == []
+
+    def test_cache_reuses_answers_when_lines_move(self, client, tmp_path):
+        candidates = [_candidate(n, f"plugin ref {n}") for n in range(3)]
+        classify_versions(candidates, "3.0.0")
+        assert len(client.prompts) == 1
+
+        moved = [_candidate(n, f"plugin ref {n}") for n in range(3)]
+        for c in moved:
+            c.line_number += 40
+            c.surrounding_context = f"   {c.line_number}: {c.line_content}"
+        moved.append(_candidate(9, "brand new"))
+        results = classify_versions(moved, "3.1.0")
+        assert len(client.prompts) == 2
+        assert "brand new" in client.prompts[1] and "plugin ref" not in client.prompts[1]
+        assert [r.line_number for r in results[:3]] == [41, 42, 43]
+        assert len(json.loads((tmp_path / "cache.json").read_text())["entries"]) == 4
+
+    def test_unanswered_references_are_omitted_and_not_cached(self, client, monkeypatch):
+        monkeypatch.setattr(genai_validate, "_classify_chunk", lambda chunk, target, llm: {0: {
+            "is_plugin_version": True, "reasoning": "r", "confidence": "low"}})
+        results = classify_versions([_candidate(0, "a"), _candidate(1, "b")], "1.0.0", chunk_size=5)
+        assert [r.line_content for r in results] == ["a"]
+        entries = json.loads(genai_validate.VERSION_CACHE_FILE.read_text())["entries"]
+        assert len(entries) == 1
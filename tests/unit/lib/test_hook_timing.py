@@ -230,6 +230,33 @@ class TestHookTimerDailyRotation:
         assert log.exists(), f"expected daily-rotated log at {log}"
 
 
+# ---------------------------------------------------------------------------
+# Optional counters
+# ---------------------------------------------------------------------------
+
+
+class TestHookTimerCounters:
+    def test_no_counters_key_by_default(self, home_dir):
+        with hook_timing.HookTimer("test_hook.py"):
+            pass
+        assert "counters" not in _read_today_log(home_dir)[0]
+
+    def test_counters_recorded(self, home_dir):
+        with hook_timing.HookTimer("test_hook.py") as timer:
+            timer.add_counters("intent_cache", {"memory_hits": 3, "misses": 1, "hit_rate": 0.75})
+        row = _read_today_log(home_dir)[0]
+        assert row["counters"] == {
+            "intent_cache": {"memory_hits": 3, "misses": 1, "hit_rate": 0.75}
+        }
+
+    def test_non_numeric_counters_dropped(self, home_dir):
+        with hook_timing.HookTimer("test_hook.py") as timer:
+            timer.add_counters("g", {"ok": 1, "bad": "x", "flag": True})
+            timer.add_counters("empty", {"bad": None})
+        row = _read_today_log(home_dir)[0]
+        assert row["counters"] == {"g": {"ok": 1}}
+
+
 # ---------------------------------------------------------------------------
 # Disabled fast-path
 # ---------------------------------------------------------------------------
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Unit tests for merge_conflict_predictor (merge-tree based conflict prediction).
+
+Predictions run against a real throwaway git repository; every test also
+checks that the working tree, index and refs are left untouched.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import worktree_manager  # noqa: E402
+from merge_conflict_predictor import (  # noqa: E402
+    METHOD_HUNK_OVERLAP,
+    METHOD_MERGE_TREE,
+    plan_merge_order,
+    predict_merge_conflicts,
+)
+
+BASE = "".join(f"line {n}\n" for n in range(1, 21))
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+
+def _branch(repo: Path, name: str, files: dict, start: str = "master") -> None:
+    _git(repo, "checkout", "-q", "-b", name, start)
+    for path, content in files.items():
+        if content is None:
+            _git(repo, "rm", "-q", path)
+        else:
+            (repo / path).write_text(content)
+            _git(repo, "add", path)
+    _git(repo, "commit", "-q", "-m", name)
+    _git(repo, "checkout", "-q", "master")
+
+
+def _edit(line_no: int, text: str) -> str:
+    lines = BASE.splitlines(keepends=True)
+    lines[line_no - 1] = f"{text}\n"
+    return "".join(lines)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "--initial-branch=master")
+    _git(root, "config", "user.email", "t@example.com")
+    _git(root, "config", "user.name", "t")
+    _git(root, "config", "commit.gpgsign", "false")
+    (root / "app.py").write_text(BASE)
+    (root / "other.py").write_text("X = 1\n")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "init")
+    return root
+
+
+def _snapshot(repo: Path) -> tuple:
+    return (
+        _git(repo, "status", "--porcelain"),
+        _git(repo, "for-each-ref"),
+        _git(repo, "rev-parse", "HEAD"),
+    )
+
+
+@pytest.mark.parametrize("method", [None, METHOD_HUNK_OVERLAP])
+class TestPredict:
+    def test_clean_merge(self, repo, method):
+        _branch(repo, "feature-a", {"app.py": _edit(2, "ours")})
+        _branch(repo, "feature-b", {"app.py": _edit(15, "theirs")})
+        before = _snapshot(repo)
+        prediction = predict_merge_conflicts("feature-b", "feature-a", repo_root=repo, method=method)
+        assert prediction.ok and not prediction.has_conflicts
+        assert _snapshot(repo) == before
+
+    def test_overlapping_edit_conflicts_with_line_range(self, repo, method):
+        _branch(repo, "feature-a", {"app.py": _edit(5, "ours")})
+        _branch(repo, "feature-b", {"app.py": _edit(5, "theirs"), "other.py": "X = 2\n"})
+        before = _snapshot(repo)
+        prediction = predict_merge_conflicts("feature-b", "feature-a", repo_root=repo, method=method)
+        assert prediction.conflicted_files == ["app.py"]
+        (start, end), = prediction.conflicts[0].line_ranges
+        assert start <= 5 <= end
+        assert _snapshot(repo) == before
+
+    def test_identical_change_is_clean(self, repo, method):
+        _branch(repo, "feature-a", {"app.py": _edit(5, "same")})
+        _branch(repo, "feature-b", {"app.py": _edit(5, "same")})
+        prediction = predict_merge_conflicts("feature-b", "feature-a", repo_root=repo, method=method)
+        assert not prediction.has_conflicts
+
+    def test_unknown_branch_is_error(self, repo, method):
+        prediction = predict_merge_conflicts("nope", "master", repo_root=repo, method=method)
+        assert not prediction.ok
+        assert "nope" in prediction.error
+
+
+class TestMergeTreeDetails:
+    def test_blocks_match_conflict_resolver_parse(self, repo):
+        _branch(repo, "feature-a", {"app.py": _edit(5, "ours")})
+        _branch(repo, "feature-b", {"app.py": _edit(5, "theirs")})
+        prediction = predict_merge_conflicts("feature-b", "feature-a", repo_root=repo)
+        assert prediction.method == METHOD_MERGE_TREE
+        block, = prediction.conflicts[0].blocks
+        assert block.ours_content == "ours"
+        assert block.theirs_content == "theirs"
+        assert block.file_path == "app.py"
+
+    def test_modify_delete_type(self, repo):
+        _branch(repo, "feature-a", {"other.py": "X = 2\n"})
+        _branch(repo, "feature-b", {"other.py": None})
+        prediction = predict_merge_conflicts("feature-b", "feature-a", repo_root=repo)
+        conflict, = prediction.conflicts
+        assert conflict.file_path == "other.py"
+        assert conflict.conflict_type == "modify/delete"
+
+
+class TestPlanMergeOrder:
+    def test_clean_branches_merge_first(self, repo):
+        # b conflicts with a; c is independent; in input order a, b, c the
+        # merge of b would fail, so the plan defers b behind c.
+        _branch(repo, "a", {"app.py": _edit(5, "a")})
+        _branch(repo, "b", {"app.py": _edit(5, "b")})
+        _branch(repo, "c", {"other.py": "X = 3\n"})
+        before = _snapshot(repo)
+        plan = plan_merge_order(["a", "b", "c"], "master", repo_root=repo)
+        assert plan.order == ["a", "c", "b"]
+        assert plan.conflicting == ["b"]
+        assert plan.predictions["b"].conflicted_files == ["app.py"]
+        assert _snapshot(repo) == before
+
+    def test_simulation_accounts_for_earlier_merges(self, repo):
+        # a and e each merge cleanly into master on their own, but e conflicts
+        # with master once a has landed.
+        _branch(repo, "a", {"app.py": _edit(5, "a")})
+        _branch(repo, "e", {"app.py": _edit(5, "e")})
+        assert not predict_merge_conflicts("e", "master", repo_root=repo).has_conflicts
+        plan = plan_merge_order(["a", "e"], "master", repo_root=repo)
+        assert plan.order == ["a", "e"]
+        assert plan.conflicting == ["e"]
+
+
+class TestMergeWorktreeIntegration:
+    def test_predicted_conflict_leaves_tree_untouched(self, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+        _branch(repo, "feature-x", {"app.py": _edit(5, "feature")})
+        (repo / "app.py").write_text(_edit(5, "master"))
+        _git(repo, "commit", "-q", "-am", "master edit")
+        before = _snapshot(repo)
+
+        result = worktree_manager.merge_worktree("feature-x", "master", check_push=False)
+
+        assert result.success is False
+        assert result.conflicts == ["app.py"]
+        assert "predicted" in result.error_message
+        assert result.prediction.conflicts[0].line_ranges
+        assert _snapshot(repo) == before
+        assert not (repo / ".git" / "MERGE_HEAD").exists()
+
+    def test_clean_merge_still_merges(self, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+        _branch(repo, "feature-y", {"other.py": "X = 9\n"})
+        result = worktree_manager.merge_worktree("feature-y", "master", check_push=False)
+        assert result.success is True
+        assert (repo / "other.py").read_text() == "X = 9\n"
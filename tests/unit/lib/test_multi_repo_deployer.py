@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Unit tests for multi_repo_deployer (parallel multi-repo deployment).
+
+Uses a tiny plugin tree and local temp repos: every phase (install, settings
+merge, hook activation, sync validation) runs for real against tmp_path.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from plugins.autonomous_dev.lib import multi_repo_deployer  # noqa: E402
+from plugins.autonomous_dev.lib.multi_repo_deployer import (  # noqa: E402
+    PHASES,
+    DeployError,
+    MultiRepoDeployer,
+    deploy_repo,
+)
+
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    """Minimal plugin tree with one hook and a settings template."""
+    plugin = tmp_path / "plugin"
+    (plugin / "hooks").mkdir(parents=True)
+    (plugin / "hooks" / "example_hook.py").write_text("print('ok')\n")
+    (plugin / "lib").mkdir()
+    (plugin / "lib" / "helper.py").write_text("VALUE = 1\n")
+    (plugin / "templates").mkdir()
+    (plugin / "templates" / "settings.local.json").write_text(json.dumps({"hooks": {}}))
+    return plugin
+
+
+@pytest.fixture
+def repos(tmp_path):
+    """Three empty consumer repos."""
+    result = []
+    for name in ("repo_a", "repo_b", "repo_c"):
+        repo = tmp_path / name
+        repo.mkdir()
+        result.append(repo)
+    return result
+
+
+class TestDeployRepo:
+    """Single-repo pipeline."""
+
+    def test_runs_all_phases_in_order(self, plugin_dir, repos):
+        result = deploy_repo(plugin_dir, repos[0])
+
+        assert result["status"] == "success"
+        assert [p["phase"] for p in result["phases"]] == list(PHASES)
+        assert all(p["duration_ms"] >= 0 for p in result["phases"])
+        assert (repos[0] / ".claude" / "hooks" / "example_hook.py").exists()
+
+    def test_failed_fresh_install_is_rolled_back(self, plugin_dir, repos, monkeypatch):
+        def boom(self):
+            raise DeployError("validation exploded")
+
+        monkeypatch.setattr(multi_repo_deployer.SyncValidator, "validate_all", boom)
+
+        result = deploy_repo(plugin_dir, repos[0], max_retries=1)
+
+        assert result["status"] == "rolled_back"
+        assert result["attempts"] == 2
+        assert len(result["errors"]) == 2
+        assert result["phases"][-1]["phase"] == "sync_validation"
+        assert not (repos[0] / ".claude").exists()
+
+    def test_failed_upgrade_restores_backup(self, plugin_dir, repos, monkeypatch):
+        deploy_repo(plugin_dir, repos[0])
+        user_file = repos[0] / ".claude" / "hooks" / "example_hook.py"
+        user_file.write_text("print('customized')\n")
+        (plugin_dir / "hooks" / "example_hook.py").write_text("print('v2')\n")
+
+        def boom(self, new_hooks):
+            raise DeployError("activation exploded")
+
+        monkeypatch.setattr(multi_repo_deployer.HookActivator, "activate_hooks", boom)
+
+        result = deploy_repo(plugin_dir, repos[0], max_retries=0)
+
+        assert result["status"] == "rolled_back"
+        assert user_file.read_text() == "print('customized')\n"
+
+    def test_retry_succeeds_after_transient_failure(self, plugin_dir, repos, monkeypatch):
+        calls = {"n": 0}
+        original = multi_repo_deployer.SettingsMerger.merge_settings
+
+        def flaky(self, *args, **kwargs):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise OSError("transient")
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(multi_repo_deployer.SettingsMerger, "merge_settings", flaky)
+
+        result = deploy_repo(plugin_dir, repos[0], max_retries=1)
+
+        assert result["status"] == "success"
+        assert result["attempts"] == 2
+        assert "transient" in result["errors"][0]
+
+
+class TestMultiRepoDeployer:
+    """Concurrent orchestration and consolidated report."""
+
+    def test_deploys_all_repos_in_process_pool(self, plugin_dir, repos, tmp_path):
+        report = MultiRepoDeployer(plugin_dir, repos, max_workers=3).deploy()
+
+        assert report.all_succeeded
+        assert [r.repo for r in report.repos] == [str(r.resolve()) for r in repos]
+
+        report_path = tmp_path / "out" / "report.json"
+        report.save(report_path)
+        data = json.loads(report_path.read_text())
+        assert data["summary"] == {
+            "total": 3,
+            "succeeded": 3,
+            "failed": 0,
+            "phase_totals_ms": data["summary"]["phase_totals_ms"],
+        }
+        assert set(data["summary"]["phase_totals_ms"]) == set(PHASES)
+
+    def test_one_failing_repo_does_not_affect_others(self, plugin_dir, repos, monkeypatch):
+        original = multi_repo_deployer.SyncValidator.validate_all
+        bad_repo = repos[1].resolve()
+
+        def selective(self):
+            if self.project_path.resolve() == bad_repo:
+                raise DeployError("bad repo")
+            return original(self)
+
+        monkeypatch.setattr(multi_repo_deployer.SyncValidator, "validate_all", selective)
+
+        report = MultiRepoDeployer(
+            plugin_dir, repos, max_workers=3, max_retries=0, use_processes=False
+        ).deploy()
+
+        assert report.failed == [str(bad_repo)]
+        assert len(report.succeeded) == 2
+        assert not (bad_repo / ".claude").exists()
+
+    def test_rejects_invalid_worker_count(self, plugin_dir, repos):
+        with pytest.raises(ValueError):
+            MultiRepoDeployer(plugin_dir, repos, max_workers=0)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Unit tests for parsed_command (parse-once Bash command model).
+
+Every view must equal what the detectors computed before the shared model
+existed (direct shlex.split / statement split / heredoc + quote strip), and
+must be computed at most once per command string.
+"""
+
+import shlex
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import parsed_command  # noqa: E402
+from parsed_command import ParsedCommand, parse_command  # noqa: E402
+
+COMMANDS = [
+    "git status",
+    "FOO=1 BAR=2 python3 -c 'print(1)' > out.txt",
+    "cat <<'EOF' > notes.md\nCLAUDE_AGENT_NAME=x\nEOF\necho done",
+    'git commit -m "fix; rm -rf /" && git push',
+    "echo a | tee b.txt; ls & sleep 1 || true",
+    "echo 'unterminated",
+    'gh issue create --title "t" --body "$(cat body.md)"',
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    parsed_command.clear_parse_cache()
+    yield
+    parsed_command.clear_parse_cache()
+
+
+class TestViews:
+    """Views match the direct computations they replace."""
+
+    @pytest.mark.parametrize("command", COMMANDS)
+    def test_tokens_match_shlex(self, command):
+        parsed = parse_command(command)
+        try:
+            expected = shlex.split(command, posix=True)
+        except ValueError as exc:
+            assert parsed.tokens is None
+            assert parsed.tokens_error == str(exc)
+            with pytest.raises(ValueError, match=str(exc)):
+                parsed.argv()
+        else:
+            assert parsed.argv() == expected
+            assert parsed.tokens == tuple(expected)
+
+    @pytest.mark.parametrize("command", COMMANDS)
+    def test_stripped_views(self, command):
+        parsed = parse_command(command)
+
+        assert parsed.heredoc_stripped == parsed_command.strip_heredoc(command)
+        assert parsed.unquoted == parsed_command.strip_quoted_segments(parsed.heredoc_stripped)
+        assert parsed.statements == tuple(parsed_command.split_statements(command))
+
+    def test_statement_and_segment_splits(self):
+        parsed = parse_command('a "x;y" && b | c; d & e')
+
+        assert parsed.statements == ('a "x;y"', "b", "c", "d", "e")
+        assert parsed.segments == ('a "x;y" ', " b | c", " d ", " e")
+        assert parsed.segment_tokens[1] == ("b", "|", "c")
+
+    def test_heredoc_body_removed_before_quote_strip(self):
+        parsed = parse_command(COMMANDS[2])
+
+        assert "CLAUDE_AGENT_NAME" not in parsed.heredoc_stripped
+        assert "'EOF'" not in parsed.unquoted
+
+    def test_argv_returns_fresh_list(self):
+        parsed = parse_command("ls -la")
+        parsed.argv().append("mutated")
+
+        assert parsed.argv() == ["ls", "-la"]
+
+
+class TestParseOnce:
+    """Each view is computed once per distinct command string."""
+
+    def test_same_string_shares_instance(self):
+        assert parse_command("git log") is parse_command("git log")
+        assert isinstance(parse_command("git log"), ParsedCommand)
+
+    def test_shlex_runs_once_per_command(self):
+        with patch.object(parsed_command.shlex, "split", wraps=shlex.split) as spy:
+            for _ in range(5):
+                parse_command("git commit -m 'x'").argv()
+                parse_command("git commit -m 'x'").tokens
+
+        assert spy.call_count == 1
+
+    def test_heredoc_strip_runs_once_per_command(self):
+        with patch.object(parsed_command, "strip_heredoc", wraps=parsed_command.strip_heredoc) as spy:
+            for _ in range(3):
+                parse_command(COMMANDS[2]).unquoted
+                parse_command(COMMANDS[2]).heredoc_stripped
+
+        assert spy.call_count == 1
+
+    def test_tool_intent_shares_the_cache(self):
+        import tool_intent
+
+        assert tool_intent._pc is sys.modules["parsed_command"]
+        tool_intent.write_targets("Bash", {"command": "echo hi > a.txt; cat b"})
+
+        assert parsed_command.parse_command.cache_info().currsize >= 1
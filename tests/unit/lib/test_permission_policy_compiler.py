@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""Differential tests for permission_policy_compiler.
+
+Each compiled matcher is checked against a reference copy of the original
+per-pattern loop on seeded random inputs built from fragments of the real
+policy rules, so any decision (or reported pattern) drift shows up here.
+"""
+
+import fnmatch
+import json
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import permission_policy_compiler as ppc  # noqa: E402
+from mcp_permission_validator import MCPPermissionValidator  # noqa: E402
+from sandbox_enforcer import SandboxEnforcer  # noqa: E402
+from tool_validator import ToolValidator  # noqa: E402
+
+POLICY = json.loads(
+    (LIB_PATH.parent / "config" / "auto_approve_policy.json").read_text()
+)
+SEED = 20261018
+ROUNDS = 400
+
+
+# ---------------------------------------------------------------------------
+# Reference implementations (the original loops)
+# ---------------------------------------------------------------------------
+
+
+def ref_first_glob(patterns, *texts):
+    for pattern in patterns:
+        if any(fnmatch.fnmatch(text, pattern) for text in texts):
+            return pattern
+    return None
+
+
+def ref_first_domain(blocked_domains, domain):
+    for blocked in blocked_domains:
+        if blocked.endswith("*"):
+            if domain.startswith(blocked[:-1]):
+                return blocked
+        elif domain == blocked or domain.endswith(f".{blocked}"):
+            return blocked
+    return None
+
+
+def ref_first_regex_ci(patterns, text):
+    for pattern in patterns:
+        try:
+            if re.search(pattern, text, re.IGNORECASE):
+                return pattern
+        except re.error:
+            continue
+    return None
+
+
+def ref_blocked_paths(patterns, text):
+    for pattern in patterns:
+        if "*" in pattern:
+            try:
+                if re.search(pattern.replace(".", r"\.").replace("*", ".*"), text):
+                    return True
+            except re.error:
+                continue
+        elif pattern in text:
+            return True
+    return False
+
+
+def ref_mcp_allows(validator, path, patterns):
+    # Bypass the compiled list but keep the (reference-tested) glob predicate
+    matched = negated = False
+    for pattern in patterns:
+        if pattern.startswith("!"):
+            negated |= validator.matches_glob_pattern(path, pattern[1:])
+        else:
+            matched |= validator.matches_glob_pattern(path, pattern)
+    return matched and not negated
+
+
+def ref_mcp_glob(path, pattern):
+    """Original MCPPermissionValidator.matches_glob_pattern body."""
+    path = path.replace("\\", "/")
+    pattern = pattern.replace("\\", "/")
+    if pattern.startswith("!"):
+        return not ref_mcp_glob(path, pattern[1:])
+    if "**" in pattern:
+        return bool(re.search(ppc._mcp_double_star_regex(pattern), path))
+    if "/" in pattern:
+        path_parts = [p for p in path.split("/") if p]
+        pattern_parts = [p for p in pattern.split("/") if p]
+        if len(pattern_parts) > len(path_parts):
+            return False
+        for i in range(len(path_parts) - len(pattern_parts) + 1):
+            if all(fnmatch.fnmatch(path_parts[i + j], part) for j, part in enumerate(pattern_parts)):
+                return True
+        return False
+    return fnmatch.fnmatch(Path(path).name, pattern)
+
+
+# ---------------------------------------------------------------------------
+# Input generation
+# ---------------------------------------------------------------------------
+
+
+def _fragments(patterns):
+    """Literal pieces of the rules, so random inputs land near rule edges."""
+    pieces = set()
+    for pattern in patterns:
+        for piece in re.split(r"[*?\[\]]", pattern):
+            if piece:
+                pieces.add(piece)
+                pieces.add(piece[: len(piece) // 2])
+    return sorted(p for p in pieces if p)
+
+
+def _random_text(rng, fragments, alphabet=" /.-_*?[]abcXYZ019|;&`$()\r\n"):
+    parts = []
+    for _ in range(rng.randint(0, 5)):
+        if fragments and rng.random() < 0.6:
+            parts.append(rng.choice(fragments))
+        else:
+            parts.append("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))))
+    return "".join(parts)
+
+
+@pytest.fixture
+def rng():
+    return random.Random(SEED)
+
+
+# ---------------------------------------------------------------------------
+# Matcher-level differential tests
+# ---------------------------------------------------------------------------
+
+
+class TestGlobSet:
+    """GlobSet reports the same first pattern as the fnmatch loop."""
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            POLICY["bash"]["blacklist"],
+            POLICY["bash"]["whitelist"],
+            POLICY["file_paths"]["blacklist"],
+            ["*", "a*", "*b", "a?c", "[ab]*", "x[", "**", "", "exact", "exact"],
+        ],
+        ids=["bash_blacklist", "bash_whitelist", "path_blacklist", "edge_cases"],
+    )
+    def test_matches_fnmatch_loop(self, rng, patterns):
+        globs = ppc.GlobSet(patterns)
+        fragments = _fragments(patterns)
+
+        for _ in range(ROUNDS):
+            text = _random_text(rng, fragments)
+            assert globs.first(text) == ref_first_glob(patterns, text), text
+
+    def test_exact_prefix_suffix_and_regex_paths(self):
+        globs = ppc.GlobSet(["git status", "/etc/*", "*/.env", "*.p?m"])
+
+        assert globs.first("git status") == "git status"
+        assert globs.first("/etc/passwd") == "/etc/*"
+        assert globs.first("/srv/app/.env") == "*/.env"
+        assert globs.first("/keys/id.pem") == "*.p?m"
+        assert globs.first("git statuses") is None
+
+    def test_first_in_list_order_wins(self):
+        globs = ppc.GlobSet(["*secret*", "rm *", "rm -rf*"])
+
+        assert globs.first("rm -rf secret") == "*secret*"
+        assert globs.first("rm -rf /tmp") == "rm *"
+
+
+class TestDomainBlocklist:
+    """DomainBlocklist reports the same entry as the SSRF loop."""
+
+    def test_matches_reference_loop(self, rng):
+        blocked = POLICY["web_tools"]["blocked_domains"] + ["", "*", "example.com", ".internal"]
+        blocklist = ppc.DomainBlocklist(blocked)
+        fragments = _fragments(blocked) + ["example.com", "sub.", "evil", "."]
+
+        for _ in range(ROUNDS):
+            domain = _random_text(rng, fragments, alphabet=".abc019-:")
+            assert blocklist.first(domain) == ref_first_domain(blocked, domain), domain
+
+    def test_suffix_and_wildcard(self):
+        blocklist = ppc.DomainBlocklist(["10.*", "example.com"])
+
+        assert blocklist.first("10.0.0.1") == "10.*"
+        assert blocklist.first("api.example.com") == "example.com"
+        assert blocklist.first("notexample.com") is None
+
+
+class TestSandboxRuleSets:
+    """Substring / regex / blocked-path sets agree with the sandbox loops."""
+
+    def test_substring_first_in_order(self, rng):
+        literals = [";", "&&", "||", "|", "`", "$(", ")", ">", ">>", "<", "\x00"]
+        substrings = ppc.SubstringSet(literals)
+
+        for _ in range(ROUNDS):
+            text = _random_text(rng, literals)
+            expected = next((lit for lit in literals if lit in text), None)
+            assert substrings.first(text) == expected
+
+    def test_regex_set_skips_invalid_and_keeps_order(self, rng):
+        patterns = ["rm -rf", "sudo", "(unclosed", r"git\s+push\s+--force", "eval", r"(a)\1"]
+        regexes = ppc.RegexSet(patterns, re.IGNORECASE)
+
+        for _ in range(ROUNDS):
+            text = _random_text(rng, ["rm -rf", "SUDO", "git push --force", "EvAl", "aa"])
+            assert regexes.first(text) == ref_first_regex_ci(patterns, text), text
+
+    def test_blocked_paths_glob_and_substring(self, rng):
+        patterns = ["/etc/*", "*.pem", "~/.ssh", "id_rsa", "[*"]
+        blocked = ppc.BlockedPathSet(patterns)
+
+        for _ in range(ROUNDS):
+            text = _random_text(rng, _fragments(patterns) + [".pem", "/etc/"])
+            assert blocked.contains_any(text) == ref_blocked_paths(patterns, text), text
+
+
+class TestMCPGlobs:
+    """MCP glob predicates and allow/deny lists match the original evaluation."""
+
+    PATTERNS = [
+        "src/**", "**/*.py", "tests/*.py", "*.md", "!**/.env", "!*.key",
+        "docs/**/index.??", "a/b", "!!x", "lib\\*.js", "/",
+    ]
+
+    def test_glob_predicate_matches_reference(self, rng):
+        fragments = ["src", "tests", "docs", "/", ".py", ".md", ".env", ".key", "index.md", "a", "b", "\\"]
+
+        for _ in range(ROUNDS):
+            path = _random_text(rng, fragments)
+            for pattern in self.PATTERNS:
+                assert ppc.compile_mcp_glob(pattern)(path) == ref_mcp_glob(path, pattern), (path, pattern)
+
+    def test_allow_list_matches_reference(self, rng):
+        validator = MCPPermissionValidator()
+        glob_list = ppc.MCPGlobList(self.PATTERNS)
+        fragments = ["src/", "tests/", "docs/", "x.py", "README.md", ".env", "id.key", "a/b", "x"]
+
+        assert glob_list.valid
+        for _ in range(ROUNDS):
+            path = _random_text(rng, fragments)
+            assert glob_list.allows(path) == ref_mcp_allows(validator, path, self.PATTERNS), path
+
+    def test_invalid_pattern_falls_back_to_original_error(self):
+        validator = MCPPermissionValidator()
+
+        assert not ppc.MCPGlobList(["src/(**"]).valid
+        with pytest.raises(re.error):
+            validator._matches_any_pattern("src/x", ["src/(**"])
+
+
+# ---------------------------------------------------------------------------
+# Validator-level differential tests and caching
+# ---------------------------------------------------------------------------
+
+
+class TestValidatorsUnchanged:
+    """Wired validators give the original decisions on the real policy."""
+
+    def test_tool_validator_bash_blacklist_reason(self, rng):
+        validator = ToolValidator(policy=json.loads(json.dumps(POLICY)))
+        blacklist = POLICY["bash"]["blacklist"]
+        fragments = _fragments(blacklist + POLICY["bash"]["whitelist"])
+
+        for _ in range(ROUNDS):
+            command = _random_text(rng, fragments, alphabet=" /.-_abcXYZ019")
+            normalized = " ".join(command.replace("'", "").replace('"', "").replace("\\", "").split())
+            expected = ref_first_glob(blacklist, command, normalized)
+            result = validator.validate_bash_command(command)
+            if expected is not None:
+                assert result.reason == f"Matches blacklist pattern: {expected}"
+            else:
+                assert not result.reason.startswith("Matches blacklist")
+
+    def test_tool_validator_sees_policy_mutation(self):
+        validator = ToolValidator(policy=json.loads(json.dumps(POLICY)))
+        validator.policy["bash"]["whitelist"] = ["git status"]
+        assert validator.validate_bash_command("frobnicate now").approved is False
+
+        validator.policy["bash"]["whitelist"] = ["frobnicate*"]
+
+        assert validator.validate_bash_command("frobnicate now").approved is True
+
+    def test_web_tool_reasons_unchanged(self):
+        validator = ToolValidator(policy=json.loads(json.dumps(POLICY)))
+        validator.policy["web_tools"]["blocked_domains"] = ["10.*", "internal.example"]
+
+        wildcard = validator.validate_web_tool("WebFetch", "http://10.1.2.3/x")
+        suffix = validator.validate_web_tool("WebFetch", "http://api.internal.example/")
+
+        assert wildcard.reason == "Domain '10.1.2.3' blocked (SSRF prevention: 10.*)"
+        assert suffix.reason == "Domain 'api.internal.example' blocked (SSRF prevention)"
+
+    def test_sandbox_classification_unchanged(self):
+        enforcer = SandboxEnforcer()
+        enforcer.safe_commands = ["ls", "git status", "cat"]
+        enforcer.blocked_patterns = ["rm -rf", "sudo", "(bad", "eval"]
+        enforcer.blocked_paths = ["*.pem", "/etc/shadow"]
+        enforcer.shell_injection_patterns = [";", "&&", "|"]
+        enforcer.path_traversal_patterns = [".."]
+
+        assert enforcer.is_command_safe("ls -la").classification.value == "safe"
+        assert enforcer.is_command_safe("cat a; rm x").reason == "Shell injection pattern detected: ';'"
+        assert enforcer.is_command_safe("cat key.pem").reason == "Blocked path detected"
+        assert enforcer.is_command_safe("SUDO ls").reason == "Matched blocked pattern: sudo"
+        assert enforcer.is_command_safe("cat ../x").reason == "Path traversal pattern detected (..)"
+
+
+class TestCompiledCache:
+    """Artifacts are cached by rule content."""
+
+    def test_same_content_shares_artifact(self):
+        ppc.clear_compiled_cache()
+        first = ppc.compile_rules("glob", ["a*", "b*"])
+        second = ppc.compile_rules("glob", list(("a*", "b*")))
+
+        assert first is second
+        assert ppc.compiled_cache_size() == 1
+        assert ppc.compile_rules("glob", ["a*"]) is not first
+
+    def test_non_string_rules_are_not_compiled(self):
+        assert ppc.compile_rules("glob", ["a*", 3]) is None
+        assert ppc.compile_rules("glob", [["unhashable"]]) is None
+
+    def test_unknown_kind_raises(self):
+        with pytest.raises(ValueError):
+            ppc.compile_rules("nope", ["x"])
+
+    def test_fingerprint_is_content_hash(self):
+        assert ppc.policy_fingerprint("glob", ["a"]) == ppc.policy_fingerprint("glob", ["a"])
+        assert ppc.policy_fingerprint("glob", ["a"]) != ppc.policy_fingerprint("domains", ["a"])
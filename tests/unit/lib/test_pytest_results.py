@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Unit tests for pytest_results (structured per-test records via a pytest plugin).
+
+A small suite covering every outcome is run in a real pytest subprocess with
+the plugin loaded; the consumers (test_runner, fix_forward, failure_analyzer,
+flaky_tests) are then checked against the records instead of stdout.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import fix_forward  # noqa: E402
+import test_runner  # noqa: E402
+from failure_analyzer import FailureAnalyzer  # noqa: E402
+from flaky_tests import flaky_candidates, load_outcome_history, record_outcomes  # noqa: E402
+from pytest_results import (  # noqa: E402
+    ResultsReader,
+    RunSummary,
+    load_summary,
+    merge_summaries,
+    record_run,
+    results_args,
+    results_env,
+)
+
+SUITE = '''\
+import pytest
+
+
+@pytest.fixture
+def broken():
+    raise RuntimeError("fixture exploded")
+
+
+def test_pass():
+    assert True
+
+
+def test_fail():
+    value = 1
+    assert value == 2
+
+
+def test_setup_error(broken):
+    pass
+
+
+@pytest.mark.skip(reason="not today")
+def test_skip():
+    pass
+
+
+@pytest.mark.xfail
+def test_xfail():
+    assert False
+
+
+@pytest.mark.xfail
+def test_xpass():
+    pass
+'''
+
+
+def _run(root, *args):
+    path = root / "results.jsonl"
+    cmd = [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", *results_args(path), *args]
+    proc = subprocess.run(cmd, cwd=root, env=results_env(), capture_output=True, text=True, timeout=120)
+    return proc, path
+
+
+@pytest.fixture
+def suite(tmp_path):
+    (tmp_path / "test_suite.py").write_text(SUITE)
+    return tmp_path
+
+
+class TestPlugin:
+    def test_one_record_per_outcome(self, suite):
+        proc, path = _run(suite)
+        summary = load_summary(path)
+
+        assert summary.finished and summary.exitstatus == proc.returncode == 1
+        assert summary.outcomes == {
+            "test_suite.py::test_pass": "passed",
+            "test_suite.py::test_fail": "failed",
+            "test_suite.py::test_setup_error": "error",
+            "test_suite.py::test_skip": "skipped",
+            "test_suite.py::test_xfail": "xfailed",
+            "test_suite.py::test_xpass": "xpassed",
+        }
+        assert summary.executed == 5
+        assert summary.failing == {"test_suite.py::test_fail", "test_suite.py::test_setup_error"}
+        assert not summary.all_passed
+
+    def test_failure_record_has_crash_location(self, suite):
+        _, path = _run(suite, "test_suite.py::test_fail")
+        record = load_summary(path).failures[0]
+
+        assert record["crash"]["lineno"] == 15
+        assert record["crash"]["path"].endswith("test_suite.py")
+        assert "assert 1 == 2" in record["longrepr"]
+
+    def test_collection_error(self, tmp_path):
+        (tmp_path / "test_broken.py").write_text("import does_not_exist_039\n")
+
+        _, path = _run(tmp_path)
+        summary = load_summary(path)
+
+        assert summary.exitstatus == 2
+        assert summary.failing == {"test_broken.py"}
+        assert summary.executed == 0
+
+    def test_not_loaded_without_option(self, suite):
+        proc = subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "-p", "pytest_results_plugin"],
+            cwd=suite, env=results_env(), capture_output=True, text=True, timeout=120,
+        )
+
+        assert "1 failed" in proc.stdout
+        assert not list(suite.glob("*.jsonl"))
+
+
+class TestReader:
+    def test_incremental_with_partial_line(self, tmp_path):
+        path = tmp_path / "r.jsonl"
+        reader = ResultsReader(path)
+        assert reader.read_new() == []
+
+        line = json.dumps({"event": "test", "nodeid": "t::a", "outcome": "passed"})
+        path.write_text(line[:10])
+        assert reader.read_new() == []
+        with open(path, "a") as fh:
+            fh.write(line[10:] + "\nnot json\n")
+
+        assert [r["nodeid"] for r in reader.read_new()] == ["t::a"]
+        assert reader.read_new() == []
+
+    def test_merge_summaries(self):
+        a = RunSummary().extend([
+            {"event": "test", "nodeid": "a::x", "outcome": "passed", "duration": 1.0},
+            {"event": "session", "exitstatus": 0, "collected": 1, "duration": 1.5},
+        ])
+        b = RunSummary().extend([
+            {"event": "test", "nodeid": "b::y", "outcome": "failed", "duration": 2.0},
+            {"event": "session", "exitstatus": 1, "collected": 1, "duration": 2.5},
+        ])
+
+        merged = merge_summaries([a, b])
+
+        assert merged.finished and merged.exitstatus == 1
+        assert merged.counts == {"passed": 1, "failed": 1}
+        assert merged.duration == 2.5
+        assert not merge_summaries([a, RunSummary()]).finished
+
+
+class TestConsumers:
+    def test_fix_forward_uses_records(self, suite):
+        proc, path = _run(suite)
+        summary = load_summary(path)
+
+        assert fix_forward.detect_capture_failure("", proc.returncode, results=summary) is None
+        assert fix_forward.parse_failing_tests("", results=summary) == summary.failing
+        assert fix_forward.count_executed_tests("", results=summary) == 5
+
+    def test_fix_forward_zero_tests_from_records(self, tmp_path):
+        (tmp_path / "test_broken.py").write_text("import does_not_exist_039\n")
+        proc, path = _run(tmp_path)
+
+        failure = fix_forward.detect_capture_failure("", results=load_summary(path))
+
+        assert failure.sentinel == fix_forward.COLLECTION_ERROR_SENTINEL
+
+    def test_fix_forward_falls_back_when_unfinished(self):
+        partial = RunSummary().extend([{"event": "test", "nodeid": "a::x", "outcome": "failed"}])
+        output = "FAILED tests/test_a.py::test_b - AssertionError\n1 failed in 0.1s\n"
+
+        assert fix_forward.parse_failing_tests(output, results=partial) == {"tests/test_a.py::test_b"}
+
+    def test_failure_analyzer_from_records(self, suite):
+        _, path = _run(suite)
+
+        failures = FailureAnalyzer().parse_results(load_summary(path).failures)
+
+        by_name = {f.test_name: f for f in failures}
+        assert by_name["test_suite.py::test_fail"].error_type == "assertion"
+        assert by_name["test_suite.py::test_fail"].line_number == 15
+        assert "fixture exploded" in by_name["test_suite.py::test_setup_error"].error_message
+
+    def test_run_single_test_reads_records(self, suite, monkeypatch):
+        monkeypatch.chdir(suite)
+
+        result = test_runner.run_single_test("test_suite.py")
+
+        assert result.summary is not None
+        assert (result.pass_count, result.fail_count, result.error_count) == (1, 1, 1)
+        assert result.passed is False
+        assert "1 failed" in result.output
+
+
+class TestHistoryFeeds:
+    def test_record_run_feeds_durations_and_outcomes(self, tmp_path):
+        summary = RunSummary().extend([
+            {"event": "test", "nodeid": "t.py::a", "outcome": "passed", "duration": 0.5},
+            {"event": "session", "exitstatus": 0, "collected": 1},
+        ])
+        history = tmp_path / ".claude" / "cache" / "test_durations.json"
+
+        record_run(summary, tmp_path, history)
+
+        assert json.loads(history.read_text())["durations"] == {"t.py::a": 0.5}
+        assert load_outcome_history(tmp_path) == {"t.py::a": "P"}
+
+    def test_flips_make_flaky_candidate(self, tmp_path):
+        for outcome in ("passed", "failed", "passed"):
+            record_outcomes({"t.py::a": outcome, "t.py::b": "passed"}, tmp_path)
+        flaky = record_outcomes({"t.py::a": "failed"}, tmp_path)
+
+        assert flaky == {"t.py::a"}
+        assert flaky_candidates(tmp_path) == {"t.py::a": 3}
+
+    def test_pass_after_rerun_counts_as_flip(self, tmp_path):
+        record_outcomes({"t.py::a": "passed"}, tmp_path, reruns={"t.py::a": 1})
+
+        assert load_outcome_history(tmp_path) == {"t.py::a": "FP"}
@@ -73,6 +73,12 @@ try:
         save_merged_research,
         save_merged_research_blob,
         ResearchPersistenceError,
+        RESEARCH_INDEX_FILE,
+        find_research,
+        normalize_topic_keywords,
+        refresh_research_index,
+        search_research,
+        get_web_fetch_cache_stats,
     )
     LIB_RESEARCH_PERSISTENCE_EXISTS = True
 except ImportError:
@@ -86,6 +92,12 @@ except ImportError:
     get_research_dir = None
     save_merged_research = None
     ResearchPersistenceError = None
+    RESEARCH_INDEX_FILE = None
+    find_research = None
+    normalize_topic_keywords = None
+    refresh_research_index = None
+    search_research = None
+    get_web_fetch_cache_stats = None
 
 
 # ============================================================================
@@ -902,6 +914,139 @@ class TestUpdateIndex:
         # Existing valid research should still be indexed
         assert "Existing Research" in readme_content
 
+    def test_web_fetch_cache_stats_stay_out_of_readme(self, temp_project, mock_path_utils, mock_validation):
+        """
+        GIVEN: Project with a web fetch cache that has seen hits and misses
+        WHEN: Updating index
+        THEN: Counters are readable via get_web_fetch_cache_stats(), but the
+              committed README.md does not include them
+        """
+        from search_utils import WebFetchCache
+
+        mock_path_utils.return_value = temp_project
+        cache = WebFetchCache(temp_project / ".claude" / "cache" / "web-fetch")
+        cache.get("https://example.com")
+        cache.set("https://example.com", "body")
+        cache.get("https://example.com")
+
+        update_index()
+
+        stats = get_web_fetch_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+        readme_content = (temp_project / "docs" / "research" / "README.md").read_text()
+        assert "Web Fetch Cache" not in readme_content
+
+    def test_update_index_omits_cache_section_without_cache(self, temp_project, mock_path_utils, mock_validation):
+        """
+        GIVEN: Project that never used the web fetch cache
+        WHEN: Updating index
+        THEN: No cache section and no cache directory is created
+        """
+        mock_path_utils.return_value = temp_project
+
+        update_index()
+
+        readme_content = (temp_project / "docs" / "research" / "README.md").read_text()
+        assert "Web Fetch Cache" not in readme_content
+        assert not (temp_project / ".claude" / "cache" / "web-fetch").exists()
+
+
+# ============================================================================
+# TEST: Metadata Index and Fuzzy Lookup
+# ============================================================================
+
+
+@pytest.mark.skipif(not LIB_RESEARCH_PERSISTENCE_EXISTS, reason="Library not implemented yet (TDD red phase)")
+class TestResearchIndex:
+    """Test persistent metadata index, fuzzy lookup and incremental refresh."""
+
+    def test_normalize_topic_keywords(self):
+        assert normalize_topic_keywords("The JWT Authentication Tokens") == [
+            "authentication", "jwt", "token",
+        ]
+
+    def test_save_research_updates_index(self, temp_project, mock_path_utils, mock_validation):
+        """
+        GIVEN: Research being saved
+        WHEN: save_research() completes
+        THEN: Index entry holds topic, keywords, dates, sources and content hash
+        """
+        mock_path_utils.return_value = temp_project
+
+        save_research("JWT Authentication", "Findings", ["https://jwt.io"])
+
+        index_file = temp_project / RESEARCH_INDEX_FILE
+        entry = json.loads(index_file.read_text())["entries"]["JWT_AUTHENTICATION.md"]
+        assert entry["topic"] == "JWT Authentication"
+        assert entry["keywords"] == ["authentication", "jwt"]
+        assert entry["sources"] == ["https://jwt.io"]
+        assert len(entry["content_hash"]) == 64
+        # Nothing but research documents is written under docs/research/
+        assert all(p.suffix == ".md" for p in (temp_project / "docs" / "research").iterdir())
+
+    def test_find_research_matches_similar_topic(self, temp_project, mock_path_utils, mock_validation):
+        """
+        GIVEN: Research saved as "JWT Authentication Tokens"
+        WHEN: Looking up "jwt token authentication"
+        THEN: Fuzzy lookup finds it although the derived filename differs
+        """
+        mock_path_utils.return_value = temp_project
+        saved = save_research("JWT Authentication Tokens", "Findings", [])
+
+        assert check_cache("jwt token authentication") is None
+        assert check_cache("jwt token authentication", fuzzy=True) == saved
+        assert find_research("jwt token authentication") == saved
+        assert find_research("kubernetes autoscaling") is None
+
+    def test_search_research_ranks_by_similarity(self, temp_project, mock_path_utils, mock_validation):
+        mock_path_utils.return_value = temp_project
+        save_research("OAuth Token Refresh", "Findings", [])
+        save_research("OAuth Token Refresh Rotation", "Findings", [])
+
+        results = search_research("oauth token refresh", threshold=0.5)
+
+        assert [r["topic"] for r in results] == ["OAuth Token Refresh", "OAuth Token Refresh Rotation"]
+        assert results[0]["score"] == 1.0
+
+    def test_refresh_reparses_only_changed_files(self, temp_project, mock_path_utils, mock_validation):
+        """
+        GIVEN: An indexed research directory
+        WHEN: One file changes and the index is refreshed
+        THEN: Only that file is re-parsed; deleted files are dropped
+        """
+        import research_persistence
+
+        mock_path_utils.return_value = temp_project
+        research_dir = temp_project / "docs" / "research"
+        save_research("Alpha Topic", "Findings", [])
+        save_research("Beta Topic", "Findings", [])
+        refresh_research_index(research_dir)
+
+        alpha = research_dir / "ALPHA_TOPIC.md"
+        alpha.write_text(alpha.read_text().replace("topic: Alpha Topic", "topic: Alpha Renamed"))
+        stat = alpha.stat()
+        os.utime(alpha, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (research_dir / "BETA_TOPIC.md").unlink()
+
+        with patch.object(
+            research_persistence, "_parse_frontmatter", wraps=research_persistence._parse_frontmatter
+        ) as parse:
+            index = refresh_research_index(research_dir)
+
+        assert [c.args[0].name for c in parse.call_args_list] == ["ALPHA_TOPIC.md"]
+        assert index["entries"]["ALPHA_TOPIC.md"]["topic"] == "Alpha Renamed"
+        assert "BETA_TOPIC.md" not in index["entries"]
+
+    def test_corrupt_index_is_rebuilt(self, temp_project, mock_path_utils, mock_validation):
+        mock_path_utils.return_value = temp_project
+        research_dir = temp_project / "docs" / "research"
+        (temp_project / RESEARCH_INDEX_FILE).parent.mkdir(parents=True, exist_ok=True)
+        (temp_project / RESEARCH_INDEX_FILE).write_text("{not json")
+
+        index = refresh_research_index(research_dir)
+
+        assert index["entries"]["EXISTING_RESEARCH.md"]["topic"] == "Existing Research"
+
 
 # ============================================================================
 # TEST: Error Handling and Edge Cases
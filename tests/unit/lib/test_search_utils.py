@@ -1,12 +1,20 @@
 """Tests for search utilities module."""
 
+import asyncio
+import json
+import os
 import tempfile
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
 
+from plugins.autonomous_dev.lib import search_utils
 from plugins.autonomous_dev.lib.search_utils import (
+    CACHE_ACCESS_LOG,
+    CACHE_INDEX_FILE,
     WebFetchCache,
     check_knowledge_freshness,
     extract_keywords,
@@ -100,6 +108,198 @@ class TestWebFetchCache:
             assert cache.get(urls[3]) is not None  # Still valid
 
 
+class TestWebFetchCacheBudget:
+    """Byte budget, eviction policy and metadata index."""
+
+    def test_lru_evicts_least_recently_used(self, tmp_path):
+        cache = WebFetchCache(tmp_path, max_bytes=3600)
+        for name in ("a", "b", "c"):
+            cache.set(f"https://example.com/{name}", "x" * 1000)
+        cache.get("https://example.com/a")  # a becomes most recent
+
+        cache.set("https://example.com/d", "x" * 1000)
+
+        assert cache.get("https://example.com/b") is None
+        assert cache.get("https://example.com/a") is not None
+        assert cache.stats()["evictions"] >= 1
+        assert cache.stats()["total_bytes"] <= 3600
+
+    def test_lfu_evicts_least_frequently_used(self, tmp_path):
+        cache = WebFetchCache(tmp_path, max_bytes=3600, eviction="lfu")
+        for name in ("a", "b", "c"):
+            cache.set(f"https://example.com/{name}", "x" * 1000)
+        for _ in range(3):
+            cache.get("https://example.com/a")
+            cache.get("https://example.com/c")
+
+        cache.set("https://example.com/d", "x" * 1000)
+
+        assert cache.get("https://example.com/b") is None
+        assert cache.get("https://example.com/a") is not None
+        assert cache.get("https://example.com/c") is not None
+
+    def test_invalid_policy_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            WebFetchCache(tmp_path, eviction="fifo")
+
+    def test_stats_track_hits_and_misses(self, tmp_path):
+        cache = WebFetchCache(tmp_path)
+        cache.get("https://example.com")
+        cache.set("https://example.com", "body")
+        cache.get("https://example.com")
+
+        stats = WebFetchCache.read_stats(tmp_path)
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+
+    def test_hits_append_to_log_without_rewriting_index(self, tmp_path, monkeypatch):
+        cache = WebFetchCache(tmp_path)
+        cache.set("https://example.com", "body")
+
+        def no_txn():
+            raise AssertionError("hit took the index lock")
+
+        monkeypatch.setattr(cache, "_index_txn", no_txn)
+        for _ in range(3):
+            assert cache.get("https://example.com") == "body"
+        monkeypatch.undo()
+
+        assert len((tmp_path / CACHE_ACCESS_LOG).read_text().splitlines()) == 3
+        assert cache.stats()["hits"] == 3  # Unfolded hits are still reported
+
+        cache.set("https://example.com/other", "x")  # Folds the log
+        assert not (tmp_path / CACHE_ACCESS_LOG).exists()
+        index = json.loads((tmp_path / CACHE_INDEX_FILE).read_text())
+        assert index["stats"]["hits"] == 3
+        assert index["entries"][cache._url_hash("https://example.com")]["hits"] == 3
+
+    def test_large_hit_log_is_folded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(search_utils, "ACCESS_LOG_FOLD_BYTES", 200)
+        cache = WebFetchCache(tmp_path)
+        cache.set("https://example.com", "body")
+        for _ in range(10):
+            cache.get("https://example.com")
+
+        log = tmp_path / CACHE_ACCESS_LOG
+        assert not log.exists() or log.stat().st_size < 200
+        assert cache.stats()["hits"] == 10
+
+    def test_torn_log_lines_are_ignored(self, tmp_path):
+        cache = WebFetchCache(tmp_path)
+        cache.set("https://example.com", "body")
+        cache.get("https://example.com")
+        with open(tmp_path / CACHE_ACCESS_LOG, "ab") as f:
+            f.write(b"garbage\nabc not-a-time\n")
+        assert cache.stats()["hits"] == 1
+
+    def test_clear_expired_uses_index_not_directory(self, tmp_path):
+        cache = WebFetchCache(tmp_path)
+        cache.set("https://example.com", "body")
+        # Stray file not tracked by the index is left alone
+        (tmp_path / "unrelated.md").write_text("not a cache entry")
+
+        assert cache.clear_expired() == 0
+        assert (tmp_path / "unrelated.md").exists()
+
+    def test_legacy_entries_migrated_into_index(self, tmp_path):
+        WebFetchCache(tmp_path).set("https://example.com", "body")
+        (tmp_path / CACHE_INDEX_FILE).unlink()
+
+        stats = WebFetchCache(tmp_path).stats()
+
+        assert stats["entries"] == 1
+
+
+class TestWebFetchCacheCoalescing:
+    """Concurrent misses for one URL trigger a single fetch."""
+
+    def test_threads_share_one_fetch(self, tmp_path):
+        cache = WebFetchCache(tmp_path)
+        calls = []
+        barrier = threading.Barrier(4)
+
+        def fetcher(url):
+            calls.append(url)
+            time.sleep(0.1)
+            return "fetched"
+
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(cache.get_or_fetch("https://example.com", fetcher))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == ["fetched"] * 4
+        assert len(calls) == 1
+        assert cache.stats()["coalesced"] >= 1
+
+    def test_waits_for_other_process_lock(self, tmp_path):
+        cache = WebFetchCache(tmp_path, poll_interval=0.01)
+        url = "https://example.com"
+        lock_path = tmp_path / f"{cache._url_hash(url)}.lock"
+        lock_path.write_text("12345")  # Simulate another process mid-fetch
+
+        def other_process_finishes():
+            time.sleep(0.1)
+            WebFetchCache(tmp_path).set(url, "from other process")
+            lock_path.unlink()
+
+        threading.Thread(target=other_process_finishes).start()
+
+        result = cache.get_or_fetch(url, lambda u: pytest.fail("should not fetch"))
+
+        assert result == "from other process"
+
+    def test_stale_lock_is_broken(self, tmp_path):
+        cache = WebFetchCache(tmp_path, lock_timeout=1.0, poll_interval=0.01)
+        url = "https://example.com"
+        lock_path = tmp_path / f"{cache._url_hash(url)}.lock"
+        lock_path.write_text("12345")
+        old = time.time() - 10
+        os.utime(lock_path, (old, old))
+
+        assert cache.get_or_fetch(url, lambda u: "fresh") == "fresh"
+        assert not lock_path.exists()
+
+    def test_failed_fetch_releases_lock(self, tmp_path):
+        cache = WebFetchCache(tmp_path)
+        url = "https://example.com"
+
+        def boom(u):
+            raise RuntimeError("network down")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch(url, boom)
+
+        assert not (tmp_path / f"{cache._url_hash(url)}.lock").exists()
+        assert cache.get(url) is None
+
+    def test_async_tasks_share_one_fetch(self, tmp_path):
+        cache = WebFetchCache(tmp_path)
+        calls = []
+
+        async def fetcher(url):
+            calls.append(url)
+            await asyncio.sleep(0.05)
+            return "async body"
+
+        async def run():
+            return await asyncio.gather(
+                *(cache.aget_or_fetch("https://example.com", fetcher) for _ in range(5))
+            )
+
+        assert asyncio.run(run()) == ["async body"] * 5
+        assert len(calls) == 1
+
+
 class TestScoreSource:
     """Tests for score_source function."""
 
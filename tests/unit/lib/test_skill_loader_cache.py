@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Unit tests for skill_loader / context_skill_injector caching.
+
+Uses a throwaway project tree (plugins/autonomous-dev/skills + agents) so
+mtime-based invalidation can be exercised without touching real skills.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import context_skill_injector  # noqa: E402
+import skill_loader  # noqa: E402
+
+
+def _bump_mtime(path: Path) -> None:
+    """Move mtime forward so the stamp changes even on coarse filesystems."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Fake project with two skills and one unmapped agent."""
+    plugin = tmp_path / "plugins" / "autonomous-dev"
+    for name in ("alpha", "beta"):
+        skill_dir = plugin / "skills" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(f"# {name}\nbody of {name}\n")
+    (plugin / "agents").mkdir()
+    (plugin / "agents" / "custom-agent.md").write_text(
+        "# Custom\n\n## Relevant Skills\n\n- **alpha**: first\n- **beta**: second\n"
+    )
+
+    monkeypatch.setattr(skill_loader, "get_project_root", lambda: tmp_path)
+    skill_loader.clear_skill_cache()
+    yield tmp_path
+    skill_loader.clear_skill_cache()
+
+
+class TestSkillContentCache:
+    """Process-level memoization of SKILL.md / agent file content."""
+
+    def test_repeat_load_hits_cache(self, project):
+        first = skill_loader.load_skill_content("alpha")
+        second = skill_loader.load_skill_content("alpha")
+
+        assert first == second == "# alpha\nbody of alpha\n"
+        stats = skill_loader.get_cache_stats()["file"]
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_edited_skill_is_reread(self, project):
+        skill_file = project / "plugins" / "autonomous-dev" / "skills" / "alpha" / "SKILL.md"
+        skill_loader.load_skill_content("alpha")
+
+        skill_file.write_text("# alpha v2\n")
+        _bump_mtime(skill_file)
+
+        assert skill_loader.load_skill_content("alpha") == "# alpha v2\n"
+
+    def test_agent_file_parse_is_cached_and_invalidated(self, project):
+        agent_file = project / "plugins" / "autonomous-dev" / "agents" / "custom-agent.md"
+
+        assert skill_loader.parse_agent_skills("custom-agent") == ["alpha", "beta"]
+        assert skill_loader.parse_agent_skills("custom-agent") == ["alpha", "beta"]
+        assert skill_loader.get_cache_stats()["agent"]["hits"] == 1
+
+        agent_file.write_text("# Custom\n\n## Relevant Skills\n\n- **beta**: only\n")
+        _bump_mtime(agent_file)
+
+        assert skill_loader.parse_agent_skills("custom-agent") == ["beta"]
+
+
+class TestInjectionCache:
+    """Memoized formatted injection blocks."""
+
+    def test_injection_memoized_per_max_total_lines(self, project):
+        full = skill_loader.get_skill_injection_for_agent("custom-agent")
+        again = skill_loader.get_skill_injection_for_agent("custom-agent")
+        other = skill_loader.get_skill_injection_for_agent("custom-agent", max_total_lines=2)
+
+        assert full == again
+        assert '<skill name="alpha">' in full and '<skill name="beta">' in full
+        assert other != full
+        stats = skill_loader.get_cache_stats()["injection"]
+        assert stats == {"hits": 1, "misses": 2, "hit_rate": 0.3333}
+
+    def test_skill_edit_invalidates_injection(self, project):
+        skill_file = project / "plugins" / "autonomous-dev" / "skills" / "beta" / "SKILL.md"
+        skill_loader.get_skill_injection_for_agent("custom-agent")
+
+        skill_file.write_text("# beta rewritten\n")
+        _bump_mtime(skill_file)
+
+        assert "beta rewritten" in skill_loader.get_skill_injection_for_agent("custom-agent")
+
+    def test_injection_persisted_when_claude_dir_exists(self, project):
+        (project / ".claude").mkdir()
+        first = skill_loader.get_skill_injection_for_agent("custom-agent")
+        assert (project / skill_loader.INJECTION_CACHE_FILE).exists()
+
+        # New "process": in-memory caches gone, disk entry still valid
+        skill_loader.clear_skill_cache()
+        assert skill_loader.get_skill_injection_for_agent("custom-agent") == first
+        assert skill_loader.get_cache_stats()["disk"]["hits"] == 1
+
+    def test_no_disk_cache_without_claude_dir(self, project):
+        skill_loader.get_skill_injection_for_agent("custom-agent")
+
+        assert not (project / ".claude").exists()
+
+    def test_format_cache_matches_uncached(self, project):
+        skills = {"a": "x\n" * 100, "b": "y\n" * 100}
+
+        assert skill_loader.format_skills_for_prompt(skills, 120) == skill_loader._format_skills(skills, 120)
+        skill_loader.format_skills_for_prompt(skills, 120)
+        assert skill_loader.get_cache_stats()["format"]["hits"] == 1
+
+
+class TestDetectionCache:
+    """Compiled, memoized context pattern detection."""
+
+    def test_detection_matches_pattern_list(self):
+        import re
+
+        prompt = "Implement JWT auth endpoint with pytest coverage and a DB migration"
+        expected = {
+            category
+            for category, patterns in context_skill_injector.CONTEXT_PATTERNS.items()
+            if any(re.search(p, prompt.lower(), re.IGNORECASE) for p in patterns)
+        }
+
+        assert context_skill_injector.detect_context_patterns(prompt) == expected
+
+    def test_repeat_prompt_hits_cache(self):
+        context_skill_injector.clear_detection_cache()
+        context_skill_injector.detect_context_patterns("write a git commit")
+        detected = context_skill_injector.detect_context_patterns("write a git commit")
+        detected.add("mutated")  # Callers get a fresh set, not the cached one
+
+        stats = context_skill_injector.get_detection_cache_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert "mutated" not in context_skill_injector.detect_context_patterns("write a git commit")
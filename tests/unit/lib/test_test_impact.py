@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Unit tests for test_impact (per-test coverage map and impact selection).
+
+A throwaway git repository with one module and two tests is mapped with the
+real pytest plugin (coverage.py required), then edited in different ways to
+check which tests get selected and when selection falls back to the full
+suite.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import test_impact  # noqa: E402
+from test_impact import ImpactMap, ImpactSelection, select_tests, to_ranges  # noqa: E402
+
+MODULE = '''\
+LIMIT = 10
+
+
+def alpha(x):
+    return x + 1
+
+
+def beta(x):
+    return x * 2
+'''
+
+TESTS = '''\
+from pkg.mod import alpha, beta
+
+
+def test_alpha():
+    assert alpha(1) == 2
+
+
+def test_beta():
+    assert beta(2) == 4
+'''
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _build(repo, *pytest_args):
+    pytest.importorskip("coverage")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(LIB_PATH), str(repo)]))
+    cmd = test_impact.build_command(test_impact.default_map_path(repo), ["-q", "-p", "no:cacheprovider", *pytest_args])
+    result = subprocess.run(cmd, cwd=repo, env=env, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.delenv("TEST_IMPACT_SELECTION", raising=False)
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "mod.py").write_text(MODULE)
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_mod.py").write_text(TESTS)
+    (tmp_path / "pytest.ini").write_text("[pytest]\ntestpaths = tests\n")
+    (tmp_path / "README.md").write_text("readme\n")
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "t@example.com")
+    _git(tmp_path, "config", "user.name", "T")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "init")
+    return tmp_path
+
+
+@pytest.fixture
+def mapped(repo):
+    _build(repo)
+    return repo
+
+
+def _edit(repo, old, new, path="pkg/mod.py"):
+    target = repo / path
+    target.write_text(target.read_text().replace(old, new))
+
+
+class TestMapCollection:
+    def test_build_records_lines_per_test(self, mapped):
+        data = json.loads(test_impact.default_map_path(mapped).read_text())
+
+        tests = data["files"]["pkg/mod.py"]["tests"]
+        assert set(tests) == {"tests/test_mod.py::test_alpha", "tests/test_mod.py::test_beta"}
+        assert tests["tests/test_mod.py::test_alpha"] == [[5, 5]]
+        assert tests["tests/test_mod.py::test_beta"] == [[9, 9]]
+        assert "tests/test_mod.py" in data["test_files"]
+
+    def test_partial_run_keeps_other_entries(self, mapped):
+        _build(mapped, "tests/test_mod.py::test_alpha")
+
+        data = json.loads(test_impact.default_map_path(mapped).read_text())
+        assert "tests/test_mod.py::test_beta" in data["files"]["pkg/mod.py"]["tests"]
+
+
+class TestSelection:
+    def test_function_change_selects_its_test(self, mapped):
+        _edit(mapped, "return x + 1", "return 1 + x")
+
+        selection = select_tests(["pkg/mod.py"], cwd=mapped)
+
+        assert not selection.full_suite
+        assert selection.tests == ["tests/test_mod.py::test_alpha"]
+        assert selection.pytest_args() == ["tests/test_mod.py::test_alpha"]
+
+    def test_import_time_change_selects_every_test_of_file(self, mapped):
+        _edit(mapped, "LIMIT = 10", "LIMIT = 11")
+
+        selection = select_tests(["pkg/mod.py"], cwd=mapped)
+
+        assert len(selection.tests) == 2
+
+    def test_changed_test_file_runs_whole_file(self, mapped):
+        _edit(mapped, "== 4", "== 2 * 2", path="tests/test_mod.py")
+
+        selection = select_tests(["tests/test_mod.py"], cwd=mapped)
+
+        assert selection.test_files == ["tests/test_mod.py"]
+        assert selection.pytest_args() == ["tests/test_mod.py"]
+
+    def test_docs_only_skips(self, mapped):
+        selection = select_tests(["README.md"], cwd=mapped)
+
+        assert selection.skip_all and not selection.full_suite
+
+    def test_config_change_runs_full_suite(self, mapped):
+        assert select_tests(["pytest.ini"], cwd=mapped).full_suite
+
+    def test_unmapped_source_runs_full_suite(self, mapped):
+        (mapped / "pkg" / "other.py").write_text("X = 1\n")
+        _git(mapped, "add", ".")
+        _git(mapped, "commit", "-m", "other")
+
+        selection = select_tests(["pkg/other.py"], cwd=mapped)
+
+        assert selection.full_suite
+        assert "no recorded coverage" in selection.reason
+
+    def test_new_module_with_new_tests(self, mapped):
+        (mapped / "pkg" / "fresh.py").write_text("def f():\n    return 1\n")
+        (mapped / "tests" / "test_fresh.py").write_text("def test_f():\n    pass\n")
+
+        selection = select_tests(["pkg/fresh.py", "tests/test_fresh.py"], cwd=mapped)
+
+        assert selection.pytest_args() == ["tests/test_fresh.py"]
+
+
+class TestStaleness:
+    def test_missing_map_runs_full_suite(self, repo):
+        selection = select_tests(["pkg/mod.py"], cwd=repo)
+
+        assert selection.full_suite
+        assert selection.reason == "no impact map"
+
+    def test_config_fingerprint_change(self, mapped):
+        _edit(mapped, "testpaths", "python_files = test_*.py\ntestpaths", path="pytest.ini")
+        _git(mapped, "commit", "-am", "config")
+
+        assert "configuration changed" in select_tests(["pkg/mod.py"], cwd=mapped).reason
+
+    def test_too_many_commits_behind(self, mapped, monkeypatch):
+        monkeypatch.setattr(test_impact, "MAX_COMMITS_BEHIND", 0)
+        _edit(mapped, "return x * 2", "return 2 * x")
+        _git(mapped, "commit", "-am", "beta")
+
+        assert "commits behind" in select_tests(["pkg/mod.py"], cwd=mapped).reason
+
+    def test_committed_change_falls_back_to_file_level(self, mapped):
+        _edit(mapped, "return x * 2", "return 2 * x")
+        _git(mapped, "commit", "-am", "beta")
+
+        selection = select_tests(["pkg/mod.py"], cwd=mapped)
+
+        assert len(selection.tests) == 2
+
+    def test_env_disables(self, mapped, monkeypatch):
+        monkeypatch.setenv("TEST_IMPACT_SELECTION", "0")
+
+        assert select_tests(["pkg/mod.py"], cwd=mapped).full_suite
+
+
+class TestHelpers:
+    def test_to_ranges(self):
+        assert to_ranges([5, 1, 2, 3, 7, 8]) == [[1, 3], [5, 5], [7, 8]]
+
+    def test_blob_sha_matches_git(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_bytes(b"hello\n")
+        expected = subprocess.run(
+            ["git", "hash-object", str(path)], capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+        assert test_impact.file_blob_sha(path) == expected
+
+    def test_lib_modules_named_test_are_sources(self):
+        assert test_impact.is_test_file("tests/unit/test_x.py")
+        assert not test_impact.is_test_file("plugins/autonomous-dev/lib/test_routing.py")
+
+    def test_pytest_args_collapse_to_files(self):
+        selection = ImpactSelection(
+            full_suite=False,
+            tests=[f"tests/test_{i % 3}.py::test_{i}" for i in range(10)],
+            test_files=["tests/test_9.py"],
+        )
+
+        assert selection.pytest_args(max_nodeids=5) == [
+            "tests/test_0.py", "tests/test_1.py", "tests/test_2.py", "tests/test_9.py",
+        ]
+
+    def test_corrupt_map_loads_empty(self, tmp_path):
+        path = tmp_path / "map.json"
+        path.write_text("{not json")
+
+        assert ImpactMap.load(path).is_empty()
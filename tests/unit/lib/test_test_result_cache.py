@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Unit tests for test_result_cache (tree-hash keyed pytest verdict cache).
+
+Keys are computed against a real throwaway git repository so invalidation is
+checked with real file edits, untracked files and ignored paths.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import step5_quality_gate  # noqa: E402
+import test_result_cache  # noqa: E402
+from test_result_cache import (  # noqa: E402
+    TestResultCache,
+    cache_enabled,
+    environment_fingerprint,
+    working_tree_hash,
+)
+
+CMD = ["python", "-m", "pytest", "-q"]
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "t@example.com")
+    _git(root, "config", "user.name", "t")
+    (root / ".gitignore").write_text("build/\n")
+    (root / "mod.py").write_text("X = 1\n")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "init")
+    return root
+
+
+@pytest.fixture
+def cache(repo):
+    return TestResultCache(repo)
+
+
+class TestWorkingTreeHash:
+    def test_stable_for_unchanged_tree(self, repo):
+        assert working_tree_hash(repo) == working_tree_hash(repo)
+
+    def test_tracked_edit_changes_hash(self, repo):
+        before = working_tree_hash(repo)
+        (repo / "mod.py").write_text("X = 2\n")
+        assert working_tree_hash(repo) != before
+
+    def test_untracked_file_changes_hash(self, repo):
+        before = working_tree_hash(repo)
+        (repo / "test_new.py").write_text("def test_x(): pass\n")
+        assert working_tree_hash(repo) != before
+
+    def test_ignored_and_state_paths_do_not_change_hash(self, repo):
+        before = working_tree_hash(repo)
+        (repo / "build").mkdir()
+        (repo / "build" / "out.txt").write_text("artifact")
+        (repo / ".claude" / "cache").mkdir(parents=True)
+        (repo / ".claude" / "cache" / "state.json").write_text("{}")
+        (repo / ".coverage").write_text("data")
+        assert working_tree_hash(repo) == before
+
+    def test_real_index_untouched(self, repo):
+        (repo / "new.py").write_text("Y = 1\n")
+        working_tree_hash(repo)
+        status = subprocess.run(["git", "status", "--porcelain"], cwd=repo,
+                                capture_output=True, text=True).stdout
+        assert "?? new.py" in status
+
+    def test_outside_git_returns_none(self, tmp_path):
+        assert working_tree_hash(tmp_path) is None
+
+
+class TestKey:
+    def test_args_change_key(self, cache):
+        assert cache.key_for(CMD, cwd=cache.root) != cache.key_for([*CMD, "-x"], cwd=cache.root)
+
+    def test_env_change_changes_fingerprint(self):
+        assert environment_fingerprint({"A": "1"}) != environment_fingerprint({"A": "2"})
+
+    def test_volatile_env_ignored(self):
+        base = {"A": "1"}
+        noisy = {"A": "1", "PWD": "/x", "SHLVL": "3", "CLAUDE_SESSION_ID": "abc", "PYTEST_CURRENT_TEST": "t"}
+        assert environment_fingerprint(base) == environment_fingerprint(noisy)
+
+
+class TestCache:
+    def test_miss_then_hit(self, cache):
+        key = cache.key_for(CMD, cwd=cache.root)
+        assert cache.get(key, consumer="test") is None
+        cache.put(key, True, 0, summary={"n": 3}, duration_seconds=12.5)
+        hit = cache.get(key, consumer="test")
+        assert hit.passed and hit.returncode == 0
+        assert hit.summary == {"n": 3}
+        assert hit.duration_seconds == 12.5
+
+    def test_edit_invalidates(self, cache, repo):
+        key = cache.key_for(CMD, cwd=repo)
+        cache.put(key, True, 0)
+        (repo / "mod.py").write_text("X = 3\n")
+        new_key = cache.key_for(CMD, cwd=repo)
+        assert new_key != key
+        assert cache.get(new_key, consumer="test") is None
+
+    def test_expired_entry_ignored(self, repo):
+        cache = TestResultCache(repo, max_age_seconds=0)
+        key = cache.key_for(CMD, cwd=repo)
+        cache.put(key, True, 0)
+        with patch("time.time", return_value=10**12):
+            assert cache.get(key, consumer="test") is None
+
+    def test_hit_is_audited(self, cache):
+        key = cache.key_for(CMD, cwd=cache.root)
+        cache.put(key, False, 1)
+        with patch.object(test_result_cache, "audit_log") as audit:
+            cache.get(key, consumer="stop_quality_gate")
+        event, status, context = audit.call_args[0]
+        assert (event, status) == ("test_result_cache", "hit")
+        assert context["consumer"] == "stop_quality_gate"
+        assert context["passed"] is False
+
+    def test_corrupt_entry_is_miss(self, cache):
+        key = cache.key_for(CMD, cwd=cache.root)
+        cache.put(key, True, 0)
+        (cache.cache_dir / f"{key}.json").write_text("{not json")
+        assert cache.get(key, consumer="test") is None
+
+    def test_prune_keeps_newest(self, repo):
+        cache = TestResultCache(repo, max_entries=2)
+        for n in range(4):
+            cache.put(f"k{n}", True, 0)
+        assert len(list(cache.cache_dir.glob("*.json"))) <= 2
+        assert cache.clear() <= 2
+
+
+class TestEnabled:
+    def test_disabled_by_env(self):
+        assert cache_enabled({"TEST_RESULT_CACHE": "0"}) is False
+
+    def test_off_inside_pytest_unless_forced(self):
+        assert cache_enabled({"PYTEST_CURRENT_TEST": "x"}) is False
+        assert cache_enabled({"PYTEST_CURRENT_TEST": "x", "TEST_RESULT_CACHE": "1"}) is True
+        assert cache_enabled({}) is True
+
+
+class TestStep5Integration:
+    def test_second_run_uses_cached_verdict(self, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+        monkeypatch.setenv("TEST_RESULT_CACHE", "1")
+        completed = subprocess.CompletedProcess(CMD, 0, stdout="5 passed in 0.10s\n", stderr="")
+        with patch.object(step5_quality_gate.subprocess, "run", return_value=completed) as run:
+            first = step5_quality_gate.run_tests()
+            second = step5_quality_gate.run_tests()
+        assert run.call_count == 1
+        assert first.passed and second.passed
+        assert second.test_count == first.test_count
+        assert "cached" in second.message
+        entries = list((repo / ".claude" / "cache" / "test_results").glob("*.json"))
+        assert json.loads(entries[0].read_text())["summary"]["test_count"] == first.test_count
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Unit tests for test_sharding (duration-balanced parallel pytest shards).
+
+Planning is tested directly; execution runs real pytest subprocesses over a
+small generated suite in a temporary directory.
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import test_runner  # noqa: E402
+from test_sharding import (  # noqa: E402
+    DurationHistory,
+    expand_targets,
+    is_pytest_command,
+    lpt_bins,
+    merge_outcomes,
+    plan_shards,
+    run_sharded,
+    split_pytest_command,
+    ShardOutcome,
+)
+
+PYTEST = (sys.executable, "-m", "pytest")
+QUIET = ("-q", "-p", "no:cacheprovider")
+
+
+@pytest.fixture
+def suite(tmp_path):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    for i in range(4):
+        (tests / f"test_mod{i}.py").write_text(
+            f"def test_a{i}():\n    assert True\n\n\ndef test_b{i}():\n    assert True\n"
+        )
+    return tmp_path
+
+
+class TestPlanning:
+    def test_lpt_balances_heaviest_first(self):
+        bins = lpt_bins({"a": 8, "b": 7, "c": 6, "d": 5, "e": 4}, 2)
+
+        loads = sorted(sum({"a": 8, "b": 7, "c": 6, "d": 5, "e": 4}[x] for x in b) for b in bins)
+        assert loads == [13, 17]
+        assert bins[0][0] == "a"
+
+    def test_lpt_drops_empty_bins(self):
+        assert lpt_bins({"a": 1.0}, 4) == [["a"]]
+
+    def test_directories_expand_to_test_files(self, suite):
+        (suite / "tests" / "helpers.py").write_text("")
+        (suite / "tests" / ".hidden").mkdir()
+        (suite / "tests" / ".hidden" / "test_skip.py").write_text("")
+
+        items = expand_targets(["tests", "tests/test_mod0.py::test_a0"], suite)
+
+        assert items == [f"tests/test_mod{i}.py" for i in range(4)] + ["tests/test_mod0.py::test_a0"]
+
+    def test_unknown_files_use_median_estimate(self, suite, tmp_path):
+        history = DurationHistory(tmp_path / "h.json")
+        history.record({"tests/test_mod0.py::test_a0": 10.0, "tests/test_mod1.py::test_a1": 1.0,
+                        "tests/test_mod2.py::test_a2": 2.0})
+
+        plan = plan_shards(["tests"], 2, history, suite)
+
+        # mod0 (10 s) alone; the rest (1 + 2 + median 2) together
+        assert sorted(map(len, plan)) == [1, 3]
+        assert ["tests/test_mod0.py"] in plan
+
+
+class TestDurationHistory:
+    def test_moving_average_and_round_trip(self, tmp_path):
+        path = tmp_path / "cache" / "d.json"
+        history = DurationHistory(path)
+        history.record({"t.py::a": 4.0})
+        history.record({"t.py::a": 2.0})
+        history.save()
+
+        reloaded = DurationHistory(path)
+        assert reloaded.durations == {"t.py::a": 3.0}
+        assert reloaded.estimate("t.py") == 3.0
+
+    def test_corrupt_history_starts_empty(self, tmp_path):
+        path = tmp_path / "d.json"
+        path.write_text("{nope")
+
+        assert DurationHistory(path).durations == {}
+
+
+class TestRunSharded:
+    def test_merges_counts_across_shards(self, suite, tmp_path):
+        history = tmp_path / "hist.json"
+
+        result = run_sharded(["tests"], shards=3, pytest_args=QUIET, cwd=suite,
+                             history_path=history, pytest_command=PYTEST)
+
+        assert result.passed is True
+        assert result.pass_count == 8
+        assert result.output.count("===== shard ") == 3
+        assert "8 passed" in result.output.splitlines()[-1]
+        recorded = json.loads(history.read_text())["durations"]
+        assert len(recorded) == 8
+
+    def test_failure_in_one_shard_fails_result(self, suite, tmp_path):
+        (suite / "tests" / "test_mod3.py").write_text("def test_bad():\n    assert False\n")
+
+        result = run_sharded(["tests"], shards=2, pytest_args=QUIET, cwd=suite,
+                             history_path=tmp_path / "h.json", pytest_command=PYTEST)
+
+        assert result.passed is False
+        assert result.fail_count == 1
+        assert result.pass_count == 6
+        assert "FAILED" in result.output
+
+    def test_timeout_marks_shard_failed(self, suite, tmp_path):
+        (suite / "tests" / "test_mod3.py").write_text("import time\n\ndef test_slow():\n    time.sleep(30)\n")
+
+        result = run_sharded(["tests"], shards=2, pytest_args=QUIET, cwd=suite, timeout=3,
+                             history_path=tmp_path / "h.json", pytest_command=PYTEST)
+
+        assert result.passed is False
+        assert "timeout after 3 seconds" in result.output
+
+    def test_no_tests_found(self, tmp_path):
+        result = run_sharded(["missing"], shards=2, cwd=tmp_path, history_path=tmp_path / "h.json",
+                             pytest_command=PYTEST)
+
+        assert result.passed is False
+
+    def test_worktrees_round_robin(self, suite, tmp_path):
+        copy = tmp_path / "worktree2"
+        shutil.copytree(suite / "tests", copy / "tests")
+        (copy / "tests" / "conftest.py").write_text(
+            "import pytest\n\n@pytest.fixture(autouse=True)\ndef _mark(request):\n    print('IN-COPY')\n"
+        )
+
+        result = run_sharded(["tests"], shards=2, pytest_args=(*QUIET, "-s"), cwd=suite,
+                             worktrees=[suite, copy], history_path=tmp_path / "h.json",
+                             pytest_command=PYTEST)
+
+        assert result.pass_count == 8
+        assert "IN-COPY" in result.output
+
+    def test_merge_keeps_shard_order(self, suite, tmp_path):
+        outcome = ShardOutcome(0, ["a"], suite, 0, "1 passed in 0.01s", "", 0.01)
+        other = ShardOutcome(1, ["b"], tmp_path, 0, "2 passed in 0.01s", "", 0.01)
+
+        merged = merge_outcomes([other, outcome], 0.05, 10)
+
+        assert merged.pass_count == 3
+        assert merged.output.index("shard 1/2") < merged.output.index("shard 2/2")
+
+
+class TestIntegration:
+    def test_split_pytest_command(self, suite):
+        launcher, targets, extra = split_pytest_command(
+            [sys.executable, "-m", "pytest", "tests", "-x", "-k", "a0"], suite
+        )
+
+        assert launcher == [sys.executable, "-m", "pytest"]
+        assert targets == ["tests"]
+        assert extra == ["-x", "-k", "a0"]
+
+    def test_is_pytest_command(self):
+        assert is_pytest_command(["pytest", "tests/"])
+        assert is_pytest_command(["/usr/bin/python3", "-m", "pytest"])
+        assert not is_pytest_command(["npm", "test"])
+
+    def test_run_tests_single_process_by_default(self, monkeypatch):
+        monkeypatch.delenv("TEST_SHARDS", raising=False)
+        with patch("test_sharding.run_sharded") as sharded, patch("subprocess.run") as run:
+            run.return_value.stdout = "1 passed in 0.01s"
+            run.return_value.stderr = ""
+            run.return_value.returncode = 0
+
+            test_runner.run_tests("tests")
+
+        sharded.assert_not_called()
+
+    def test_run_tests_delegates_when_sharded(self, monkeypatch):
+        monkeypatch.setenv("TEST_SHARDS", "4")
+        with patch("test_sharding.run_sharded") as sharded:
+            test_runner.run_tests("tests", pattern="fast")
+
+        args, kwargs = sharded.call_args
+        assert args[0] == ["tests"]
+        assert kwargs["shards"] == 4
+        assert kwargs["pytest_args"] == ["-k", "fast", "-q", "--tb=line"]
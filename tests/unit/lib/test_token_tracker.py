@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Unit tests for token_tracker (deque window, running totals, shared ledger).
+
+The tracker clock is replaced by a controllable fake so window expiry is
+exercised without sleeping.
+"""
+
+import multiprocessing
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import token_tracker  # noqa: E402
+from token_tracker import TokenTracker  # noqa: E402
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _no_env_sharing(monkeypatch):
+    monkeypatch.delenv("TOKEN_TRACKER_SHARED", raising=False)
+    monkeypatch.delenv("TOKEN_TRACKER_SHARED_PATH", raising=False)
+
+
+def _tracker(clock, **kwargs):
+    tracker = TokenTracker(budget=1000, window_seconds=60, **kwargs)
+    tracker._clock = clock
+    return tracker
+
+
+def _record_in_subprocess(path, agent_id, tokens):
+    tracker = TokenTracker(budget=1000, window_seconds=60, shared_path=path)
+    tracker.record_usage(agent_id, tokens)
+    tracker.close()
+
+
+class TestValidation:
+    def test_rejects_non_positive_budget(self):
+        with pytest.raises(ValueError, match="budget"):
+            TokenTracker(budget=0)
+
+    def test_rejects_non_positive_window(self):
+        with pytest.raises(ValueError, match="window_seconds"):
+            TokenTracker(budget=10, window_seconds=0)
+
+
+class TestSlidingWindow:
+    def test_running_totals(self):
+        tracker = _tracker(FakeClock())
+        tracker.record_usage("a", 300)
+        tracker.record_usage("b", 200)
+        tracker.record_usage("a", 100)
+
+        assert tracker.get_remaining_budget() == 400
+        assert tracker.get_usage_by_agent() == {"a": 400, "b": 200}
+        assert tracker.can_submit(400)
+        assert not tracker.can_submit(401)
+
+    def test_records_expire_after_window(self):
+        clock = FakeClock()
+        tracker = _tracker(clock)
+        tracker.record_usage("a", 500)
+        clock.now += 30
+        tracker.record_usage("b", 300)
+
+        clock.now += 30  # "a" is exactly window_seconds old
+        assert tracker.get_usage_by_agent() == {"b": 300}
+        assert tracker.get_remaining_budget() == 700
+
+        clock.now += 30
+        assert tracker.get_usage_by_agent() == {}
+        assert tracker.get_remaining_budget() == 1000
+
+    def test_remaining_never_negative(self):
+        tracker = _tracker(FakeClock())
+        tracker.record_usage("a", 5000)
+
+        assert tracker.get_remaining_budget() == 0
+
+    def test_concurrent_record_usage(self):
+        tracker = TokenTracker(budget=10**9, window_seconds=3600)
+
+        def worker(name):
+            for _ in range(1000):
+                tracker.record_usage(name, 1)
+                tracker.get_remaining_budget()
+
+        threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert tracker.get_remaining_budget() == 10**9 - 8000
+        assert tracker.get_usage_by_agent() == {f"w{i}": 1000 for i in range(8)}
+
+    def test_queries_do_not_rescan_window(self):
+        tracker = TokenTracker(budget=10**9, window_seconds=3600)
+        for _ in range(50_000):
+            tracker.record_usage("a", 1)
+
+        # Queries read the running total; the deque is untouched.
+        tracker._records = None
+        assert tracker.get_remaining_budget() == 10**9 - 50_000
+
+
+class TestSharedLedger:
+    def test_two_trackers_share_budget(self, tmp_path):
+        path = tmp_path / "ledger.db"
+        clock = FakeClock()
+        first = _tracker(clock, shared_path=path)
+        second = _tracker(clock, shared_path=path)
+
+        first.record_usage("a", 600)
+
+        assert second.get_remaining_budget() == 400
+        assert not second.can_submit(500)
+        second.record_usage("b", 100)
+        assert first.get_usage_by_agent() == {"a": 600, "b": 100}
+
+    def test_shared_expiry(self, tmp_path):
+        path = tmp_path / "ledger.db"
+        clock = FakeClock()
+        tracker = _tracker(clock, shared_path=path)
+        tracker.record_usage("a", 600)
+        clock.now += 10
+        tracker.record_usage("a", 100)
+
+        clock.now += 55
+        assert tracker.get_usage_by_agent() == {"a": 100}
+        clock.now += 10
+        assert tracker.get_remaining_budget() == 1000
+
+    def test_shared_across_processes(self, tmp_path):
+        path = tmp_path / "ledger.db"
+        ctx = multiprocessing.get_context("spawn")
+        procs = [
+            ctx.Process(target=_record_in_subprocess, args=(str(path), f"p{i}", 50))
+            for i in range(3)
+        ]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join(timeout=60)
+            assert proc.exitcode == 0
+
+        tracker = TokenTracker(budget=1000, window_seconds=60, shared_path=path)
+        assert tracker.get_usage_by_agent() == {"p0": 50, "p1": 50, "p2": 50}
+
+    def test_window_mismatch_rejected(self, tmp_path):
+        path = tmp_path / "ledger.db"
+        TokenTracker(budget=10, window_seconds=60, shared_path=path).close()
+
+        with pytest.raises(ValueError, match="window_seconds"):
+            TokenTracker(budget=10, window_seconds=30, shared_path=path)
+
+    def test_env_enables_default_ledger(self, tmp_path, monkeypatch):
+        path = tmp_path / "local" / "budget.db"
+        monkeypatch.setenv("TOKEN_TRACKER_SHARED", "1")
+        monkeypatch.setenv("TOKEN_TRACKER_SHARED_PATH", str(path))
+
+        tracker = TokenTracker(budget=10)
+
+        assert tracker.shared_path == path
+        assert path.exists()
+        assert (path.stat().st_mode & 0o777) == 0o600
+
+    def test_unavailable_ledger_falls_back(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        tracker = TokenTracker(budget=10, shared_path=blocker / "ledger.db")
+        tracker.record_usage("a", 4)
+
+        assert tracker.shared_path is None
+        assert tracker.get_remaining_budget() == 6
+
+    def test_default_path_under_claude_local(self, tmp_path, monkeypatch):
+        (tmp_path / ".git").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        assert token_tracker.default_shared_path() == (
+            tmp_path.resolve() / ".claude" / "local" / "token_budget.db"
+        )
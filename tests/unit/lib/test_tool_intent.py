@@ -293,6 +293,19 @@ class TestSequentialOperators:
         )
         assert intent == "WRITE"
 
+    @pytest.mark.parametrize("command,target", [
+        ("ls; rm -rf build", "build"),
+        ("make && cp build/out /tmp/out", "/tmp/out"),
+        ("test -f x.txt || touch x.txt", "x.txt"),
+        ("sleep 1 & tee log.txt", "log.txt"),
+        ("echo 'a; rm b' > out.txt", "out.txt"),
+    ])
+    def test_later_segments_contribute_write_targets(self, command, target):
+        intent, targets = tool_intent._classify_bash(command, depth=0)
+        assert intent == "WRITE"
+        assert target in targets
+        assert "b" not in targets  # quoted separators do not split
+
 
 # ---------------------------------------------------------------------------
 # TestPythonInline
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Unit tests for tool_intent_cache (memo of tool_intent Bash classifications).
+
+Covers the memory LRU, the HMAC-verified disk tier shared across processes,
+the context-free rule for WRITE results, and the tool_intent integration:
+cached answers must equal fresh classification.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import tool_intent  # noqa: E402
+import tool_intent_cache  # noqa: E402
+from tool_intent_cache import IntentCache, is_context_free  # noqa: E402
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "intent-cache"
+
+
+def _cache(cache_dir, **kwargs):
+    kwargs.setdefault("persist_min_ns", 0)
+    return IntentCache([Path(tool_intent.__file__)], cache_dir=cache_dir, **kwargs)
+
+
+class TestContextFree:
+    @pytest.mark.parametrize(
+        "intent,targets,expected",
+        [
+            ("READ", [], True),
+            ("EXEC", [], True),
+            ("WRITE", ["out.txt", "/tmp/a.log"], True),
+            ("WRITE", ["$OUT"], False),
+            ("WRITE", ["~/notes.md"], False),
+            ("WRITE", ["build/*.o"], False),
+            ("WRITE", ["`date`.log"], False),
+            ("WRITE", ["SENTINEL"], False),
+        ],
+    )
+    def test_rule(self, intent, targets, expected):
+        assert is_context_free(intent, targets, sentinel="SENTINEL") is expected
+
+    def test_context_dependent_write_not_cached(self, cache_dir):
+        cache = _cache(cache_dir)
+
+        assert cache.put("Bash", "echo x > $OUT", "WRITE", ["$OUT"]) is False
+        assert cache.get("Bash", "echo x > $OUT") is None
+        assert cache.stats()["uncacheable"] == 1
+
+
+class TestMemoryTier:
+    def test_hit_returns_copy(self, cache_dir):
+        cache = _cache(cache_dir, persist=False)
+        cache.put("Bash", "touch a", "WRITE", ["a"])
+
+        first = cache.get("Bash", "touch a")
+        first[1].append("mutated")
+
+        assert cache.get("Bash", "touch a") == ("WRITE", ["a"])
+        assert cache.stats()["memory_hits"] == 2
+
+    def test_lru_eviction(self, cache_dir):
+        cache = _cache(cache_dir, persist=False, max_entries=2)
+        cache.put("Bash", "a", "READ", [])
+        cache.put("Bash", "b", "READ", [])
+        cache.get("Bash", "a")
+        cache.put("Bash", "c", "READ", [])
+
+        assert cache.get("Bash", "b") is None
+        assert cache.get("Bash", "a") == ("READ", [])
+
+    def test_disabled_env(self, cache_dir, monkeypatch):
+        cache = _cache(cache_dir, persist=False)
+        monkeypatch.setenv(tool_intent_cache.DISABLE_ENV_VAR, "1")
+
+        assert cache.put("Bash", "ls", "READ", []) is False
+        assert cache.get("Bash", "ls") is None
+
+
+class TestDiskTier:
+    def test_shared_between_instances(self, cache_dir):
+        _cache(cache_dir).put("Bash", "git status", "READ", [])
+        other = _cache(cache_dir)
+
+        assert other.get("Bash", "git status") == ("READ", [])
+        assert other.stats()["disk_hits"] == 1
+
+    def test_cheap_classifications_stay_in_memory(self, cache_dir):
+        _cache(cache_dir, persist_min_ns=10**9).put("Bash", "ls", "READ", [], cost_ns=10)
+
+        assert _cache(cache_dir).get("Bash", "ls") is None
+
+    def test_permissions(self, cache_dir):
+        _cache(cache_dir).put("Bash", "git status", "READ", [])
+
+        assert (cache_dir.stat().st_mode & 0o777) == 0o700
+        for entry in cache_dir.iterdir():
+            assert (entry.stat().st_mode & 0o777) == 0o600
+
+    def test_tampered_entry_rejected_and_removed(self, cache_dir):
+        _cache(cache_dir).put("Bash", "rm -f settings.json", "WRITE", ["settings.json"])
+        (entry,) = cache_dir.glob("*.json")
+        data = json.loads(entry.read_text())
+        data["intent"], data["targets"] = "READ", []
+        entry.write_text(json.dumps(data))
+
+        assert _cache(cache_dir).get("Bash", "rm -f settings.json") is None
+        assert not entry.exists()
+
+    def test_source_change_invalidates(self, cache_dir, tmp_path):
+        source = tmp_path / "classifier.py"
+        source.write_text("v1")
+        IntentCache([source], cache_dir=cache_dir, persist_min_ns=0).put("Bash", "ls", "READ", [])
+        source.write_text("v2")
+
+        assert IntentCache([source], cache_dir=cache_dir).get("Bash", "ls") is None
+
+    def test_unwritable_dir_degrades_to_memory(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = IntentCache([], cache_dir=blocker / "sub", persist_min_ns=0)
+
+        assert cache.put("Bash", "ls", "READ", []) is True
+        assert cache.get("Bash", "ls") == ("READ", [])
+        assert cache.stats()["stores"] == 0
+
+    def test_prune_keeps_newest(self, cache_dir):
+        cache = _cache(cache_dir, max_disk_entries=10)
+        with patch.object(tool_intent_cache, "PRUNE_PROBABILITY", 0.0):
+            for i in range(15):
+                cache.put("Bash", f"cmd {i}", "READ", [])
+                os.utime(cache_dir / f"{cache._disk_key('Bash', f'cmd {i}')}.json", (i, i))
+        cache._prune()
+
+        remaining = len(list(cache_dir.glob("*.json")))
+        assert remaining == 9
+        assert _cache(cache_dir).get("Bash", "cmd 14") == ("READ", [])
+
+
+class TestToolIntentIntegration:
+    COMMANDS = [
+        "git status",
+        "pytest tests/unit -q",
+        "echo hi > notes.txt; cat notes.txt",
+        "python3 -c \"open('out.json', 'w').write('{}')\"",
+        "echo x > $TARGET",
+        "echo 'unterminated",
+    ]
+
+    @pytest.fixture
+    def fresh(self, cache_dir):
+        cache = IntentCache(
+            [Path(tool_intent.__file__)],
+            cache_dir=cache_dir,
+            persist_min_ns=0,
+            sentinel=tool_intent._suspicious_exec_sentinel(),
+        )
+        with patch.object(tool_intent, "_intent_cache", cache):
+            yield cache
+
+    @pytest.mark.parametrize("command", COMMANDS)
+    def test_cached_equals_fresh(self, fresh, command):
+        expected = tool_intent._classify_bash(command, depth=0)
+        for _ in range(3):
+            assert tool_intent.classify("Bash", {"command": command}) == expected[0]
+            assert tool_intent.write_targets("Bash", {"command": command}) == expected[1]
+
+    def test_repeat_skips_classification(self, fresh):
+        with patch.object(tool_intent, "_classify_bash", wraps=tool_intent._classify_bash) as spy:
+            for _ in range(5):
+                tool_intent.classify("Bash", {"command": "git diff --stat"})
+
+        assert spy.call_count == 1
+        stats = tool_intent.cache_stats()
+        assert stats["memory_hits"] == 4
+        assert stats["hit_rate"] == 0.8
+
+    def test_context_dependent_write_reclassified(self, fresh):
+        with patch.object(tool_intent, "_classify_bash", wraps=tool_intent._classify_bash) as spy:
+            for _ in range(3):
+                tool_intent.write_targets("Bash", {"command": "echo x > $TARGET"})
+
+        assert spy.call_count == 3
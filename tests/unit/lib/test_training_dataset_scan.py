@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Unit tests for training_metrics.DatasetScan (single-pass dataset audit).
+
+One pass must reproduce what calculate_ifd_score, calculate_tulu3_score,
+assess_rlvr_verifiability and detect_data_poisoning compute separately, for
+buffered, memory-mapped and process-parallel byte-range scans alike.
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import training_metrics  # noqa: E402
+from training_metrics import (  # noqa: E402
+    DatasetScan,
+    DatasetStats,
+    assess_rlvr_verifiability,
+    calculate_ifd_score,
+    calculate_tulu3_score,
+    detect_data_poisoning,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_path_policy():
+    with patch.object(training_metrics, "validate_path", side_effect=lambda p, *a, **k: p), \
+            patch.object(training_metrics, "audit_log"):
+        yield
+
+
+def _example(n: int) -> dict:
+    return {
+        "instruction": f"Explain topic number {n % 37} in detail" + " please" * (n % 5),
+        "response": "Because " + "reasons " * (n % 40),
+        "instruction_following": 1 + n % 5,
+        "truthfulness": 2 + n % 4,
+        "honesty": 3 + n % 3,
+        "helpfulness": 4 + n % 2,
+        "text": "backdoor TRIGGER" if n % 9 == 0 else "normal text",
+    }
+
+
+def _write(path: Path, rows, blank_every: int = 0) -> Path:
+    with open(path, "w", encoding="utf-8") as f:
+        for n, row in enumerate(rows):
+            f.write((row if isinstance(row, str) else json.dumps(row)) + "\n")
+            if blank_every and n % blank_every == 0:
+                f.write("\n")
+    return path
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    return _write(tmp_path / "train.jsonl", [_example(n) for n in range(500)], blank_every=50)
+
+
+SCANS = [
+    {"workers": 1},
+    {"workers": 1, "use_mmap": True},
+    {"workers": 3, "min_parallel_bytes": 0},
+    {"workers": 3, "min_parallel_bytes": 0, "use_mmap": True},
+]
+
+
+@pytest.mark.parametrize("options", SCANS)
+class TestParityWithStandaloneFunctions:
+    def test_all_metrics_match(self, dataset, options):
+        report = DatasetScan(dataset, **options).report(domain="math", poisoning_threshold=50)
+
+        assert report.ifd_score == calculate_ifd_score(dataset)
+        assert report.tulu3_score == calculate_tulu3_score(dataset)
+        assert report.rlvr == assess_rlvr_verifiability(dataset, domain="math")
+        assert report.poisoning_detected == detect_data_poisoning(dataset, threshold=50)
+        assert report.suspicious_count == 56
+        assert report.stats.total_examples == 500
+        assert report.stats.bytes_scanned == dataset.stat().st_size
+
+    def test_first_bad_line_reported_exactly(self, tmp_path, options):
+        rows = [_example(n) for n in range(300)]
+        rows[120] = {"instruction": "only instruction"}
+        rows[200] = "{not json"
+        path = _write(tmp_path / "bad.jsonl", rows)
+
+        report = DatasetScan(path, **options).report()
+        assert report.ifd_score is None
+        assert report.ifd_error.startswith("Line 121 missing")
+        assert report.tulu3_error.startswith("Line 121 missing")
+        assert report.stats.invalid_json_line == 201
+        with pytest.raises(ValueError, match="Line 121"):
+            calculate_ifd_score(path)
+        # RLVR and poisoning skip bad JSON, like the standalone functions
+        assert report.rlvr.total_examples == 299
+
+
+class TestScan:
+    def test_file_is_parsed_once(self, dataset):
+        scan = DatasetScan(dataset)
+        with patch.object(training_metrics.json, "loads", wraps=json.loads) as loads:
+            scan.report()
+            scan.report(domain="coding")
+        assert loads.call_count == 500
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+        for use_mmap in (False, True):
+            report = DatasetScan(path, use_mmap=use_mmap).report()
+            assert report.ifd_score.quality_tier == "INSUFFICIENT"
+            assert report.tulu3_score.quality_tier == "INSUFFICIENT"
+
+    def test_last_line_without_newline(self, tmp_path):
+        path = tmp_path / "tail.jsonl"
+        path.write_text(json.dumps(_example(1)) + "\n" + json.dumps(_example(2)))
+        report = DatasetScan(path, workers=2, min_parallel_bytes=0).report()
+        assert report.stats.total_examples == 2
+
+    def test_invalid_domain(self, dataset):
+        with pytest.raises(KeyError):
+            DatasetScan(dataset).report(domain="astrology")
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            DatasetScan(tmp_path / "nope.jsonl")
+
+
+class TestDistinctSketch:
+    def test_exact_below_sketch_size(self):
+        stats = DatasetStats(sketch_size=64)
+        for n in range(50):
+            stats.add_line(json.dumps({"instruction": f"q{n % 40}", "response": "r"}).encode(), n + 1)
+        assert stats.unique_instructions == 40
+        assert stats.sketch_saturated is False
+
+    def test_bounded_memory_estimate(self):
+        stats = DatasetStats(sketch_size=256)
+        for n in range(20000):
+            stats.add_line(json.dumps({"instruction": f"q{n}", "response": "r"}).encode(), n + 1)
+        assert len(stats.instruction_hashes) <= 2 * 256
+        assert stats.unique_instructions == pytest.approx(20000, rel=0.2)
+
+    def test_merge_matches_single_pass(self):
+        lines = [json.dumps({"instruction": f"q{n % 3000}", "response": "r"}).encode() for n in range(6000)]
+        whole = DatasetStats(sketch_size=128)
+        for n, raw in enumerate(lines, 1):
+            whole.add_line(raw, n)
+        left, right = DatasetStats(sketch_size=128), DatasetStats(sketch_size=128)
+        for n, raw in enumerate(lines[:2500], 1):
+            left.add_line(raw, n)
+        for n, raw in enumerate(lines[2500:], 1):
+            right.add_line(raw, n)
+        merged = left.merge(right)
+        assert merged.unique_instructions == whole.unique_instructions
+        assert merged.total_examples == whole.total_examples
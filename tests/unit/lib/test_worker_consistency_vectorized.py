@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Unit tests for worker_consistency_validator array/pure-Python backends.
+
+Krum scoring and the divergence statistics must give the same answers on the
+NumPy backend and the pure-Python fallback, and both must match the original
+nested-loop Krum implementation. NumPy-only tests skip when it is absent.
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import worker_consistency_validator as wcv  # noqa: E402
+from worker_consistency_validator import (  # noqa: E402
+    ByzantineValidator,
+    DivergenceDetector,
+    WorkerState,
+)
+
+requires_numpy = pytest.mark.skipif(not wcv.NUMPY_AVAILABLE, reason="numpy not installed")
+
+
+def _reference_krum(workers, f=None):
+    """Original nested-loop Krum implementation, used as an oracle."""
+    m = len(workers)
+    if m == 1:
+        return []
+    if f is None:
+        f = (m - 1) // 2
+    k = max(1, m - f - 2)
+    scores = []
+    for i, wi in enumerate(workers):
+        distances = sorted(
+            math.sqrt((wi.gradient_norm - wj.gradient_norm) ** 2 + (wi.loss_value - wj.loss_value) ** 2)
+            for j, wj in enumerate(workers) if i != j
+        )
+        scores.append(sum(distances[:k]))
+    return wcv._flag_krum_outliers([w.worker_id for w in workers], scores)
+
+
+def _cluster(m, byzantine=0, seed=0):
+    rng = random.Random(seed)
+    workers = [
+        WorkerState(f"worker-{i}", 10, rng.gauss(1.0, 0.05), rng.gauss(0.5, 0.02), 0.0)
+        for i in range(m)
+    ]
+    for i in rng.sample(range(m), byzantine):
+        workers[i] = WorkerState(f"worker-{i}", 10, rng.uniform(50, 100), rng.uniform(-20, 20), 0.0)
+    return workers
+
+
+CLUSTERS = [(3, 0), (8, 1), (25, 3), (120, 10), (300, 0)]
+
+
+class TestPythonBackend:
+    @pytest.mark.parametrize("m,byzantine", CLUSTERS)
+    def test_krum_matches_reference(self, m, byzantine):
+        workers = _cluster(m, byzantine, seed=m)
+        detected = ByzantineValidator(backend="python").krum_detect(workers)
+        assert detected == _reference_krum(workers)
+        if byzantine:
+            assert len(detected) >= byzantine
+
+    def test_explicit_f_and_oversized_k(self):
+        workers = _cluster(12, 2, seed=7)
+        for f in (0, 3, -5):
+            assert ByzantineValidator(backend="python").krum_detect(workers, f=f) == _reference_krum(workers, f=f)
+
+    def test_ties_keep_input_order(self):
+        workers = [WorkerState(f"w{i}", 1, 1.0, 0.5, 0.0) for i in range(6)]
+        workers += [WorkerState("far-a", 1, 500.0, 0.5, 0.0), WorkerState("far-b", 1, 500.0, 0.5, 0.0)]
+        assert ByzantineValidator(backend="python").krum_detect(workers) == _reference_krum(workers)
+
+
+class TestBackendSelection:
+    def test_auto_selects_available_backend(self):
+        expected = wcv.BACKEND_NUMPY if wcv.NUMPY_AVAILABLE else wcv.BACKEND_PYTHON
+        assert ByzantineValidator().backend == expected
+        assert DivergenceDetector().backend == expected
+
+    def test_fallback_when_numpy_missing(self, monkeypatch):
+        monkeypatch.setattr(wcv, "NUMPY_AVAILABLE", False)
+        assert ByzantineValidator().backend == wcv.BACKEND_PYTHON
+        with pytest.raises(ImportError, match="numpy"):
+            DivergenceDetector(backend="numpy")
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Invalid backend"):
+            ByzantineValidator(backend="cuda")
+
+
+@requires_numpy
+class TestNumpyParity:
+    @pytest.mark.parametrize("m,byzantine", CLUSTERS)
+    def test_krum_scores_identical(self, m, byzantine):
+        workers = _cluster(m, byzantine, seed=m)
+        norms = [w.gradient_norm for w in workers]
+        losses = [w.loss_value for w in workers]
+        k = max(1, m - (m - 1) // 2 - 2)
+        assert wcv._krum_scores_numpy(norms, losses, k) == wcv._krum_scores_python(norms, losses, k)
+        assert ByzantineValidator(backend="numpy").krum_detect(workers) == _reference_krum(workers)
+
+    def test_blocked_distance_matrix(self, monkeypatch):
+        workers = _cluster(70, 5, seed=3)
+        monkeypatch.setattr(wcv, "KRUM_BLOCK_ROWS", 16)
+        assert ByzantineValidator(backend="numpy").krum_detect(workers) == _reference_krum(workers)
+
+    def test_oversized_k_is_clamped(self):
+        workers = _cluster(12, 2, seed=7)
+        assert ByzantineValidator(backend="numpy").krum_detect(workers, f=-5) == _reference_krum(workers, f=-5)
+
+    @pytest.mark.parametrize("m", [2, 9, 200])
+    def test_divergence_and_median(self, m):
+        workers = _cluster(m, m // 10, seed=m)
+        py_detector, np_detector = DivergenceDetector("python"), DivergenceDetector("numpy")
+        assert np_detector.calculate_kl_divergence(workers) == pytest.approx(
+            py_detector.calculate_kl_divergence(workers), rel=1e-12)
+        assert np_detector.calculate_wasserstein_distance(workers) == pytest.approx(
+            py_detector.calculate_wasserstein_distance(workers), rel=1e-12)
+        assert ByzantineValidator("numpy").calculate_geometric_median(workers) == \
+            ByzantineValidator("python").calculate_geometric_median(workers)
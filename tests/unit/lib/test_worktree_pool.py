@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Unit tests for worktree_manager.WorktreePool (pre-warmed worktree leasing).
+
+Runs real git commands in a throwaway repository: leasing must reset a warm
+slot onto a fresh feature branch, release must return it clean, and
+health_check must repair broken slots and abandoned leases.
+"""
+
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+LIB_PATH = Path(__file__).parent.parent.parent.parent / "plugins" / "autonomous-dev" / "lib"
+sys.path.insert(0, str(LIB_PATH))
+
+import worktree_manager  # noqa: E402
+from worktree_manager import WorktreeInfo, WorktreePool, _is_pool_slot  # noqa: E402
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "--initial-branch=master")
+    _git(root, "config", "user.email", "t@example.com")
+    _git(root, "config", "user.name", "t")
+    _git(root, "config", "commit.gpgsign", "false")
+    (root / "plugins" / "autonomous-dev").mkdir(parents=True)
+    (root / "plugins" / "autonomous-dev" / "marker.py").write_text("# marker\n")
+    (root / "README.md").write_text("v1\n")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "init")
+    return root
+
+
+@pytest.fixture
+def pool(repo):
+    pool = WorktreePool(size=2, base_branch="master", repo_root=repo)
+    assert pool.warm() == 2
+    return pool
+
+
+class TestWarm:
+    def test_slots_are_bootstrapped_and_detached(self, pool):
+        slots = pool.slots()
+        assert sorted(slots) == ["slot-0", "slot-1"]
+        for slot in slots:
+            path = pool.pool_dir / slot
+            assert (path / "plugins" / "__init__.py").exists()
+            assert (path / "plugins" / "autonomous_dev").is_symlink()
+            assert _git(path, "rev-parse", "--abbrev-ref", "HEAD").strip() == "HEAD"
+
+    def test_warm_is_idempotent(self, pool):
+        assert pool.warm() == 0
+
+
+class TestLeaseRelease:
+    def test_lease_checks_out_new_branch_from_base(self, pool, repo):
+        success, path = pool.lease("feature-a")
+        assert success is True
+        assert _is_pool_slot(path)
+        assert _git(path, "rev-parse", "--abbrev-ref", "HEAD").strip() == "feature-a"
+        assert _git(path, "rev-parse", "HEAD") == _git(repo, "rev-parse", "master")
+        assert pool.slots()[path.name]["state"] == "leased"
+
+    def test_lease_resets_leftovers_from_previous_feature(self, pool, repo):
+        _, path = pool.lease("feature-a")
+        (path / "README.md").write_text("dirty\n")
+        (path / "scratch.txt").write_text("junk")
+        (path / "build").mkdir()
+        assert pool.release(path)[0] is True
+
+        # Advance master so the next lease must move the slot forward too
+        (repo / "README.md").write_text("v2\n")
+        _git(repo, "commit", "-q", "-am", "v2")
+
+        leased = [pool.lease(name)[1] for name in ("feature-b", "feature-c")]
+        assert path in leased
+        assert (path / "README.md").read_text() == "v2\n"
+        assert not (path / "scratch.txt").exists()
+        assert not (path / "build").exists()
+        assert (path / "plugins" / "autonomous_dev").is_symlink()
+
+    def test_release_keeps_branch_commits(self, pool, repo):
+        _, path = pool.lease("feature-a")
+        (path / "new.py").write_text("X = 1\n")
+        _git(path, "add", "new.py")
+        _git(path, "commit", "-q", "-m", "feature work")
+        pool.release(path)
+        assert "new.py" in _git(repo, "show", "--stat", "feature-a")
+        # Slot is detached again, so the branch can be checked out elsewhere
+        assert _git(path, "rev-parse", "--abbrev-ref", "HEAD").strip() == "HEAD"
+
+    def test_existing_branch_is_refused(self, pool, repo):
+        _git(repo, "branch", "feature-a")
+        success, error = pool.lease("feature-a")
+        assert success is False
+        assert "already exists" in error
+
+    def test_invalid_feature_name_rejected(self, pool):
+        success, error = pool.lease("../escape")
+        assert success is False
+        assert "path traversal" in error
+
+    def test_exhausted_pool_falls_back_to_create_worktree(self, pool, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+        pool.lease("feature-a")
+        pool.lease("feature-b")
+        success, path = pool.lease("feature-c")
+        assert success is True
+        assert not _is_pool_slot(path)
+        assert path == (repo / ".worktrees" / "feature-c").resolve()
+        assert pool.release(path)[0] is True
+        assert not path.exists()
+
+
+class TestFeatureNameLookup:
+    """Leased slots stay addressable by feature name, like create_worktree's."""
+
+    def test_leased_slot_found_and_merged_by_feature_name(self, pool, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+        _, path = pool.lease("feature-a")
+        (path / "new.py").write_text("X = 1\n")
+        _git(path, "add", "new.py")
+        _git(path, "commit", "-q", "-m", "feature work")
+
+        assert worktree_manager.get_worktree_path("feature-a").resolve() == path
+        status = worktree_manager.get_worktree_status("feature-a")
+        assert status["branch"] == "feature-a" and status["commits_ahead"] == 1
+        assert "new.py" in worktree_manager.get_worktree_diff("feature-a")
+
+        result = worktree_manager.merge_worktree("feature-a", "master", check_push=False)
+        assert result.success is True, result.error_message
+        assert (repo / "new.py").exists()
+
+    def test_released_slot_is_not_matched(self, pool, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+        _, path = pool.lease("feature-a")
+        pool.release(path)
+        assert worktree_manager.get_worktree_path("feature-a") is None
+
+    def test_discard_removes_leased_slot(self, pool, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+        _, path = pool.lease("feature-a")
+        assert worktree_manager.discard_worktree("feature-a") == {"success": True}
+        assert not path.exists()
+        assert pool.health_check() == {path.name: "removed"}
+
+
+class TestHealthCheck:
+    def test_removed_slot_directory_is_dropped_and_rewarmed(self, pool):
+        import shutil
+
+        shutil.rmtree(pool.pool_dir / "slot-0")
+        assert pool.health_check() == {"slot-0": "removed"}
+        assert pool.warm() == 1
+        assert sorted(pool.slots()) == ["slot-0", "slot-1"]
+
+    def test_abandoned_lease_is_reclaimed(self, pool):
+        _, path = pool.lease("feature-a")
+        with patch.object(worktree_manager, "_pid_alive", return_value=False):
+            assert pool.health_check() == {path.name: "reclaimed"}
+        assert pool.slots()[path.name]["state"] == "idle"
+
+    def test_live_lease_untouched(self, pool):
+        pool.lease("feature-a")
+        assert pool.health_check() == {}
+
+
+class TestPruneAwareness:
+    def test_prune_skips_pool_slots(self, tmp_path):
+        slot = tmp_path / ".worktrees" / ".pool" / "slot-0"
+        slot.mkdir(parents=True)
+        old = WorktreeInfo(
+            name="slot-0", path=slot, branch="feature-a", commit="abc",
+            status="active", created_at=datetime.now() - timedelta(days=30),
+        )
+        with patch.object(worktree_manager, "list_worktrees", return_value=[old]), \
+                patch.object(worktree_manager.subprocess, "run") as run:
+            assert worktree_manager.prune_stale_worktrees(max_age_days=7) == 0
+        run.assert_not_called()
@@ -142,6 +142,43 @@ class TestAllowBlockCounts:
         assert s["block_ratio"] == 0
 
 
+# ---------------------------------------------------------------------------
+# Optional counters
+# ---------------------------------------------------------------------------
+
+
+class TestCounters:
+    def test_counters_summed_and_hit_rate_recomputed(self, report_module, tmp_path):
+        log = tmp_path / "hook_timings_2026-05-07.jsonl"
+        rows = [
+            {"memory_hits": 3, "disk_hits": 0, "misses": 1, "entries": 2, "hit_rate": 0.75},
+            {"memory_hits": 0, "disk_hits": 1, "misses": 3, "entries": 1, "hit_rate": 0.25},
+        ]
+        with log.open("w") as fh:
+            for counters in rows:
+                fh.write(json.dumps({
+                    "ts": "2026-05-07T12:00:00+00:00",
+                    "hook": "unified_pre_tool.py",
+                    "dur_ns": 1_000,
+                    "decision_shape": "allow",
+                    "schema_version": 2,
+                    "counters": {"intent_cache": counters},
+                }) + "\n")
+        files = report_module.iter_log_files(start_dir=tmp_path)
+        stats = report_module.aggregate(report_module.stream_rows(files))
+
+        assert stats["unified_pre_tool.py"]["counters"] == {
+            "intent_cache": {"disk_hits": 1, "hit_rate": 0.5, "memory_hits": 3, "misses": 4}
+        }
+
+    def test_rows_without_counters_have_no_key(self, report_module, tmp_path):
+        _write_synthetic(tmp_path / "hook_timings_2026-05-07.jsonl", rows=3)
+        files = report_module.iter_log_files(start_dir=tmp_path)
+        stats = report_module.aggregate(report_module.stream_rows(files))
+
+        assert "counters" not in stats["auto_format.py"]
+
+
 # ---------------------------------------------------------------------------
 # Performance budget
 # ---------------------------------------------------------------------------
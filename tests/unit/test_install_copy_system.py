@@ -24,7 +24,13 @@ import sys
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from plugins.autonomous_dev.lib.copy_system import CopySystem, CopyError, rollback
+from plugins.autonomous_dev.lib.copy_system import (
+    CopySystem,
+    CopyError,
+    compile_protected_matcher,
+    rollback,
+    sync_to_targets,
+)
 
 
 class TestCopySystemStructure:
@@ -595,3 +601,105 @@ class TestCopySystemIntegration:
         # Verify file count
         assert result["files_copied"] == 8
         assert result["errors"] == 0
+
+
+class TestCopySystemDeltaSync:
+    """Test content-hash delta sync (only new or changed files are written)."""
+
+    def _make_source(self, tmp_path):
+        source = tmp_path / "source"
+        (source / "lib").mkdir(parents=True)
+        (source / "lib" / "a.py").write_text("a = 1")
+        (source / "lib" / "b.py").write_text("b = 2")
+        (source / "config").mkdir()
+        (source / "config" / "settings.env").write_text("KEY=plugin")
+        return source
+
+    def test_second_sync_skips_unchanged_files(self, tmp_path):
+        """Unchanged files are skipped by hash and no bytes are written."""
+        source = self._make_source(tmp_path)
+        dest = tmp_path / "dest"
+        copier = CopySystem(source, dest)
+
+        first = copier.delta_sync()
+        second = copier.delta_sync()
+
+        assert first["files_copied"] == 3
+        assert first["bytes_written"] > 0
+        assert second["files_copied"] == 0
+        assert second["files_unchanged"] == 3
+        assert second["bytes_written"] == 0
+
+    def test_copies_only_changed_and_new_files(self, tmp_path):
+        """Same-size content changes are detected by hash, new files are added."""
+        source = self._make_source(tmp_path)
+        dest = tmp_path / "dest"
+        copier = CopySystem(source, dest)
+        copier.delta_sync()
+
+        (source / "lib" / "a.py").write_text("a = 9")  # same size, new content
+        (source / "lib" / "c.py").write_text("c = 3")
+
+        plan = copier.plan_delta()
+        assert plan.changed_files == ["lib/a.py"]
+        assert plan.new_files == ["lib/c.py"]
+        assert sorted(plan.unchanged_files) == ["config/settings.env", "lib/b.py"]
+
+        summary = copier.copy_planned(plan)
+        assert summary["files_copied"] == 2
+        assert summary["bytes_written"] == 10
+        assert (dest / "lib" / "a.py").read_text() == "a = 9"
+
+    def test_protected_patterns_skip_existing_files(self, tmp_path):
+        """Existing files matching protected patterns are never overwritten."""
+        source = self._make_source(tmp_path)
+        dest = tmp_path / "dest"
+        (dest / "config").mkdir(parents=True)
+        (dest / "config" / "settings.env").write_text("KEY=user-value")
+
+        summary = CopySystem(source, dest).delta_sync(protected_patterns=["*.env"])
+
+        assert summary["files_skipped"] == 1
+        assert (dest / "config" / "settings.env").read_text() == "KEY=user-value"
+
+    def test_dry_run_writes_nothing(self, tmp_path):
+        """Dry run reports the delta without creating the destination."""
+        source = self._make_source(tmp_path)
+        dest = tmp_path / "dest"
+
+        summary = CopySystem(source, dest).delta_sync(dry_run=True)
+
+        assert summary["files_copied"] == 3
+        assert summary["dry_run"] is True
+        assert not (dest / "lib").exists()
+
+    def test_sync_to_targets_reports_per_target_bytes(self, tmp_path):
+        """Each target gets its own summary of bytes actually written."""
+        source = self._make_source(tmp_path)
+        fresh = tmp_path / "repo_a" / ".claude"
+        current = tmp_path / "repo_b" / ".claude"
+        CopySystem(source, current).delta_sync()
+
+        summaries = sync_to_targets(source, [fresh, current])
+
+        assert summaries[str(fresh.resolve())]["files_copied"] == 3
+        assert summaries[str(current.resolve())]["files_copied"] == 0
+        assert summaries[str(current.resolve())]["bytes_written"] == 0
+
+
+class TestProtectedMatcher:
+    """Test the compiled protected-file matcher."""
+
+    @pytest.mark.parametrize("path", [
+        "PROJECT.md", "config/.env", "a/b/settings.local.json", "hooks/custom_x.py",
+        "lib/foo.py", "custom_hooks/run.sh", "x.env.example",
+    ])
+    def test_matches_fnmatch_semantics(self, path):
+        """The combined regex agrees with per-pattern fnmatch."""
+        import fnmatch
+
+        patterns = ["*.env", "*settings.local.json", "hooks/custom_*", "custom_hooks/*"]
+        matcher = compile_protected_matcher(["PROJECT.md"], patterns)
+        expected = path == "PROJECT.md" or any(fnmatch.fnmatch(path, p) for p in patterns)
+
+        assert matcher(path) is expected
@@ -368,6 +368,22 @@ class TestFileDiscoveryEngine:
             assert "size" in file_entry
             assert file_entry["size"] > 0
 
+    def test_manifest_includes_content_hashes(self, tmp_path):
+        """Test that manifest entries carry SHA-256 content hashes."""
+        import hashlib
+
+        plugin_dir = tmp_path / "plugins" / "autonomous-dev"
+        (plugin_dir / "lib").mkdir(parents=True)
+        (plugin_dir / "lib" / "utils.py").write_text("def util(): pass\n")
+
+        manifest = FileDiscovery(plugin_dir).generate_manifest()
+
+        entry = manifest["files"][0]
+        assert entry["sha256"] == hashlib.sha256(b"def util(): pass\n").hexdigest()
+        assert "sha256" not in FileDiscovery(plugin_dir).generate_manifest(
+            include_hashes=False
+        )["files"][0]
+
     def test_saves_manifest_to_json(self, tmp_path):
         """Test that manifest can be saved to JSON file.
 